@@ -0,0 +1 @@
+"""OpenCode SDK 性能基准测试。"""
@@ -0,0 +1,108 @@
+"""
+JSON 编解码器基准测试。
+
+通过 ``httpx.MockTransport`` 调用 ``HttpClient``，对比旧的解码方式
+（``response.json()`` / 先解码为 ``str`` 再 ``json.loads``）与
+:mod:`opencode_sdk.codec` 中各可用编解码器在大型响应上的耗时，
+以及请求体编码（httpx ``json=`` 与 ``codec.dumps``）的耗时。
+
+运行::
+
+    python -m benchmarks.bench_codec
+"""
+
+import json
+import time
+from typing import Any, Callable, Dict
+
+import httpx
+
+from opencode_sdk import codec
+from opencode_sdk.http_client import HttpClient
+
+from .bench_response_mode import _message
+
+
+def _best(fn: Callable[[], Any], repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _http_client(body: bytes, content_type: str) -> HttpClient:
+    client = HttpClient(base_url="http://bench")
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, content=body, headers={"content-type": content_type})
+    )
+    client.client = httpx.Client(base_url="http://bench", transport=transport)
+    return client
+
+
+def _legacy_decode(client: HttpClient, path: str, content_type: str) -> Any:
+    """旧实现：JSON 响应调用 response.json()，其他响应先取 text。"""
+    response = client.client.get(path)
+    if content_type.startswith("application/json"):
+        return response.json()
+    return json.loads(response.text)
+
+
+def bench_decode(name: str, path: str, body: bytes, content_type: str) -> None:
+    client = _http_client(body, content_type)
+    results: Dict[str, float] = {
+        "legacy": _best(lambda: _legacy_decode(client, path, content_type))
+    }
+    for codec_name in codec.available_codecs():
+        codec.set_codec(codec_name)
+        results[codec_name] = _best(lambda: client.get(path))
+    codec.set_codec()
+    client.close()
+
+    baseline = results["legacy"]
+    line = "  ".join(
+        f"{label}={seconds * 1000:7.1f} ms ({baseline / seconds:4.2f}x)"
+        for label, seconds in results.items()
+    )
+    print(f"decode {name:<28} {len(body) / 1e6:5.1f} MB  {line}")
+
+
+def bench_encode(name: str, payload: Any) -> None:
+    request = httpx.Request  # httpx 对 json= 的编码发生在构造请求时
+    results: Dict[str, float] = {
+        "httpx": _best(lambda: request("POST", "http://bench/", json=payload).read())
+    }
+    for codec_name in codec.available_codecs():
+        current = codec.set_codec(codec_name)
+        results[codec_name] = _best(
+            lambda: request("POST", "http://bench/", content=current.dumps(payload)).read()
+        )
+    codec.set_codec()
+
+    baseline = results["httpx"]
+    line = "  ".join(
+        f"{label}={seconds * 1000:7.1f} ms ({baseline / seconds:4.2f}x)"
+        for label, seconds in results.items()
+    )
+    print(f"encode {name:<28}           {line}")
+
+
+def main() -> None:
+    print(f"可用编解码器: {', '.join(codec.available_codecs())}")
+
+    messages = json.dumps([_message(i) for i in range(5_000)]).encode()
+    bench_decode("/session/{id}/message", "/session/ses/message", messages, "application/json")
+
+    source = "\n".join(f"    line_{i} = compute({i}, '中文注释')  # {'x' * 40}" for i in range(100_000))
+    file_body = json.dumps({"type": "text", "content": source}, ensure_ascii=False).encode()
+    bench_decode("/file/read (text/plain)", "/file/read", file_body, "text/plain")
+    bench_decode("/file/read (json)", "/file/read", file_body, "application/json")
+
+    prompt = {"parts": [{"type": "text", "text": source[:2_000_000]}], "agent": "build"}
+    bench_encode("prompt body (2 MB text)", prompt)
+    bench_encode("message list", json.loads(messages))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""
+SSE 事件解码微基准测试。
+
+对比旧实现（每个事件重新执行导入、重建类型映射、``json.loads`` 后
+``cls(**data)``）与新实现（缓存的判别联合 ``TypeAdapter.validate_json``）
+把 SSE ``data`` 字节解码为事件模型的吞吐量。
+
+运行::
+
+    python -m benchmarks.bench_event_decode
+"""
+
+import json
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from opencode_sdk.sse_client import SSEClient
+
+
+def _legacy(event_type: Optional[str], event_data: bytes) -> Optional[Any]:
+    """旧实现：每个事件都执行导入并重建映射。"""
+    data = json.loads(event_data)
+    if not isinstance(data, dict):
+        return None
+    if "payload" in data and isinstance(data["payload"], dict):
+        data = data["payload"]
+    if event_type is None:
+        event_type = data.get("type")
+    if not event_type:
+        return None
+
+    from opencode_sdk.models.events import (
+        EventServerInstanceDisposed,
+        EventServerConnected,
+        EventInstallationUpdated,
+        EventInstallationUpdateAvailable,
+        EventLspClientDiagnostics,
+        EventLspUpdated,
+        EventMessageUpdated,
+        EventMessageRemoved,
+        EventMessagePartUpdated,
+        EventMessagePartRemoved,
+        EventMessagePartDelta,
+        EventPermissionUpdated,
+        EventPermissionReplied,
+        EventSessionStatus,
+        EventSessionIdle,
+        EventSessionCompacted,
+        EventSessionCreated,
+        EventSessionUpdated,
+        EventSessionDeleted,
+        EventSessionDiff,
+        EventSessionError,
+        EventFileEdited,
+        EventFileWatcherUpdated,
+        EventVcsBranchUpdated,
+        EventTodoUpdated,
+        EventCommandExecuted,
+        EventTuiPromptAppend,
+        EventTuiCommandExecute,
+        EventTuiToastShow,
+        EventPtyCreated,
+        EventPtyUpdated,
+        EventPtyExited,
+        EventPtyDeleted,
+    )
+
+    event_class_map = {
+        "server.instance.disposed": EventServerInstanceDisposed,
+        "server.connected": EventServerConnected,
+        "installation.updated": EventInstallationUpdated,
+        "installation.update-available": EventInstallationUpdateAvailable,
+        "lsp.client.diagnostics": EventLspClientDiagnostics,
+        "lsp.updated": EventLspUpdated,
+        "message.updated": EventMessageUpdated,
+        "message.removed": EventMessageRemoved,
+        "message.part.updated": EventMessagePartUpdated,
+        "message.part.removed": EventMessagePartRemoved,
+        "message.part.delta": EventMessagePartDelta,
+        "permission.updated": EventPermissionUpdated,
+        "permission.replied": EventPermissionReplied,
+        "session.status": EventSessionStatus,
+        "session.idle": EventSessionIdle,
+        "session.compacted": EventSessionCompacted,
+        "session.created": EventSessionCreated,
+        "session.updated": EventSessionUpdated,
+        "session.deleted": EventSessionDeleted,
+        "session.diff": EventSessionDiff,
+        "session.error": EventSessionError,
+        "file.edited": EventFileEdited,
+        "file.watcher.updated": EventFileWatcherUpdated,
+        "vcs.branch.updated": EventVcsBranchUpdated,
+        "todo.updated": EventTodoUpdated,
+        "command.executed": EventCommandExecuted,
+        "tui.prompt.append": EventTuiPromptAppend,
+        "tui.command.execute": EventTuiCommandExecute,
+        "tui.toast.show": EventTuiToastShow,
+        "pty.created": EventPtyCreated,
+        "pty.updated": EventPtyUpdated,
+        "pty.exited": EventPtyExited,
+        "pty.deleted": EventPtyDeleted,
+    }
+
+    event_class = event_class_map.get(event_type)
+    return event_class(**data) if event_class else None
+
+
+def delta_frames(count: int, envelope: bool = False) -> List[bytes]:
+    """大量 message.part.delta 事件的 data 字节。"""
+    frames = []
+    for i in range(count):
+        event = {
+            "type": "message.part.delta",
+            "properties": {
+                "sessionID": "ses_bench",
+                "messageID": "msg_bench",
+                "partID": "prt_bench",
+                "field": "text",
+                "delta": f"token {i} ",
+            },
+        }
+        if envelope:
+            event = {"directory": "/data/workspace", "payload": event}
+        frames.append(json.dumps(event).encode())
+    return frames
+
+
+def mixed_frames(count: int) -> List[bytes]:
+    """delta 为主，夹杂 part/status/idle 事件。"""
+    frames = delta_frames(count)
+    part = {
+        "type": "message.part.updated",
+        "properties": {
+            "part": {
+                "id": "prt_1",
+                "sessionID": "ses_bench",
+                "messageID": "msg_bench",
+                "type": "text",
+                "text": "hello " * 20,
+            }
+        },
+    }
+    status = {
+        "type": "session.status",
+        "properties": {"sessionID": "ses_bench", "status": {"type": "busy"}},
+    }
+    idle = {"type": "session.idle", "properties": {"sessionID": "ses_bench"}}
+    for i, extra in enumerate((part, status, idle) * (count // 30)):
+        frames[i * 10] = json.dumps(extra).encode()
+    return frames
+
+
+def _measure(name: str, frames: List[bytes], repeat: int = 3) -> None:
+    client = SSEClient(base_url="http://localhost")
+    impls: Dict[str, Callable[[Optional[str], bytes], Any]] = {
+        "legacy": _legacy,
+        "adapter": client._parse_event,
+    }
+    results = {}
+    for label, impl in impls.items():
+        best = float("inf")
+        decoded = 0
+        for _ in range(repeat):
+            start = time.perf_counter()
+            decoded = sum(1 for frame in frames if impl(None, frame) is not None)
+            best = min(best, time.perf_counter() - start)
+        results[label] = (decoded, best)
+
+    legacy_count, legacy_time = results["legacy"]
+    new_count, new_time = results["adapter"]
+    assert legacy_count == new_count, (legacy_count, new_count)
+    print(
+        f"{name:<24} events={new_count:>7}  "
+        f"legacy={legacy_count / legacy_time:>10,.0f} ev/s  "
+        f"adapter={new_count / new_time:>10,.0f} ev/s  "
+        f"speedup={legacy_time / new_time:5.2f}x"
+    )
+
+
+def main() -> None:
+    _measure("delta", delta_frames(50_000))
+    _measure("delta (global envelope)", delta_frames(50_000, envelope=True))
+    _measure("mixed", mixed_frames(50_000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+本地查找索引基准测试。
+
+生成 100,000 个合成文件路径，测量 :class:`FindIndex` 的构建耗时，以及前缀、子串和
+子序列三类查询的 p50 / p99 延迟（每次返回 50 条结果）。作为对照，同时测量对全部路径
+逐个做子串判断的线性扫描耗时。
+
+运行::
+
+    python -m benchmarks.bench_find_index
+"""
+
+import random
+import statistics
+import time
+from typing import Callable, List
+
+from opencode_sdk import FindIndex
+
+_WORDS = [
+    "client", "session", "models", "utils", "event", "hub", "parser", "index", "config",
+    "server", "test", "core", "api", "http", "file", "cache", "walk", "stream", "message",
+    "provider", "router", "schema", "worker", "queue", "auth", "storage", "render", "view",
+]
+
+
+def _paths(count: int) -> List[str]:
+    rng = random.Random(1)
+    paths = set()
+    while len(paths) < count:
+        depth = rng.randint(1, 5)
+        directory = "/".join(f"{rng.choice(_WORDS)}{rng.randint(0, 40)}" for _ in range(depth))
+        paths.add(f"{directory}/{rng.choice(_WORDS)}_{rng.choice(_WORDS)}{rng.randint(0, 99)}.py")
+    return sorted(paths)
+
+
+def _measure(run: Callable[[], object], repeat: int = 200) -> List[float]:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - start) * 1000)
+    return sorted(samples)
+
+
+def _report(name: str, samples: List[float]) -> None:
+    p50 = statistics.median(samples)
+    p99 = samples[int(len(samples) * 0.99) - 1]
+    print(f"{name:<32} p50={p50:>7.3f} ms  p99={p99:>7.3f} ms")
+
+
+def main(count: int = 100_000) -> None:
+    paths = _paths(count)
+    index = FindIndex()
+    start = time.perf_counter()
+    index.load_files(paths)
+    print(f"构建索引：{count:,} 个文件，{time.perf_counter() - start:.2f} s")
+
+    queries = [
+        ("前缀 'sess'", "sess"),
+        ("前缀 'provider_sch'", "provider_sch"),
+        ("子串 'schema_worker'", "schema_worker"),
+        ("子串 'auth3/'", "auth3/"),
+        ("子序列 'prvsch'", "prvsch"),
+        ("子序列 'cfgrtr'", "cfgrtr"),
+        ("无结果 'zzzz'", "zzzz"),
+    ]
+    for name, query in queries:
+        _report(name, _measure(lambda: index.search_files(query, 50)))
+
+    lowered = [p.lower() for p in paths]
+    _report("线性扫描子串 'schema_worker'", _measure(
+        lambda: [p for p in lowered if "schema_worker" in p][:50], repeat=20
+    ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+流式文本搜索基准测试。
+
+在独立进程中启动一个模拟 ``GET /find/text`` 的测试服务器，返回约 200,000 条
+ripgrep 风格的匹配结果（约 40 MB 的 JSON 数组），以固定带宽分块发送，模拟远程服务器。
+比较 ``find.text()`` 与 ``find.text_stream()``：
+
+- 首条结果可用的时间
+- 全部结果处理完毕的时间
+- 客户端 Python 堆内存峰值（tracemalloc）
+
+运行::
+
+    python -m benchmarks.bench_find_stream
+"""
+
+import json
+import multiprocessing
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Iterable, Tuple
+
+from opencode_sdk import OpencodeClient
+
+_MATCHES = 200_000
+# 发送带宽（字节/秒）和每块大小
+_BANDWIDTH = 100 * 1024 * 1024
+_CHUNK = 64 * 1024
+
+
+def _body() -> bytes:
+    matches = [
+        {
+            "path": {"text": f"src/module{i // 40}/file{i // 8}.py"},
+            "lines": {"text": f"    value_{i} = compute(identifier, {i})  # identifier\n"},
+            "line_number": i % 500 + 1,
+            "absolute_offset": i * 64,
+            "submatches": [{"match": {"text": "identifier"}, "start": 24, "end": 34}],
+        }
+        for i in range(_MATCHES)
+    ]
+    return json.dumps(matches).encode()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    body = b""
+
+    def do_GET(self) -> None:  # noqa: N802
+        body = self.body
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        start = time.perf_counter()
+        for offset in range(0, len(body), _CHUNK):
+            self.wfile.write(body[offset:offset + _CHUNK])
+            # 按带宽限速
+            delay = start + (offset + _CHUNK) / _BANDWIDTH - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+def _serve_forever(port: Any) -> None:
+    _Handler.body = _body()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    port.value = server.server_address[1]
+    server.serve_forever()
+
+
+def _serve() -> Tuple[multiprocessing.Process, str]:
+    port = multiprocessing.Value("i", 0)
+    process = multiprocessing.Process(target=_serve_forever, args=(port,), daemon=True)
+    process.start()
+    while not port.value:
+        time.sleep(0.01)
+    return process, f"http://127.0.0.1:{port.value}"
+
+
+def _consume(search: Callable[[], Iterable[Any]]) -> Tuple[int, float, float]:
+    start = time.perf_counter()
+    first = 0.0
+    count = 0
+    for _ in search():
+        if not count:
+            first = time.perf_counter() - start
+        count += 1
+    return count, first, time.perf_counter() - start
+
+
+def _run(name: str, search: Callable[[], Iterable[Any]]) -> None:
+    count, first, elapsed = _consume(search)
+    # tracemalloc 会明显拖慢分配，内存峰值单独运行一遍测量
+    tracemalloc.start()
+    _consume(search)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{name:<16} {count:>8,} 条  首条 {first * 1000:>8.1f} ms  "
+        f"全部 {elapsed:>6.2f} s  内存峰值 {peak / 1024 / 1024:>7.1f} MB"
+    )
+
+
+def main() -> None:
+    server, base_url = _serve()
+    print(f"{_MATCHES:,} 条结果，带宽 {_BANDWIDTH // 1024 // 1024} MB/s")
+    with OpencodeClient(base_url=base_url, timeout=120) as client:
+        _run("text()", lambda: client.find.text("identifier"))
+        _run("text_stream()", lambda: client.find.text_stream("identifier"))
+        _run("text_by_file()", lambda: client.find.text_by_file("identifier"))
+    server.terminate()
+
+
+if __name__ == "__main__":
+    main()
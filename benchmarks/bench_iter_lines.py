@@ -0,0 +1,114 @@
+"""
+分块按行读取基准测试。
+
+在独立进程中启动一个模拟 ``GET /file/read`` 的测试服务器，提供一个 1,000,000 行
+（约 100 MB）的合成日志文件，每个请求附加固定延迟模拟远程服务器。比较：
+
+- ``files.read()`` 一次读取整个文件
+- ``files.iter_lines()`` 在不同流水线深度下的吞吐量
+- ``files.read_mapped()`` 写入内存映射临时文件
+
+同时报告客户端 Python 堆内存峰值（tracemalloc，单独运行一遍测量）。
+
+运行::
+
+    python -m benchmarks.bench_iter_lines
+"""
+
+import json
+import multiprocessing
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from opencode_sdk import OpencodeClient
+
+_LINES = 1_000_000
+_LATENCY = 0.005
+
+
+def _lines() -> list:
+    return [
+        f"2026-01-01T00:00:{i % 60:02d}Z INFO worker-{i % 16} request id={i:08d} status=200 took={i % 997}ms"
+        for i in range(_LINES)
+    ]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    lines: list = []
+
+    def do_GET(self) -> None:  # noqa: N802
+        query = parse_qs(urlparse(self.path).query)
+        start = int(query.get("startLine", ["1"])[0])
+        end = int(query.get("endLine", [str(_LINES)])[0])
+        chunk = self.lines[start - 1:end]
+        body = json.dumps({"type": "text", "content": "\n".join(chunk) + "\n" if chunk else ""}).encode()
+        time.sleep(_LATENCY)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+def _serve_forever(port: Any) -> None:
+    _Handler.lines = _lines()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    port.value = server.server_address[1]
+    server.serve_forever()
+
+
+def _serve() -> Tuple[multiprocessing.Process, str]:
+    port = multiprocessing.Value("i", 0)
+    process = multiprocessing.Process(target=_serve_forever, args=(port,), daemon=True)
+    process.start()
+    while not port.value:
+        time.sleep(0.01)
+    return process, f"http://127.0.0.1:{port.value}"
+
+
+def _run(name: str, work: Callable[[], int]) -> None:
+    start = time.perf_counter()
+    count = work()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    work()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{name:<36} {count:>9,} 行  {elapsed:>6.2f} s  "
+        f"{count / elapsed:>10,.0f} 行/s  内存峰值 {peak / 1024 / 1024:>7.1f} MB"
+    )
+
+
+def _mapped(client: OpencodeClient) -> int:
+    with client.files.read_mapped("server.log", chunk_lines=20_000, concurrency=4) as lines:
+        return len(lines)
+
+
+def main() -> None:
+    server, base_url = _serve()
+    print(f"{_LINES:,} 行，服务器延迟 {_LATENCY * 1000:.0f} ms/请求")
+    with OpencodeClient(base_url=base_url, timeout=300) as client:
+        _run("read()", lambda: len(client.files.read("server.log").content.splitlines()))
+        for chunk_lines, concurrency in [(20_000, 1), (20_000, 4), (5_000, 1), (5_000, 4), (5_000, 8)]:
+            _run(
+                f"iter_lines({chunk_lines}, concurrency={concurrency})",
+                lambda: sum(1 for _ in client.files.iter_lines(
+                    "server.log", chunk_lines=chunk_lines, concurrency=concurrency
+                )),
+            )
+        _run("read_mapped(20000, concurrency=4)", lambda: _mapped(client))
+    server.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+连接池参数基准测试。
+
+在独立进程中启动一个支持 keep-alive 的 HTTP/1.1 测试服务器（避免与客户端
+争抢 GIL），用线程池并发调用 ``OpencodeClient`` 的同步接口（模拟批量
+``files.read`` / ``find.text``），比较不同连接池参数下的吞吐量、新建 TCP
+连接数和失败请求数。HTTP/2 需要 ``h2`` 且服务器
+支持 h2c，本测试服务器只支持 HTTP/1.1，因此只测试 HTTP/1.1 参数。
+
+运行::
+
+    python -m benchmarks.bench_pool
+"""
+
+import json
+import multiprocessing
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Tuple
+
+from opencode_sdk import OpencodeClient
+from opencode_sdk.exceptions import OpencodeException
+
+_BODY = json.dumps({"type": "text", "content": "x = 1\n" * 200}).encode()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # 头和正文分两次写出，复用连接时 Nagle + 延迟 ACK 会让每个响应多等约 40ms
+    disable_nagle_algorithm = True
+    connections: Any = None
+
+    def setup(self) -> None:
+        super().setup()
+        with _Handler.connections.get_lock():
+            _Handler.connections.value += 1
+
+    def do_GET(self) -> None:  # noqa: N802
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(_BODY)))
+        self.end_headers()
+        self.wfile.write(_BODY)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+def _serve_forever(port: Any, connections: Any) -> None:
+    _Handler.connections = connections
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    port.value = server.server_address[1]
+    server.serve_forever()
+
+
+def _serve() -> Tuple[multiprocessing.Process, str, Any]:
+    # 默认 backlog 为 5，高并发建连时会触发 SYN 重传，掩盖连接池本身的差异
+    ThreadingHTTPServer.request_queue_size = 1024
+    port = multiprocessing.Value("i", 0)
+    connections = multiprocessing.Value("i", 0)
+    process = multiprocessing.Process(target=_serve_forever, args=(port, connections), daemon=True)
+    process.start()
+    while not port.value:
+        time.sleep(0.01)
+    return process, f"http://127.0.0.1:{port.value}", connections
+
+
+def _run(
+    base_url: str, connections: Any, options: Dict[str, Any], requests: int, workers: int
+) -> Tuple[float, int, int]:
+    with OpencodeClient(base_url=base_url, timeout=30, **options) as client:
+        http = client._http_client
+
+        def fetch(i: int) -> bool:
+            try:
+                http.get("/file/content", params={"path": f"f{i}"})
+                return True
+            except OpencodeException:
+                return False
+
+        # 预热：建立初始连接
+        fetch(-1)
+        connections.value = 0
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            ok = sum(pool.map(fetch, range(requests)))
+        elapsed = time.perf_counter() - start
+    return ok / elapsed, connections.value, requests - ok
+
+
+def main(requests: int = 4000, workers: int = 64) -> None:
+    server, base_url, connections = _serve()
+    scenarios = [
+        ("默认 (100 / 20 keep-alive / 5s)", {}),
+        ("max_keepalive_connections=64", {"max_keepalive_connections": 64}),
+        ("max_connections=16", {"max_connections": 16, "max_keepalive_connections": 16}),
+        ("max_connections=64, keepalive=64", {"max_connections": 64, "max_keepalive_connections": 64}),
+        ("keepalive_expiry=0 (不复用)", {"keepalive_expiry": 0}),
+    ]
+    print(f"{requests} 个请求，{workers} 个线程")
+    for name, options in scenarios:
+        rate, opened, failed = _run(base_url, connections, options, requests, workers)
+        print(f"{name:<36} {rate:>9,.0f} req/s  新建连接={opened:<6} 失败={failed}")
+    server.terminate()
+
+
+if __name__ == "__main__":
+    main()
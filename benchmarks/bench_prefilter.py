@@ -0,0 +1,79 @@
+"""
+事件预过滤基准测试。
+
+模拟同一目录下 8 个会话同时生成、事件逐帧交错的 ``/event`` 流（共 80,000 个事件），
+订阅者只关心其中一个会话，对比 ``SSEClient`` 解码全部事件后再过滤与
+:class:`~opencode_sdk.event_filter.EventFilter` 按字节预过滤的处理速率。
+
+运行::
+
+    python -m benchmarks.bench_prefilter
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+import httpx
+
+from opencode_sdk.event_filter import EventFilter
+from opencode_sdk.event_hub import event_session_id
+from opencode_sdk.sse_client import SSEClient
+
+from .mock_server import ChunkStream, event_stream
+
+_SESSIONS = [f"ses_{i}" for i in range(8)]
+
+
+def interleaved_stream(events_per_session: int) -> bytes:
+    """多个会话的事件逐帧交错的 SSE 字节流。"""
+    frames = event_stream(events_per_session).split(b"\n\n")[:-1]
+    return b"".join(
+        frame.replace(b"ses_bench", session.encode()) + b"\n\n"
+        for frame in frames
+        for session in _SESSIONS
+    )
+
+
+async def _consume(payload: bytes, prefilter: Optional[EventFilter]) -> int:
+    """读取整个事件流，返回目标会话的事件数。"""
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, headers={"content-type": "text/event-stream"}, stream=ChunkStream(payload, 16384)
+        )
+
+    count = 0
+    base_url = "http://opencode.bench"
+    async with httpx.AsyncClient(base_url=base_url, transport=httpx.MockTransport(handler)) as http:
+        async with SSEClient(base_url, client=http, prefilter=prefilter) as sse:
+            async for event in sse.connect("/event"):
+                if event_session_id(event) == _SESSIONS[3]:
+                    count += 1
+    return count
+
+
+def main(repeat: int = 3) -> None:
+    payload = interleaved_stream(10_000)
+    total = len(_SESSIONS) * 10_000
+    print(f"{len(_SESSIONS)} 个会话交错，共 {total:,} 个事件，{len(payload) / 1e6:.1f} MB")
+    baseline = None
+    for label, prefilter in (
+        ("全部解码", None),
+        ("按会话预过滤", EventFilter(session_ids=[_SESSIONS[3]])),
+        ("按会话和类型预过滤", EventFilter([_SESSIONS[3]], ["message.updated", "session.idle"])),
+    ):
+        best = float("inf")
+        count = 0
+        for _ in range(repeat):
+            start = time.perf_counter()
+            count = asyncio.run(_consume(payload, prefilter))
+            best = min(best, time.perf_counter() - start)
+        baseline = baseline or best
+        print(
+            f"{label:<12} 目标会话事件 {count:>6}  {total / best:>12,.0f} 事件/s  "
+            f"耗时 {best * 1000:>7.1f} ms  {baseline / best:5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
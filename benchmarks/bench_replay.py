@@ -0,0 +1,89 @@
+"""
+SSE 录制与回放基准测试。
+
+不带参数时，从 :mod:`benchmarks.mock_server` 的 ``/event`` 流录制 20,000 个事件
+（不压缩和 zstd 压缩各一次），对比开启录制前后 ``SSEClient`` 的事件速率和录制文件大小，
+然后以不限速方式回放，分别测量只分帧（``frames()``）和分帧加解码（``events()``）的吞吐量。
+给出录制文件路径时只回放该文件。
+
+运行::
+
+    python -m benchmarks.bench_replay [录制文件.sselog]
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from typing import Optional
+
+from opencode_sdk.sse_client import SSEClient
+from opencode_sdk.sse_replay import SSERecorder, SSEReplayer
+
+from .mock_server import MockOpencodeServer
+
+
+async def _receive(server: MockOpencodeServer, recorder: Optional[SSERecorder]) -> float:
+    """接收整个事件流，返回耗时（秒）。"""
+    async with server.async_client() as http:
+        start = time.perf_counter()
+        async with SSEClient(server.base_url, client=http, recorder=recorder) as sse:
+            async for _ in sse.connect("/event"):
+                pass
+        return time.perf_counter() - start
+
+
+async def _events(replayer: SSEReplayer) -> int:
+    count = 0
+    async for _ in replayer.events():
+        count += 1
+    return count
+
+
+def replay(path: str, repeat: int = 3) -> None:
+    replayer = SSEReplayer(path, speed=None)
+    size = replayer.size
+    for label, run in (
+        ("frames()", lambda: sum(1 for _ in replayer.frames())),
+        ("events()", lambda: asyncio.run(_events(replayer))),
+    ):
+        best = float("inf")
+        count = 0
+        for _ in range(repeat):
+            start = time.perf_counter()
+            count = run()
+            best = min(best, time.perf_counter() - start)
+        print(
+            f"回放 {label:<10} {count:>7} 个事件  {count / best:>12,.0f} 事件/s  "
+            f"{size / best / 1e6:>7.1f} MB/s"
+        )
+
+
+def main() -> None:
+    if len(sys.argv) > 1:
+        replay(sys.argv[1])
+        return
+
+    server = MockOpencodeServer()
+    print(f"SSE 事件流 {server.events:,} 个事件，{len(server.event_body) / 1e6:.1f} MB")
+    baseline = min(asyncio.run(_receive(server, None)) for _ in range(3))
+    print(f"{'不录制':<14} {server.events / baseline:>12,.0f} 事件/s")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for compress in (False, True):
+            path = os.path.join(tmp, f"events-{int(compress)}.sselog")
+            elapsed = float("inf")
+            for _ in range(3):
+                with SSERecorder(path, compress=compress) as recorder:
+                    elapsed = min(elapsed, asyncio.run(_receive(server, recorder)))
+            label = "录制 (zstd)" if compress else "录制"
+            print(
+                f"{label:<14} {server.events / elapsed:>12,.0f} 事件/s  "
+                f"文件 {os.path.getsize(path) / 1e6:>6.2f} MB"
+            )
+        replay(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+响应模式基准测试。
+
+在一个包含 10,000 条消息（每条带若干 part）的会话上，分别以 ``model``、
+``lazy`` 和 ``raw`` 模式调用 ``client.sessions.messages()``，只读取
+``id``、``role`` 和 ``time.created`` 三个字段，比较耗时和内存峰值。
+HTTP 层使用 ``httpx.MockTransport``，三种模式的 JSON 解码开销相同。
+
+运行::
+
+    python -m benchmarks.bench_response_mode
+"""
+
+import json
+import time
+import tracemalloc
+from typing import Any, Dict, List
+
+import httpx
+
+from opencode_sdk import OpencodeClient
+
+
+def _message(i: int) -> Dict[str, Any]:
+    """构造一条带 part 的助手消息（``{"info", "parts"}`` 格式）。"""
+    info = {
+        "id": f"msg_{i:06d}",
+        "sessionID": "ses_bench",
+        "role": "assistant",
+        "time": {"created": 1_700_000_000_000 + i, "completed": 1_700_000_000_500 + i},
+        "parentID": f"msg_{i - 1:06d}",
+        "modelID": "claude-sonnet",
+        "providerID": "anthropic",
+        "mode": "build",
+        "path": {"cwd": "/data/workspace", "root": "/data/workspace"},
+        "cost": 0.0012,
+        "tokens": {"input": 1200, "output": 300, "reasoning": 0, "cache": {"read": 0, "write": 0}},
+        "finish": "stop",
+    }
+    base = {"sessionID": "ses_bench", "messageID": info["id"]}
+    parts = [
+        {**base, "id": f"prt_{i}_0", "type": "step-start"},
+        {**base, "id": f"prt_{i}_1", "type": "text", "text": "lorem ipsum " * 20},
+        {
+            **base,
+            "id": f"prt_{i}_2",
+            "type": "tool",
+            "callID": f"call_{i}",
+            "tool": "read",
+            "state": {
+                "status": "completed",
+                "input": {"filePath": "/data/workspace/main.py"},
+                "output": "x = 1\n" * 20,
+                "title": "main.py",
+                "metadata": {},
+                "time": {"start": 1, "end": 2},
+            },
+        },
+        {
+            **base,
+            "id": f"prt_{i}_3",
+            "type": "step-finish",
+            "reason": "stop",
+            "cost": 0.0012,
+            "tokens": {"input": 1200, "output": 300, "reasoning": 0, "cache": {"read": 0, "write": 0}},
+        },
+    ]
+    return {"info": info, "parts": parts}
+
+
+def _client(body: bytes) -> OpencodeClient:
+    client = OpencodeClient(base_url="http://bench")
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(
+            200, content=body, headers={"content-type": "application/json"}
+        )
+    )
+    client._http_client.client = httpx.Client(base_url="http://bench", transport=transport)
+    return client
+
+
+def _read_fields(messages: List[Any], raw: bool) -> int:
+    total = 0
+    if raw:
+        for item in messages:
+            info = item["info"]
+            total += len(info["id"]) + len(info["role"]) + info["time"]["created"] % 7
+    else:
+        for msg in messages:
+            total += len(msg.id) + len(msg.role) + msg.time.created % 7
+    return total
+
+
+def main(count: int = 10_000, repeat: int = 3) -> None:
+    body = json.dumps([_message(i) for i in range(count)]).encode()
+    client = _client(body)
+    print(f"{count} 条消息，响应体 {len(body) / 1e6:.1f} MB")
+
+    baseline = None
+    for mode in ("model", "lazy", "raw"):
+        kwargs = {"raw": True} if mode == "raw" else {"lazy": True} if mode == "lazy" else {}
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            messages = client.sessions.messages("ses_bench", **kwargs)
+            _read_fields(messages, raw=mode == "raw")
+            best = min(best, time.perf_counter() - start)
+            del messages
+
+        tracemalloc.start()
+        messages = client.sessions.messages("ses_bench", **kwargs)
+        _read_fields(messages, raw=mode == "raw")
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del messages
+
+        baseline = baseline or best
+        print(
+            f"{mode:<6} time={best * 1000:8.1f} ms  "
+            f"peak={peak / 1e6:7.1f} MB  speedup={baseline / best:5.2f}x"
+        )
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+SSE 解析器微基准测试。
+
+对比旧实现（``aiter_lines`` + ``strip`` + 字符串拼接）与字节级增量解析器
+:class:`~opencode_sdk.sse_parser.SSEParser` 的事件吞吐量（只测分帧，不含 JSON 解析）。
+注意旧实现直接忽略 ``id:`` 行，而新解析器会记录 Last-Event-ID，
+因此带 id 的场景下新解析器做了更多工作。
+
+运行::
+
+    python -m benchmarks.bench_sse_parser
+"""
+
+import asyncio
+import json
+import time
+from typing import AsyncIterator, List, Optional
+
+import httpx
+
+from opencode_sdk.sse_parser import SSEParser
+
+
+class _ChunkStream(httpx.AsyncByteStream):
+    """按固定大小切块输出的响应流，模拟网络读取。"""
+
+    def __init__(self, payload: bytes, chunk_size: int) -> None:
+        self._payload = payload
+        self._chunk_size = chunk_size
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        payload, size = self._payload, self._chunk_size
+        for i in range(0, len(payload), size):
+            yield payload[i:i + size]
+
+
+def _response(payload: bytes, chunk_size: int) -> httpx.Response:
+    return httpx.Response(
+        200,
+        headers={"content-type": "text/event-stream"},
+        stream=_ChunkStream(payload, chunk_size),
+    )
+
+
+async def _legacy(response: httpx.Response) -> int:
+    """旧实现：逐行 strip 并用字符串拼接 data。"""
+    count = 0
+    event_type: Optional[str] = None
+    event_data = ""
+    async for line in response.aiter_lines():
+        line = line.strip()
+        if not line:
+            if event_data:
+                count += 1
+                event_type = None
+                event_data = ""
+            continue
+        if line.startswith("event:"):
+            event_type = line[6:].strip()
+        elif line.startswith("data:"):
+            data = line[5:].strip()
+            if event_data:
+                event_data += "\n" + data
+            else:
+                event_data = data
+    return count
+
+
+async def _incremental(response: httpx.Response) -> int:
+    """新实现：字节块直接送入增量解析器。"""
+    count = 0
+    parser = SSEParser()
+    async for chunk in response.aiter_bytes():
+        count += len(parser.feed(chunk))
+    return count
+
+
+def delta_stream(events: int, with_ids: bool = False) -> bytes:
+    """大量小型 message.part.delta 事件（OpenCode 默认只发送 data 字段）。"""
+    frames: List[bytes] = []
+    for i in range(events):
+        payload = {
+            "type": "message.part.delta",
+            "properties": {
+                "sessionID": "ses_bench",
+                "messageID": "msg_bench",
+                "partID": "prt_bench",
+                "field": "text",
+                "delta": f"token {i} ",
+            },
+        }
+        prefix = f"id: {i}\n" if with_ids else ""
+        frames.append(f"{prefix}data: {json.dumps(payload)}\n\n".encode())
+    return b"".join(frames)
+
+
+def multiline_stream(events: int, lines: int, width: int) -> bytes:
+    """每个事件包含多行 data（例如携带完整工具输出的 message.updated）。"""
+    line = b"data: " + b"x" * width + b"\n"
+    frame = line * lines + b"\n"
+    return frame * events
+
+
+async def _measure(name: str, payload: bytes, chunk_size: int, repeat: int = 3) -> None:
+    results = {}
+    for label, impl in (("legacy", _legacy), ("incremental", _incremental)):
+        best = float("inf")
+        count = 0
+        for _ in range(repeat):
+            response = _response(payload, chunk_size)
+            start = time.perf_counter()
+            count = await impl(response)
+            best = min(best, time.perf_counter() - start)
+        results[label] = (count, best)
+
+    legacy_count, legacy_time = results["legacy"]
+    new_count, new_time = results["incremental"]
+    assert legacy_count == new_count, (legacy_count, new_count)
+    print(
+        f"{name:<28} events={new_count:>7}  "
+        f"legacy={legacy_count / legacy_time:>12,.0f} ev/s  "
+        f"incremental={new_count / new_time:>12,.0f} ev/s  "
+        f"speedup={legacy_time / new_time:5.2f}x"
+    )
+
+
+async def main() -> None:
+    await _measure("delta (4 KiB chunks)", delta_stream(50_000), 4096)
+    await _measure("delta (64 KiB chunks)", delta_stream(50_000), 65536)
+    await _measure("delta + id (4 KiB chunks)", delta_stream(50_000, with_ids=True), 4096)
+    await _measure("multiline 2000x120B", multiline_stream(20, 2000, 120), 16384)
+    await _measure("multiline 20000x80B", multiline_stream(2, 20000, 80), 16384)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,168 @@
+"""
+TCP 回环与 Unix 域套接字传输基准测试。
+
+在独立进程中分别启动监听 TCP 回环地址和 Unix 域套接字的同一个测试服务器，
+对比两种 ``transport`` 下：
+
+- 单线程顺序请求的延迟（p50 / p99）
+- 多线程并发请求的吞吐量
+- ``/event`` SSE 事件流的接收速率
+
+运行::
+
+    python -m benchmarks.bench_transport
+"""
+
+import asyncio
+import json
+import multiprocessing
+import os
+import statistics
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from socketserver import ThreadingUnixStreamServer
+from typing import Any, Dict, List, Optional, Tuple
+
+from opencode_sdk import OpencodeClient
+from opencode_sdk.sse_client import SSEClient
+
+_BODY = json.dumps({"type": "text", "content": "x = 1\n" * 200}).encode()
+_EVENT = (
+    b"data: "
+    + json.dumps({"type": "server.connected", "properties": {"delta": "token " * 8}}).encode()
+    + b"\n\n"
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # 头和正文分两次写出，复用连接时 Nagle + 延迟 ACK 会让每个响应多等约 40ms
+    disable_nagle_algorithm = True
+    events = 0
+
+    def address_string(self) -> str:
+        # Unix 域套接字的 client_address 是空字符串
+        return "local"
+
+    def do_GET(self) -> None:  # noqa: N802
+        if self.path.startswith("/event"):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            batch = _EVENT * 100
+            for _ in range(self.events // 100):
+                self.wfile.write(batch)
+            self.close_connection = True
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(_BODY)))
+        self.end_headers()
+        self.wfile.write(_BODY)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+class _UnixHandler(_Handler):
+    # Unix 域套接字不支持 TCP_NODELAY，也没有 Nagle 算法
+    disable_nagle_algorithm = False
+
+
+class _UnixHTTPServer(ThreadingUnixStreamServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+def _serve_forever(address: Optional[str], port: Any, events: int) -> None:
+    _Handler.events = events
+    server: Any
+    if address is None:
+        ThreadingHTTPServer.request_queue_size = 1024
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        server.daemon_threads = True
+        port.value = server.server_address[1]
+    else:
+        server = _UnixHTTPServer(address, _UnixHandler)
+        port.value = 1
+    server.serve_forever()
+
+
+def _serve(address: Optional[str], events: int) -> Tuple[multiprocessing.Process, int]:
+    port = multiprocessing.Value("i", 0)
+    process = multiprocessing.Process(target=_serve_forever, args=(address, port, events), daemon=True)
+    process.start()
+    while not port.value:
+        time.sleep(0.01)
+    return process, port.value
+
+
+def _latency(client: OpencodeClient, requests: int) -> List[float]:
+    http = client._http_client
+    http.get("/file/content", params={"path": "warmup"})
+    samples = []
+    for i in range(requests):
+        start = time.perf_counter()
+        http.get("/file/content", params={"path": f"f{i}"})
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _throughput(client: OpencodeClient, requests: int, workers: int) -> float:
+    http = client._http_client
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(lambda i: http.get("/file/content", params={"path": f"f{i}"}), range(requests)))
+    return requests / (time.perf_counter() - start)
+
+
+async def _stream(base_url: str, transport: Optional[str]) -> float:
+    count = 0
+    start = time.perf_counter()
+    async with SSEClient(base_url, transport=transport) as client:
+        async for _ in client.connect("/event"):
+            count += 1
+    return count / (time.perf_counter() - start)
+
+
+def _bench(base_url: str, transport: Optional[str], requests: int, workers: int) -> Dict[str, float]:
+    options = {"max_connections": workers, "max_keepalive_connections": workers}
+    with OpencodeClient(base_url=base_url, timeout=30, transport=transport, **options) as client:
+        samples = sorted(_latency(client, requests))
+        rate = _throughput(client, requests * 4, workers)
+    return {
+        "p50": statistics.median(samples) * 1e6,
+        "p99": samples[int(len(samples) * 0.99)] * 1e6,
+        "rps": rate,
+        "eps": asyncio.run(_stream(base_url, transport)),
+    }
+
+
+def main(requests: int = 2000, workers: int = 16, events: int = 50000) -> None:
+    tcp_server, port = _serve(None, events)
+    sock_dir = tempfile.mkdtemp()
+    sock_path = os.path.join(sock_dir, "opencode.sock")
+    uds_server, _ = _serve(sock_path, events)
+    while not os.path.exists(sock_path):
+        time.sleep(0.01)
+
+    results = [
+        ("TCP 127.0.0.1", _bench(f"http://127.0.0.1:{port}", None, requests, workers)),
+        ("Unix 域套接字", _bench("http://localhost", f"unix://{sock_path}", requests, workers)),
+    ]
+    print(f"顺序 {requests} 个请求 / 并发 {requests * 4} 个请求（{workers} 线程）/ SSE {events} 个事件")
+    print(f"{'传输':<16}{'p50 (µs)':>10}{'p99 (µs)':>10}{'req/s':>10}{'事件/s':>10}")
+    for name, r in results:
+        print(f"{name:<16}{r['p50']:>10.0f}{r['p99']:>10.0f}{r['rps']:>10,.0f}{r['eps']:>10,.0f}")
+
+    tcp_server.terminate()
+    uds_server.terminate()
+    os.unlink(sock_path)
+    os.rmdir(sock_dir)
+
+
+if __name__ == "__main__":
+    main()
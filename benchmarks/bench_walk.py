@@ -0,0 +1,146 @@
+"""
+目录遍历基准测试。
+
+在独立进程中启动一个模拟 ``GET /file`` 的测试服务器，提供一棵合成目录树
+（3 层、每层 10 个子目录，最底层每个目录 100 个文件，共 100,000 个文件和 1,110 个目录）。
+服务器为每个请求加上固定延迟，模拟远程服务器的网络往返和文件系统开销。比较：
+
+- ``files.list(recursive=True)`` 一次返回整棵树
+- ``files.walk(concurrency=1)``，即逐个目录串行遍历
+- ``files.walk()`` 在不同并发数下的遍历速度
+
+运行::
+
+    python -m benchmarks.bench_walk
+"""
+
+import json
+import multiprocessing
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from opencode_sdk import OpencodeClient
+
+_FANOUT = 10
+_LEVELS = 3
+_FILES = 100
+_ROOT = "/repo"
+
+
+def _node(path: str, kind: str) -> Dict[str, Any]:
+    return {
+        "name": path.rsplit("/", 1)[-1],
+        "path": path,
+        "absolute": f"{_ROOT}/{path}",
+        "type": kind,
+        "ignored": False,
+    }
+
+
+def _children(path: str) -> List[Dict[str, Any]]:
+    depth = 0 if path == "." else path.count("/") + 1
+    prefix = "" if path == "." else path + "/"
+    if depth < _LEVELS:
+        return [_node(f"{prefix}d{i}", "directory") for i in range(_FANOUT)]
+    if depth == _LEVELS:
+        return [_node(f"{prefix}f{i:03d}.py", "file") for i in range(_FILES)]
+    return []
+
+
+def _tree() -> Tuple[Dict[str, bytes], bytes]:
+    """预先生成每个目录的响应和整棵树的递归响应。"""
+    listings: Dict[str, bytes] = {}
+    everything: List[Dict[str, Any]] = []
+    pending = ["."]
+    while pending:
+        path = pending.pop()
+        children = _children(path)
+        listings[path] = json.dumps(children).encode()
+        everything.extend(children)
+        pending.extend(c["path"] for c in children if c["type"] == "directory")
+    return listings, json.dumps(everything).encode()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    listings: Dict[str, bytes] = {}
+    recursive: bytes = b"[]"
+    latency = 0.0
+
+    def do_GET(self) -> None:  # noqa: N802
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        path = query.get("path", ["."])[0]
+        if query.get("recursive", ["false"])[0] == "true":
+            body = self.recursive
+        else:
+            body = self.listings.get(path, b"[]")
+        if self.latency:
+            time.sleep(self.latency)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+def _serve_forever(port: Any, latency: float) -> None:
+    _Handler.listings, _Handler.recursive = _tree()
+    _Handler.latency = latency
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    port.value = server.server_address[1]
+    server.serve_forever()
+
+
+def _serve(latency: float) -> Tuple[multiprocessing.Process, str]:
+    ThreadingHTTPServer.request_queue_size = 1024
+    port = multiprocessing.Value("i", 0)
+    process = multiprocessing.Process(target=_serve_forever, args=(port, latency), daemon=True)
+    process.start()
+    while not port.value:
+        time.sleep(0.01)
+    return process, f"http://127.0.0.1:{port.value}"
+
+
+def _report(name: str, nodes: int, elapsed: float, first: float) -> None:
+    print(
+        f"{name:<28} {nodes:>8,} 个节点  {elapsed:>7.2f} s  "
+        f"{nodes / elapsed:>10,.0f} 节点/s  首批 {first * 1000:>7.1f} ms"
+    )
+
+
+def main(latency: float = 0.005, levels: Tuple[int, ...] = (1, 8, 32, 64)) -> None:
+    server, base_url = _serve(latency)
+    print(f"合成目录树：{_FANOUT ** _LEVELS * _FILES:,} 个文件，服务器延迟 {latency * 1000:.0f} ms/请求")
+    limit = max(levels)
+    with OpencodeClient(
+        base_url=base_url, timeout=120, max_connections=limit, max_keepalive_connections=limit
+    ) as client:
+        client.files.list()  # 预热
+
+        start = time.perf_counter()
+        nodes = client.files.list(recursive=True)
+        elapsed = time.perf_counter() - start
+        _report("list(recursive=True)", len(nodes), elapsed, elapsed)
+
+        for concurrency in levels:
+            start = time.perf_counter()
+            first = 0.0
+            count = 0
+            for _ in client.files.walk(concurrency=concurrency):
+                if not count:
+                    first = time.perf_counter() - start
+                count += 1
+            _report(f"walk(concurrency={concurrency})", count, time.perf_counter() - start, first)
+    server.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+"""
+进程内模拟 OpenCode 服务器。
+
+基于 ``httpx.MockTransport``，不经过网络，按 OpenCode 服务器的真实格式回放以下端点的负载：
+
+- ``GET /session/{id}/message``：带 step / text / tool part 的助手消息列表
+- ``POST /session/{id}/message``：一条完整的助手回复
+- ``GET /file/read``：源代码文件内容
+- ``GET /find/text``：ripgrep 风格的搜索结果
+- ``GET /event``、``GET /global/event``：一轮轮对话产生的 SSE 事件流（按块输出）
+
+响应体在构造时预先编码，请求处理只做路由，测得的是 SDK 自身（请求构造、JSON 解码、
+模型校验、SSE 解析）的开销。同一个 transport 同时支持同步和异步客户端::
+
+    server = MockOpencodeServer()
+    client = OpencodeClient(base_url=server.base_url)
+    client._http_client.client = server.client()
+"""
+
+import json
+import re
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+import httpx
+
+_SESSION = "ses_bench"
+_JSON = {"content-type": "application/json"}
+
+_MESSAGE_PATH = re.compile(r"^/session/([^/]+)/message$")
+
+
+def _tokens() -> Dict[str, Any]:
+    return {"input": 1200, "output": 300, "reasoning": 0, "cache": {"read": 800, "write": 0}}
+
+
+def assistant_info(i: int, completed: bool = True) -> Dict[str, Any]:
+    """助手消息的 info 部分。"""
+    info: Dict[str, Any] = {
+        "id": f"msg_{i:06d}",
+        "sessionID": _SESSION,
+        "role": "assistant",
+        "time": {"created": 1_700_000_000_000 + i * 1000},
+        "parentID": f"msg_{i - 1:06d}",
+        "modelID": "claude-sonnet",
+        "providerID": "anthropic",
+        "mode": "build",
+        "path": {"cwd": "/data/workspace", "root": "/data/workspace"},
+        "cost": 0.0,
+        "tokens": _tokens(),
+    }
+    if completed:
+        info["time"]["completed"] = info["time"]["created"] + 850
+        info["cost"] = 0.0042
+        info["finish"] = "tool-calls"
+    return info
+
+
+def _tool_state(status: str) -> Dict[str, Any]:
+    state: Dict[str, Any] = {"status": status, "input": {"filePath": "/data/workspace/src/app.py"}}
+    if status == "pending":
+        state["raw"] = '{"filePath": "/data/workspace/src/app.py"}'
+    elif status == "running":
+        state["time"] = {"start": 1_700_000_000_100}
+    elif status == "completed":
+        state.update(
+            output="".join(f"{n:>5}\tdef handler_{n}(request):\n" for n in range(1, 61)),
+            title="src/app.py",
+            metadata={"preview": "def handler_1(request):"},
+            time={"start": 1_700_000_000_100, "end": 1_700_000_000_180},
+        )
+    return state
+
+
+def assistant_parts(i: int) -> List[Dict[str, Any]]:
+    """一条助手消息的 part：step-start、推理、文本、工具调用和 step-finish。"""
+    base = {"sessionID": _SESSION, "messageID": f"msg_{i:06d}"}
+    return [
+        {**base, "id": f"prt_{i}_0", "type": "step-start"},
+        {
+            **base,
+            "id": f"prt_{i}_1",
+            "type": "reasoning",
+            "text": "Need to inspect the request handlers before changing the router. " * 3,
+            "time": {"start": 1, "end": 2},
+        },
+        {
+            **base,
+            "id": f"prt_{i}_2",
+            "type": "text",
+            "text": "I'll read `src/app.py` to see how the handlers are registered. " * 6,
+            "time": {"start": 2, "end": 3},
+        },
+        {
+            **base,
+            "id": f"prt_{i}_3",
+            "type": "tool",
+            "callID": f"toolu_{i:06d}",
+            "tool": "read",
+            "state": _tool_state("completed"),
+        },
+        {
+            **base,
+            "id": f"prt_{i}_4",
+            "type": "step-finish",
+            "reason": "tool-calls",
+            "cost": 0.0042,
+            "tokens": _tokens(),
+        },
+    ]
+
+
+def _message(i: int) -> Dict[str, Any]:
+    return {"info": assistant_info(i), "parts": assistant_parts(i)}
+
+
+def _event(payload: Dict[str, Any]) -> bytes:
+    return b"data: " + json.dumps(payload, separators=(",", ":")).encode() + b"\n\n"
+
+
+def _turn(i: int, deltas: int) -> List[bytes]:
+    """一轮对话的事件：忙碌、消息创建、part 更新、文本增量、工具状态变化、完成和空闲。"""
+    parts = assistant_parts(i)
+    text = parts[2]
+    events = [
+        {"type": "session.status", "properties": {"sessionID": _SESSION, "status": {"type": "busy"}}},
+        {"type": "message.updated", "properties": {"info": assistant_info(i, completed=False)}},
+        {"type": "message.part.updated", "properties": {"part": parts[0]}},
+        {"type": "message.part.updated", "properties": {"part": {**text, "text": ""}}},
+    ]
+    events.extend(
+        {
+            "type": "message.part.delta",
+            "properties": {
+                "sessionID": _SESSION,
+                "messageID": text["messageID"],
+                "partID": text["id"],
+                "field": "text",
+                "delta": f"token{n} ",
+            },
+        }
+        for n in range(deltas)
+    )
+    tool = parts[3]
+    for status in ("pending", "running", "completed"):
+        events.append(
+            {"type": "message.part.updated", "properties": {"part": {**tool, "state": _tool_state(status)}}}
+        )
+    events.extend([
+        {"type": "message.part.updated", "properties": {"part": parts[4]}},
+        {"type": "message.updated", "properties": {"info": assistant_info(i)}},
+        {"type": "session.status", "properties": {"sessionID": _SESSION, "status": {"type": "idle"}}},
+        {"type": "session.idle", "properties": {"sessionID": _SESSION}},
+    ])
+    return [_event(event) for event in events]
+
+
+def event_stream(events: int, deltas_per_turn: int = 50) -> bytes:
+    """
+    生成至少包含 ``events`` 个事件的 SSE 字节流。
+
+    以 ``server.connected`` 开头，之后是若干轮完整的对话事件。
+    """
+    frames = [_event({"type": "server.connected", "properties": {}})]
+    turn = 0
+    while len(frames) < events:
+        frames.extend(_turn(turn, deltas_per_turn))
+        turn += 1
+    return b"".join(frames[:events])
+
+
+class ChunkStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """按固定大小切块输出的响应体，模拟网络读取，同步和异步客户端均可使用。"""
+
+    def __init__(self, payload: bytes, chunk_size: int) -> None:
+        self._payload = payload
+        self._chunk_size = chunk_size
+
+    def __iter__(self) -> Iterator[bytes]:
+        payload, size = self._payload, self._chunk_size
+        for i in range(0, len(payload), size):
+            yield payload[i:i + size]
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for chunk in self:
+            yield chunk
+
+
+class MockOpencodeServer:
+    """
+    回放预先生成负载的模拟服务器。
+
+    Args:
+        messages: ``GET /session/{id}/message`` 返回的消息数
+        file_lines: ``/file/read`` 返回的文件行数
+        matches: ``/find/text`` 返回的匹配数
+        events: SSE 事件流包含的事件数
+        chunk_size: 流式响应每块的字节数
+    """
+
+    base_url = "http://opencode.bench"
+
+    def __init__(
+        self,
+        messages: int = 50,
+        file_lines: int = 400,
+        matches: int = 500,
+        events: int = 20_000,
+        chunk_size: int = 16 * 1024,
+    ) -> None:
+        self.chunk_size = chunk_size
+        self.messages_body = json.dumps([_message(i) for i in range(messages)]).encode()
+        self.prompt_body = json.dumps(_message(messages)).encode()
+        self.file_body = json.dumps({
+            "type": "text",
+            "content": "".join(
+                f"def handler_{n}(request):\n    return render(request, 'page_{n}.html')\n\n"
+                for n in range(file_lines // 3)
+            ),
+        }).encode()
+        self.find_body = json.dumps([
+            {
+                "path": {"text": f"src/module{n // 25}/views{n // 5}.py"},
+                "lines": {"text": f"    response = render(request, 'page_{n}.html')\n"},
+                "line_number": n % 300 + 1,
+                "absolute_offset": n * 72,
+                "submatches": [{"match": {"text": "render"}, "start": 15, "end": 21}],
+            }
+            for n in range(matches)
+        ]).encode()
+        self.event_body = event_stream(events)
+        self.events = events
+        self.requests = 0
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        """按方法和路径分派请求。"""
+        self.requests += 1
+        path = request.url.path
+        if _MESSAGE_PATH.match(path):
+            if request.method == "POST":
+                return httpx.Response(200, content=self.prompt_body, headers=_JSON)
+            return httpx.Response(200, content=self.messages_body, headers=_JSON)
+        if path == "/file/read":
+            return httpx.Response(200, content=self.file_body, headers=_JSON)
+        if path == "/find/text":
+            return httpx.Response(
+                200, headers=_JSON, stream=ChunkStream(self.find_body, self.chunk_size)
+            )
+        if path in ("/event", "/global/event"):
+            return httpx.Response(
+                200,
+                headers={"content-type": "text/event-stream"},
+                stream=ChunkStream(self.event_body, self.chunk_size),
+            )
+        return httpx.Response(404, json={"name": "NotFoundError", "data": {"message": path}})
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
+
+    def client(self, headers: Optional[Dict[str, str]] = None) -> httpx.Client:
+        """连接到本服务器的同步 httpx 客户端。"""
+        return httpx.Client(base_url=self.base_url, headers=headers, transport=self.transport())
+
+    def async_client(self, headers: Optional[Dict[str, str]] = None) -> httpx.AsyncClient:
+        """连接到本服务器的异步 httpx 客户端。"""
+        return httpx.AsyncClient(base_url=self.base_url, headers=headers, transport=self.transport())
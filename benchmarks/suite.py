@@ -0,0 +1,215 @@
+"""
+离线基准测试套件。
+
+所有场景都连接 :mod:`benchmarks.mock_server` 中的进程内模拟服务器，不需要运行中的
+OpenCode 服务器，结果只反映 SDK 自身的开销，适合跟踪版本间的性能回归。场景包括：
+
+- 同步客户端：``sessions.messages()``、``sessions.prompt()``、``files.read()``、
+  ``find.text()`` 和 ``find.text_stream()`` 的吞吐量与 p50 / p99 延迟
+- 异步客户端：同样的请求以固定并发度同时发出
+- SSE：只做分帧的 :class:`SSEParser`，以及分帧加事件模型解码的 ``SSEClient.connect()``
+
+每个场景在独立的子进程中运行，报告该进程的峰值 RSS。结果打印为表格，同时写入 JSON 文件
+（默认 ``benchmark-results.json``）。
+
+运行::
+
+    python -m benchmarks.suite [结果文件.json]
+"""
+
+import asyncio
+import json
+import platform
+import resource
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from multiprocessing import get_context
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from opencode_sdk import AsyncOpencodeClient, OpencodeClient, __version__
+from opencode_sdk.codec import get_codec
+from opencode_sdk.sse_client import SSEClient
+from opencode_sdk.sse_parser import SSEParser
+
+from .mock_server import MockOpencodeServer
+
+_PROMPT = [{"type": "text", "text": "Refactor the request handlers in src/app.py"}]
+
+# 同步 / 异步客户端的请求场景：名称 -> (请求次数, 调用函数)
+_REQUESTS: Dict[str, Any] = {
+    "session.messages": (500, lambda c: c.sessions.messages("ses_bench")),
+    "session.prompt": (2000, lambda c: c.sessions.prompt("ses_bench", parts=_PROMPT)),
+    "file.read": (3000, lambda c: c.files.read("src/app.py")),
+    "find.text": (500, lambda c: c.find.text("render")),
+}
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux 以 KB 为单位，macOS 以字节为单位
+    return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+
+
+def _latency_stats(samples: List[float], elapsed: float) -> Dict[str, float]:
+    samples.sort()
+    return {
+        "requests": len(samples),
+        "req_per_s": len(samples) / elapsed,
+        "p50_ms": statistics.median(samples) * 1000,
+        "p99_ms": samples[max(int(len(samples) * 0.99) - 1, 0)] * 1000,
+    }
+
+
+def _sync_client(server: MockOpencodeServer) -> OpencodeClient:
+    client = OpencodeClient(base_url=server.base_url)
+    client._http_client.client = server.client(client._http_client.default_headers)
+    return client
+
+
+def _async_client(server: MockOpencodeServer) -> AsyncOpencodeClient:
+    client = AsyncOpencodeClient(base_url=server.base_url)
+    client._http_client.client = server.async_client(client._http_client.default_headers)
+    return client
+
+
+def _run_sync(server: MockOpencodeServer, requests: int, call: Callable[[Any], Any]) -> Dict[str, float]:
+    with _sync_client(server) as client:
+        for _ in range(min(requests // 10, 50)):
+            call(client)
+        samples = []
+        start = time.perf_counter()
+        for _ in range(requests):
+            began = time.perf_counter()
+            call(client)
+            samples.append(time.perf_counter() - began)
+        return _latency_stats(samples, time.perf_counter() - start)
+
+
+async def _run_async(
+    server: MockOpencodeServer,
+    requests: int,
+    call: Callable[[Any], Awaitable[Any]],
+    concurrency: int = 16,
+) -> Dict[str, float]:
+    async with _async_client(server) as client:
+        await asyncio.gather(*(call(client) for _ in range(concurrency)))
+        samples: List[float] = []
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one() -> None:
+            async with semaphore:
+                began = time.perf_counter()
+                await call(client)
+                samples.append(time.perf_counter() - began)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(requests)))
+        stats = _latency_stats(samples, time.perf_counter() - start)
+        stats["concurrency"] = concurrency
+        return stats
+
+
+def _find_stream(server: MockOpencodeServer) -> Dict[str, float]:
+    return _run_sync(server, 500, lambda c: sum(1 for _ in c.find.text_stream("render")))
+
+
+def _sse_parser(server: MockOpencodeServer) -> Dict[str, float]:
+    body, size = server.event_body, server.chunk_size
+    chunks = [body[i:i + size] for i in range(0, len(body), size)]
+    best = float("inf")
+    count = 0
+    for _ in range(3):
+        parser = SSEParser()
+        start = time.perf_counter()
+        count = sum(len(parser.feed(chunk)) for chunk in chunks)
+        best = min(best, time.perf_counter() - start)
+    return {"events": count, "events_per_s": count / best, "mb_per_s": len(body) / best / 1e6}
+
+
+async def _sse_client(server: MockOpencodeServer) -> Dict[str, float]:
+    best = float("inf")
+    count = 0
+    async with server.async_client() as http:
+        for _ in range(3):
+            count = 0
+            start = time.perf_counter()
+            async with SSEClient(server.base_url, client=http) as sse:
+                async for _ in sse.connect("/event"):
+                    count += 1
+            best = min(best, time.perf_counter() - start)
+    return {"events": count, "events_per_s": count / best}
+
+
+def _scenario(name: str) -> Dict[str, Any]:
+    """在当前进程中运行一个场景，返回指标和峰值 RSS。"""
+    server = MockOpencodeServer()
+    kind, _, endpoint = name.partition(".")
+    if name == "sync.find.text_stream":
+        stats = _find_stream(server)
+    elif kind == "sync":
+        requests, call = _REQUESTS[endpoint]
+        stats = _run_sync(server, requests, call)
+    elif kind == "async":
+        requests, call = _REQUESTS[endpoint]
+        stats = asyncio.run(_run_async(server, requests, call))
+    elif name == "sse.parser":
+        stats = _sse_parser(server)
+    else:
+        stats = asyncio.run(_sse_client(server))
+    stats["peak_rss_mb"] = _peak_rss_mb()
+    return stats
+
+
+SCENARIOS = (
+    [f"sync.{endpoint}" for endpoint in _REQUESTS]
+    + ["sync.find.text_stream"]
+    + [f"async.{endpoint}" for endpoint in _REQUESTS]
+    + ["sse.parser", "sse.client"]
+)
+
+
+def _format(stats: Dict[str, Any]) -> str:
+    if "events_per_s" in stats:
+        return f"{stats['events_per_s']:>12,.0f} 事件/s {'':>22}"
+    return (
+        f"{stats['req_per_s']:>12,.0f} req/s  "
+        f"p50 {stats['p50_ms']:>6.3f} ms  p99 {stats['p99_ms']:>6.3f} ms"
+    )
+
+
+def main(output: Optional[str] = "benchmark-results.json") -> Dict[str, Any]:
+    server = MockOpencodeServer()
+    print(
+        f"opencode-sdk {__version__}，编解码器 {get_codec().name}，Python {platform.python_version()}；"
+        f"消息列表 {len(server.messages_body) / 1024:.0f} KB，文件 {len(server.file_body) / 1024:.0f} KB，"
+        f"搜索结果 {len(server.find_body) / 1024:.0f} KB，SSE {server.events:,} 个事件"
+    )
+    results: Dict[str, Any] = {}
+    # 每个场景使用全新的子进程，峰值 RSS 互不影响
+    context = get_context("spawn")
+    for name in SCENARIOS:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            stats = pool.submit(_scenario, name).result()
+        results[name] = stats
+        print(f"{name:<24} {_format(stats)}  RSS 峰值 {stats['peak_rss_mb']:>6.1f} MB")
+
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "sdk_version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "codec": get_codec().name,
+        "results": results,
+    }
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"结果已写入 {output}")
+    return report
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2])
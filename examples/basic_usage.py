@@ -3,10 +3,7 @@
 from opencode_sdk import OpencodeClient
 
 # 创建客户端
-client = OpencodeClient(
-    base_url="http://localhost:8000",
-    directory="/path/to/your/project"
-)
+client = OpencodeClient(base_url="http://localhost:8000", directory="/path/to/your/project")
 
 print("OpenCode Python SDK - 基础使用示例")
 print("=" * 50)
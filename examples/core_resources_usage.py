@@ -6,10 +6,7 @@
 from opencode_sdk import OpencodeClient
 
 # 创建客户端
-client = OpencodeClient(
-    base_url="http://localhost:8000",
-    directory="/path/to/your/project"
-)
+client = OpencodeClient(base_url="http://localhost:8000", directory="/path/to/your/project")
 
 print("=" * 60)
 print("OpenCode Python SDK - 核心资源使用示例")
@@ -26,13 +23,13 @@ try:
     print(f"找到 {len(projects)} 个项目:")
     for project in projects[:3]:  # 只显示前3个
         print(f"  - {project.get('name', 'N/A')}: {project.get('path', 'N/A')}")
-    
+
     # 获取当前项目
     current_project = client.projects.current()
     print(f"\n当前项目:")
     print(f"  名称: {current_project.get('name', 'N/A')}")
     print(f"  路径: {current_project.get('path', 'N/A')}")
-    
+
 except Exception as e:
     print(f"错误: {e}")
 
@@ -49,20 +46,20 @@ try:
     print(f"  默认提供商: {config.default_provider_id}")
     print(f"  默认模型: {config.default_model_id}")
     print(f"  代理: {config.agent_id if config.agent_id else '未设置'}")
-    
+
     # 列出提供商配置
     providers_config = client.config.providers()
     print(f"\n已配置的提供商: {len(providers_config)} 个")
     for provider in providers_config[:3]:
         print(f"  - {provider.get('id', 'N/A')}: {provider.get('name', 'N/A')}")
-    
+
     # 更新配置（示例，取消注释以执行）
     # updated_config = client.config.update(
     #     default_provider_id="anthropic",
     #     default_model_id="claude-3-5-sonnet-20241022"
     # )
     # print(f"\n✅ 配置已更新")
-    
+
 except Exception as e:
     print(f"错误: {e}")
 
@@ -82,7 +79,7 @@ try:
         # 显示前3个模型
         for model in provider.models[:3]:
             print(f"       - {model.id}")
-    
+
     # 获取认证方法
     auth_methods = client.providers.auth()
     print(f"\n认证方法:")
@@ -90,7 +87,7 @@ try:
         print(f"  {provider_id}:")
         for method in methods:
             print(f"    - {method.type}")
-    
+
 except Exception as e:
     print(f"错误: {e}")
 
@@ -107,18 +104,18 @@ try:
     for file in files[:5]:  # 只显示前5个
         file_type = "📁" if file.is_directory else "📄"
         print(f"  {file_type} {file.name}")
-    
+
     # 读取文件（示例）
     # content = client.files.read("README.md")
     # print(f"\nREADME.md 内容:")
     # print(content.content[:200] + "...")
-    
+
     # 获取文件状态
     status = client.files.status()
     print(f"\n文件状态:")
     print(f"  修改的文件: {len(status.get('modified', []))} 个")
     print(f"  未跟踪的文件: {len(status.get('untracked', []))} 个")
-    
+
 except Exception as e:
     print(f"错误: {e}")
 
@@ -136,14 +133,14 @@ try:
     for result in results[:3]:
         print(f"  📄 {result.get('path', 'N/A')}:{result.get('line', 'N/A')}")
         print(f"     {result.get('text', 'N/A')[:60]}...")
-    
+
     # 搜索文件
     print(f"\n搜索文件 '*.py':")
     files = client.find.files("*.py", max_results=5)
     print(f"找到 {len(files)} 个文件:")
     for file in files[:3]:
         print(f"  📄 {file.get('path', 'N/A')}")
-    
+
     # 搜索符号
     print(f"\n搜索符号 'main':")
     symbols = client.find.symbols("main", max_results=5)
@@ -151,7 +148,7 @@ try:
     for symbol in symbols[:3]:
         print(f"  🔧 {symbol.get('name', 'N/A')} ({symbol.get('kind', 'N/A')})")
         print(f"     位置: {symbol.get('path', 'N/A')}")
-    
+
 except Exception as e:
     print(f"错误: {e}")
 
@@ -164,33 +161,33 @@ print("-" * 60)
 try:
     # 获取配置
     config = client.config.get()
-    
+
     # 使用配置创建会话
     session = client.sessions.create(
         name="综合示例会话",
         provider_id=config.default_provider_id,
-        model_id=config.default_model_id
+        model_id=config.default_model_id,
     )
     print(f"✅ 创建会话成功:")
     print(f"  会话 ID: {session.id}")
     print(f"  提供商: {session.provider_id}")
     print(f"  模型: {session.model_id}")
-    
+
     # 搜索项目中的文件
     files = client.find.files("*.md", max_results=3)
     if files:
         print(f"\n找到 {len(files)} 个 Markdown 文件:")
         for file in files:
             print(f"  - {file.get('path', 'N/A')}")
-    
+
     # 读取第一个文件（如果存在）
     if files:
-        first_file = files[0].get('path')
+        first_file = files[0].get("path")
         content = client.files.read(first_file)
         print(f"\n读取文件: {first_file}")
         print(f"  行数: {len(content.content.splitlines())}")
         print(f"  大小: {len(content.content)} 字节")
-    
+
 except Exception as e:
     print(f"错误: {e}")
 
@@ -214,7 +211,7 @@ try:
     print()
     print("  # 处理回调")
     print("  result = client.providers.oauth.callback('github', code='...')")
-    
+
 except Exception as e:
     print(f"错误: {e}")
 
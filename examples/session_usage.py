@@ -3,10 +3,7 @@
 from opencode_sdk import OpencodeClient
 
 # 创建客户端
-client = OpencodeClient(
-    base_url="http://localhost:8000",
-    directory="/path/to/your/project"
-)
+client = OpencodeClient(base_url="http://localhost:8000", directory="/path/to/your/project")
 
 print("=" * 60)
 print("OpenCode Python SDK - Session 资源使用示例")
@@ -30,16 +27,14 @@ print("2. 创建新会话")
 print("-" * 60)
 try:
     new_session = client.sessions.create(
-        name="Python SDK 测试会话",
-        provider_id="anthropic",
-        model_id="claude-3-5-sonnet-20241022"
+        name="Python SDK 测试会话", provider_id="anthropic", model_id="claude-3-5-sonnet-20241022"
     )
     print(f"✅ 创建成功!")
     print(f"  会话 ID: {new_session.id}")
     print(f"  会话名称: {new_session.name}")
     print(f"  提供商: {new_session.provider_id}")
     print(f"  模型: {new_session.model_id}")
-    
+
     # 保存会话 ID 供后续使用
     session_id = new_session.id
 except Exception as e:
@@ -66,11 +61,7 @@ print("4. 发送消息到会话")
 print("-" * 60)
 try:
     response = client.sessions.prompt(
-        session_id,
-        parts=[{
-            "type": "text",
-            "text": "你好！请简单介绍一下你自己。"
-        }]
+        session_id, parts=[{"type": "text", "text": "你好！请简单介绍一下你自己。"}]
     )
     print(f"✅ 消息发送成功!")
     print(f"  消息 ID: {response.id}")
@@ -99,11 +90,7 @@ print()
 print("6. 执行命令")
 print("-" * 60)
 try:
-    result = client.sessions.command(
-        session_id,
-        name="search",
-        args={"query": "TODO"}
-    )
+    result = client.sessions.command(session_id, name="search", args={"query": "TODO"})
     print(f"✅ 命令执行成功!")
     print(f"  结果: {result.parts[0].text[:100] if result.parts else 'N/A'}...")
 except Exception as e:
@@ -162,7 +149,7 @@ print("-" * 60)
 try:
     shared_session = client.sessions.share(session_id)
     print(f"✅ 会话已分享!")
-    if hasattr(shared_session, 'share_url'):
+    if hasattr(shared_session, "share_url"):
         print(f"  分享链接: {shared_session.share_url}")
 except Exception as e:
     print(f"错误: {e}")
@@ -187,10 +174,7 @@ print()
 print("12. 更新会话")
 print("-" * 60)
 try:
-    updated_session = client.sessions.update(
-        session_id,
-        name="Python SDK 测试会话（已更新）"
-    )
+    updated_session = client.sessions.update(session_id, name="Python SDK 测试会话（已更新）")
     print(f"✅ 会话已更新!")
     print(f"  新名称: {updated_session.name}")
 except Exception as e:
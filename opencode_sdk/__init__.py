@@ -4,7 +4,14 @@ OpenCode Python SDK
 OpenCode AI CLI 的 Python 客户端库。
 """
 
-from .client import OpencodeClient, create_opencode_client
+from .batch import PromptResult
+from .client import (
+    AsyncOpencodeClient,
+    OpencodeClient,
+    create_async_opencode_client,
+    create_opencode_client,
+)
+from .event_filter import EventFilter
 from .exceptions import (
     APIError,
     BadRequestError,
@@ -14,12 +21,31 @@ from .exceptions import (
     ProviderAuthError,
     UnknownError,
 )
+from .file_cache import FileCache, FileCacheStats
+from .find_index import FindIndex
+from .instrumentation import (
+    Instrumentation,
+    LatencyHistogram,
+    MetricsExporter,
+    RequestMetrics,
+    RequestRecord,
+    RouteSeries,
+)
+from .lazy import LazyModel
+from .line_reader import MappedLines
+from .retry import RetryPolicy, RetryStats
+from .session_store import SessionStore
+from .sse_client import ReconnectPolicy, SSEMetrics
+from .sse_replay import SSERecorder, SSEReplayer
+from .transcript import TranscriptAssembler
 from .version import __version__
 
 __all__ = [
     # 客户端
     "OpencodeClient",
     "create_opencode_client",
+    "AsyncOpencodeClient",
+    "create_async_opencode_client",
     # 异常
     "OpencodeException",
     "ProviderAuthError",
@@ -28,6 +54,33 @@ __all__ = [
     "BadRequestError",
     "MessageAbortedError",
     "UnknownError",
+    # 重试
+    "RetryPolicy",
+    "RetryStats",
+    # 请求指标
+    "Instrumentation",
+    "LatencyHistogram",
+    "MetricsExporter",
+    "RequestMetrics",
+    "RequestRecord",
+    "RouteSeries",
+    # 批量执行
+    "PromptResult",
+    # 本地缓存
+    "SessionStore",
+    "FileCache",
+    "FileCacheStats",
+    "FindIndex",
+    "MappedLines",
+    # 响应模式
+    "LazyModel",
+    # 事件流
+    "EventFilter",
+    "ReconnectPolicy",
+    "SSEMetrics",
+    "SSERecorder",
+    "SSEReplayer",
+    "TranscriptAssembler",
     # 版本
     "__version__",
 ]
@@ -0,0 +1,273 @@
+"""
+批量 prompt 执行。
+
+:func:`run_prompts` 和 :func:`arun_prompts` 以有限并发向多个会话发送 prompt，
+按完成顺序逐个产出 :class:`PromptResult`。单个任务失败或超时不会中断整批任务；
+超时或提前结束遍历时，仍在执行的会话会通过 ``abort`` 中止。
+
+一般通过 ``client.sessions.prompt_many()`` 使用。
+"""
+
+import asyncio
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .exceptions import OpencodeException, TimeoutError
+
+PromptJob = Union[
+    Tuple[str, List[Dict[str, Any]]],
+    Tuple[str, List[Dict[str, Any]], Dict[str, Any]],
+]
+"""批量任务：``(session_id, parts)`` 或 ``(session_id, parts, kwargs)``"""
+
+
+@dataclass
+class PromptResult:
+    """单个批量 prompt 任务的结果。"""
+
+    index: int
+    """任务在输入中的序号（从 0 开始）"""
+
+    session_id: str
+    """会话 ID"""
+
+    message: Optional[Any] = None
+    """AI 的响应消息，失败时为 None"""
+
+    error: Optional[BaseException] = None
+    """任务失败的原因；超时为 :class:`~opencode_sdk.exceptions.TimeoutError`"""
+
+    elapsed: float = 0.0
+    """任务从开始执行到完成（或超时）的耗时（秒）"""
+
+    @property
+    def ok(self) -> bool:
+        """任务是否成功。"""
+        return self.error is None
+
+
+def _normalize_job(job: PromptJob) -> Tuple[str, List[Dict[str, Any]], Dict[str, Any]]:
+    """把 ``(session_id, parts[, kwargs])`` 统一为三元组。"""
+    if len(job) == 2:
+        session_id, parts = job  # type: ignore[misc]
+        return session_id, parts, {}
+    if len(job) == 3:
+        session_id, parts, kwargs = job  # type: ignore[misc]
+        return session_id, parts, dict(kwargs or {})
+    raise ValueError(f"批量任务应为 (session_id, parts) 或 (session_id, parts, kwargs): {job!r}")
+
+
+def _check_args(concurrency: int, timeout: Optional[float]) -> None:
+    if concurrency <= 0:
+        raise ValueError("concurrency 必须为正整数")
+    if timeout is not None and timeout <= 0:
+        raise ValueError("timeout 必须为正数")
+
+
+def _timeout_error(timeout: Optional[float]) -> TimeoutError:
+    return TimeoutError(f"prompt 超过 {timeout} 秒未完成，已中止会话")
+
+
+class _Running:
+    """已提交到线程池的任务；``started`` 在工作线程真正开始执行时记录。"""
+
+    __slots__ = ("index", "session_id", "started")
+
+    def __init__(self, index: int, session_id: str) -> None:
+        self.index = index
+        self.session_id = session_id
+        self.started: Optional[float] = None
+
+
+def _abort_quietly(abort: Callable[[str], Any], session_id: str) -> None:
+    """中止会话；会话可能已经结束，忽略中止失败。"""
+    try:
+        abort(session_id)
+    except OpencodeException:
+        pass
+
+
+def run_prompts(
+    prompt: Callable[..., Any],
+    abort: Callable[[str], Any],
+    jobs: Iterable[PromptJob],
+    concurrency: int = 8,
+    timeout: Optional[float] = None,
+) -> Iterator[PromptResult]:
+    """
+    在线程池中以有限并发执行 prompt，按完成顺序产出结果。
+
+    ``jobs`` 按需读取，同时提交的任务不超过 ``concurrency`` 个，因此可以传入生成器。
+
+    Args:
+        prompt: 发送 prompt 的函数，签名同 ``SessionResource.prompt``
+        abort: 中止会话的函数，签名同 ``SessionResource.abort``
+        jobs: 批量任务
+        concurrency: 最大并发数
+        timeout: 单个任务的超时时间（秒），从任务开始执行时计时；None 表示不限
+
+    Yields:
+        PromptResult 对象
+    """
+    _check_args(concurrency, timeout)
+    pending = enumerate(jobs)
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="opencode-prompt")
+    running: Dict[Future, _Running] = {}
+
+    def call(job: _Running, parts: List[Dict[str, Any]], kwargs: Dict[str, Any]) -> Any:
+        job.started = time.monotonic()
+        return prompt(job.session_id, parts, **kwargs)
+
+    try:
+        exhausted = False
+        while True:
+            while not exhausted and len(running) < concurrency:
+                try:
+                    index, item = next(pending)
+                except StopIteration:
+                    exhausted = True
+                    break
+                session_id, parts, kwargs = _normalize_job(item)
+                job = _Running(index, session_id)
+                running[executor.submit(call, job, parts, kwargs)] = job
+            if not running:
+                return
+
+            wait_for: Optional[float] = None
+            if timeout is not None:
+                now = time.monotonic()
+                deadlines = [
+                    job.started + timeout for job in running.values() if job.started is not None
+                ]
+                # 还没开始执行的任务稍后再检查
+                wait_for = max(0.0, min(deadlines) - now) if deadlines else 0.05
+            done, _ = wait(running, timeout=wait_for, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                job = running.pop(future)
+                elapsed = time.monotonic() - (job.started or time.monotonic())
+                error = future.exception()
+                yield PromptResult(
+                    index=job.index,
+                    session_id=job.session_id,
+                    message=None if error is not None else future.result(),
+                    error=error,
+                    elapsed=elapsed,
+                )
+
+            if timeout is not None:
+                now = time.monotonic()
+                for future, job in list(running.items()):
+                    if job.started is not None and now - job.started >= timeout:
+                        # 中止后服务器会结束该请求，工作线程随之释放
+                        del running[future]
+                        _abort_quietly(abort, job.session_id)
+                        yield PromptResult(
+                            index=job.index,
+                            session_id=job.session_id,
+                            error=_timeout_error(timeout),
+                            elapsed=now - job.started,
+                        )
+    finally:
+        # 提前结束遍历：取消排队中的任务，中止正在执行的会话
+        for future, job in running.items():
+            if not future.done() and not future.cancel():
+                _abort_quietly(abort, job.session_id)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def _arun_one(
+    prompt: Callable[..., Awaitable[Any]],
+    abort: Callable[[str], Awaitable[Any]],
+    index: int,
+    session_id: str,
+    parts: List[Dict[str, Any]],
+    kwargs: Dict[str, Any],
+    timeout: Optional[float],
+) -> PromptResult:
+    started = time.monotonic()
+    message: Optional[Any] = None
+    error: Optional[BaseException] = None
+    try:
+        message = await asyncio.wait_for(prompt(session_id, parts, **kwargs), timeout)
+    except asyncio.TimeoutError:
+        await _aabort_quietly(abort, session_id)
+        error = _timeout_error(timeout)
+    except Exception as e:
+        error = e
+    return PromptResult(
+        index=index,
+        session_id=session_id,
+        message=message,
+        error=error,
+        elapsed=time.monotonic() - started,
+    )
+
+
+async def _aabort_quietly(abort: Callable[[str], Awaitable[Any]], session_id: str) -> None:
+    try:
+        await abort(session_id)
+    except OpencodeException:
+        pass
+
+
+async def arun_prompts(
+    prompt: Callable[..., Awaitable[Any]],
+    abort: Callable[[str], Awaitable[Any]],
+    jobs: Iterable[PromptJob],
+    concurrency: int = 8,
+    timeout: Optional[float] = None,
+) -> AsyncIterator[PromptResult]:
+    """
+    在事件循环中以有限并发执行 prompt，按完成顺序产出结果，参见 :func:`run_prompts`。
+
+    提前结束遍历（break 或 ``aclose()``）或外部取消时，会取消尚未完成的任务并中止对应会话。
+    """
+    _check_args(concurrency, timeout)
+    pending = enumerate(jobs)
+    running: Dict["asyncio.Task[PromptResult]", str] = {}
+    try:
+        exhausted = False
+        while True:
+            while not exhausted and len(running) < concurrency:
+                try:
+                    index, item = next(pending)
+                except StopIteration:
+                    exhausted = True
+                    break
+                session_id, parts, kwargs = _normalize_job(item)
+                task = asyncio.create_task(
+                    _arun_one(prompt, abort, index, session_id, parts, kwargs, timeout)
+                )
+                running[task] = session_id
+            if not running:
+                return
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                del running[task]
+                yield task.result()
+    finally:
+        unfinished = [(task, session_id) for task, session_id in running.items() if not task.done()]
+        for task, _ in unfinished:
+            task.cancel()
+        if unfinished:
+            await asyncio.gather(
+                *(task for task, _ in unfinished),
+                *(_aabort_quietly(abort, session_id) for _, session_id in unfinished),
+                return_exceptions=True,
+            )
@@ -2,8 +2,11 @@
 
 from typing import Any, Dict, Optional
 
-from .http_client import HttpClient
+from .http_client import AsyncHttpClient, HttpClient
+from .instrumentation import Instrumentation
 from .resources.base import BaseResource
+from .retry import RetryPolicy, RetryStats
+from .sse_replay import SSERecorder
 
 
 class OpencodeClient:
@@ -19,6 +22,17 @@ class OpencodeClient:
         directory: Optional[str] = None,
         timeout: Optional[float] = None,
         headers: Optional[Dict[str, str]] = None,
+        response_mode: str = "model",
+        retry: Optional[RetryPolicy] = None,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        http2: bool = False,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        write_timeout: Optional[float] = None,
+        pool_timeout: Optional[float] = None,
+        transport: Optional[str] = None,
     ) -> None:
         """
         初始化 OpenCode 客户端。
@@ -28,6 +42,24 @@ class OpencodeClient:
             directory: 项目目录路径（添加到 x-opencode-directory header）
             timeout: 请求超时时间（秒），None 表示无超时
             headers: 要包含在请求中的额外 headers
+            response_mode: 响应模式。"model"（默认）返回完整校验的模型；
+                "raw" 返回原始 JSON；"lazy" 返回字段按需校验的惰性视图。
+                单次调用可通过 ``raw=`` / ``lazy=`` 参数覆盖。目前只作用于
+                ``sessions`` 的 ``list`` / ``get`` / ``children`` / ``messages`` /
+                ``message`` / ``iter_messages``，其他接口总是返回完整校验的模型
+            retry: 重试策略（None 表示不重试）；单个资源可通过
+                ``with_retry()`` 覆盖，计数见 :attr:`retry_stats`
+            max_connections: 连接池最大连接数（默认 100），None 表示不限
+            max_keepalive_connections: 最多保持的空闲连接数（默认 20），None 表示不限
+            keepalive_expiry: 空闲连接保持时间（秒，默认 5.0）
+            http2: 是否启用 HTTP/2 多路复用（需要 ``pip install opencode-sdk[http2]``）
+            connect_timeout: 建立连接超时（秒），None 表示沿用 ``timeout``
+            read_timeout: 读取响应超时（秒），None 表示沿用 ``timeout``
+            write_timeout: 发送请求超时（秒），None 表示沿用 ``timeout``
+            pool_timeout: 等待空闲连接超时（秒），None 表示沿用 ``timeout``
+            transport: 连接方式。None（默认）通过 TCP 连接 ``base_url``；
+                "unix:///path/to/opencode.sock" 通过 Unix 域套接字连接同机的服务器，
+                请求和 SSE 事件流都走该套接字
 
         示例:
             >>> client = OpencodeClient(
@@ -40,95 +72,125 @@ class OpencodeClient:
             directory=directory,
             timeout=timeout,
             headers=headers,
+            response_mode=response_mode,
+            retry=retry,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            write_timeout=write_timeout,
+            pool_timeout=pool_timeout,
+            transport=transport,
         )
 
         # 初始化资源
         from .resources import (
-            SessionResource,
-            EventResource,
-            ProjectResource,
+            AppResource,
+            AuthResource,
+            CommandResource,
             ConfigResource,
-            ProviderResource,
+            EventResource,
             FileResource,
             FindResource,
-            McpResource,
+            FormatterResource,
+            GlobalResource,
+            InstanceResource,
             LspResource,
+            McpResource,
+            PathResource,
+            ProjectResource,
+            ProviderResource,
             PtyResource,
+            SessionResource,
             ToolResource,
             TuiResource,
-            AppResource,
-            CommandResource,
-            GlobalResource,
-            InstanceResource,
-            PathResource,
             VcsResource,
-            FormatterResource,
-            AuthResource,
         )
-        
+
         # ==================== 核心资源 ====================
         # 会话管理：创建、列表、更新、删除 AI 编码会话，发送消息
         self.sessions = SessionResource(self._http_client)
-        
+
         # 事件订阅：订阅实时事件流（SSE），接收流式响应
         self.events = EventResource(self._http_client)
-        
+
         # 项目管理：列出和管理项目
         self.projects = ProjectResource(self._http_client)
-        
+
         # 配置管理：获取和更新系统配置（模型、提供商等）
         self.config = ConfigResource(self._http_client)
-        
+
         # 提供商管理：管理 AI 提供商（如 OpenAI、Anthropic 等）
         self.providers = ProviderResource(self._http_client)
-        
+
         # 文件操作：读取、列表文件
         self.files = FileResource(self._http_client)
-        
+
         # 搜索功能：搜索文件、文本内容
         self.find = FindResource(self._http_client)
-        
+
         # ==================== 高级功能资源 ====================
         # MCP 集成：模型上下文协议（Model Context Protocol）服务器管理
         self.mcp = McpResource(self._http_client)
-        
+
         # LSP 集成：语言服务器协议（Language Server Protocol）
         self.lsp = LspResource(self._http_client)
-        
+
         # PTY 管理：伪终端（Pseudo-Terminal）会话管理
         self.pty = PtyResource(self._http_client)
-        
+
         # 工具管理：列出可用的工具（bash、read、write 等）
         self.tools = ToolResource(self._http_client)
-        
+
         # TUI 交互：终端用户界面（Terminal UI）交互
         self.tui = TuiResource(self._http_client)
-        
+
         # 应用管理：应用程序管理和日志
         self.app = AppResource(self._http_client)
-        
+
         # 命令管理：命令管理
         self.commands = CommandResource(self._http_client)
-        
+
         # ==================== 全局和系统资源 ====================
         # 全局资源：全局事件和系统级操作
         self.global_resource = GlobalResource(self._http_client)
-        
+
         # 实例管理：OpenCode 实例管理
         self.instance = InstanceResource(self._http_client)
-        
+
         # 路径管理：路径相关操作
         self.path = PathResource(self._http_client)
-        
+
         # 版本控制：Git 等版本控制系统集成
         self.vcs = VcsResource(self._http_client)
-        
+
         # 格式化工具：代码格式化工具管理
         self.formatter = FormatterResource(self._http_client)
-        
+
         # 认证管理：用户认证和授权
         self.auth = AuthResource(self._http_client)
 
+    @property
+    def retry_stats(self) -> RetryStats:
+        """所有资源共享的重试计数。"""
+        return self._http_client.retry_stats
+
+    @property
+    def instrumentation(self) -> Instrumentation:
+        """请求生命周期钩子、导出器和按路由汇总的延迟 / 字节指标。"""
+        return self._http_client.instrumentation
+
+    @property
+    def sse_recorder(self) -> Optional[SSERecorder]:
+        """录制事件流原始字节的 SSERecorder，对之后建立的事件流连接生效，None 表示不录制。"""
+        return self._http_client.sse_recorder
+
+    @sse_recorder.setter
+    def sse_recorder(self, recorder: Optional[SSERecorder]) -> None:
+        self._http_client.sse_recorder = recorder
+
     def close(self) -> None:
         """关闭客户端并释放资源。"""
         self._http_client.close()
@@ -147,6 +209,17 @@ def create_opencode_client(
     directory: Optional[str] = None,
     timeout: Optional[float] = None,
     headers: Optional[Dict[str, str]] = None,
+    response_mode: str = "model",
+    retry: Optional[RetryPolicy] = None,
+    max_connections: Optional[int] = 100,
+    max_keepalive_connections: Optional[int] = 20,
+    keepalive_expiry: Optional[float] = 5.0,
+    http2: bool = False,
+    connect_timeout: Optional[float] = None,
+    read_timeout: Optional[float] = None,
+    write_timeout: Optional[float] = None,
+    pool_timeout: Optional[float] = None,
+    transport: Optional[str] = None,
 ) -> OpencodeClient:
     """
     创建 OpenCode 客户端实例。
@@ -158,6 +231,17 @@ def create_opencode_client(
         directory: 项目目录路径
         timeout: 请求超时时间（秒）
         headers: 额外的 headers
+        response_mode: 响应模式（"model"、"raw" 或 "lazy"）
+        retry: 重试策略，None 表示不重试
+        max_connections: 连接池最大连接数
+        max_keepalive_connections: 最多保持的空闲连接数
+        keepalive_expiry: 空闲连接保持时间（秒）
+        http2: 是否启用 HTTP/2 多路复用
+        connect_timeout: 建立连接超时（秒）
+        read_timeout: 读取响应超时（秒）
+        write_timeout: 发送请求超时（秒）
+        pool_timeout: 等待空闲连接超时（秒）
+        transport: 连接方式（None 或 "unix:///path.sock"）
 
     Returns:
         OpencodeClient 实例
@@ -173,4 +257,235 @@ def create_opencode_client(
         directory=directory,
         timeout=timeout,
         headers=headers,
+        response_mode=response_mode,
+        retry=retry,
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+        http2=http2,
+        connect_timeout=connect_timeout,
+        read_timeout=read_timeout,
+        write_timeout=write_timeout,
+        pool_timeout=pool_timeout,
+        transport=transport,
+    )
+
+
+class AsyncOpencodeClient:
+    """
+    异步 OpenCode API 客户端。
+
+    与 :class:`OpencodeClient` 拥有相同的资源属性，所有方法均为协程。
+    全部资源（包括 SSE 事件订阅）共享同一个 ``httpx.AsyncClient`` 连接池，
+    单个进程即可在一个事件循环中驱动大量并发会话，无需线程。
+    """
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8000",
+        directory: Optional[str] = None,
+        timeout: Optional[float] = None,
+        headers: Optional[Dict[str, str]] = None,
+        response_mode: str = "model",
+        retry: Optional[RetryPolicy] = None,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        http2: bool = False,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        write_timeout: Optional[float] = None,
+        pool_timeout: Optional[float] = None,
+        transport: Optional[str] = None,
+    ) -> None:
+        """
+        初始化异步 OpenCode 客户端。
+
+        Args:
+            base_url: OpenCode 服务器的基础 URL（默认: http://localhost:8000）
+            directory: 项目目录路径（添加到 x-opencode-directory header）
+            timeout: 请求超时时间（秒），None 表示无超时
+            headers: 要包含在请求中的额外 headers
+            response_mode: 响应模式。"model"（默认）返回完整校验的模型；
+                "raw" 返回原始 JSON；"lazy" 返回字段按需校验的惰性视图。
+                单次调用可通过 ``raw=`` / ``lazy=`` 参数覆盖。目前只作用于
+                ``sessions`` 的 ``list`` / ``get`` / ``children`` / ``messages`` /
+                ``message`` / ``iter_messages``，其他接口总是返回完整校验的模型
+            retry: 重试策略（None 表示不重试）；单个资源可通过
+                ``with_retry()`` 覆盖，计数见 :attr:`retry_stats`
+            max_connections: 连接池最大连接数（默认 100），None 表示不限
+            max_keepalive_connections: 最多保持的空闲连接数（默认 20），None 表示不限
+            keepalive_expiry: 空闲连接保持时间（秒，默认 5.0）
+            http2: 是否启用 HTTP/2 多路复用（需要 ``pip install opencode-sdk[http2]``）
+            connect_timeout: 建立连接超时（秒），None 表示沿用 ``timeout``
+            read_timeout: 读取响应超时（秒），None 表示沿用 ``timeout``
+            write_timeout: 发送请求超时（秒），None 表示沿用 ``timeout``
+            pool_timeout: 等待空闲连接超时（秒），None 表示沿用 ``timeout``
+            transport: 连接方式。None（默认）通过 TCP 连接 ``base_url``；
+                "unix:///path/to/opencode.sock" 通过 Unix 域套接字连接同机的服务器，
+                请求和 SSE 事件流都走该套接字
+
+        示例:
+            >>> async with AsyncOpencodeClient(base_url="http://localhost:8000") as client:
+            ...     sessions = await client.sessions.list()
+        """
+        self._http_client = AsyncHttpClient(
+            base_url=base_url,
+            directory=directory,
+            timeout=timeout,
+            headers=headers,
+            response_mode=response_mode,
+            retry=retry,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            write_timeout=write_timeout,
+            pool_timeout=pool_timeout,
+            transport=transport,
+        )
+
+        from .resources import (
+            AsyncAppResource,
+            AsyncAuthResource,
+            AsyncCommandResource,
+            AsyncConfigResource,
+            AsyncEventResource,
+            AsyncFileResource,
+            AsyncFindResource,
+            AsyncFormatterResource,
+            AsyncGlobalResource,
+            AsyncInstanceResource,
+            AsyncLspResource,
+            AsyncMcpResource,
+            AsyncPathResource,
+            AsyncProjectResource,
+            AsyncProviderResource,
+            AsyncPtyResource,
+            AsyncSessionResource,
+            AsyncToolResource,
+            AsyncTuiResource,
+            AsyncVcsResource,
+        )
+
+        # ==================== 核心资源 ====================
+        self.sessions = AsyncSessionResource(self._http_client)
+        self.events = AsyncEventResource(self._http_client)
+        self.projects = AsyncProjectResource(self._http_client)
+        self.config = AsyncConfigResource(self._http_client)
+        self.providers = AsyncProviderResource(self._http_client)
+        self.files = AsyncFileResource(self._http_client)
+        self.find = AsyncFindResource(self._http_client)
+
+        # ==================== 高级功能资源 ====================
+        self.mcp = AsyncMcpResource(self._http_client)
+        self.lsp = AsyncLspResource(self._http_client)
+        self.pty = AsyncPtyResource(self._http_client)
+        self.tools = AsyncToolResource(self._http_client)
+        self.tui = AsyncTuiResource(self._http_client)
+        self.app = AsyncAppResource(self._http_client)
+        self.commands = AsyncCommandResource(self._http_client)
+
+        # ==================== 全局和系统资源 ====================
+        self.global_resource = AsyncGlobalResource(self._http_client)
+        self.instance = AsyncInstanceResource(self._http_client)
+        self.path = AsyncPathResource(self._http_client)
+        self.vcs = AsyncVcsResource(self._http_client)
+        self.formatter = AsyncFormatterResource(self._http_client)
+        self.auth = AsyncAuthResource(self._http_client)
+
+    @property
+    def retry_stats(self) -> RetryStats:
+        """所有资源共享的重试计数。"""
+        return self._http_client.retry_stats
+
+    @property
+    def instrumentation(self) -> Instrumentation:
+        """请求生命周期钩子、导出器和按路由汇总的延迟 / 字节指标。"""
+        return self._http_client.instrumentation
+
+    @property
+    def sse_recorder(self) -> Optional[SSERecorder]:
+        """录制事件流原始字节的 SSERecorder，对之后建立的事件流连接生效，None 表示不录制。"""
+        return self._http_client.sse_recorder
+
+    @sse_recorder.setter
+    def sse_recorder(self, recorder: Optional[SSERecorder]) -> None:
+        self._http_client.sse_recorder = recorder
+
+    async def aclose(self) -> None:
+        """关闭客户端并释放连接池。"""
+        await self._http_client.aclose()
+
+    async def __aenter__(self) -> "AsyncOpencodeClient":
+        """异步上下文管理器入口。"""
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """异步上下文管理器退出。"""
+        await self.aclose()
+
+
+def create_async_opencode_client(
+    base_url: str = "http://localhost:8000",
+    directory: Optional[str] = None,
+    timeout: Optional[float] = None,
+    headers: Optional[Dict[str, str]] = None,
+    response_mode: str = "model",
+    retry: Optional[RetryPolicy] = None,
+    max_connections: Optional[int] = 100,
+    max_keepalive_connections: Optional[int] = 20,
+    keepalive_expiry: Optional[float] = 5.0,
+    http2: bool = False,
+    connect_timeout: Optional[float] = None,
+    read_timeout: Optional[float] = None,
+    write_timeout: Optional[float] = None,
+    pool_timeout: Optional[float] = None,
+    transport: Optional[str] = None,
+) -> AsyncOpencodeClient:
+    """
+    创建异步 OpenCode 客户端实例。
+
+    Args:
+        base_url: OpenCode 服务器的基础 URL
+        directory: 项目目录路径
+        timeout: 请求超时时间（秒）
+        headers: 额外的 headers
+        response_mode: 响应模式（"model"、"raw" 或 "lazy"）
+        retry: 重试策略，None 表示不重试
+        max_connections: 连接池最大连接数
+        max_keepalive_connections: 最多保持的空闲连接数
+        keepalive_expiry: 空闲连接保持时间（秒）
+        http2: 是否启用 HTTP/2 多路复用
+        connect_timeout: 建立连接超时（秒）
+        read_timeout: 读取响应超时（秒）
+        write_timeout: 发送请求超时（秒）
+        pool_timeout: 等待空闲连接超时（秒）
+        transport: 连接方式（None 或 "unix:///path.sock"）
+
+    Returns:
+        AsyncOpencodeClient 实例
+
+    示例:
+        >>> client = create_async_opencode_client(base_url="http://localhost:8000")
+        >>> session = await client.sessions.create(title="新会话")
+    """
+    return AsyncOpencodeClient(
+        base_url=base_url,
+        directory=directory,
+        timeout=timeout,
+        headers=headers,
+        response_mode=response_mode,
+        retry=retry,
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+        http2=http2,
+        connect_timeout=connect_timeout,
+        read_timeout=read_timeout,
+        write_timeout=write_timeout,
+        pool_timeout=pool_timeout,
+        transport=transport,
     )
@@ -0,0 +1,141 @@
+"""
+JSON 编解码模块。
+
+HTTP 响应、请求体和 SSE 事件统一通过这里的编解码器处理。安装了
+``orjson`` 或 ``msgspec`` 时自动使用（``pip install opencode-sdk[fast]``），
+否则回退到标准库 ``json``。解码直接作用于字节，编码直接输出字节，
+省去中间的 ``str``。
+"""
+
+import json
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Union
+
+
+class JSONCodec(NamedTuple):
+    """一组 JSON 编解码函数。"""
+
+    name: str
+    """编解码器名称"""
+
+    loads: Callable[[Union[bytes, str]], Any]
+    """从字节（或字符串）解码 JSON；失败时抛出 ValueError 的子类"""
+
+    dumps: Callable[[Any], bytes]
+    """将对象编码为 UTF-8 JSON 字节"""
+
+
+def _stdlib_codec() -> JSONCodec:
+    def dumps(obj: Any) -> bytes:
+        # 与 httpx 的 json= 参数保持一致的紧凑输出
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode(
+            "utf-8"
+        )
+
+    return JSONCodec("json", json.loads, dumps)
+
+
+def _orjson_codec() -> JSONCodec:
+    import orjson
+
+    option = orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=option)
+
+    return JSONCodec("orjson", orjson.loads, dumps)
+
+
+def _msgspec_codec() -> JSONCodec:
+    import msgspec
+
+    decoder = msgspec.json.Decoder()
+    encoder = msgspec.json.Encoder()
+    return JSONCodec("msgspec", decoder.decode, encoder.encode)
+
+
+# 按优先级排列的可用编解码器
+_FACTORIES: Dict[str, Callable[[], JSONCodec]] = {
+    "orjson": _orjson_codec,
+    "msgspec": _msgspec_codec,
+    "json": _stdlib_codec,
+}
+
+
+def available_codecs() -> List[str]:
+    """
+    列出当前环境中可用的编解码器。
+
+    Returns:
+        编解码器名称列表，按自动选择的优先级排列
+    """
+    names = []
+    for name, factory in _FACTORIES.items():
+        try:
+            factory()
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def _load_codec(name: str) -> JSONCodec:
+    factory = _FACTORIES.get(name)
+    if factory is None:
+        raise ValueError(f"未知的 JSON 编解码器: {name!r}，可选值为 {', '.join(_FACTORIES)}")
+    return factory()
+
+
+def _auto_codec() -> JSONCodec:
+    for name in _FACTORIES:
+        try:
+            return _load_codec(name)
+        except ImportError:
+            continue
+    return _stdlib_codec()
+
+
+_codec: JSONCodec = _auto_codec()
+
+
+def get_codec() -> JSONCodec:
+    """返回当前使用的编解码器。"""
+    return _codec
+
+
+def set_codec(codec: Optional[Union[str, JSONCodec]] = None) -> JSONCodec:
+    """
+    切换全局使用的编解码器。
+
+    Args:
+        codec: 编解码器名称（``"orjson"``、``"msgspec"``、``"json"``）、
+            自定义 JSONCodec，或 None 表示重新自动选择
+
+    Returns:
+        生效的编解码器
+
+    Raises:
+        ValueError: 未知的编解码器名称
+        ImportError: 指定的编解码器未安装
+
+    Example:
+        >>> from opencode_sdk import codec
+        >>> codec.set_codec("json")  # 强制使用标准库
+    """
+    global _codec
+    if codec is None:
+        _codec = _auto_codec()
+    elif isinstance(codec, str):
+        _codec = _load_codec(codec)
+    else:
+        _codec = codec
+    return _codec
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """使用当前编解码器解码 JSON。"""
+    return _codec.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """使用当前编解码器将对象编码为 JSON 字节。"""
+    return _codec.dumps(obj)
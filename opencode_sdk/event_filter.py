@@ -0,0 +1,99 @@
+"""
+事件订阅过滤。
+
+:class:`EventFilter` 在 JSON 解析和模型校验之前，直接在 SSE ``data`` 字节上检查
+``type`` 和 ``sessionID`` 字段，跳过订阅者不关心的事件。只关心一个会话的消费者
+不再为同一目录下其他会话的 ``message.part.delta`` 付出解码开销。
+
+字节级检查是保守的：只有能确定事件不匹配时才丢弃，不确定的事件（例如不含
+``sessionID`` 字段的 ``session.updated``）照常解码，再由事件中心按会话和类型精确分发。
+"""
+
+import re
+from typing import Dict, FrozenSet, Iterable, Optional
+
+# 不依赖字段顺序和嵌套层级：只要任意一处取值匹配就保留事件
+_TYPE_FIELD = re.compile(rb'"type"\s*:\s*"([^"\\]*)"')
+_SESSION_FIELD = re.compile(rb'"sessionID"\s*:\s*"([^"\\]*)"')
+
+
+class EventFilter:
+    """
+    按事件类型和会话 ID 预过滤 SSE 事件帧。
+
+    Args:
+        session_ids: 只保留这些会话的事件，None 表示不限
+        event_types: 只保留这些类型的事件，None 表示不限
+
+    Example:
+        >>> f = EventFilter(session_ids=["ses_a"])
+        >>> f.matches(None, b'{"type":"message.part.delta","properties":{"sessionID":"ses_b"}}')
+        False
+    """
+
+    __slots__ = ("session_ids", "event_types", "_session_bytes", "_type_bytes")
+
+    def __init__(
+        self,
+        session_ids: Optional[Iterable[str]] = None,
+        event_types: Optional[Iterable[str]] = None,
+    ) -> None:
+        self.session_ids: Optional[FrozenSet[str]] = (
+            frozenset(session_ids) if session_ids is not None else None
+        )
+        self.event_types: Optional[FrozenSet[str]] = (
+            frozenset(event_types) if event_types is not None else None
+        )
+        self._session_bytes = (
+            frozenset(s.encode() for s in self.session_ids)
+            if self.session_ids is not None
+            else None
+        )
+        self._type_bytes = (
+            frozenset(t.encode() for t in self.event_types)
+            if self.event_types is not None
+            else None
+        )
+
+    def matches(self, event_type: Optional[str], data: bytes) -> bool:
+        """
+        判断事件帧是否可能匹配过滤条件。
+
+        Args:
+            event_type: ``event:`` 字段给出的类型，未指定时为 None
+            data: 事件数据（JSON 字节串）
+
+        Returns:
+            False 表示可以确定不匹配，跳过解码
+        """
+        types = self._type_bytes
+        if types is not None:
+            if event_type is not None:
+                if event_type.encode() not in types:
+                    return False
+            elif not any(value in types for value in _TYPE_FIELD.findall(data)):
+                return False
+
+        sessions = self._session_bytes
+        if sessions is not None:
+            values = _SESSION_FIELD.findall(data)
+            # 不带 sessionID 字段的事件（如 session.updated 的会话 ID 在 info.id 中）交给事件中心判断
+            if values and not any(value in sessions for value in values):
+                return False
+        return True
+
+    def params(self) -> Dict[str, str]:
+        """
+        请求服务器端过滤时附加的查询参数。
+
+        多个取值以逗号分隔；不支持这些参数的服务器会忽略它们，客户端的预过滤照常生效。
+        """
+        params = {}
+        if self.session_ids:
+            params["sessionID"] = ",".join(sorted(self.session_ids))
+        if self.event_types:
+            params["type"] = ",".join(sorted(self.event_types))
+        return params
+
+    def __repr__(self) -> str:
+        return f"EventFilter(session_ids={self.session_ids!r}, event_types={self.event_types!r})"
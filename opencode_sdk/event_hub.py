@@ -0,0 +1,404 @@
+"""
+事件中心模块。
+
+在同一个客户端、同一个端点（及目录）上只保持一条 SSE 连接，
+并通过有界 asyncio 队列把事件分发给各个订阅者。订阅者按会话 ID
+和事件类型注册，分发时只会触达相关的队列；所有订阅者都不关心的事件
+在解码前就由 :class:`~opencode_sdk.event_filter.EventFilter` 跳过。
+"""
+
+import asyncio
+import weakref
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Optional, Set, Tuple, Union
+
+from .event_filter import EventFilter
+from .models.events import Event
+from .sse_client import ReconnectPolicy, SSEClient, SSEMetrics
+
+# 订阅结束标记
+_CLOSED = object()
+
+
+def event_session_id(event: Any) -> Optional[str]:
+    """
+    提取事件所属的会话 ID。
+
+    Args:
+        event: 事件对象
+
+    Returns:
+        会话 ID；事件与具体会话无关时返回 None
+    """
+    properties = getattr(event, "properties", None)
+    if properties is None:
+        return None
+
+    session_id = getattr(properties, "session_id", None)
+    if session_id:
+        return session_id
+
+    # message.updated 事件的会话 ID 位于 info 中；session.* 事件的 info 为会话本身
+    info = getattr(properties, "info", None)
+    if info is not None:
+        if isinstance(info, dict):
+            return info.get("sessionID") or info.get("id")
+        return getattr(info, "session_id", None)
+
+    part = getattr(properties, "part", None)
+    if part is not None:
+        return getattr(part, "session_id", None)
+    return None
+
+
+class EventSubscription:
+    """
+    事件中心的单个订阅。
+
+    以异步迭代器的方式消费事件。队列满时丢弃最旧的事件并记入
+    ``dropped``，避免单个慢消费者拖慢整条连接。
+    """
+
+    def __init__(
+        self,
+        hub: "EventHub",
+        session_ids: Optional[FrozenSet[str]] = None,
+        event_types: Optional[FrozenSet[str]] = None,
+        maxsize: int = 10000,
+    ) -> None:
+        """
+        初始化订阅。
+
+        Args:
+            hub: 所属事件中心
+            session_ids: 只接收这些会话的事件，None 表示不限
+            event_types: 只接收这些类型的事件，None 表示不限
+            maxsize: 队列容量
+        """
+        self._hub = hub
+        self.session_ids = session_ids
+        self.event_types = event_types
+        self.dropped = 0
+        self._queue: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=maxsize)
+        self._closed = False
+
+    def _offer(self, item: Any) -> None:
+        """放入事件；队列已满时丢弃最旧的事件。"""
+        if self._closed:
+            return
+        if self._queue.full():
+            try:
+                self._queue.get_nowait()
+                self.dropped += 1
+            except asyncio.QueueEmpty:
+                pass
+        self._queue.put_nowait(item)
+
+    def _finish(self, error: Optional[BaseException] = None) -> None:
+        """由事件中心调用，结束订阅（可携带连接错误）。"""
+        if self._closed:
+            return
+        self._offer(error if error is not None else _CLOSED)
+        self._closed = True
+
+    def __aiter__(self) -> "EventSubscription":
+        return self
+
+    async def __anext__(self) -> Event:
+        if self._closed and self._queue.empty():
+            raise StopAsyncIteration
+        item = await self._queue.get()
+        if item is _CLOSED:
+            raise StopAsyncIteration
+        if isinstance(item, BaseException):
+            raise item
+        return item
+
+    async def aclose(self) -> None:
+        """取消订阅。最后一个订阅者离开时事件中心会关闭 SSE 连接。"""
+        if not self._closed:
+            self._closed = True
+        await self._hub._unsubscribe(self)
+
+    async def __aenter__(self) -> "EventSubscription":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+
+class EventHub:
+    """
+    多路复用的 SSE 事件中心。
+
+    第一个订阅者到来时建立连接，最后一个订阅者离开时断开连接。
+    事件只解析一次，再按会话 ID 和事件类型分发给订阅者。
+
+    Example:
+        >>> hub = EventHub(sse_factory, "/event", {"directory": "/data/workspace"})
+        >>> async with await hub.subscribe(session_id="ses_123") as events:
+        ...     async for event in events:
+        ...         print(event.type)
+    """
+
+    def __init__(
+        self,
+        sse_factory: Callable[[], SSEClient],
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        queue_size: int = 10000,
+        reconnect: Union[bool, ReconnectPolicy] = False,
+    ) -> None:
+        """
+        初始化事件中心。
+
+        Args:
+            sse_factory: 创建 SSE 客户端的工厂函数
+            url: SSE 端点 URL（相对路径）
+            params: 查询参数
+            queue_size: 每个订阅者队列的默认容量
+            reconnect: 连接断开时是否自动重连（可传入 ReconnectPolicy）
+        """
+        self._sse_factory = sse_factory
+        self.url = url
+        self.params = dict(params or {})
+        self.queue_size = queue_size
+        self.reconnect = reconnect
+
+        self._by_session: Dict[str, Set[EventSubscription]] = {}
+        self._wildcard: Set[EventSubscription] = set()
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._sse_client: Optional[SSEClient] = None
+        self._prefilter: Optional[EventFilter] = None
+        self._connected = asyncio.Event()
+        self._on_close: Optional[Callable[["EventHub"], None]] = None
+
+        # 统计信息
+        self.connections_opened = 0
+        self.events_received = 0
+        self.events_dispatched = 0
+        self.metrics = SSEMetrics()
+
+    @property
+    def subscriber_count(self) -> int:
+        """当前订阅者数量。"""
+        return len(self._wildcard) + sum(len(s) for s in self._by_session.values())
+
+    async def subscribe(
+        self,
+        session_id: Optional[str] = None,
+        event_types: Optional[Iterable[str]] = None,
+        maxsize: Optional[int] = None,
+    ) -> EventSubscription:
+        """
+        注册订阅者，必要时建立 SSE 连接。
+
+        Args:
+            session_id: 只接收该会话的事件，None 表示接收全部事件
+            event_types: 只接收这些类型的事件
+            maxsize: 队列容量，默认使用 ``queue_size``
+
+        Returns:
+            EventSubscription 对象
+        """
+        subscription = EventSubscription(
+            self,
+            session_ids=frozenset([session_id]) if session_id else None,
+            event_types=frozenset(event_types) if event_types else None,
+            maxsize=maxsize or self.queue_size,
+        )
+        if session_id:
+            self._by_session.setdefault(session_id, set()).add(subscription)
+        else:
+            self._wildcard.add(subscription)
+        self._update_prefilter()
+
+        if self._task is None or self._task.done():
+            self._connected.clear()
+            self._task = asyncio.create_task(self._pump())
+        return subscription
+
+    async def wait_connected(self, timeout: Optional[float] = None) -> bool:
+        """
+        等待 SSE 连接建立。
+
+        在发送会触发事件的请求（如 prompt_async）之前调用，避免丢失最早的事件。
+
+        Args:
+            timeout: 最长等待时间（秒），None 表示一直等待
+
+        Returns:
+            连接是否已建立
+        """
+        if self._task is None:
+            return False
+        waiter = asyncio.ensure_future(self._connected.wait())
+        done, _ = await asyncio.wait(
+            {waiter, self._task}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+        )
+        if waiter not in done:
+            waiter.cancel()
+        return self._connected.is_set()
+
+    async def _unsubscribe(self, subscription: EventSubscription) -> None:
+        """移除订阅者；没有订阅者时关闭连接。"""
+        if subscription.session_ids:
+            for session_id in subscription.session_ids:
+                subscribers = self._by_session.get(session_id)
+                if subscribers is not None:
+                    subscribers.discard(subscription)
+                    if not subscribers:
+                        del self._by_session[session_id]
+        else:
+            self._wildcard.discard(subscription)
+
+        if self.subscriber_count == 0:
+            await self.close()
+        else:
+            self._update_prefilter()
+
+    @property
+    def prefilter(self) -> Optional[EventFilter]:
+        """当前所有订阅者的并集对应的预过滤条件，None 表示解码全部事件。"""
+        return self._prefilter
+
+    def _update_prefilter(self) -> None:
+        """订阅者变化后重新计算预过滤条件（取所有订阅者关心事件的并集）。"""
+        subscribers = self._subscribers()
+        session_ids = None if self._wildcard else frozenset(self._by_session)
+        types: Set[str] = set()
+        for subscription in subscribers:
+            if subscription.event_types is None:
+                event_types = None
+                break
+            types.update(subscription.event_types)
+        else:
+            event_types = frozenset(types)
+        if not subscribers or (session_ids is None and event_types is None):
+            prefilter = None
+        else:
+            prefilter = EventFilter(session_ids, event_types)
+        self._prefilter = prefilter
+        if self._sse_client is not None:
+            self._sse_client.prefilter = prefilter
+
+    def _dispatch(self, event: Event) -> None:
+        """将事件分发给匹配的订阅者。"""
+        self.events_received += 1
+        targets = list(self._wildcard)
+        session_id = event_session_id(event)
+        if session_id is not None:
+            targets.extend(self._by_session.get(session_id, ()))
+
+        event_type = getattr(event, "type", None)
+        for subscription in targets:
+            if subscription.event_types is None or event_type in subscription.event_types:
+                subscription._offer(event)
+                self.events_dispatched += 1
+
+    def _subscribers(self) -> Set[EventSubscription]:
+        subscribers = set(self._wildcard)
+        for group in self._by_session.values():
+            subscribers.update(group)
+        return subscribers
+
+    async def _pump(self) -> None:
+        """读取 SSE 连接并分发事件。"""
+        error: Optional[BaseException] = None
+        sse_client: Optional[SSEClient] = None
+        try:
+            async with self._sse_factory() as sse_client:
+                self.connections_opened += 1
+                self.metrics = sse_client.metrics
+                sse_client.prefilter = self._prefilter
+                self._sse_client = sse_client
+                async for event in sse_client.connect(
+                    self.url,
+                    params=self.params,
+                    on_open=self._connected.set,
+                    reconnect=self.reconnect,
+                ):
+                    self._dispatch(event)
+        except asyncio.CancelledError:
+            return
+        except Exception as e:
+            error = e
+        finally:
+            # close() 等待本任务退出期间可能已有新的连接，不能清掉它的客户端
+            if self._sse_client is sse_client:
+                self._sse_client = None
+
+        # 连接结束（或出错）：通知所有订阅者
+        for subscription in self._subscribers():
+            subscription._finish(error)
+        self._by_session.clear()
+        self._wildcard.clear()
+        if self._on_close is not None:
+            self._on_close(self)
+
+    async def close(self) -> None:
+        """关闭连接并结束所有订阅。"""
+        task, self._task = self._task, None
+        # 在等待连接任务退出之前结束订阅并从缓存中移除：等待期间到来的订阅者
+        # 会建立新的连接，不会被这里结束，也不会留下无法访问的连接
+        for subscription in self._subscribers():
+            subscription._finish()
+        self._by_session.clear()
+        self._wildcard.clear()
+        self._prefilter = None
+        if self._on_close is not None:
+            self._on_close(self)
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+
+
+HubKey = Tuple[int, str, Tuple[Tuple[str, str], ...], bool]
+
+# 每个 HTTP 客户端各自维护一组事件中心
+_HUBS: "weakref.WeakKeyDictionary[Any, Dict[HubKey, EventHub]]" = weakref.WeakKeyDictionary()
+
+
+def get_event_hub(
+    owner: Any,
+    url: str,
+    params: Optional[Dict[str, Any]],
+    sse_factory: Callable[[], SSEClient],
+    reconnect: Union[bool, ReconnectPolicy] = False,
+) -> EventHub:
+    """
+    获取（或创建）某个客户端在当前事件循环中的事件中心。
+
+    相同的客户端、端点和查询参数共享同一个事件中心，也就共享同一条 SSE 连接。
+
+    Args:
+        owner: 拥有该连接的 HTTP 客户端
+        url: SSE 端点 URL
+        params: 查询参数
+        sse_factory: 创建 SSE 客户端的工厂函数
+        reconnect: 是否自动重连；自动重连和不重连的订阅使用各自的事件中心
+
+    Returns:
+        EventHub 对象
+    """
+    loop = asyncio.get_running_loop()
+    key: HubKey = (
+        id(loop),
+        url,
+        tuple(sorted((k, str(v)) for k, v in (params or {}).items())),
+        bool(reconnect),
+    )
+    hubs = _HUBS.setdefault(owner, {})
+    hub = hubs.get(key)
+    if hub is None:
+        hub = EventHub(sse_factory, url, params, reconnect=reconnect)
+
+        def _forget(closed: EventHub) -> None:
+            if hubs.get(key) is closed:
+                del hubs[key]
+
+        hub._on_close = _forget
+        hubs[key] = hub
+    return hub
@@ -0,0 +1,356 @@
+"""
+文件内容缓存。
+
+:class:`FileCache` 缓存 ``files.read()`` 和 ``files.list()`` 的结果，按路径和行范围
+（或目录和列出参数）作为键，总大小超过上限时按 LRU 淘汰。缓存根据
+``file.edited`` 和 ``file.watcher.updated`` 事件精确失效：
+
+- 文件内容变化只失效该文件的读取结果
+- 文件新增或删除还会失效其上级目录的列表结果
+
+通过 ``client.files.with_cache(cache)`` 启用，并用 :meth:`FileCache.watch`
+订阅事件保持缓存有效。
+"""
+
+import posixpath
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, List, Optional, Set, Tuple, Union
+
+from .sse_client import ReconnectPolicy
+from .utils import call_resource, relative_path
+
+# 触发失效的事件
+FILE_EVENT_TYPES = frozenset({"file.edited", "file.watcher.updated"})
+
+# 每个 FileNode 除名称和路径外的估算开销（字节）
+_NODE_OVERHEAD = 64
+
+
+@dataclass
+class FileCacheStats:
+    """缓存计数，可在多个线程中共享。"""
+
+    hits: int = 0
+    """命中次数"""
+
+    misses: int = 0
+    """未命中次数"""
+
+    evictions: int = 0
+    """因超出容量被淘汰的条目数"""
+
+    invalidations: int = 0
+    """因文件变化被失效的条目数"""
+
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @property
+    def hit_rate(self) -> float:
+        """命中率，尚无读取时为 0。"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """返回当前计数的副本，便于导出到监控系统。"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "hit_rate": self.hit_rate,
+            }
+
+    def reset(self) -> None:
+        """清零所有计数。"""
+        with self._lock:
+            self.hits = self.misses = self.evictions = self.invalidations = 0
+
+
+def _content_size(content: Any) -> int:
+    text = getattr(content, "content", "")
+    diff = getattr(content, "diff", None) or ""
+    return len(text.encode("utf-8", "surrogatepass")) + len(diff)
+
+
+def _listing_size(nodes: List[Any]) -> int:
+    return sum(
+        len(node.path) + len(node.absolute) + len(node.name) + _NODE_OVERHEAD for node in nodes
+    )
+
+
+class FileCache:
+    """
+    按总字节数限制容量的 LRU 文件缓存，线程安全。
+
+    缓存中的对象会直接返回给调用方，调用方不应修改它们。
+
+    Example:
+        >>> cache = FileCache(max_bytes=64 * 1024 * 1024)
+        >>> client.files = client.files.with_cache(cache)
+        >>> watcher = asyncio.create_task(cache.watch(client))
+        >>> client.files.read("src/main.py")   # 未命中，请求服务器
+        >>> client.files.read("src/main.py")   # 命中
+        >>> print(cache.stats.snapshot())
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, root: Optional[str] = None) -> None:
+        """
+        初始化缓存。
+
+        Args:
+            max_bytes: 缓存内容的总字节数上限（文件内容按 UTF-8 计算，目录列表为估算值）
+            root: 项目根目录，用于把事件中的绝对路径转换为相对路径；
+                None 时从目录列表结果或 :meth:`watch` 中自动获取
+        """
+        if max_bytes <= 0:
+            raise ValueError("max_bytes 必须为正整数")
+        self.max_bytes = max_bytes
+        self.root = root.rstrip("/") if root else None
+        self.stats = FileCacheStats()
+        self.bytes = 0
+        """当前缓存内容的总字节数"""
+
+        self._lock = threading.RLock()
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        # 路径 -> 该文件的读取缓存键
+        self._reads: Dict[str, Set[Hashable]] = {}
+        # 目录 -> 该目录的列表缓存键
+        self._lists: Dict[str, Set[Hashable]] = {}
+        # 每次失效递增；请求期间发生过失效的结果不写入缓存
+        self._generation = 0
+
+    # ==================== 路径 ====================
+
+    def _normalize(self, path: str) -> str:
+        """统一为相对于项目根目录的 POSIX 路径，根目录为 "."。"""
+        return relative_path(path, self.root)
+
+    def _learn_root(self, nodes: List[Any]) -> None:
+        """从目录列表结果推断项目根目录（absolute 去掉 path 部分）。"""
+        if self.root is not None:
+            return
+        for node in nodes:
+            relative = posixpath.normpath(node.path)
+            absolute = posixpath.normpath(node.absolute)
+            if relative != "." and absolute.endswith("/" + relative):
+                self.root = absolute[: -len(relative) - 1] or "/"
+                return
+
+    # ==================== 读写 ====================
+
+    @staticmethod
+    def read_key(path: str, start_line: Optional[int], end_line: Optional[int]) -> Tuple[Any, ...]:
+        return ("read", path, start_line, end_line)
+
+    @staticmethod
+    def list_key(path: str, recursive: bool, max_depth: Optional[int]) -> Tuple[Any, ...]:
+        return ("list", path, recursive, max_depth)
+
+    @property
+    def generation(self) -> int:
+        """失效计数。在发出请求前读取，写入时传给 ``put_*``，避免缓存请求期间已过期的结果。"""
+        return self._generation
+
+    def get_read(
+        self, path: str, start_line: Optional[int] = None, end_line: Optional[int] = None
+    ) -> Any:
+        """查找文件内容，未命中时返回 None。"""
+        return self._get(self.read_key(self._normalize(path), start_line, end_line))
+
+    def put_read(
+        self,
+        path: str,
+        start_line: Optional[int],
+        end_line: Optional[int],
+        content: Any,
+        generation: Optional[int] = None,
+    ) -> None:
+        """缓存文件内容。"""
+        path = self._normalize(path)
+        key = self.read_key(path, start_line, end_line)
+        self._put(key, content, _content_size(content), self._reads, path, generation)
+
+    def get_list(
+        self, path: str = ".", recursive: bool = False, max_depth: Optional[int] = None
+    ) -> Any:
+        """查找目录列表，未命中时返回 None。"""
+        return self._get(self.list_key(self._normalize(path), recursive, max_depth))
+
+    def put_list(
+        self,
+        path: str,
+        recursive: bool,
+        max_depth: Optional[int],
+        nodes: List[Any],
+        generation: Optional[int] = None,
+    ) -> None:
+        """缓存目录列表。"""
+        self._learn_root(nodes)
+        path = self._normalize(path)
+        key = self.list_key(path, recursive, max_depth)
+        self._put(key, nodes, _listing_size(nodes), self._lists, path, generation)
+
+    def _get(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                with self.stats._lock:
+                    self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            with self.stats._lock:
+                self.stats.hits += 1
+            return entry[0]
+
+    def _put(
+        self,
+        key: Hashable,
+        value: Any,
+        size: int,
+        index: Dict[str, Set[Hashable]],
+        path: str,
+        generation: Optional[int],
+    ) -> None:
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._remove(key)
+            self._entries[key] = (value, size)
+            index.setdefault(path, set()).add(key)
+            self.bytes += size
+            evicted = 0
+            while self.bytes > self.max_bytes:
+                old_key = next(iter(self._entries))
+                self._remove(old_key)
+                evicted += 1
+        if evicted:
+            with self.stats._lock:
+                self.stats.evictions += evicted
+
+    def _remove(self, key: Hashable) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self.bytes -= entry[1]
+        index = self._reads if key[0] == "read" else self._lists  # type: ignore[index]
+        keys = index.get(key[1])  # type: ignore[index]
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del index[key[1]]  # type: ignore[index]
+        return True
+
+    # ==================== 失效 ====================
+
+    def invalidate(self, path: str, structure: bool = True) -> int:
+        """
+        使某个文件的缓存失效。
+
+        Args:
+            path: 文件路径（相对或绝对）
+            structure: 文件是否可能被新增或删除；为 True 时同时失效上级目录的列表
+
+        Returns:
+            失效的条目数
+        """
+        path = self._normalize(path)
+        removed = 0
+        with self._lock:
+            self._generation += 1
+            for key in list(self._reads.get(path, ())):
+                removed += self._remove(key)
+            # 路径本身是目录时，它的列表也失效（例如目录被删除）
+            for key in list(self._lists.get(path, ())):
+                removed += self._remove(key)
+            if structure:
+                parent = posixpath.dirname(path) or "."
+                depth = 1
+                while True:
+                    for key in list(self._lists.get(parent, ())):
+                        recursive, max_depth = key[2], key[3]  # type: ignore[index]
+                        if depth == 1 or (recursive and (max_depth is None or depth <= max_depth)):
+                            removed += self._remove(key)
+                    if parent in (".", "/"):
+                        break
+                    parent = posixpath.dirname(parent) or "."
+                    depth += 1
+        if removed:
+            with self.stats._lock:
+                self.stats.invalidations += removed
+        return removed
+
+    def clear(self) -> None:
+        """清空缓存。"""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._reads.clear()
+            self._lists.clear()
+            self.bytes = 0
+
+    def apply(self, event: Any) -> None:
+        """
+        根据事件使缓存失效。
+
+        ``file.watcher.updated`` 的 ``change`` 只失效文件内容；``add``、``unlink``
+        和 ``file.edited``（编辑工具可能创建新文件）还会失效上级目录的列表。
+        """
+        event_type = getattr(event, "type", None)
+        if event_type == "file.edited":
+            path = self._normalize(event.properties.file)
+            self.invalidate(path, structure=not self._listed(path))
+        elif event_type == "file.watcher.updated":
+            self.invalidate(event.properties.file, structure=event.properties.event != "change")
+
+    def _listed(self, path: str) -> bool:
+        """文件是否已出现在缓存的上级目录列表中（即编辑的是已有文件）。"""
+        parent = posixpath.dirname(path) or "."
+        with self._lock:
+            keys = self._lists.get(parent)
+            if not keys:
+                return False
+            return all(
+                any(posixpath.normpath(node.path) == path for node in self._entries[key][0])
+                for key in keys
+            )
+
+    async def watch(
+        self,
+        client: Any,
+        reconnect: Union[bool, ReconnectPolicy] = True,
+        connect_timeout: Optional[float] = 10.0,
+    ) -> None:
+        """
+        订阅全局事件流并持续使缓存失效，直到任务被取消。
+
+        事件流重连后会清空缓存（断线期间的事件已经丢失）；事件流终止时同样清空缓存。
+
+        Args:
+            client: OpencodeClient 或 AsyncOpencodeClient
+            reconnect: 事件流断开时是否自动重连（可传入 ReconnectPolicy）
+            connect_timeout: 开始处理事件前等待事件流建立的最长时间（秒），
+                None 表示一直等待；超时后仍继续订阅，连接建立后开始失效
+        """
+        if self.root is None:
+            paths = await call_resource(client.path.get)
+            directory = paths.get("directory") if isinstance(paths, dict) else None
+            if directory:
+                self.root = directory.rstrip("/")
+        hub = client.events.hub("/global/event", reconnect=reconnect)
+        subscription = await hub.subscribe(event_types=FILE_EVENT_TYPES | {"server.connected"})
+        await hub.wait_connected(connect_timeout)
+        connects = hub.metrics.connects
+        try:
+            async with subscription:
+                async for event in subscription:
+                    if hub.metrics.connects != connects:
+                        connects = hub.metrics.connects
+                        self.clear()
+                    self.apply(event)
+        finally:
+            self.clear()
@@ -0,0 +1,438 @@
+"""
+本地文件名与符号索引。
+
+:class:`FindIndex` 一次性获取项目的文件列表（``files.walk()``）和工作区符号
+（``find.symbols("")``），之后在进程内回答模糊查询，不再访问服务器。通过
+``client.find.with_index(index)`` 启用后，``find.files()`` 和 ``find.symbols()``
+优先查询本地索引，只有索引尚未加载（或查询为 glob 模式）时才请求服务器。
+
+匹配分三档，依次补足结果数量：
+
+1. 文件名（符号名）以查询开头，按字母顺序
+2. 路径（符号名）包含查询，文件名中命中的优先，其次路径较短的优先
+3. 查询是文件名（其次是路径）的子序列（如 ``mcl`` 匹配 ``models/client.py``），匹配越紧凑越靠前
+
+候选集合通过三元组（查询不足 3 个字符时为单字符）倒排索引求交集得到，只对候选做验证。
+:meth:`FindIndex.watch` 订阅 ``file.watcher.updated`` 事件，新增和删除文件时更新索引。
+"""
+
+import asyncio
+import bisect
+import heapq
+import posixpath
+import re
+from collections import defaultdict
+from typing import Any, Callable, DefaultDict, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from .sse_client import ReconnectPolicy
+from .utils import call_resource, relative_path
+
+# glob 查询交给服务器处理
+_GLOB_CHARS = frozenset("*?[")
+
+
+def _grams(text: str) -> Set[str]:
+    """文本的三元组；不足 3 个字符时为单字符。"""
+    if len(text) < 3:
+        return set(text)
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class _FuzzyIndex:
+    """
+    支持前缀、子串和子序列查询的倒排索引。
+
+    每个条目有一个完整键（文件为路径，符号为名称）和一个短名称（文件名或符号名），
+    均以小写保存。删除的条目在列表中置为 None，编号不复用。
+    """
+
+    def __init__(self) -> None:
+        self._items: List[Any] = []
+        self._keys: List[str] = []
+        self._names: List[str] = []
+        # 所属文件 -> 条目编号，用于按文件删除
+        self._owners: Dict[str, Set[int]] = {}
+        # 三元组 / 单字符 -> 条目编号
+        self._grams: Dict[str, Set[int]] = {}
+        self._chars: Dict[str, Set[int]] = {}
+        # 名称中的单字符 -> 条目编号，用于名称的子序列查询
+        self._name_chars: Dict[str, Set[int]] = {}
+        # (小写名称, 编号)，按名称排序，用于前缀查询
+        self._sorted: List[Tuple[str, int]] = []
+        self.size = 0
+
+    def add(self, key: str, name: str, item: Any, owner: str) -> None:
+        index = len(self._items)
+        key, name = key.lower(), name.lower()
+        self._items.append(item)
+        self._keys.append(key)
+        self._names.append(name)
+        self._owners.setdefault(owner, set()).add(index)
+        for gram in _grams(key) if len(key) >= 3 else ():
+            self._grams.setdefault(gram, set()).add(index)
+        for char in set(key):
+            self._chars.setdefault(char, set()).add(index)
+        for char in set(name):
+            self._name_chars.setdefault(char, set()).add(index)
+        bisect.insort(self._sorted, (name, index))
+        self.size += 1
+
+    def bulk_add(self, entries: Iterable[Tuple[str, str, Any, str]]) -> None:
+        """批量添加，最后统一排序，避免逐个插入有序列表。"""
+        grams: DefaultDict[str, Set[int]] = defaultdict(set, self._grams)
+        chars: DefaultDict[str, Set[int]] = defaultdict(set, self._chars)
+        name_chars: DefaultDict[str, Set[int]] = defaultdict(set, self._name_chars)
+        for key, name, item, owner in entries:
+            index = len(self._items)
+            key, name = key.lower(), name.lower()
+            self._items.append(item)
+            self._keys.append(key)
+            self._names.append(name)
+            self._owners.setdefault(owner, set()).add(index)
+            for i in range(len(key) - 2):
+                grams[key[i : i + 3]].add(index)
+            for char in set(key):
+                chars[char].add(index)
+            for char in set(name):
+                name_chars[char].add(index)
+            self._sorted.append((name, index))
+        self._grams, self._chars, self._name_chars = dict(grams), dict(chars), dict(name_chars)
+        self._sorted.sort()
+        self.size = sum(item is not None for item in self._items)
+
+    def remove(self, owner: str) -> int:
+        """删除属于某个文件的全部条目，返回删除数量。"""
+        removed = 0
+        for index in self._owners.pop(owner, ()):
+            if self._items[index] is None:
+                continue
+            key, name = self._keys[index], self._names[index]
+            for gram in _grams(key) if len(key) >= 3 else ():
+                self._grams.get(gram, set()).discard(index)
+            for char in set(key):
+                self._chars.get(char, set()).discard(index)
+            for char in set(name):
+                self._name_chars.get(char, set()).discard(index)
+            position = bisect.bisect_left(self._sorted, (name, index))
+            if position < len(self._sorted) and self._sorted[position] == (name, index):
+                del self._sorted[position]
+            self._items[index] = None
+            removed += 1
+        self.size -= removed
+        return removed
+
+    def owners(self) -> List[str]:
+        return list(self._owners)
+
+    def _candidates(self, query: str) -> Set[int]:
+        """包含查询中全部三元组（不足 3 个字符时为全部字符）的条目。"""
+        table = self._grams if len(query) >= 3 else self._chars
+        return self._intersect(table, _grams(query))
+
+    @staticmethod
+    def _intersect(table: Dict[str, Set[int]], grams: Iterable[str]) -> Set[int]:
+        """从最小的集合开始求交集。"""
+        sets = []
+        for gram in grams:
+            ids = table.get(gram)
+            if not ids:
+                return set()
+            sets.append(ids)
+        sets.sort(key=len)
+        result = set(sets[0])
+        for ids in sets[1:]:
+            result &= ids
+            if not result:
+                break
+        return result
+
+    def __contains__(self, owner: object) -> bool:
+        return owner in self._owners
+
+    def search(
+        self, query: str, limit: int, accept: Optional[Callable[[Any], bool]] = None
+    ) -> List[Any]:
+        query = query.lower()
+        if not query:
+            return []
+        items, keys, names = self._items, self._keys, self._names
+        found: List[int] = []
+        seen: Set[int] = set()
+
+        def usable(index: int) -> bool:
+            item = items[index]
+            return item is not None and index not in seen and (accept is None or accept(item))
+
+        # 第一档：名称前缀，按名称顺序
+        ordered = self._sorted
+        for position in range(bisect.bisect_left(ordered, (query,)), len(ordered)):
+            name, index = ordered[position]
+            if not name.startswith(query):
+                break
+            if usable(index):
+                seen.add(index)
+                found.append(index)
+                if len(found) >= limit:
+                    return [items[i] for i in found]
+
+        # 第二档：子串，文件名中命中的优先，其次键较短的优先
+        substring = [i for i in self._candidates(query) if query in keys[i] and usable(i)]
+        for index in heapq.nsmallest(
+            limit - len(found),
+            substring,
+            key=lambda i: (query not in names[i], len(keys[i]), keys[i]),
+        ):
+            seen.add(index)
+            found.append(index)
+        if len(found) >= limit or len(query) < 2:
+            return [items[i] for i in found]
+
+        # 第三档：子序列，匹配跨度越小越靠前；先匹配名称，不足时再匹配完整的键。
+        # 候选是包含查询中全部字符的条目（子序列的必要条件）
+        pattern = re.compile(".*?".join(map(re.escape, query)))
+        for table, texts in ((self._name_chars, names), (self._chars, keys)):
+            scored = []
+            for index in self._intersect(table, set(query)):
+                if not usable(index):
+                    continue
+                match = pattern.search(texts[index])
+                if match is not None:
+                    scored.append(
+                        (match.end() - match.start(), len(keys[index]), keys[index], index)
+                    )
+            for entry in heapq.nsmallest(limit - len(found), scored):
+                seen.add(entry[-1])
+                found.append(entry[-1])
+            if len(found) >= limit:
+                break
+        return [items[i] for i in found]
+
+
+def _symbol_path(symbol: Any) -> str:
+    location = symbol.get("location") or {}
+    return location.get("uri") or symbol.get("path") or ""
+
+
+def _file_path(item: Any) -> str:
+    return item if isinstance(item, str) else item.get("path", "")
+
+
+class FindIndex:
+    """
+    本地模糊文件名与符号索引。
+
+    同时适用于 OpencodeClient 和 AsyncOpencodeClient，查询方法都是同步的纯内存操作。
+
+    Example:
+        >>> index = FindIndex()
+        >>> await index.load(client)
+        >>> client.find = client.find.with_index(index)
+        >>> watcher = asyncio.create_task(index.watch(client))
+        >>> client.find.files("mcli")        # 本地查询，不访问服务器
+        >>> index.search_symbols("Client")
+    """
+
+    def __init__(self, root: Optional[str] = None, default_limit: int = 50) -> None:
+        """
+        初始化索引。
+
+        Args:
+            root: 项目根目录，用于把事件和符号位置中的绝对路径转换为相对路径；
+                None 时在 :meth:`load` 中从服务器获取
+            default_limit: 未指定 ``max_results`` 时返回的最大结果数
+        """
+        self.root = root.rstrip("/") if root else None
+        self.default_limit = default_limit
+        self._files = _FuzzyIndex()
+        self._symbols = _FuzzyIndex()
+        self.files_loaded = False
+        """文件索引是否已加载；未加载时 ``find.files()`` 请求服务器"""
+
+        self.symbols_loaded = False
+        """符号索引是否已加载；未加载时 ``find.symbols()`` 请求服务器"""
+
+    # ==================== 加载 ====================
+
+    async def load(
+        self,
+        client: Any,
+        files: bool = True,
+        symbols: bool = True,
+        concurrency: int = 8,
+        exclude: Union[str, Iterable[str], None] = (".git", "node_modules"),
+    ) -> "FindIndex":
+        """
+        从服务器加载文件列表和工作区符号，替换已有内容。
+
+        文件列表通过 ``files.walk()`` 并发获取，跳过被 .gitignore 忽略的文件；
+        符号通过 ``find.symbols("")`` 获取，能返回多少取决于服务器的语言服务器。
+
+        Args:
+            client: OpencodeClient 或 AsyncOpencodeClient
+            files: 是否加载文件列表
+            symbols: 是否加载工作区符号
+            concurrency: 遍历目录的并发请求数
+            exclude: 不展开的目录，参见 ``files.walk()``
+
+        Returns:
+            自身，便于链式调用
+        """
+        if self.root is None:
+            paths = await call_resource(client.path.get)
+            directory = paths.get("directory") if isinstance(paths, dict) else None
+            if directory:
+                self.root = directory.rstrip("/")
+        if files:
+            walker = client.files.walk(concurrency=concurrency, exclude=exclude, skip_ignored=True)
+            if hasattr(walker, "__aiter__"):
+                nodes = [node async for node in walker]
+            else:
+                nodes = await asyncio.to_thread(list, walker)
+            # 构建 10 万个文件的索引需要数秒，放到线程中执行，期间旧索引仍可查询
+            paths = [node.path for node in nodes if node.type == "file"]
+            await asyncio.to_thread(self.load_files, paths)
+        if symbols:
+            await asyncio.to_thread(self.load_symbols, await call_resource(client.find.symbols, ""))
+        return self
+
+    def load_files(self, paths: Iterable[Any]) -> None:
+        """
+        用给定的文件替换文件索引。
+
+        Args:
+            paths: 相对路径字符串，或 ``find.files()`` 返回的字典（包含 ``path``）
+        """
+        index = _FuzzyIndex()
+        entries = []
+        for item in paths:
+            path = relative_path(_file_path(item), self.root)
+            entries.append((path, posixpath.basename(path), {"path": path}, path))
+        index.bulk_add(entries)
+        self._files = index
+        self.files_loaded = True
+
+    def load_symbols(self, symbols: Iterable[Dict[str, Any]]) -> None:
+        """
+        用给定的符号替换符号索引。
+
+        Args:
+            symbols: ``find.symbols()`` 返回的符号字典（包含 ``name`` 和 ``location``）
+        """
+        index = _FuzzyIndex()
+        index.bulk_add(
+            (symbol["name"], symbol["name"], symbol, relative_path(_symbol_path(symbol), self.root))
+            for symbol in symbols
+        )
+        self._symbols = index
+        self.symbols_loaded = True
+
+    # ==================== 查询 ====================
+
+    def search_files(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        path: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        模糊查询文件。
+
+        Args:
+            query: 查询字符串，不区分大小写
+            limit: 最大结果数，None 时使用 ``default_limit``
+            path: 只返回该目录下的文件
+
+        Returns:
+            ``{"path": 相对路径}`` 字典列表，按匹配程度排序
+        """
+        accept = None
+        if path:
+            prefix = relative_path(path, self.root).rstrip("/") + "/"
+            if prefix != "./":
+                accept = lambda item: item["path"].startswith(prefix)  # noqa: E731
+        return self._files.search(query, limit or self.default_limit, accept)
+
+    def search_symbols(self, query: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        模糊查询符号名称。
+
+        Args:
+            query: 查询字符串，不区分大小写
+            limit: 最大结果数，None 时使用 ``default_limit``
+
+        Returns:
+            符号字典列表（与 ``find.symbols()`` 的格式相同），按匹配程度排序
+        """
+        return self._symbols.search(query, limit or self.default_limit)
+
+    def answers(self, kind: str, query: str) -> bool:
+        """本地索引能否回答该查询；``kind`` 为 ``"files"`` 或 ``"symbols"``。"""
+        loaded = self.files_loaded if kind == "files" else self.symbols_loaded
+        return loaded and bool(query) and not (_GLOB_CHARS & set(query))
+
+    @property
+    def file_count(self) -> int:
+        """索引中的文件数。"""
+        return self._files.size
+
+    @property
+    def symbol_count(self) -> int:
+        """索引中的符号数。"""
+        return self._symbols.size
+
+    # ==================== 更新 ====================
+
+    def add_file(self, path: str) -> None:
+        """添加文件（已存在时忽略）。"""
+        path = relative_path(path, self.root)
+        if path not in self._files:
+            self._files.add(path, posixpath.basename(path), {"path": path}, path)
+
+    def remove_file(self, path: str) -> None:
+        """删除文件及其中的符号；删除的是目录时同时删除目录下的全部文件。"""
+        path = relative_path(path, self.root)
+        prefix = path + "/"
+        for index in (self._files, self._symbols):
+            for owner in index.owners():
+                if owner == path or owner.startswith(prefix):
+                    index.remove(owner)
+
+    def apply(self, event: Any) -> None:
+        """
+        根据 ``file.watcher.updated`` 事件更新索引。
+
+        新增文件加入文件索引；删除文件（或目录）同时移除其中的符号。文件内容变化不影响
+        文件索引，符号的增减需要重新调用 :meth:`load` 获取。
+        """
+        if getattr(event, "type", None) != "file.watcher.updated":
+            return
+        change = event.properties.event
+        if change == "add":
+            self.add_file(event.properties.file)
+        elif change == "unlink":
+            self.remove_file(event.properties.file)
+
+    async def watch(
+        self,
+        client: Any,
+        reconnect: Union[bool, ReconnectPolicy] = True,
+    ) -> None:
+        """
+        订阅全局事件流并持续更新索引，直到任务被取消。
+
+        事件流重连后重新加载已加载的部分（断线期间的变化已经丢失）。
+
+        Args:
+            client: OpencodeClient 或 AsyncOpencodeClient
+            reconnect: 事件流断开时是否自动重连（可传入 ReconnectPolicy）
+        """
+        hub = client.events.hub("/global/event", reconnect=reconnect)
+        subscription = await hub.subscribe(event_types={"file.watcher.updated", "server.connected"})
+        await hub.wait_connected(10.0)
+        connects = hub.metrics.connects
+        async with subscription:
+            async for event in subscription:
+                if hub.metrics.connects != connects:
+                    connects = hub.metrics.connects
+                    await self.load(client, files=self.files_loaded, symbols=self.symbols_loaded)
+                self.apply(event)
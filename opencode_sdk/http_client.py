@@ -1,11 +1,25 @@
 """OpenCode API 的 HTTP 客户端。"""
 
-import json
-from typing import Any, Dict, Optional, Union
+import asyncio
+import copy
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 from urllib.parse import urljoin
 
 import httpx
 
+from . import codec
 from .exceptions import (
     APIError,
     BadRequestError,
@@ -14,10 +28,56 @@ from .exceptions import (
     OpencodeException,
     TimeoutError,
 )
+from .instrumentation import Instrumentation
+from .lazy import check_response_mode
+from .retry import RetryPolicy, RetryStats
+from .utils import parse_transport
 
+if TYPE_CHECKING:
+    from .sse_replay import SSERecorder
+
+
+def _encode_json(
+    json_data: Optional[Any],
+    headers: Optional[Dict[str, str]],
+) -> Tuple[Optional[bytes], Optional[Dict[str, str]]]:
+    """使用当前编解码器把请求体直接编码为字节，并补全 Content-Type。"""
+    if json_data is None:
+        return None, headers
+    headers = {"Content-Type": "application/json", **(headers or {})}
+    return codec.dumps(json_data), headers
+
+
+# 请求确定没有发出的传输错误（可以安全重试任何方法）
+_UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+def _transport_error(error: httpx.TransportError) -> OpencodeException:
+    """将 httpx 传输错误转换为 SDK 异常。"""
+    if isinstance(error, httpx.TimeoutException):
+        return TimeoutError(f"请求超时: {str(error)}")
+    if isinstance(error, httpx.ConnectError):
+        return ConnectionError(f"连接失败: {str(error)}")
+    return ConnectionError(f"连接中断: {str(error)}")
+
+
+_ClientT = TypeVar("_ClientT", bound="_BaseHttpClient")
+
+
+def _pick(value: Optional[float], default: Optional[float]) -> Optional[float]:
+    return default if value is None else value
+
+
+def _require_h2() -> None:
+    """HTTP/2 依赖 h2 包，缺失时给出明确的安装提示。"""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        raise ImportError("启用 HTTP/2 需要安装 h2: pip install opencode-sdk[http2]") from None
 
-class HttpClient:
-    """用于向 OpenCode API 发送请求的 HTTP 客户端。"""
+
+class _BaseHttpClient:
+    """同步与异步 HTTP 客户端共享的配置和响应处理逻辑。"""
 
     def __init__(
         self,
@@ -25,31 +85,106 @@ class HttpClient:
         directory: Optional[str] = None,
         timeout: Optional[float] = None,
         headers: Optional[Dict[str, str]] = None,
+        response_mode: str = "model",
+        retry: Optional[RetryPolicy] = None,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        http2: bool = False,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        write_timeout: Optional[float] = None,
+        pool_timeout: Optional[float] = None,
+        transport: Optional[str] = None,
     ) -> None:
         """
-        初始化 HTTP 客户端。
+        初始化 HTTP 客户端配置。
 
         Args:
             base_url: OpenCode 服务器的基础 URL
             directory: 项目目录路径（添加到 x-opencode-directory header）
             timeout: 请求超时时间（秒），None 表示无超时
             headers: 要包含在请求中的额外 headers
+            response_mode: 响应模式（"model"、"raw" 或 "lazy"），参见 :mod:`opencode_sdk.lazy`
+            retry: 重试策略，None 表示不重试
+            max_connections: 连接池最大连接数，None 表示不限
+            max_keepalive_connections: 最多保持的空闲连接数，None 表示不限
+            keepalive_expiry: 空闲连接保持时间（秒）
+            http2: 是否启用 HTTP/2 多路复用（需要安装 ``h2``）
+            connect_timeout: 建立连接超时（秒），None 表示沿用 ``timeout``
+            read_timeout: 读取响应超时（秒），None 表示沿用 ``timeout``
+            write_timeout: 发送请求超时（秒），None 表示沿用 ``timeout``
+            pool_timeout: 等待空闲连接超时（秒），None 表示沿用 ``timeout``
+            transport: None 或 "tcp" 表示通过 TCP 连接；"unix:///path.sock" 表示通过
+                Unix 域套接字连接（``base_url`` 仍用于 Host 头和请求路径）
         """
         self.base_url = base_url.rstrip("/")
         self.directory = directory
         self.timeout = timeout
         self.default_headers = headers or {}
+        self.response_mode = check_response_mode(response_mode)
+        self.retry = retry
+        self.retry_stats = RetryStats()
+        self.instrumentation = Instrumentation()
+        # 之后建立的事件流连接把原始字节写入该录制器
+        self.sse_recorder: Optional["SSERecorder"] = None
+        self.http2 = http2
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.timeouts = httpx.Timeout(
+            timeout,
+            connect=_pick(connect_timeout, timeout),
+            read=_pick(read_timeout, timeout),
+            write=_pick(write_timeout, timeout),
+            pool=_pick(pool_timeout, timeout),
+        )
+        if http2:
+            _require_h2()
+        self.transport = transport
+        self.uds = parse_transport(transport)
 
         # 如果提供了目录，添加目录 header
         if directory:
             self.default_headers["x-opencode-directory"] = directory
 
-        # 创建 httpx 客户端
-        self.client = httpx.Client(
-            base_url=self.base_url,
-            timeout=timeout,
-            headers=self.default_headers,
-        )
+    def with_options(self: _ClientT, *, retry: Optional[RetryPolicy] = None) -> _ClientT:
+        """
+        创建使用不同重试策略的客户端副本。
+
+        副本与原客户端共享底层连接池和重试计数，用于为个别资源单独配置重试。
+
+        Args:
+            retry: 副本使用的重试策略，None 表示不重试
+
+        Returns:
+            客户端副本
+        """
+        clone = copy.copy(self)
+        clone.retry = retry
+        return clone
+
+    def _retry_delay(
+        self,
+        method: str,
+        error: BaseException,
+        attempt: int,
+        sent: bool,
+    ) -> Optional[float]:
+        """根据重试策略决定是否重试；可以重试时返回等待时间，否则返回 None。"""
+        policy = self.retry
+        if (
+            policy is None
+            or attempt >= policy.max_attempts
+            or not policy.is_retryable(method, error, sent)
+        ):
+            self.retry_stats._record_result(attempt, False)
+            return None
+        delay = policy.delay(attempt, error)
+        self.retry_stats._record_retry(error, delay)
+        return delay
 
     def _build_url(self, path: str) -> str:
         """从路径构建完整 URL。"""
@@ -63,13 +198,13 @@ class HttpClient:
                 raise NotFoundError("资源未找到")
             elif response.status_code == 400:
                 try:
-                    data = response.json()
-                    raise BadRequestError(
-                        data.get("message", "错误的请求"),
-                        errors=data.get("errors", []),
-                    )
-                except json.JSONDecodeError:
+                    data = codec.loads(response.content)
+                except ValueError:
                     raise BadRequestError("错误的请求")
+                raise BadRequestError(
+                    data.get("message", "错误的请求"),
+                    errors=data.get("errors", []),
+                )
             elif response.status_code >= 400:
                 raise APIError(
                     message=f"HTTP {response.status_code}: {response.text}",
@@ -83,19 +218,19 @@ class HttpClient:
             if response.status_code == 204:
                 return None
 
-            # 解析 JSON 响应
+            # 解析 JSON 响应（直接从字节解码，不经过 str）
+            content = response.content
             content_type = response.headers.get("content-type", "")
             if content_type.startswith("application/json"):
-                return response.json()
+                return codec.loads(content)
             else:
-                text = response.text
                 # 如果响应为空，返回 None
-                if not text or text.strip() == "":
+                if not content or not content.strip():
                     return None
                 try:
-                    return json.loads(text)
-                except json.JSONDecodeError:
-                    return text
+                    return codec.loads(content)
+                except ValueError:
+                    return response.text
 
         except httpx.TimeoutException as e:
             raise TimeoutError(f"请求超时: {str(e)}")
@@ -104,6 +239,145 @@ class HttpClient:
         except httpx.HTTPError as e:
             raise OpencodeException(f"HTTP 错误: {str(e)}")
 
+
+class HttpClient(_BaseHttpClient):
+    """用于向 OpenCode API 发送请求的 HTTP 客户端。"""
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8000",
+        directory: Optional[str] = None,
+        timeout: Optional[float] = None,
+        headers: Optional[Dict[str, str]] = None,
+        response_mode: str = "model",
+        retry: Optional[RetryPolicy] = None,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        http2: bool = False,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        write_timeout: Optional[float] = None,
+        pool_timeout: Optional[float] = None,
+        transport: Optional[str] = None,
+    ) -> None:
+        """
+        初始化 HTTP 客户端。
+
+        Args:
+            base_url: OpenCode 服务器的基础 URL
+            directory: 项目目录路径（添加到 x-opencode-directory header）
+            timeout: 请求超时时间（秒），None 表示无超时
+            headers: 要包含在请求中的额外 headers
+            response_mode: 响应模式（"model"、"raw" 或 "lazy"），参见 :mod:`opencode_sdk.lazy`
+            retry: 重试策略，None 表示不重试
+            max_connections: 连接池最大连接数，None 表示不限
+            max_keepalive_connections: 最多保持的空闲连接数，None 表示不限
+            keepalive_expiry: 空闲连接保持时间（秒）
+            http2: 是否启用 HTTP/2 多路复用（需要安装 ``h2``）
+            connect_timeout: 建立连接超时（秒），None 表示沿用 ``timeout``
+            read_timeout: 读取响应超时（秒），None 表示沿用 ``timeout``
+            write_timeout: 发送请求超时（秒），None 表示沿用 ``timeout``
+            pool_timeout: 等待空闲连接超时（秒），None 表示沿用 ``timeout``
+            transport: None 或 "tcp" 表示通过 TCP 连接；"unix:///path.sock" 表示通过
+                Unix 域套接字连接（``base_url`` 仍用于 Host 头和请求路径）
+        """
+        super().__init__(
+            base_url=base_url,
+            directory=directory,
+            timeout=timeout,
+            headers=headers,
+            response_mode=response_mode,
+            retry=retry,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            write_timeout=write_timeout,
+            pool_timeout=pool_timeout,
+            transport=transport,
+        )
+
+        # 创建 httpx 客户端
+        self.client = httpx.Client(
+            base_url=self.base_url,
+            timeout=self.timeouts,
+            headers=self.default_headers,
+            limits=self.limits,
+            http2=self.http2,
+            transport=(
+                httpx.HTTPTransport(uds=self.uds, limits=self.limits, http2=self.http2)
+                if self.uds
+                else None
+            ),
+        )
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """
+        发送 HTTP 请求。
+
+        所有 get/post/put/patch/delete 方法最终都经由此方法发出请求，
+        每次尝试都经过 :attr:`instrumentation` 的钩子并记录指标。
+
+        Args:
+            method: HTTP 方法
+            path: API 端点路径
+            params: 查询参数
+            json_data: JSON 请求体数据
+            data: 表单数据
+            headers: 额外的 headers
+
+        Returns:
+            响应数据
+        """
+        content, headers = _encode_json(json_data, headers)
+        attempt = 0
+        while True:
+            attempt += 1
+            self.retry_stats._record_request()
+            record = self.instrumentation._start(method, path, attempt, content)
+            sent = True
+            try:
+                try:
+                    response = self.client.request(
+                        method,
+                        path,
+                        params=params,
+                        content=content,
+                        data=data,
+                        headers=headers,
+                    )
+                except httpx.TransportError as e:
+                    sent = not isinstance(e, _UNSENT_ERRORS)
+                    raise _transport_error(e) from e
+                self.instrumentation._received(record, response)
+                result = self._handle_response(response)
+            except Exception as e:
+                self.instrumentation._fail(record, e)
+                if not isinstance(e, (APIError, TimeoutError, ConnectionError)):
+                    raise
+                delay = self._retry_delay(method, e, attempt, sent)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                continue
+            except BaseException as e:
+                self.instrumentation._fail(record, e)
+                raise
+            self.instrumentation._finish(record)
+            self.retry_stats._record_result(attempt, True)
+            return result
+
     def get(
         self,
         path: str,
@@ -121,17 +395,7 @@ class HttpClient:
         Returns:
             响应数据
         """
-        try:
-            response = self.client.get(
-                path,
-                params=params,
-                headers=headers,
-            )
-            return self._handle_response(response)
-        except httpx.TimeoutException as e:
-            raise TimeoutError(f"请求超时: {str(e)}")
-        except httpx.ConnectError as e:
-            raise ConnectionError(f"连接失败: {str(e)}")
+        return self.request("GET", path, params=params, headers=headers)
 
     def post(
         self,
@@ -154,19 +418,9 @@ class HttpClient:
         Returns:
             响应数据
         """
-        try:
-            response = self.client.post(
-                path,
-                json=json_data,
-                data=data,
-                params=params,
-                headers=headers,
-            )
-            return self._handle_response(response)
-        except httpx.TimeoutException as e:
-            raise TimeoutError(f"请求超时: {str(e)}")
-        except httpx.ConnectError as e:
-            raise ConnectionError(f"连接失败: {str(e)}")
+        return self.request(
+            "POST", path, params=params, json_data=json_data, data=data, headers=headers
+        )
 
     def put(
         self,
@@ -185,17 +439,7 @@ class HttpClient:
         Returns:
             响应数据
         """
-        try:
-            response = self.client.put(
-                path,
-                json=json_data,
-                headers=headers,
-            )
-            return self._handle_response(response)
-        except httpx.TimeoutException as e:
-            raise TimeoutError(f"请求超时: {str(e)}")
-        except httpx.ConnectError as e:
-            raise ConnectionError(f"连接失败: {str(e)}")
+        return self.request("PUT", path, json_data=json_data, headers=headers)
 
     def patch(
         self,
@@ -214,17 +458,7 @@ class HttpClient:
         Returns:
             响应数据
         """
-        try:
-            response = self.client.patch(
-                path,
-                json=json_data,
-                headers=headers,
-            )
-            return self._handle_response(response)
-        except httpx.TimeoutException as e:
-            raise TimeoutError(f"请求超时: {str(e)}")
-        except httpx.ConnectError as e:
-            raise ConnectionError(f"连接失败: {str(e)}")
+        return self.request("PATCH", path, json_data=json_data, headers=headers)
 
     def delete(
         self,
@@ -241,16 +475,58 @@ class HttpClient:
         Returns:
             响应数据
         """
+        return self.request("DELETE", path, headers=headers)
+
+    @contextmanager
+    def stream(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Iterator[httpx.Response]:
+        """
+        发送请求并以流的形式读取响应体。
+
+        状态码表示错误时读取完整响应体并抛出与 :meth:`request` 相同的异常；
+        读取过程中的传输错误同样转换为 SDK 异常。流式请求不重试，
+        记录的耗时和字节数包括读取响应体的部分。
+
+        Args:
+            method: HTTP 方法
+            path: API 端点路径
+            params: 查询参数
+            json_data: JSON 请求体数据
+            headers: 额外的 headers
+
+        Yields:
+            尚未读取响应体的 httpx.Response，通过 ``iter_bytes()`` 逐块读取
+
+        Example:
+            >>> with http.stream("GET", "/find/text", params={"query": "TODO"}) as response:
+            ...     for chunk in response.iter_bytes():
+            ...         ...
+        """
+        content, headers = _encode_json(json_data, headers)
+        record = self.instrumentation._start(method, path, content=content)
         try:
-            response = self.client.delete(
-                path,
-                headers=headers,
-            )
-            return self._handle_response(response)
-        except httpx.TimeoutException as e:
-            raise TimeoutError(f"请求超时: {str(e)}")
-        except httpx.ConnectError as e:
-            raise ConnectionError(f"连接失败: {str(e)}")
+            try:
+                with self.client.stream(
+                    method, path, params=params, content=content, headers=headers
+                ) as response:
+                    self.instrumentation._received(record, response)
+                    if response.status_code >= 400:
+                        response.read()
+                        self._handle_response(response)
+                    yield response
+            except httpx.TransportError as e:
+                raise _transport_error(e) from e
+        except BaseException as e:
+            # 包括调用方提前关闭生成器（GeneratorExit）和任务取消，记录为 cancelled
+            self.instrumentation._fail(record, e)
+            raise
+        self.instrumentation._finish(record, response)
 
     def close(self) -> None:
         """关闭 HTTP 客户端。"""
@@ -263,3 +539,233 @@ class HttpClient:
     def __exit__(self, *args: Any) -> None:
         """上下文管理器退出。"""
         self.close()
+
+
+class AsyncHttpClient(_BaseHttpClient):
+    """
+    基于 httpx.AsyncClient 的异步 HTTP 客户端。
+
+    所有异步资源共享同一个连接池，SSE 订阅也复用该连接池。
+    """
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8000",
+        directory: Optional[str] = None,
+        timeout: Optional[float] = None,
+        headers: Optional[Dict[str, str]] = None,
+        response_mode: str = "model",
+        retry: Optional[RetryPolicy] = None,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        http2: bool = False,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        write_timeout: Optional[float] = None,
+        pool_timeout: Optional[float] = None,
+        transport: Optional[str] = None,
+    ) -> None:
+        """
+        初始化异步 HTTP 客户端。
+
+        Args:
+            base_url: OpenCode 服务器的基础 URL
+            directory: 项目目录路径（添加到 x-opencode-directory header）
+            timeout: 请求超时时间（秒），None 表示无超时
+            headers: 要包含在请求中的额外 headers
+            response_mode: 响应模式（"model"、"raw" 或 "lazy"），参见 :mod:`opencode_sdk.lazy`
+            retry: 重试策略，None 表示不重试
+            max_connections: 连接池最大连接数，None 表示不限
+            max_keepalive_connections: 最多保持的空闲连接数，None 表示不限
+            keepalive_expiry: 空闲连接保持时间（秒）
+            http2: 是否启用 HTTP/2 多路复用（需要安装 ``h2``）
+            connect_timeout: 建立连接超时（秒），None 表示沿用 ``timeout``
+            read_timeout: 读取响应超时（秒），None 表示沿用 ``timeout``
+            write_timeout: 发送请求超时（秒），None 表示沿用 ``timeout``
+            pool_timeout: 等待空闲连接超时（秒），None 表示沿用 ``timeout``
+            transport: None 或 "tcp" 表示通过 TCP 连接；"unix:///path.sock" 表示通过
+                Unix 域套接字连接（``base_url`` 仍用于 Host 头和请求路径）
+        """
+        super().__init__(
+            base_url=base_url,
+            directory=directory,
+            timeout=timeout,
+            headers=headers,
+            response_mode=response_mode,
+            retry=retry,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            write_timeout=write_timeout,
+            pool_timeout=pool_timeout,
+            transport=transport,
+        )
+
+        # 创建 httpx 异步客户端
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeouts,
+            headers=self.default_headers,
+            limits=self.limits,
+            http2=self.http2,
+            transport=(
+                httpx.AsyncHTTPTransport(uds=self.uds, limits=self.limits, http2=self.http2)
+                if self.uds
+                else None
+            ),
+        )
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """
+        发送异步 HTTP 请求。
+
+        Args:
+            method: HTTP 方法
+            path: API 端点路径
+            params: 查询参数
+            json_data: JSON 请求体数据
+            data: 表单数据
+            headers: 额外的 headers
+
+        Returns:
+            响应数据
+        """
+        content, headers = _encode_json(json_data, headers)
+        attempt = 0
+        while True:
+            attempt += 1
+            self.retry_stats._record_request()
+            record = self.instrumentation._start(method, path, attempt, content)
+            sent = True
+            try:
+                try:
+                    response = await self.client.request(
+                        method,
+                        path,
+                        params=params,
+                        content=content,
+                        data=data,
+                        headers=headers,
+                    )
+                except httpx.TransportError as e:
+                    sent = not isinstance(e, _UNSENT_ERRORS)
+                    raise _transport_error(e) from e
+                self.instrumentation._received(record, response)
+                result = self._handle_response(response)
+            except Exception as e:
+                self.instrumentation._fail(record, e)
+                if not isinstance(e, (APIError, TimeoutError, ConnectionError)):
+                    raise
+                delay = self._retry_delay(method, e, attempt, sent)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                continue
+            except BaseException as e:
+                self.instrumentation._fail(record, e)
+                raise
+            self.instrumentation._finish(record)
+            self.retry_stats._record_result(attempt, True)
+            return result
+
+    async def get(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """发送异步 GET 请求。"""
+        return await self.request("GET", path, params=params, headers=headers)
+
+    async def post(
+        self,
+        path: str,
+        json_data: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """发送异步 POST 请求。"""
+        return await self.request(
+            "POST", path, params=params, json_data=json_data, data=data, headers=headers
+        )
+
+    async def put(
+        self,
+        path: str,
+        json_data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """发送异步 PUT 请求。"""
+        return await self.request("PUT", path, json_data=json_data, headers=headers)
+
+    async def patch(
+        self,
+        path: str,
+        json_data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """发送异步 PATCH 请求。"""
+        return await self.request("PATCH", path, json_data=json_data, headers=headers)
+
+    async def delete(
+        self,
+        path: str,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """发送异步 DELETE 请求。"""
+        return await self.request("DELETE", path, headers=headers)
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> AsyncIterator[httpx.Response]:
+        """发送异步请求并以流的形式读取响应体，参见 :meth:`HttpClient.stream`。"""
+        content, headers = _encode_json(json_data, headers)
+        record = self.instrumentation._start(method, path, content=content)
+        try:
+            try:
+                async with self.client.stream(
+                    method, path, params=params, content=content, headers=headers
+                ) as response:
+                    self.instrumentation._received(record, response)
+                    if response.status_code >= 400:
+                        await response.aread()
+                        self._handle_response(response)
+                    yield response
+            except httpx.TransportError as e:
+                raise _transport_error(e) from e
+        except BaseException as e:
+            # 包括调用方提前关闭生成器（GeneratorExit）和任务取消，记录为 cancelled
+            self.instrumentation._fail(record, e)
+            raise
+        self.instrumentation._finish(record, response)
+
+    async def aclose(self) -> None:
+        """关闭异步 HTTP 客户端。"""
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "AsyncHttpClient":
+        """异步上下文管理器入口。"""
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """异步上下文管理器退出。"""
+        await self.aclose()
@@ -0,0 +1,590 @@
+"""
+HTTP 请求的生命周期钩子和指标。
+
+每个 HTTP 客户端带有一个 :class:`Instrumentation`（``client.instrumentation``），
+所有经过 ``get/post/put/patch/delete/stream`` 的请求（每次重试单独计）都会：
+
+- 把原始路径归一化为路由模板（``/session/ses_abc/message`` → ``/session/{id}/message``），
+  避免监控系统中出现无限多的标签值
+- 按 (方法, 路由, 状态) 记录 HDR 风格的延迟直方图和收发字节数（:class:`RequestMetrics`）
+- 依次调用注册的 before / after / error 钩子和指标导出器（:class:`MetricsExporter`）
+
+钩子和导出器在发出请求的线程（或事件循环）中同步调用，应当尽快返回；
+它们抛出的异常会传播给调用方。
+
+Example:
+    >>> client = OpencodeClient()
+    >>> client.instrumentation.add_hook(
+    ...     after=lambda r: print(r.method, r.route, r.status, f"{r.elapsed * 1000:.1f} ms")
+    ... )
+    >>> client.sessions.messages("ses_abc")
+    GET /session/{id}/message 200 3.2 ms
+    >>> client.instrumentation.metrics.histogram("/session/{id}/message").percentile(99)
+    0.0041
+"""
+
+import asyncio
+import math
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import httpx
+
+from . import tracing
+from .exceptions import ConnectionError, TimeoutError
+
+# SDK 使用的全部带参数的路由，以及与参数路由同级的固定路由
+ROUTES: Tuple[str, ...] = (
+    "/auth/{providerID}",
+    "/mcp/{name}/auth",
+    "/mcp/{name}/auth/authenticate",
+    "/mcp/{name}/auth/callback",
+    "/mcp/{name}/connect",
+    "/mcp/{name}/disconnect",
+    "/project/current",
+    "/project/{projectID}",
+    "/provider/auth",
+    "/provider/{providerID}/oauth/authorize",
+    "/provider/{providerID}/oauth/callback",
+    "/pty/{ptyID}",
+    "/pty/{ptyID}/connect",
+    "/session/status",
+    "/session/{id}",
+    "/session/{id}/abort",
+    "/session/{id}/children",
+    "/session/{id}/command",
+    "/session/{id}/diff",
+    "/session/{id}/fork",
+    "/session/{id}/init",
+    "/session/{id}/message",
+    "/session/{id}/message/{messageID}",
+    "/session/{id}/permissions/{permissionID}",
+    "/session/{id}/revert",
+    "/session/{id}/share",
+    "/session/{id}/shell",
+    "/session/{id}/summarize",
+    "/session/{id}/todo",
+    "/session/{id}/unrevert",
+)
+
+# 不在路由表中的路径里，看起来像 ID 的片段（含数字且较长，或纯数字）
+_ID_SEGMENT = re.compile(r"^(?:\d+|(?=[^/]*\d)[^/]{8,})$")
+
+# 路由缓存的最大条目数
+_ROUTE_CACHE_SIZE = 4096
+
+# 调用方主动放弃请求时抛出的异常：提前关闭流式响应的生成器，或取消所在的任务
+_CANCELLED = (GeneratorExit, asyncio.CancelledError)
+
+
+class _RouteNode:
+    __slots__ = ("children", "param", "template")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_RouteNode"] = {}
+        self.param: Optional["_RouteNode"] = None
+        self.template: Optional[str] = None
+
+
+class _Router:
+    """把路径匹配到路由模板，固定片段优先于参数片段。"""
+
+    def __init__(self, templates: Iterable[str]) -> None:
+        self._root = _RouteNode()
+        self._cache: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self.add(templates)
+
+    def add(self, templates: Iterable[str]) -> None:
+        with self._lock:
+            for template in templates:
+                node = self._root
+                for segment in template.strip("/").split("/"):
+                    if segment.startswith("{") and segment.endswith("}"):
+                        if node.param is None:
+                            node.param = _RouteNode()
+                        node = node.param
+                    else:
+                        node = node.children.setdefault(segment, _RouteNode())
+                node.template = template
+            self._cache = {}
+
+    def match(self, path: str) -> str:
+        route = self._cache.get(path)
+        if route is None:
+            route = self._match(path)
+            cache = self._cache
+            if len(cache) >= _ROUTE_CACHE_SIZE:
+                cache.clear()
+            cache[path] = route
+        return route
+
+    def _match(self, path: str) -> str:
+        path = path.split("?", 1)[0]
+        segments = path.strip("/").split("/")
+        template = _walk(self._root, segments, 0)
+        if template is not None:
+            return template
+        return "/" + "/".join("{id}" if _ID_SEGMENT.match(s) else s for s in segments)
+
+
+def _walk(node: _RouteNode, segments: List[str], index: int) -> Optional[str]:
+    if index == len(segments):
+        return node.template
+    child = node.children.get(segments[index])
+    if child is not None:
+        template = _walk(child, segments, index + 1)
+        if template is not None:
+            return template
+    if node.param is not None and segments[index]:
+        return _walk(node.param, segments, index + 1)
+    return None
+
+
+class LatencyHistogram:
+    """
+    HDR 风格的对数-线性延迟直方图。
+
+    以微秒为单位计数，每个 2 的幂区间再均分为 128 个桶，任意取值的相对误差不超过 1%，
+    内存占用与记录次数无关。不是线程安全的，:class:`RequestMetrics` 在锁内使用它。
+
+    Example:
+        >>> histogram = LatencyHistogram()
+        >>> for ms in (1, 2, 3, 100):
+        ...     histogram.record(ms / 1000)
+        >>> round(histogram.percentile(50), 4)
+        0.002
+    """
+
+    # 每个 2 的幂区间的桶数为 2 ** (_SUB_BITS - 1)
+    _SUB_BITS = 8
+    _SUB_COUNT = 1 << _SUB_BITS
+    _HALF_COUNT = _SUB_COUNT >> 1
+
+    def __init__(self) -> None:
+        self._counts: List[int] = []
+        self.count = 0
+        self.total = 0.0
+        self.min = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """记录一次耗时（秒）。"""
+        micros = int(seconds * 1_000_000) if seconds > 0 else 0
+        shift = max(micros.bit_length() - self._SUB_BITS, 0)
+        index = shift * self._HALF_COUNT + (micros >> shift)
+        counts = self._counts
+        if index >= len(counts):
+            counts.extend([0] * (index + 1 - len(counts)))
+        counts[index] += 1
+        if not self.count or seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.count += 1
+        self.total += seconds
+
+    def _upper(self, index: int) -> float:
+        """第 index 个桶包含的最大值（秒）。"""
+        if index < self._SUB_COUNT:
+            shift, sub = 0, index
+        else:
+            shift = (index - self._SUB_COUNT) // self._HALF_COUNT + 1
+            sub = index - shift * self._HALF_COUNT
+        return (((sub + 1) << shift) - 1) / 1_000_000
+
+    @property
+    def mean(self) -> float:
+        """平均耗时（秒）。"""
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """
+        返回百分位数（秒）。
+
+        Args:
+            percent: 0 到 100 之间的百分比，例如 99 表示 p99
+
+        Returns:
+            不小于该比例样本的最小桶上界，不超过记录到的最大值；没有样本时为 0
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(percent * self.count / 100))
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen >= rank:
+                return min(max(self._upper(index), self.min), self.max)
+        return self.max
+
+    def buckets(self) -> Iterator[Tuple[float, int]]:
+        """依次产出非空桶的 (上界秒数, 计数)，供导出器换算为目标系统的桶。"""
+        for index, count in enumerate(self._counts):
+            if count:
+                yield self._upper(index), count
+
+    def cumulative(self, bounds: Sequence[float]) -> List[int]:
+        """
+        计算每个上界（秒，升序）以内的累计样本数，对应 Prometheus 的 ``le`` 桶。
+
+        由于桶宽的存在，落在边界附近的样本可能被计入相邻的上界（误差不超过 1%）。
+        """
+        result = []
+        buckets = list(self.buckets())
+        position = seen = 0
+        for bound in bounds:
+            while position < len(buckets) and buckets[position][0] <= bound:
+                seen += buckets[position][1]
+                position += 1
+            result.append(seen)
+        return result
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """把另一个直方图的样本合并进来。"""
+        if not other.count:
+            return
+        counts = self._counts
+        if len(other._counts) > len(counts):
+            counts.extend([0] * (len(other._counts) - len(counts)))
+        for index, count in enumerate(other._counts):
+            counts[index] += count
+        self.min = other.min if not self.count else min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.count += other.count
+        self.total += other.total
+
+    def copy(self) -> "LatencyHistogram":
+        clone = LatencyHistogram()
+        clone.merge(self)
+        return clone
+
+    def snapshot(self) -> Dict[str, float]:
+        """返回计数、总和和常用百分位数（秒）。"""
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.mean,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "p999": self.percentile(99.9),
+        }
+
+
+@dataclass
+class RequestRecord:
+    """一次 HTTP 请求（一次尝试）的信息，依次传给 before、after 或 error 钩子。"""
+
+    method: str
+    """HTTP 方法"""
+
+    path: str
+    """原始请求路径"""
+
+    route: str
+    """路由模板，如 ``/session/{id}/message``"""
+
+    attempt: int = 1
+    """第几次尝试（重试时递增）"""
+
+    status: Optional[int] = None
+    """响应状态码，没有收到响应时为 None"""
+
+    elapsed: float = 0.0
+    """耗时（秒）；流式请求包括读取响应体的时间"""
+
+    bytes_sent: int = 0
+    """JSON 请求体字节数"""
+
+    bytes_received: int = 0
+    """响应体字节数（网络上传输的字节数）"""
+
+    error: Optional[BaseException] = None
+    """请求失败时的异常"""
+
+    started: float = field(default=0.0, repr=False)
+    """开始时间（``time.perf_counter()``）"""
+
+    span: Any = field(default=None, repr=False)
+    """启用 OpenTelemetry 追踪时请求对应的 span"""
+
+    @property
+    def outcome(self) -> str:
+        """
+        指标使用的状态标签：有响应时为状态码，否则为 ``timeout``、``connection`` 或 ``error``；
+        调用方提前停止读取流式响应或取消请求时为 ``cancelled``。
+        """
+        if isinstance(self.error, _CANCELLED):
+            return "cancelled"
+        if self.status is not None:
+            return str(self.status)
+        if isinstance(self.error, TimeoutError):
+            return "timeout"
+        if isinstance(self.error, ConnectionError):
+            return "connection"
+        return "error"
+
+
+@dataclass
+class RouteSeries:
+    """一个 (方法, 路由, 状态) 组合的累计指标。"""
+
+    method: str
+    route: str
+    status: str
+    """状态码或 ``timeout`` / ``connection`` / ``error`` / ``cancelled``"""
+
+    count: int = 0
+    errors: int = 0
+    """失败的请求数（包括错误状态码）"""
+
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "method": self.method,
+            "route": self.route,
+            "status": self.status,
+            "count": self.count,
+            "errors": self.errors,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "latency": self.latency.snapshot(),
+        }
+
+
+class RequestMetrics:
+    """按 (方法, 路由, 状态) 汇总的请求指标，可在多个线程中共享。"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._series: Dict[Tuple[str, str, str], RouteSeries] = {}
+
+    def _record(self, record: RequestRecord) -> None:
+        key = (record.method, record.route, record.outcome)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = RouteSeries(*key)
+            series.count += 1
+            if record.error is not None:
+                series.errors += 1
+            series.bytes_sent += record.bytes_sent
+            series.bytes_received += record.bytes_received
+            series.latency.record(record.elapsed)
+
+    def series(self) -> List[RouteSeries]:
+        """返回所有组合的指标副本，供拉取式导出器（如 Prometheus collector）使用。"""
+        with self._lock:
+            return [
+                RouteSeries(
+                    s.method,
+                    s.route,
+                    s.status,
+                    s.count,
+                    s.errors,
+                    s.bytes_sent,
+                    s.bytes_received,
+                    s.latency.copy(),
+                )
+                for s in self._series.values()
+            ]
+
+    def histogram(
+        self,
+        route: Optional[str] = None,
+        method: Optional[str] = None,
+        status: Optional[Union[int, str]] = None,
+    ) -> LatencyHistogram:
+        """
+        合并符合条件的延迟直方图。
+
+        Args:
+            route: 路由模板，None 表示全部
+            method: HTTP 方法，None 表示全部
+            status: 状态码或 ``timeout`` / ``connection`` / ``error`` / ``cancelled``，None 表示全部
+
+        Returns:
+            合并后的直方图（副本）
+        """
+        wanted = None if status is None else str(status)
+        merged = LatencyHistogram()
+        with self._lock:
+            for (m, r, s), series in self._series.items():
+                if (
+                    (route is None or r == route)
+                    and (method is None or m == method)
+                    and (wanted is None or s == wanted)
+                ):
+                    merged.merge(series.latency)
+        return merged
+
+    def snapshot(self) -> Dict[str, Any]:
+        """返回总计和每个组合的指标，便于序列化或导出到监控系统。"""
+        series = self.series()
+        return {
+            "requests": sum(s.count for s in series),
+            "errors": sum(s.errors for s in series),
+            "bytes_sent": sum(s.bytes_sent for s in series),
+            "bytes_received": sum(s.bytes_received for s in series),
+            "routes": [s.snapshot() for s in series],
+        }
+
+    def reset(self) -> None:
+        """清空所有指标。"""
+        with self._lock:
+            self._series = {}
+
+
+class MetricsExporter(ABC):
+    """
+    指标导出器接口。
+
+    推送式导出器（如 StatsD）继承本类并实现 :meth:`export`，每次请求结束（无论成功或
+    失败）后收到一条 :class:`RequestRecord`；拉取式导出器（如 Prometheus collector）
+    可以直接读取 ``instrumentation.metrics.series()``，不必实现本接口。
+
+    Example:
+        >>> class StatsdExporter(MetricsExporter):
+        ...     def __init__(self, statsd):
+        ...         self.statsd = statsd
+        ...     def export(self, record):
+        ...         tags = [f"route:{record.route}", f"status:{record.outcome}"]
+        ...         self.statsd.timing("opencode.http.request", record.elapsed * 1000, tags=tags)
+        >>> client.instrumentation.add_exporter(StatsdExporter(statsd))
+    """
+
+    @abstractmethod
+    def export(self, record: RequestRecord) -> None:
+        """处理一次已结束的请求。"""
+
+
+Hook = Callable[[RequestRecord], Any]
+
+
+def _received_bytes(response: httpx.Response) -> int:
+    if response.num_bytes_downloaded:
+        return response.num_bytes_downloaded
+    try:
+        return len(response.content)
+    except httpx.ResponseNotRead:
+        return 0
+
+
+class Instrumentation:
+    """
+    HTTP 客户端的钩子、导出器和指标。
+
+    每次尝试依次经过：``before`` 钩子 → 发送请求 → 记录指标 → ``after`` 钩子（成功）
+    或 ``error`` 钩子（传输错误、错误状态码或响应解析失败）→ 导出器。
+    """
+
+    def __init__(self, routes: Iterable[str] = ()) -> None:
+        """
+        Args:
+            routes: 追加到 :data:`ROUTES` 的路由模板
+        """
+        self.metrics = RequestMetrics()
+        self._router = _Router((*ROUTES, *routes))
+        # 注册时整体替换元组，请求路径上无需加锁
+        self._before: Tuple[Hook, ...] = ()
+        self._after: Tuple[Hook, ...] = ()
+        self._error: Tuple[Hook, ...] = ()
+        self._exporters: Tuple[MetricsExporter, ...] = ()
+
+    def route(self, path: str) -> str:
+        """返回路径对应的路由模板。"""
+        return self._router.match(path)
+
+    def add_routes(self, *templates: str) -> None:
+        """注册额外的路由模板，如 ``"/experimental/widget/{widgetID}"``。"""
+        self._router.add(templates)
+
+    def add_hook(
+        self,
+        before: Optional[Hook] = None,
+        after: Optional[Hook] = None,
+        error: Optional[Hook] = None,
+    ) -> Callable[[], None]:
+        """
+        注册生命周期钩子。
+
+        Args:
+            before: 发出请求前调用
+            after: 请求成功后调用
+            error: 请求失败后调用，``record.error`` 为异常
+
+        Returns:
+            取消注册的函数
+        """
+        if before is not None:
+            self._before += (before,)
+        if after is not None:
+            self._after += (after,)
+        if error is not None:
+            self._error += (error,)
+
+        def remove() -> None:
+            self._before = tuple(h for h in self._before if h is not before)
+            self._after = tuple(h for h in self._after if h is not after)
+            self._error = tuple(h for h in self._error if h is not error)
+
+        return remove
+
+    def add_exporter(self, exporter: MetricsExporter) -> None:
+        """注册指标导出器。"""
+        self._exporters += (exporter,)
+
+    def remove_exporter(self, exporter: MetricsExporter) -> None:
+        """取消注册指标导出器。"""
+        self._exporters = tuple(e for e in self._exporters if e is not exporter)
+
+    def _start(
+        self, method: str, path: str, attempt: int = 1, content: Optional[bytes] = None
+    ) -> RequestRecord:
+        record = RequestRecord(method, path, self._router.match(path), attempt)
+        if content:
+            record.bytes_sent = len(content)
+        for hook in self._before:
+            hook(record)
+        if tracing._tracer is not None:
+            record.span = tracing.start_request_span(record)
+        record.started = time.perf_counter()
+        return record
+
+    def _received(self, record: RequestRecord, response: httpx.Response) -> None:
+        record.elapsed = time.perf_counter() - record.started
+        record.status = response.status_code
+        record.bytes_received = _received_bytes(response)
+
+    def _finish(self, record: RequestRecord, response: Optional[httpx.Response] = None) -> None:
+        if response is not None:
+            self._received(record, response)
+        self.metrics._record(record)
+        if record.span is not None:
+            tracing.end_request_span(record)
+        for hook in self._after:
+            hook(record)
+        for exporter in self._exporters:
+            exporter.export(record)
+
+    def _fail(self, record: RequestRecord, error: BaseException) -> None:
+        if record.status is None:
+            record.elapsed = time.perf_counter() - record.started
+        record.error = error
+        self.metrics._record(record)
+        if record.span is not None:
+            tracing.end_request_span(record)
+        for hook in self._error:
+            hook(record)
+        for exporter in self._exporters:
+            exporter.export(record)
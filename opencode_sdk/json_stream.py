@@ -0,0 +1,158 @@
+"""
+增量 JSON 解码。
+
+大型 JSON 数组响应（如 ``find.text()`` 的搜索结果）可以边接收边解码：
+:class:`JSONArrayDecoder` 按块接收字节，每当一个顶层元素完整到达时就把它解码并返回，
+不必等整个响应体下载完毕，内存中也只保留尚未完整的元素。服务器以 NDJSON
+（每行一个 JSON 值）返回时使用 :class:`NDJSONDecoder`。
+
+数组元素由标准库 ``json`` 的 C 扫描器（``raw_decode``）逐个解码，不完整的元素留在
+缓冲区中等待后续数据；NDJSON 的每一行交给当前的编解码器（:mod:`opencode_sdk.codec`）解码。
+"""
+
+import codecs
+import json
+import re
+from typing import Any, List
+
+from . import codec
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# 顶层标量之后允许出现的字符
+_SCALAR_END = frozenset(",] \t\n\r")
+
+# 不完整的元素超过这个长度后，不再每收到一块数据就重新解析
+_RETRY_THRESHOLD = 64 * 1024
+
+# 解析状态
+_START, _VALUE_OR_END, _VALUE, _SEPARATOR, _DONE = range(5)
+
+
+class JSONArrayDecoder:
+    """
+    顶层 JSON 数组的增量解码器。
+
+    Example:
+        >>> decoder = JSONArrayDecoder()
+        >>> decoder.feed(b'[{"a": 1}, {"a"')
+        [{'a': 1}]
+        >>> decoder.feed(b': 2}]')
+        [{'a': 2}]
+        >>> decoder.close()
+        []
+    """
+
+    def __init__(self) -> None:
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._decode = json.JSONDecoder().raw_decode
+        # 尚未解码的文本（从下一个待处理的字符开始）
+        self._text = ""
+        self._state = _START
+        # 缓冲区至少达到这个长度才再次尝试解码不完整的元素，避免大元素被反复解析
+        self._retry_at = 0
+
+    def feed(self, data: bytes) -> List[Any]:
+        """
+        追加一块数据，返回其中完整到达的元素。
+
+        Args:
+            data: 响应体的下一块字节
+
+        Returns:
+            已解码的元素列表（可能为空）
+
+        Raises:
+            ValueError: 数据不是 JSON 数组
+        """
+        text = self._text + self._utf8.decode(data)
+        if len(text) < self._retry_at:
+            self._text = text
+            return []
+        items: List[Any] = []
+        pos = self._parse(text, items)
+        self._text = text[pos:]
+        return items
+
+    def _parse(self, text: str, items: List[Any]) -> int:
+        """从 text 开头解析尽可能多的元素，返回已处理的长度。"""
+        size = len(text)
+        pos = 0
+        state = self._state
+        self._retry_at = 0
+        while True:
+            pos = _WHITESPACE.match(text, pos).end()  # type: ignore[union-attr]
+            if pos >= size:
+                break
+            char = text[pos]
+            if state == _DONE:
+                raise ValueError("JSON 数组结束后还有多余的数据")
+            if state == _START:
+                if char != "[":
+                    raise ValueError("响应不是 JSON 数组")
+                state = _VALUE_OR_END
+                pos += 1
+            elif state == _SEPARATOR or (state == _VALUE_OR_END and char == "]"):
+                if char == "]":
+                    state = _DONE
+                elif char == "," and state == _SEPARATOR:
+                    state = _VALUE
+                else:
+                    raise ValueError(f"JSON 数组格式错误: 意外的字符 {char!r}")
+                pos += 1
+            else:
+                try:
+                    item, end = self._decode(text, pos)
+                except json.JSONDecodeError:
+                    # 元素尚不完整。大元素等缓冲区增长一半以上再试，
+                    # 跨越多块的大元素总解析量仍为线性
+                    remaining = size - pos
+                    if remaining >= _RETRY_THRESHOLD:
+                        self._retry_at = remaining + remaining // 2
+                    break
+                if not isinstance(item, (dict, list, str)) and (
+                    end >= size or text[end] not in _SCALAR_END
+                ):
+                    # 数字等标量没有自己的结束符：``1.`` 或 ``1.5e`` 只解码出了前缀，
+                    # 后面必须跟着分隔符、``]`` 或空白才算完整
+                    break
+                items.append(item)
+                pos = end
+                state = _SEPARATOR
+        self._state = state
+        return pos
+
+    def close(self) -> List[Any]:
+        """
+        确认数组已经完整结束。
+
+        Returns:
+            缓冲区中剩余的元素
+
+        Raises:
+            ValueError: 数据在数组结束前中断
+        """
+        text = self._text + self._utf8.decode(b"", final=True)
+        items: List[Any] = []
+        self._text = text[self._parse(text, items) :]
+        if self._state != _DONE:
+            raise ValueError("JSON 数组不完整，响应可能被截断")
+        return items
+
+
+class NDJSONDecoder:
+    """按行分隔的 JSON（NDJSON）增量解码器，接口与 :class:`JSONArrayDecoder` 相同。"""
+
+    def __init__(self) -> None:
+        self._buffer = b""
+
+    def feed(self, data: bytes) -> List[Any]:
+        """追加一块数据，返回其中完整的行解码后的值。"""
+        lines = (self._buffer + data).split(b"\n")
+        self._buffer = lines.pop()
+        return [codec.loads(line) for line in lines if line.strip()]
+
+    def close(self) -> List[Any]:
+        """解码没有以换行符结尾的最后一行。"""
+        line, self._buffer = self._buffer, b""
+        return [codec.loads(line)] if line.strip() else []
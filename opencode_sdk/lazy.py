@@ -0,0 +1,180 @@
+"""
+响应的原始（raw）与惰性（lazy）模式。
+
+默认情况下，每个响应都会被完整校验为 pydantic 模型。对于只读取少数字段的
+批处理任务，这部分开销可以省去：
+
+- ``raw``：直接返回服务器的 JSON（dict / list），不做任何校验；
+- ``lazy``：返回 :class:`LazyModel` 轻量视图，字段在首次访问时才校验并缓存。
+"""
+
+from functools import lru_cache
+from typing import Annotated, Any, Dict, Optional, Tuple, Type, get_args, get_origin
+
+from pydantic import BaseModel, Field, TypeAdapter
+from pydantic.fields import FieldInfo
+
+# 支持的响应模式
+RESPONSE_MODES = ("model", "raw", "lazy")
+
+
+def resolve_response_mode(
+    default: str,
+    raw: Optional[bool] = None,
+    lazy: Optional[bool] = None,
+) -> str:
+    """
+    根据客户端默认值和单次调用的参数确定响应模式。
+
+    Args:
+        default: 客户端级别的响应模式
+        raw: 单次调用是否返回原始 JSON
+        lazy: 单次调用是否返回惰性视图
+
+    Returns:
+        ``"model"``、``"raw"`` 或 ``"lazy"``
+    """
+    if raw:
+        return "raw"
+    if lazy:
+        return "lazy"
+    if (raw is False and default == "raw") or (lazy is False and default == "lazy"):
+        return "model"
+    return default
+
+
+def check_response_mode(mode: str) -> str:
+    """校验响应模式名称。"""
+    if mode not in RESPONSE_MODES:
+        raise ValueError(f"无效的响应模式: {mode!r}，可选值为 {', '.join(RESPONSE_MODES)}")
+    return mode
+
+
+@lru_cache(maxsize=None)
+def _field_specs(model: Type[BaseModel]) -> Dict[str, Tuple[str, TypeAdapter, FieldInfo]]:
+    """模型字段名 -> (JSON 键, 字段校验器, 字段信息)，每个模型只构建一次。"""
+    specs = {}
+    for name, field in model.model_fields.items():
+        # 保留判别字段和约束，使字段单独校验时与整体校验行为一致
+        annotation: Any = field.annotation
+        metadata = list(field.metadata)
+        if field.discriminator is not None:
+            metadata.append(Field(discriminator=field.discriminator))
+        if metadata:
+            # Python 3.10 不支持下标中的星号解包，先组成元组
+            args = (annotation, *metadata)
+            annotation = Annotated[args]
+        adapter: TypeAdapter = TypeAdapter(annotation)
+        specs[name] = (field.alias or name, adapter, field)
+    return specs
+
+
+@lru_cache(maxsize=None)
+def _union_members(tp: Any) -> Optional[Tuple[str, Dict[Any, Type[BaseModel]]]]:
+    """解析 ``Annotated[Union[...], Field(discriminator=...)]``，返回判别字段和取值映射。"""
+    if get_origin(tp) is not Annotated:
+        return None
+    union, *metadata = get_args(tp)
+    discriminator = next(
+        (m.discriminator for m in metadata if isinstance(m, FieldInfo) and m.discriminator),
+        None,
+    )
+    if not isinstance(discriminator, str):
+        return None
+    classes = get_args(union)
+    members = {cls.model_fields[discriminator].default: cls for cls in classes}
+    key = classes[0].model_fields[discriminator].alias or discriminator
+    return key, members
+
+
+class LazyModel:
+    """
+    模型的惰性视图。
+
+    持有原始字典，访问某个字段时才校验该字段（嵌套对象整体校验为对应模型）
+    并缓存结果；未访问的字段完全不产生开销。
+
+    Example:
+        >>> messages = client.sessions.messages("ses_123", lazy=True)
+        >>> for msg in messages:
+        ...     print(msg.id, msg.role, msg.time.created)  # 只校验这三个字段
+        >>> full = messages[0].to_model()  # 需要时转换为完整模型
+    """
+
+    __slots__ = ("_data", "_model", "_cache")
+
+    def __init__(self, data: Dict[str, Any], model: Type[BaseModel]) -> None:
+        """
+        初始化惰性视图。
+
+        Args:
+            data: 服务器返回的原始字典
+            model: 对应的 pydantic 模型类
+        """
+        self._data = data
+        self._model = model
+        self._cache: Dict[str, Any] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        cache = self._cache
+        if name in cache:
+            return cache[name]
+        spec = _field_specs(self._model).get(name)
+        if spec is None:
+            raise AttributeError(f"{self._model.__name__!r} 没有字段 {name!r}")
+        key, adapter, field = spec
+        data = self._data
+        if key in data:
+            value = adapter.validate_python(data[key])
+        elif name in data:
+            value = adapter.validate_python(data[name])
+        elif field.is_required():
+            raise AttributeError(f"{self._model.__name__!r} 缺少必填字段 {key!r}")
+        else:
+            value = field.get_default(call_default_factory=True)
+        cache[name] = value
+        return value
+
+    @property
+    def model_class(self) -> Type[BaseModel]:
+        """对应的模型类。"""
+        return self._model
+
+    def to_dict(self) -> Dict[str, Any]:
+        """返回原始字典（不复制）。"""
+        return self._data
+
+    def to_model(self) -> BaseModel:
+        """完整校验并返回模型对象。"""
+        return self._model.model_validate(self._data)
+
+    def __dir__(self) -> Any:
+        return list(_field_specs(self._model)) + ["model_class", "to_dict", "to_model"]
+
+    def __repr__(self) -> str:
+        return f"LazyModel({self._model.__name__}, keys={list(self._data)})"
+
+
+def lazy_view(data: Any, tp: Any) -> Any:
+    """
+    为原始 JSON 创建惰性视图。
+
+    Args:
+        data: 服务器返回的字典或字典列表
+        tp: 模型类，或按判别字段区分的联合类型（如 Message）
+
+    Returns:
+        LazyModel 或 LazyModel 列表；无法确定模型时原样返回
+    """
+    if isinstance(data, list):
+        return [lazy_view(item, tp) for item in data]
+    if not isinstance(data, dict):
+        return data
+    union = _union_members(tp)
+    if union is not None:
+        discriminator, members = union
+        model = members.get(data.get(discriminator))
+        if model is None:
+            return data
+        return LazyModel(data, model)
+    return LazyModel(data, tp)
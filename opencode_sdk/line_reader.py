@@ -0,0 +1,283 @@
+"""
+分块按行读取大文件。
+
+:func:`iter_lines` 和 :func:`aiter_lines` 把文件切成固定行数的区间，通过
+``files.read(path, start_line, end_line)`` 分块读取，同时保持多个区间请求在途（流水线），
+按顺序逐行产出。某个区间返回的行数不足时视为到达文件末尾，之后的区间请求会被取消。
+
+:class:`MappedLines` 把读取的行写入临时文件并通过 ``mmap`` 映射，只在内存中保留每行的
+偏移量，适合需要随机访问、但不希望把整个文件放在堆上的场景。
+
+一般通过 ``client.files.iter_lines()`` 和 ``client.files.read_mapped()`` 使用。
+"""
+
+import asyncio
+import mmap
+import tempfile
+from array import array
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    overload,
+)
+
+from .exceptions import OpencodeException
+
+
+def _split_lines(content: Any) -> List[str]:
+    """把区间内容拆分为行（不含换行符）。"""
+    if getattr(content, "encoding", None) == "base64":
+        raise OpencodeException("二进制文件不支持按行读取")
+    text = content.content
+    if not text:
+        return []
+    lines = text.split("\n")
+    if text.endswith("\n"):
+        lines.pop()
+    return lines
+
+
+def _check_args(
+    chunk_lines: int, concurrency: int, start_line: int, end_line: Optional[int]
+) -> None:
+    if chunk_lines <= 0:
+        raise ValueError("chunk_lines 必须为正整数")
+    if concurrency <= 0:
+        raise ValueError("concurrency 必须为正整数")
+    if start_line <= 0:
+        raise ValueError("start_line 从 1 开始")
+    if end_line is not None and end_line < start_line:
+        raise ValueError("end_line 不能小于 start_line")
+
+
+def _ranges(
+    chunk_lines: int, start_line: int, end_line: Optional[int]
+) -> Iterator[Tuple[int, int]]:
+    """依次生成 (起始行, 结束行) 区间，行号从 1 开始、包含两端。"""
+    start = start_line
+    while end_line is None or start <= end_line:
+        end = start + chunk_lines - 1
+        if end_line is not None:
+            end = min(end, end_line)
+        yield start, end
+        start = end + 1
+
+
+def iter_lines(
+    read: Callable[[str, int, int], Any],
+    path: str,
+    chunk_lines: int = 1000,
+    concurrency: int = 4,
+    start_line: int = 1,
+    end_line: Optional[int] = None,
+) -> Iterator[str]:
+    """
+    在线程池中流水线读取文件区间，按顺序逐行产出。
+
+    参数含义参见 :meth:`FileResource.iter_lines`。
+
+    Args:
+        read: 读取区间的函数，签名同 ``FileResource.read(path, start_line, end_line)``
+
+    Yields:
+        文件的每一行（不含换行符）
+    """
+    _check_args(chunk_lines, concurrency, start_line, end_line)
+    ranges = _ranges(chunk_lines, start_line, end_line)
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="opencode-lines")
+    pending: Deque[Tuple["Future[Any]", int]] = deque()
+    try:
+        while True:
+            while len(pending) < concurrency:
+                span = next(ranges, None)
+                if span is None:
+                    break
+                pending.append((executor.submit(read, path, *span), span[1] - span[0] + 1))
+            if not pending:
+                return
+            future, expected = pending.popleft()
+            lines = _split_lines(future.result())
+            yield from lines
+            if len(lines) < expected:
+                # 文件已经结束
+                return
+    finally:
+        for future, _ in pending:
+            future.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def aiter_lines(
+    read: Callable[[str, int, int], Awaitable[Any]],
+    path: str,
+    chunk_lines: int = 1000,
+    concurrency: int = 4,
+    start_line: int = 1,
+    end_line: Optional[int] = None,
+) -> AsyncIterator[str]:
+    """在事件循环中流水线读取文件区间，参见 :func:`iter_lines`。"""
+    _check_args(chunk_lines, concurrency, start_line, end_line)
+    ranges = _ranges(chunk_lines, start_line, end_line)
+    pending: Deque[Tuple["asyncio.Future[Any]", int]] = deque()
+    try:
+        while True:
+            while len(pending) < concurrency:
+                span = next(ranges, None)
+                if span is None:
+                    break
+                pending.append((asyncio.ensure_future(read(path, *span)), span[1] - span[0] + 1))
+            if not pending:
+                return
+            task, expected = pending.popleft()
+            lines = _split_lines(await task)
+            for line in lines:
+                yield line
+            if len(lines) < expected:
+                return
+    finally:
+        for task, _ in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*(task for task, _ in pending), return_exceptions=True)
+
+
+class MappedLines:
+    """
+    映射到临时文件的只读行序列。
+
+    行以 UTF-8 写入临时文件并通过 ``mmap`` 读取，堆上只保存每行的偏移量（每行 8 字节）。
+    支持 ``len()``、下标（从 0 开始）和切片，临时文件在 :meth:`close` 时删除。
+
+    Example:
+        >>> with client.files.read_mapped("logs/server.log") as lines:
+        ...     print(len(lines), lines[-1])
+        ...     errors = [i for i, line in enumerate(lines) if "ERROR" in line]
+    """
+
+    def __init__(self, directory: Optional[str] = None) -> None:
+        """
+        创建空的行序列。
+
+        Args:
+            directory: 临时文件所在目录，None 表示系统默认临时目录
+        """
+        self._file = tempfile.TemporaryFile(dir=directory)
+        # 第 i 行的字节范围为 [_offsets[i], _offsets[i + 1] - 1)，末尾的 1 字节是换行符
+        self._offsets = array("Q", [0])
+        self._map: Optional[mmap.mmap] = None
+
+    def extend(self, lines: Iterable[str]) -> None:
+        """追加多行。"""
+        if self._map is not None:
+            raise ValueError("MappedLines 已完成写入")
+        offsets = self._offsets
+        position = offsets[-1]
+        chunk = []
+        for line in lines:
+            data = line.encode("utf-8", "surrogatepass") + b"\n"
+            position += len(data)
+            offsets.append(position)
+            chunk.append(data)
+        self._file.write(b"".join(chunk))
+
+    def seal(self) -> "MappedLines":
+        """结束写入并映射文件。"""
+        if self._map is None:
+            self._file.flush()
+            if self._offsets[-1]:
+                self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self
+
+    @property
+    def nbytes(self) -> int:
+        """临时文件的字节数。"""
+        return self._offsets[-1]
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[str]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("行号超出范围")
+        if self._map is None:
+            raise ValueError("MappedLines 尚未完成写入，请先调用 seal()")
+        start, end = self._offsets[index], self._offsets[index + 1] - 1
+        return self._map[start:end].decode("utf-8", "surrogatepass")
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def close(self) -> None:
+        """关闭映射并删除临时文件。"""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __enter__(self) -> "MappedLines":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+# 写入临时文件时每批的行数
+_SPILL_BATCH = 10_000
+
+
+def spill_lines(lines: Iterable[str], directory: Optional[str] = None) -> MappedLines:
+    """把行写入 :class:`MappedLines`，出错时删除临时文件。"""
+    mapped = MappedLines(directory)
+    try:
+        batch: List[str] = []
+        for line in lines:
+            batch.append(line)
+            if len(batch) >= _SPILL_BATCH:
+                mapped.extend(batch)
+                batch.clear()
+        mapped.extend(batch)
+        return mapped.seal()
+    except BaseException:
+        mapped.close()
+        raise
+
+
+async def aspill_lines(lines: AsyncIterable[str], directory: Optional[str] = None) -> MappedLines:
+    """异步版本的 :func:`spill_lines`。"""
+    mapped = MappedLines(directory)
+    try:
+        batch: List[str] = []
+        async for line in lines:
+            batch.append(line)
+            if len(batch) >= _SPILL_BATCH:
+                mapped.extend(batch)
+                batch.clear()
+        mapped.extend(batch)
+        return mapped.seal()
+    except BaseException:
+        mapped.close()
+        raise
@@ -11,7 +11,7 @@ from .config import (
     McpRemoteConfig,
     ProviderConfig,
 )
-from .events import Event, GlobalEvent
+from .events import EVENT_ADAPTER, EVENT_CLASS_MAP, Event, GlobalEvent
 from .file import File, FileContent, FileNode, Symbol
 from .message import (
     AgentPart,
@@ -29,7 +29,11 @@ from .message import (
     SubtaskPart,
     TextPart,
     ToolPart,
+    ToolState,
     UserMessage,
+    parse_message,
+    parse_messages,
+    parse_part,
 )
 from .other import (
     Agent,
@@ -45,7 +49,7 @@ from .other import (
     VcsInfo,
 )
 from .provider import Model, Provider, ProviderAuthAuthorization, ProviderAuthMethod
-from .session import Session, SessionStatus
+from .session import SESSION_STATUS_ADAPTER, Session, SessionStatus
 
 __all__ = [
     # 通用模型
@@ -56,11 +60,16 @@ __all__ = [
     # 会话模型
     "Session",
     "SessionStatus",
+    "SESSION_STATUS_ADAPTER",
     # 消息模型
     "Message",
     "UserMessage",
     "AssistantMessage",
     "Part",
+    "ToolState",
+    "parse_message",
+    "parse_messages",
+    "parse_part",
     "TextPart",
     "SubtaskPart",
     "ReasoningPart",
@@ -76,6 +85,8 @@ __all__ = [
     # 事件模型
     "Event",
     "GlobalEvent",
+    "EVENT_ADAPTER",
+    "EVENT_CLASS_MAP",
     # 配置模型
     "Config",
     "AgentConfig",
@@ -4,7 +4,6 @@ from typing import Any, Dict, List, Literal, Optional, Union
 
 from pydantic import BaseModel, Field
 
-
 # ============================================================================
 # 快捷键配置
 # ============================================================================
@@ -36,9 +35,9 @@ class AgentPermission(BaseModel):
     """代理权限配置。"""
 
     edit: Optional[Literal["ask", "allow", "deny"]] = Field(None, description="编辑权限")
-    bash: Optional[Union[Literal["ask", "allow", "deny"], Dict[str, Literal["ask", "allow", "deny"]]]] = Field(
-        None, description="Bash 权限"
-    )
+    bash: Optional[
+        Union[Literal["ask", "allow", "deny"], Dict[str, Literal["ask", "allow", "deny"]]]
+    ] = Field(None, description="Bash 权限")
     webfetch: Optional[Literal["ask", "allow", "deny"]] = Field(None, description="网页抓取权限")
     doom_loop: Optional[Literal["ask", "allow", "deny"]] = Field(None, description="死循环权限")
     external_directory: Optional[Literal["ask", "allow", "deny"]] = Field(
@@ -82,7 +81,9 @@ class ProviderModelCost(BaseModel):
     output: float = Field(..., description="输出成本")
     cache_read: Optional[float] = Field(None, description="缓存读取成本")
     cache_write: Optional[float] = Field(None, description="缓存写入成本")
-    context_over_200k: Optional[Dict[str, float]] = Field(None, description="超过 200k 上下文的成本")
+    context_over_200k: Optional[Dict[str, float]] = Field(
+        None, description="超过 200k 上下文的成本"
+    )
 
 
 class ProviderModelLimit(BaseModel):
@@ -95,8 +96,12 @@ class ProviderModelLimit(BaseModel):
 class ProviderModelModalities(BaseModel):
     """提供商模型模态配置。"""
 
-    input: List[Literal["text", "audio", "image", "video", "pdf"]] = Field(..., description="输入模态")
-    output: List[Literal["text", "audio", "image", "video", "pdf"]] = Field(..., description="输出模态")
+    input: List[Literal["text", "audio", "image", "video", "pdf"]] = Field(
+        ..., description="输入模态"
+    )
+    output: List[Literal["text", "audio", "image", "video", "pdf"]] = Field(
+        ..., description="输出模态"
+    )
 
 
 class ProviderModelConfig(BaseModel):
@@ -281,9 +286,9 @@ class PermissionConfig(BaseModel):
     """权限配置。"""
 
     edit: Optional[Literal["ask", "allow", "deny"]] = Field(None, description="编辑权限")
-    bash: Optional[Union[Literal["ask", "allow", "deny"], Dict[str, Literal["ask", "allow", "deny"]]]] = Field(
-        None, description="Bash 权限"
-    )
+    bash: Optional[
+        Union[Literal["ask", "allow", "deny"], Dict[str, Literal["ask", "allow", "deny"]]]
+    ] = Field(None, description="Bash 权限")
     webfetch: Optional[Literal["ask", "allow", "deny"]] = Field(None, description="网页抓取权限")
     doom_loop: Optional[Literal["ask", "allow", "deny"]] = Field(None, description="死循环权限")
     external_directory: Optional[Literal["ask", "allow", "deny"]] = Field(
@@ -318,9 +323,7 @@ class ExperimentalConfig(BaseModel):
         alias="openTelemetry",
         description="为 AI SDK 调用启用 OpenTelemetry spans（使用 'experimental_telemetry' 标志）",
     )
-    primary_tools: Optional[List[str]] = Field(
-        None, description="仅对主代理可用的工具。"
-    )
+    primary_tools: Optional[List[str]] = Field(None, description="仅对主代理可用的工具。")
 
     class Config:
         populate_by_name = True
@@ -332,7 +335,9 @@ class Config(BaseModel):
     schema_: Optional[str] = Field(None, alias="$schema", description="配置验证的 JSON schema 引用")
     theme: Optional[str] = Field(None, description="界面使用的主题名称")
     keybinds: Optional[KeybindsConfig] = Field(None, description="快捷键配置")
-    log_level: Optional[Literal["DEBUG", "INFO", "WARN", "ERROR"]] = Field(None, alias="logLevel", description="日志级别")
+    log_level: Optional[Literal["DEBUG", "INFO", "WARN", "ERROR"]] = Field(
+        None, alias="logLevel", description="日志级别"
+    )
     tui: Optional[TuiConfig] = Field(None, description="TUI 特定设置")
     command: Optional[Dict[str, CommandConfig]] = Field(None, description="命令配置")
     watcher: Optional[WatcherConfig] = Field(None, description="监视器配置")
@@ -342,7 +347,9 @@ class Config(BaseModel):
         None,
         description="控制分享行为：'manual' 允许通过命令手动分享，'auto' 启用自动分享，'disabled' 禁用所有分享",
     )
-    autoshare: Optional[bool] = Field(None, description="已弃用：使用 'share' 字段代替。自动分享新创建的会话")
+    autoshare: Optional[bool] = Field(
+        None, description="已弃用：使用 'share' 字段代替。自动分享新创建的会话"
+    )
     autoupdate: Optional[Union[bool, Literal["notify"]]] = Field(
         None,
         description="自动更新到最新版本。设置为 true 自动更新，false 禁用，或 'notify' 显示更新通知",
@@ -351,19 +358,31 @@ class Config(BaseModel):
     enabled_providers: Optional[List[str]] = Field(
         None, description="设置后，仅启用这些提供商。所有其他提供商将被忽略"
     )
-    model: Optional[str] = Field(None, description="使用的模型，格式为 provider/model，例如 anthropic/claude-2")
+    model: Optional[str] = Field(
+        None, description="使用的模型，格式为 provider/model，例如 anthropic/claude-2"
+    )
     small_model: Optional[str] = Field(
         None, description="用于标题生成等任务的小模型，格式为 provider/model"
     )
-    username: Optional[str] = Field(None, description="在对话中显示的自定义用户名，而不是系统用户名")
-    mode: Optional[Dict[str, AgentConfig]] = Field(None, description="已弃用：使用 `agent` 字段代替。")
+    username: Optional[str] = Field(
+        None, description="在对话中显示的自定义用户名，而不是系统用户名"
+    )
+    mode: Optional[Dict[str, AgentConfig]] = Field(
+        None, description="已弃用：使用 `agent` 字段代替。"
+    )
     agent: Optional[Dict[str, AgentConfig]] = Field(None, description="代理配置")
-    provider: Optional[Dict[str, ProviderConfig]] = Field(None, description="自定义提供商配置和模型覆盖")
+    provider: Optional[Dict[str, ProviderConfig]] = Field(
+        None, description="自定义提供商配置和模型覆盖"
+    )
     mcp: Optional[Dict[str, McpConfig]] = Field(None, description="MCP（模型上下文协议）服务器配置")
-    formatter: Optional[Union[bool, Dict[str, FormatterConfig]]] = Field(None, description="格式化器配置")
+    formatter: Optional[Union[bool, Dict[str, FormatterConfig]]] = Field(
+        None, description="格式化器配置"
+    )
     lsp: Optional[Union[bool, Dict[str, LspConfig]]] = Field(None, description="LSP 配置")
     instructions: Optional[List[str]] = Field(None, description="要包含的额外指令文件或模式")
-    layout: Optional[Literal["auto", "stretch"]] = Field(None, description="已弃用：始终使用拉伸布局。")
+    layout: Optional[Literal["auto", "stretch"]] = Field(
+        None, description="已弃用：始终使用拉伸布局。"
+    )
     permission: Optional[PermissionConfig] = Field(None, description="权限配置")
     tools: Optional[Dict[str, bool]] = Field(None, description="工具可用性")
     enterprise: Optional[EnterpriseConfig] = Field(None, description="企业配置")
@@ -1,14 +1,13 @@
 """事件数据模型。"""
 
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import Annotated, Any, Dict, List, Literal, Optional, Type, Union, get_args
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 from .common import FileDiff, Permission
 from .message import Message, Part
 from .session import SessionStatus
 
-
 # ============================================================================
 # 服务器事件
 # ============================================================================
@@ -518,45 +517,58 @@ class EventPtyDeleted(BaseModel):
 # 事件联合类型
 # ============================================================================
 
-Event = Union[
-    EventServerInstanceDisposed,
-    EventServerConnected,
-    EventInstallationUpdated,
-    EventInstallationUpdateAvailable,
-    EventLspClientDiagnostics,
-    EventLspUpdated,
-    EventMessageUpdated,
-    EventMessageRemoved,
-    EventMessagePartUpdated,
-    EventMessagePartRemoved,
-    EventMessagePartDelta,
-    EventPermissionUpdated,
-    EventPermissionReplied,
-    EventSessionStatus,
-    EventSessionIdle,
-    EventSessionCompacted,
-    EventSessionCreated,
-    EventSessionUpdated,
-    EventSessionDeleted,
-    EventSessionDiff,
-    EventSessionError,
-    EventFileEdited,
-    EventFileWatcherUpdated,
-    EventVcsBranchUpdated,
-    EventTodoUpdated,
-    EventCommandExecuted,
-    EventTuiPromptAppend,
-    EventTuiCommandExecute,
-    EventTuiToastShow,
-    EventPtyCreated,
-    EventPtyUpdated,
-    EventPtyExited,
-    EventPtyDeleted,
+Event = Annotated[
+    Union[
+        EventServerInstanceDisposed,
+        EventServerConnected,
+        EventInstallationUpdated,
+        EventInstallationUpdateAvailable,
+        EventLspClientDiagnostics,
+        EventLspUpdated,
+        EventMessageUpdated,
+        EventMessageRemoved,
+        EventMessagePartUpdated,
+        EventMessagePartRemoved,
+        EventMessagePartDelta,
+        EventPermissionUpdated,
+        EventPermissionReplied,
+        EventSessionStatus,
+        EventSessionIdle,
+        EventSessionCompacted,
+        EventSessionCreated,
+        EventSessionUpdated,
+        EventSessionDeleted,
+        EventSessionDiff,
+        EventSessionError,
+        EventFileEdited,
+        EventFileWatcherUpdated,
+        EventVcsBranchUpdated,
+        EventTodoUpdated,
+        EventCommandExecuted,
+        EventTuiPromptAppend,
+        EventTuiCommandExecute,
+        EventTuiToastShow,
+        EventPtyCreated,
+        EventPtyUpdated,
+        EventPtyExited,
+        EventPtyDeleted,
+    ],
+    Field(discriminator="type"),
 ]
 
+# 事件类型 -> 事件类，模块加载时构建一次
+EVENT_CLASS_MAP: Dict[str, Type[BaseModel]] = {
+    cls.model_fields["type"].default: cls for cls in get_args(get_args(Event)[0])
+}
+
 
 class GlobalEvent(BaseModel):
     """全局事件包装器。"""
 
     directory: str = Field(..., description="目录")
     payload: Event = Field(..., description="事件载荷")
+
+
+# 缓存的校验器：按 type 字段直接分派，无需逐个尝试联合成员
+EVENT_ADAPTER: TypeAdapter[Event] = TypeAdapter(Event)
+GLOBAL_EVENT_ADAPTER: TypeAdapter[GlobalEvent] = TypeAdapter(GlobalEvent)
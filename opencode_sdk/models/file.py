@@ -6,7 +6,6 @@ from pydantic import BaseModel, Field
 
 from .common import Range
 
-
 # ============================================================================
 # 文件模型
 # ============================================================================
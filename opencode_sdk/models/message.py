@@ -1,12 +1,11 @@
 """消息和部分数据模型。"""
 
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import Annotated, Any, Dict, List, Literal, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 from .common import FileDiff, Range
 
-
 # ============================================================================
 # 消息模型
 # ============================================================================
@@ -101,8 +100,8 @@ class AssistantMessage(BaseModel):
         populate_by_name = True
 
 
-# 消息联合类型
-Message = Union[UserMessage, AssistantMessage]
+# 消息联合类型（按 role 字段分派）
+Message = Annotated[Union[UserMessage, AssistantMessage], Field(discriminator="role")]
 
 
 # ============================================================================
@@ -177,7 +176,7 @@ class SymbolSource(BaseModel):
     kind: int = Field(..., description="符号类型")
 
 
-FilePartSource = Union[FileSource, SymbolSource]
+FilePartSource = Annotated[Union[FileSource, SymbolSource], Field(discriminator="type")]
 
 
 class FilePart(BaseModel):
@@ -236,7 +235,10 @@ class ToolStateError(BaseModel):
     time: Dict[str, int] = Field(..., description="时间信息")
 
 
-ToolState = Union[ToolStatePending, ToolStateRunning, ToolStateCompleted, ToolStateError]
+ToolState = Annotated[
+    Union[ToolStatePending, ToolStateRunning, ToolStateCompleted, ToolStateError],
+    Field(discriminator="status"),
+]
 
 
 class ToolPart(BaseModel):
@@ -376,20 +378,23 @@ class SubtaskPart(BaseModel):
         populate_by_name = True
 
 
-# 所有部分的联合类型
-Part = Union[
-    TextPart,
-    SubtaskPart,
-    ReasoningPart,
-    FilePart,
-    ToolPart,
-    StepStartPart,
-    StepFinishPart,
-    SnapshotPart,
-    PatchPart,
-    AgentPart,
-    RetryPart,
-    CompactionPart,
+# 所有部分的联合类型（按 type 字段分派）
+Part = Annotated[
+    Union[
+        TextPart,
+        SubtaskPart,
+        ReasoningPart,
+        FilePart,
+        ToolPart,
+        StepStartPart,
+        StepFinishPart,
+        SnapshotPart,
+        PatchPart,
+        AgentPart,
+        RetryPart,
+        CompactionPart,
+    ],
+    Field(discriminator="type"),
 ]
 
 
@@ -397,3 +402,65 @@ Part = Union[
 ToolStateCompleted.model_rebuild()
 UserMessage.model_rebuild()
 AssistantMessage.model_rebuild()
+
+
+# 缓存的校验器
+MESSAGE_ADAPTER: TypeAdapter[Message] = TypeAdapter(Message)
+MESSAGES_ADAPTER: TypeAdapter[List[Message]] = TypeAdapter(List[Message])
+PART_ADAPTER: TypeAdapter[Part] = TypeAdapter(Part)
+PARTS_ADAPTER: TypeAdapter[List[Part]] = TypeAdapter(List[Part])
+TOOL_STATE_ADAPTER: TypeAdapter[ToolState] = TypeAdapter(ToolState)
+
+
+def _message_dict(data: Dict[str, Any]) -> Dict[str, Any]:
+    """展开 ``{"info": ..., "parts": [...]}`` 形式的消息。"""
+    if "info" in data and "parts" in data:
+        data = {**data["info"], "parts": data["parts"]}
+    return data
+
+
+def parse_message(data: Dict[str, Any]) -> Message:
+    """
+    将消息字典转换为 UserMessage 或 AssistantMessage。
+
+    按 ``role`` 字段直接分派，并支持 ``{"info": ..., "parts": [...]}`` 形式的响应。
+
+    Args:
+        data: 消息字典
+
+    Returns:
+        消息对象
+
+    Raises:
+        pydantic.ValidationError: 缺少 ``role`` 字段或角色未知
+    """
+    return MESSAGE_ADAPTER.validate_python(_message_dict(data))
+
+
+def parse_messages(items: List[Dict[str, Any]]) -> List[Message]:
+    """
+    批量转换消息列表，整个列表只经过一次校验器调用。
+
+    Args:
+        items: 消息字典列表
+
+    Returns:
+        消息对象列表
+
+    Raises:
+        pydantic.ValidationError: 某条消息缺少 ``role`` 字段或角色未知
+    """
+    return MESSAGES_ADAPTER.validate_python([_message_dict(item) for item in items])
+
+
+def parse_part(data: Dict[str, Any]) -> Part:
+    """
+    将部分字典转换为对应的 Part 模型（按 ``type`` 字段分派）。
+
+    Args:
+        data: 部分字典
+
+    Returns:
+        部分对象
+    """
+    return PART_ADAPTER.validate_python(data)
@@ -4,7 +4,6 @@ from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
-
 # ============================================================================
 # PTY 模型
 # ============================================================================
@@ -179,7 +178,13 @@ class McpStatusNeedsClientRegistration(BaseModel):
     error: str = Field(..., description="错误消息")
 
 
-McpStatus = McpStatusConnected | McpStatusDisabled | McpStatusFailed | McpStatusNeedsAuth | McpStatusNeedsClientRegistration
+McpStatus = (
+    McpStatusConnected
+    | McpStatusDisabled
+    | McpStatusFailed
+    | McpStatusNeedsAuth
+    | McpStatusNeedsClientRegistration
+)
 
 
 # ============================================================================
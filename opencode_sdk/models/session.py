@@ -1,8 +1,8 @@
 """会话数据模型。"""
 
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import Annotated, Any, Dict, List, Literal, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 from .common import FileDiff
 
@@ -28,8 +28,17 @@ class SessionStatusBusy(BaseModel):
     type: Literal["busy"] = "busy"
 
 
-# 会话状态联合类型
-SessionStatus = Union[SessionStatusIdle, SessionStatusRetry, SessionStatusBusy]
+# 会话状态联合类型（按 type 字段分派）
+SessionStatus = Annotated[
+    Union[SessionStatusIdle, SessionStatusRetry, SessionStatusBusy],
+    Field(discriminator="type"),
+]
+
+# 缓存的校验器
+SESSION_STATUS_ADAPTER: TypeAdapter[SessionStatus] = TypeAdapter(SessionStatus)
+SESSION_STATUS_MAP_ADAPTER: TypeAdapter[Dict[str, SessionStatus]] = TypeAdapter(
+    Dict[str, SessionStatus]
+)
 
 
 class SessionSummary(BaseModel):
@@ -1,26 +1,26 @@
 """OpenCode SDK 的资源模块。"""
 
-from .base import BaseResource
-from .session import SessionResource
-from .event import EventResource
-from .project import ProjectResource
-from .config import ConfigResource
-from .provider import ProviderResource
-from .file import FileResource
-from .find import FindResource
-from .mcp import McpResource, McpAuthResource
-from .lsp import LspResource
-from .pty import PtyResource
-from .tool import ToolResource
-from .tui import TuiResource
-from .app import AppResource
-from .command import CommandResource
-from .global_resource import GlobalResource
-from .instance import InstanceResource
-from .path import PathResource
-from .vcs import VcsResource
-from .formatter import FormatterResource
-from .auth import AuthResource
+from .app import AppResource, AsyncAppResource
+from .auth import AsyncAuthResource, AuthResource
+from .base import AsyncBaseResource, BaseResource
+from .command import AsyncCommandResource, CommandResource
+from .config import AsyncConfigResource, ConfigResource
+from .event import AsyncEventResource, EventResource
+from .file import AsyncFileResource, FileResource
+from .find import AsyncFindResource, FindResource
+from .formatter import AsyncFormatterResource, FormatterResource
+from .global_resource import AsyncGlobalResource, GlobalResource
+from .instance import AsyncInstanceResource, InstanceResource
+from .lsp import AsyncLspResource, LspResource
+from .mcp import AsyncMcpAuthResource, AsyncMcpResource, McpAuthResource, McpResource
+from .path import AsyncPathResource, PathResource
+from .project import AsyncProjectResource, ProjectResource
+from .provider import AsyncProviderResource, ProviderResource
+from .pty import AsyncPtyResource, PtyResource
+from .session import AsyncSessionResource, SessionResource
+from .tool import AsyncToolResource, ToolResource
+from .tui import AsyncTuiResource, TuiResource
+from .vcs import AsyncVcsResource, VcsResource
 
 __all__ = [
     "BaseResource",
@@ -45,4 +45,27 @@ __all__ = [
     "VcsResource",
     "FormatterResource",
     "AuthResource",
+    # 异步资源
+    "AsyncBaseResource",
+    "AsyncSessionResource",
+    "AsyncEventResource",
+    "AsyncProjectResource",
+    "AsyncConfigResource",
+    "AsyncProviderResource",
+    "AsyncFileResource",
+    "AsyncFindResource",
+    "AsyncMcpResource",
+    "AsyncMcpAuthResource",
+    "AsyncLspResource",
+    "AsyncPtyResource",
+    "AsyncToolResource",
+    "AsyncTuiResource",
+    "AsyncAppResource",
+    "AsyncCommandResource",
+    "AsyncGlobalResource",
+    "AsyncInstanceResource",
+    "AsyncPathResource",
+    "AsyncVcsResource",
+    "AsyncFormatterResource",
+    "AsyncAuthResource",
 ]
@@ -3,7 +3,7 @@
 from typing import Any, Dict, List, Literal, Optional
 
 from ..http_client import HttpClient
-from .base import BaseResource
+from .base import AsyncBaseResource, BaseResource
 
 
 class AppResource(BaseResource):
@@ -14,7 +14,7 @@ class AppResource(BaseResource):
         service: str,
         level: Literal["debug", "info", "warn", "error"],
         message: str,
-        extra: Optional[Dict[str, Any]] = None
+        extra: Optional[Dict[str, Any]] = None,
     ) -> bool:
         """
         写入日志到服务器。
@@ -31,7 +31,7 @@ class AppResource(BaseResource):
         示例:
             >>> # 写入信息日志
             >>> client.app.log("my-service", "info", "操作成功")
-            
+
             >>> # 写入错误日志并附加元数据
             >>> client.app.log(
             ...     "my-service",
@@ -40,11 +40,7 @@ class AppResource(BaseResource):
             ...     extra={"user_id": "123", "action": "delete"}
             ... )
         """
-        data = {
-            "service": service,
-            "level": level,
-            "message": message
-        }
+        data = {"service": service, "level": level, "message": message}
         if extra is not None:
             data["extra"] = extra
 
@@ -77,3 +73,29 @@ class AppResource(BaseResource):
             ...     print(f"{skill['name']}: {skill['description']}")
         """
         return self._http_client.get("/skill")
+
+
+class AsyncAppResource(AsyncBaseResource):
+    """异步应用管理资源。"""
+
+    async def log(
+        self,
+        service: str,
+        level: Literal["debug", "info", "warn", "error"],
+        message: str,
+        extra: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """异步写入日志到服务器，参见 :meth:`AppResource.log`。"""
+        data = {"service": service, "level": level, "message": message}
+        if extra is not None:
+            data["extra"] = extra
+
+        return await self._http_client.post("/log", json_data=data)
+
+    async def agents(self) -> List[Dict[str, Any]]:
+        """异步列出所有可用的 AI 代理，参见 :meth:`AppResource.agents`。"""
+        return await self._http_client.get("/agent")
+
+    async def skills(self) -> List[Dict[str, Any]]:
+        """异步列出所有可用的技能，参见 :meth:`AppResource.skills`。"""
+        return await self._http_client.get("/skill")
@@ -1,12 +1,84 @@
 """OpenCode SDK 的基础资源类。"""
 
-from typing import TYPE_CHECKING, Any, Dict, Optional
+import copy
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, TypeVar, cast
+
+from ..lazy import lazy_view, resolve_response_mode
 
 if TYPE_CHECKING:
-    from ..http_client import HttpClient
+    from ..http_client import AsyncHttpClient, HttpClient
+    from ..retry import RetryPolicy
+
+
+_ResourceT = TypeVar("_ResourceT", bound="_ResourceMixin")
+_T = TypeVar("_T")
+
+
+class _ResourceMixin:
+    """同步与异步资源共享的逻辑。"""
+
+    _http_client: Any
+
+    def with_retry(self: _ResourceT, retry: Optional["RetryPolicy"]) -> _ResourceT:
+        """
+        返回使用指定重试策略的资源副本，其他资源不受影响。
+
+        Args:
+            retry: 重试策略，None 表示不重试
+
+        Returns:
+            新的资源对象（共享连接池和重试计数）
+
+        Example:
+            >>> client.files = client.files.with_retry(RetryPolicy(max_attempts=5))
+        """
+        clone = copy.copy(self)
+        clone._http_client = self._http_client.with_options(retry=retry)
+        return clone
+
+    def _convert(
+        self,
+        data: Any,
+        build: Callable[[Any], _T],
+        view_type: Any,
+        raw: Optional[bool] = None,
+        lazy: Optional[bool] = None,
+        normalize: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+    ) -> _T:
+        """
+        按响应模式转换响应数据。
+
+        返回类型按默认的 ``model`` 模式标注为 ``build`` 的返回类型，这样公开方法可以
+        继续声明模型类型；``raw`` / ``lazy`` 模式下实际返回原始 JSON 或
+        :class:`~opencode_sdk.lazy.LazyModel`。
+
+        Args:
+            data: 服务器返回的 JSON
+            build: 完整校验时使用的构建函数
+            view_type: 惰性视图对应的模型类或判别联合类型
+            raw: 单次调用是否返回原始 JSON（覆盖客户端设置）
+            lazy: 单次调用是否返回惰性视图（覆盖客户端设置）
+            normalize: 创建惰性视图前对每个字典的预处理
+
+        Returns:
+            模型对象、原始 JSON 或惰性视图
+        """
+        mode = resolve_response_mode(
+            getattr(self._http_client, "response_mode", "model"), raw, lazy
+        )
+        if mode == "model":
+            return build(data)
+        if mode == "raw":
+            return cast(_T, data)
+        if normalize is not None:
+            if isinstance(data, list):
+                data = [normalize(item) for item in data]
+            elif isinstance(data, dict):
+                data = normalize(data)
+        return cast(_T, lazy_view(data, view_type))
 
 
-class BaseResource:
+class BaseResource(_ResourceMixin):
     """所有 API 资源的基类。"""
 
     def __init__(self, client: "HttpClient") -> None:
@@ -62,3 +134,61 @@ class BaseResource:
     ) -> Any:
         """发送 DELETE 请求。"""
         return self._http_client.delete(path, headers=headers)
+
+
+class AsyncBaseResource(_ResourceMixin):
+    """所有异步 API 资源的基类。"""
+
+    def __init__(self, client: "AsyncHttpClient") -> None:
+        """
+        初始化异步资源。
+
+        Args:
+            client: 异步 HTTP 客户端实例
+        """
+        self._http_client = client
+
+    async def _get(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """发送异步 GET 请求。"""
+        return await self._http_client.get(path, params=params, headers=headers)
+
+    async def _post(
+        self,
+        path: str,
+        json_data: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """发送异步 POST 请求。"""
+        return await self._http_client.post(path, json_data=json_data, data=data, headers=headers)
+
+    async def _put(
+        self,
+        path: str,
+        json_data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """发送异步 PUT 请求。"""
+        return await self._http_client.put(path, json_data=json_data, headers=headers)
+
+    async def _patch(
+        self,
+        path: str,
+        json_data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """发送异步 PATCH 请求。"""
+        return await self._http_client.patch(path, json_data=json_data, headers=headers)
+
+    async def _delete(
+        self,
+        path: str,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """发送异步 DELETE 请求。"""
+        return await self._http_client.delete(path, headers=headers)
@@ -3,7 +3,7 @@
 from typing import Any, Dict, List
 
 from ..http_client import HttpClient
-from .base import BaseResource
+from .base import AsyncBaseResource, BaseResource
 
 
 class CommandResource(BaseResource):
@@ -22,3 +22,11 @@ class CommandResource(BaseResource):
             ...     print(f"{cmd['name']}: {cmd['description']}")
         """
         return self._http_client.get("/command")
+
+
+class AsyncCommandResource(AsyncBaseResource):
+    """异步命令管理资源。"""
+
+    async def list(self) -> List[Dict[str, Any]]:
+        """异步列出所有可用的命令，参见 :meth:`CommandResource.list`。"""
+        return await self._http_client.get("/command")
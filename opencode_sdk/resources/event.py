@@ -4,118 +4,173 @@ Event 资源模块。
 提供事件订阅功能，用于接收服务器推送的实时事件。
 """
 
-from typing import AsyncIterator, Optional, Dict, Any
-from ..models.events import Event, GlobalEvent
-from ..sse_client import SSEClient
-from .base import BaseResource
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Union
 
+from ..event_filter import EventFilter
+from ..event_hub import EventHub, get_event_hub
+from ..models.events import Event
+from ..sse_client import ReconnectPolicy, SSEClient
+from .base import AsyncBaseResource, BaseResource
 
-class EventResource(BaseResource):
+
+class _EventMixin(ABC):
     """
-    Event 资源类。
-    
-    提供事件订阅功能，支持：
-    - 全局事件订阅
-    - 会话事件订阅
-    - 实时事件流处理
+    同步与异步 Event 资源共享的订阅方法。
+
+    子类实现 :meth:`_sse_client` 和 :meth:`_send_prompt`。
     """
-    
+
+    _http_client: Any
+
+    @abstractmethod
+    def _sse_client(self) -> SSEClient:
+        """创建用于订阅事件流的 SSE 客户端。"""
+
+    @abstractmethod
+    async def _send_prompt(self, url: str, data: Dict[str, Any], params: Dict[str, Any]) -> None:
+        """发送 prompt_async 请求。"""
+
+    def hub(
+        self,
+        url: str = "/global/event",
+        params: Optional[Dict[str, Any]] = None,
+        reconnect: Union[bool, ReconnectPolicy] = False,
+    ) -> EventHub:
+        """
+        获取共享的事件中心。
+
+        同一客户端对同一端点（及查询参数，如 directory）的所有订阅共享一条
+        SSE 连接，事件只解析一次后分发给各订阅者。
+
+        Args:
+            url: SSE 端点 URL（``/global/event`` 或 ``/event``）
+            params: 查询参数
+            reconnect: 连接断开时是否自动重连（可传入 ReconnectPolicy）
+
+        Returns:
+            EventHub 对象
+        """
+        return get_event_hub(self._http_client, url, params, self._sse_client, reconnect)
+
     async def subscribe(
         self,
         session_id: Optional[str] = None,
-        **kwargs
+        event_types: Optional[Iterable[str]] = None,
+        reconnect: Union[bool, ReconnectPolicy] = False,
+        server_filter: bool = False,
+        **kwargs: Any,
     ) -> AsyncIterator[Event]:
         """
         订阅事件流。
-        
-        如果提供 session_id，则订阅特定会话的事件；
-        否则订阅全局事件。
-        
+
+        如果提供 session_id，则从 ``/event`` 流中只接收该会话的事件；
+        否则订阅全局事件。所有订阅通过共享的事件中心复用连接，
+        其他订阅者也不关心的事件在解码前按字节跳过。
+
         Args:
             session_id: 可选的会话 ID
+            event_types: 可选的事件类型集合，只接收这些类型的事件
+            reconnect: 连接断开时自动重连并通过 Last-Event-ID 续传，
+                可传入 ReconnectPolicy 自定义退避参数
+            server_filter: 是否把会话 ID 和事件类型作为查询参数交给服务器过滤；
+                此时订阅使用单独的连接，不支持这些参数的服务器会忽略它们
             **kwargs: 其他查询参数
-            
+
         Yields:
             Event 对象
-            
+
         Raises:
             ConnectionError: 连接失败
             TimeoutError: 连接超时
             APIError: API 错误
-            
+
         Example:
             >>> # 订阅全局事件
             >>> async for event in client.events.subscribe():
             ...     print(f"全局事件: {event.type}")
-            
+
             >>> # 订阅会话事件
             >>> async for event in client.events.subscribe(session_id="session_123"):
-            ...     if event.type == "text":
-            ...         print(event.text, end="", flush=True)
+            ...     if event.type == "message.part.delta":
+            ...         print(event.properties.delta, end="", flush=True)
+
+            >>> # 长期订阅：断线自动重连
+            >>> async for event in client.events.subscribe(reconnect=True):
+            ...     print(event.type)
         """
         # 构建 URL
-        if session_id:
-            url = f"/session/{session_id}/prompt_async"
-        else:
-            url = "/global/event"
-        
+        url = "/event" if session_id else "/global/event"
+
         # 构建查询参数
         params = dict(kwargs)
-        
-        # 创建 SSE 客户端
-        async with SSEClient(
-            base_url=self._http_client.base_url,
-            headers=self._http_client.default_headers,
-            timeout=self._http_client.timeout
-        ) as sse_client:
-            async for event in sse_client.connect(url, params):
+        if server_filter:
+            params.update(EventFilter([session_id] if session_id else None, event_types).params())
+
+        subscription = await self.hub(url, params, reconnect).subscribe(
+            session_id=session_id, event_types=event_types
+        )
+        async with subscription:
+            async for event in subscription:
                 yield event
-    
-    async def subscribe_global(self) -> AsyncIterator[GlobalEvent]:
+
+    async def subscribe_global(
+        self, reconnect: Union[bool, ReconnectPolicy] = False
+    ) -> AsyncIterator[Event]:
         """
         订阅全局事件。
-        
+
         这是 subscribe() 的便捷方法，专门用于订阅全局事件。
-        
+
+        Args:
+            reconnect: 连接断开时是否自动重连（可传入 ReconnectPolicy）
+
         Yields:
-            GlobalEvent 对象
-            
+            Event 对象（SSE 客户端已去掉 ``/global/event`` 的 ``{"directory", "payload"}`` 包装）
+
         Example:
             >>> async for event in client.events.subscribe_global():
             ...     print(f"全局事件: {event.type}")
-            ...     if event.type == "session:created":
-            ...         print(f"新会话: {event.info.name}")
+            ...     if event.type == "session.created":
+            ...         print(f"新会话: {event.properties.info['id']}")
         """
-        async for event in self.subscribe():
-            # 全局事件应该是 GlobalEvent 类型
-            if isinstance(event, dict):
-                yield GlobalEvent(**event)
-            else:
-                yield event
-    
+        async for event in self.subscribe(reconnect=reconnect):
+            yield event
+
     async def subscribe_session(
         self,
         session_id: str,
-        parts: Optional[list] = None,
+        parts: Optional[List[Dict[str, Any]]] = None,
         directory: Optional[str] = None,
-        **kwargs
+        event_types: Optional[Iterable[str]] = None,
+        server_filter: bool = False,
+        **kwargs: Any,
     ) -> AsyncIterator[Event]:
         """
         订阅会话事件（发送消息并接收响应流）。
-        
+
         正确的流程：
-        1. 发送消息到 /session/{id}/prompt_async（触发任务）
-        2. 订阅 /event 端点（SSE 流）接收响应
-        
+        1. 在共享的 /event 连接（SSE 流）上注册该会话的订阅
+        2. 发送消息到 /session/{id}/prompt_async（触发任务）
+        3. 接收响应，直到该会话的 session.idle 事件到达
+
+        共享连接上其他会话的事件（以及 ``event_types`` 之外的事件）在解码前按
+        ``sessionID`` / ``type`` 字节跳过，不产生 JSON 解析和模型校验开销。
+
         Args:
             session_id: 会话 ID
             parts: 消息部分列表（如果提供，则发送消息）
             directory: 工作目录路径
+            event_types: 只接收这些类型的事件，None 表示全部；
+                发送消息时总会在内部接收 session.idle 以判断会话结束
+            server_filter: 是否把会话 ID 和事件类型作为查询参数交给服务器过滤，
+                参见 :meth:`subscribe`
             **kwargs: 其他参数（如 model, agent 等）
-            
+
         Yields:
             Event 对象
-            
+
         Example:
             >>> async for event in client.events.subscribe_session(
             ...     session_id="session_123",
@@ -132,50 +187,101 @@ class EventResource(BaseResource):
             # 构建请求数据
             data = {"parts": parts}
             # 将 kwargs 中的参数添加到 data
-            for key in ['agent', 'model', 'variant']:
+            for key in ["agent", "model", "variant"]:
                 if key in kwargs:
                     data[key] = kwargs[key]
-            
+
             # 构建 prompt_async 的查询参数
             prompt_params = {}
             if directory:
-                prompt_params['directory'] = directory
-            
-            # 先发送消息到 prompt_async 端点（触发任务）
-            prompt_url = f"/session/{session_id}/prompt_async"
-            
-            # 发送 POST 请求
-            self._http_client.post(
-                prompt_url,
-                json_data=data,
-                params=prompt_params
-            )
-            
-            # 然后订阅事件流
+                prompt_params["directory"] = directory
+
+            # 先注册订阅并等待连接建立，避免丢失任务最早产生的事件
             event_params = {}
             if directory:
-                event_params['directory'] = directory
-            
-            url = "/event"
-            
-            # 使用 SSE 客户端订阅事件
-            async with SSEClient(
-                base_url=self._http_client.base_url,
-                headers=self._http_client.default_headers,
-                timeout=self._http_client.timeout
-            ) as sse_client:
-                # 启动事件流连接（GET 请求，带 directory 参数）
-                async for event in sse_client.connect(url, params=event_params, method="GET"):
-                    yield event
-                    
-                    # 如果收到 session.idle 事件，表示会话完成
-                    if hasattr(event, 'type') and event.type == "session.idle":
-                        # 检查是否是当前会话
-                        if hasattr(event, 'properties') and hasattr(event.properties, 'sessionID'):
-                            if event.properties.sessionID == session_id:
-                                break
+                event_params["directory"] = directory
+
+            # session.idle 用于判断会话结束，即使调用方不需要也要订阅
+            wanted = frozenset(event_types) if event_types else None
+            types = wanted | {"session.idle"} if wanted is not None else None
+            if server_filter:
+                event_params.update(EventFilter([session_id], types).params())
+
+            hub = self.hub("/event", event_params)
+            subscription = await hub.subscribe(session_id=session_id, event_types=types)
+            async with subscription:
+                await hub.wait_connected(timeout=self._http_client.timeout)
+
+                # 发送消息到 prompt_async 端点（触发任务，不阻塞事件循环）
+                prompt_url = f"/session/{session_id}/prompt_async"
+                await self._send_prompt(prompt_url, data, prompt_params)
+
+                async for event in subscription:
+                    if wanted is None or event.type in wanted:
+                        yield event
+
+                    # 收到当前会话的 session.idle 事件，表示会话完成
+                    if event.type == "session.idle":
+                        break
         else:
             # 只订阅事件，不发送消息
-            async for event in self.subscribe(session_id=session_id, **kwargs):
+            params: Dict[str, Any] = {"directory": directory} if directory else {}
+            async for event in self.subscribe(
+                session_id=session_id,
+                event_types=event_types,
+                server_filter=server_filter,
+                **params,
+            ):
                 yield event
 
+
+class EventResource(_EventMixin, BaseResource):
+    """
+    Event 资源类。
+
+    提供事件订阅功能，支持：
+    - 全局事件订阅
+    - 会话事件订阅
+    - 实时事件流处理
+    """
+
+    def _sse_client(self) -> SSEClient:
+        """创建用于订阅事件流的 SSE 客户端。"""
+        return SSEClient(
+            base_url=self._http_client.base_url,
+            headers=self._http_client.default_headers,
+            timeout=self._http_client.timeout,
+            transport=self._http_client.transport,
+            recorder=self._http_client.sse_recorder,
+        )
+
+    async def _send_prompt(self, url: str, data: Dict[str, Any], params: Dict[str, Any]) -> None:
+        """
+        发送 prompt_async 请求。
+
+        同步 HttpClient 的请求在线程中执行，避免阻塞事件循环。
+        """
+        await asyncio.to_thread(self._http_client.post, url, json_data=data, params=params)
+
+
+class AsyncEventResource(_EventMixin, AsyncBaseResource):
+    """
+    异步 Event 资源类。
+
+    与 :class:`EventResource` 提供相同的订阅方法，prompt 请求直接在事件循环中
+    发送，SSE 连接复用 :class:`~opencode_sdk.http_client.AsyncHttpClient` 的连接池。
+    """
+
+    def _sse_client(self) -> SSEClient:
+        """创建复用共享连接池的 SSE 客户端。"""
+        return SSEClient(
+            base_url=self._http_client.base_url,
+            headers=self._http_client.default_headers,
+            timeout=self._http_client.timeout,
+            client=self._http_client.client,
+            recorder=self._http_client.sse_recorder,
+        )
+
+    async def _send_prompt(self, url: str, data: Dict[str, Any], params: Dict[str, Any]) -> None:
+        """发送 prompt_async 请求。"""
+        await self._http_client.post(url, json_data=data, params=params)
@@ -4,107 +4,393 @@ File 资源模块。
 提供文件操作功能，包括列出文件、读取文件和获取文件状态。
 """
 
-from typing import List, Optional, Dict, Any
-from ..models.file import FileNode, FileContent
-from .base import BaseResource
+import copy
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+)
 
+from ..line_reader import MappedLines, aiter_lines, aspill_lines, iter_lines, spill_lines
+from ..models.file import FileContent, FileNode
+from ..walk import Patterns, awalk_tree, walk_tree
+from .base import AsyncBaseResource, BaseResource
 
-class FileResource(BaseResource):
+if TYPE_CHECKING:
+    from ..file_cache import FileCache
+
+
+_FileResourceT = TypeVar("_FileResourceT", bound="_FileCacheMixin")
+
+
+class _FileCacheMixin:
+    """同步与异步 File 资源共享的缓存配置。"""
+
+    cache: Optional["FileCache"] = None
+
+    def with_cache(self: _FileResourceT, cache: Optional["FileCache"]) -> _FileResourceT:
+        """
+        返回在 ``read()`` 和 ``list()`` 前使用指定缓存的资源副本。
+
+        缓存需要通过 :meth:`FileCache.watch` 订阅文件事件才能在文件变化时失效。
+
+        Args:
+            cache: 文件缓存，None 表示不使用缓存
+
+        Returns:
+            新的资源对象
+
+        Example:
+            >>> cache = FileCache(max_bytes=64 * 1024 * 1024)
+            >>> client.files = client.files.with_cache(cache)
+        """
+        clone = copy.copy(self)
+        clone.cache = cache
+        return clone
+
+
+class FileResource(_FileCacheMixin, BaseResource):
     """
     File 资源类。
-    
+
     提供文件操作功能，包括：
     - 列出文件和目录
     - 读取文件内容
     - 获取文件状态
     """
-    
+
     def list(
-        self,
-        path: str = ".",
-        recursive: bool = False,
-        max_depth: Optional[int] = None
+        self, path: str = ".", recursive: bool = False, max_depth: Optional[int] = None
     ) -> List[FileNode]:
         """
         列出文件和目录。
-        
+
         Args:
             path: 目录路径（默认为当前目录）
             recursive: 是否递归列出子目录
             max_depth: 最大递归深度
-            
+
         Returns:
             FileNode 对象列表
-            
+
         Example:
             >>> # 列出当前目录
             >>> files = client.files.list()
             >>> for file in files:
             ...     print(f"{file.name} ({'dir' if file.is_directory else 'file'})")
-            
+
             >>> # 递归列出所有文件
             >>> files = client.files.list(recursive=True, max_depth=3)
         """
-        params: Dict[str, Any] = {'path': path}
+        cache = self.cache
+        if cache is not None:
+            nodes = cache.get_list(path, recursive, max_depth)
+            if nodes is not None:
+                return nodes
+            generation = cache.generation
+
+        params: Dict[str, Any] = {"path": path}
         if recursive:
-            params['recursive'] = True
+            params["recursive"] = True
         if max_depth is not None:
-            params['maxDepth'] = max_depth
-            
-        response = self._http_client.get('/file', params=params)
-        return [FileNode(**item) for item in response]
-    
-    def read(
+            params["maxDepth"] = max_depth
+
+        response = self._http_client.get("/file", params=params)
+        nodes = [FileNode(**item) for item in response]
+        if cache is not None:
+            cache.put_list(path, recursive, max_depth, nodes, generation)
+        return nodes
+
+    def walk(
         self,
-        path: str,
-        start_line: Optional[int] = None,
-        end_line: Optional[int] = None
+        path: str = ".",
+        concurrency: int = 8,
+        max_depth: Optional[int] = None,
+        include: Patterns = None,
+        exclude: Patterns = None,
+        prune: Optional[Callable[[FileNode], bool]] = None,
+        skip_ignored: bool = False,
+        on_error: Optional[Callable[[str, Exception], Any]] = None,
+    ) -> Iterator[FileNode]:
+        """
+        并发遍历目录树，逐个返回文件和目录节点。
+
+        按广度优先逐层调用非递归的 :meth:`list`，同时进行的请求不超过 ``concurrency`` 个，
+        每个目录的列表返回后立即产出其中的节点。适合 ``list(recursive=True)`` 因目录树过大
+        而超时的仓库。节点按目录完成的顺序产出，同一层内的顺序不固定。
+
+        glob 模式与节点的相对路径或名称匹配即视为命中（``*`` 可以匹配 ``/``）。
+
+        Args:
+            path: 起始目录
+            concurrency: 最大并发请求数
+            max_depth: 最大深度，起始目录下的节点深度为 1；None 表示不限
+            include: 只产出匹配的节点，不影响是否展开目录
+            exclude: 跳过匹配的节点，匹配的目录也不再展开
+            prune: 对目录返回 True 时不展开该目录（目录本身仍会产出）
+            skip_ignored: 是否跳过被 .gitignore 忽略的节点
+            on_error: 列出某个目录失败时的回调 ``on_error(path, error)``，
+                None 表示直接抛出异常
+
+        Yields:
+            FileNode 对象
+
+        Example:
+            >>> for node in client.files.walk(include="*.py", exclude=["node_modules", ".git"]):
+            ...     print(node.path)
+
+            >>> # 不展开 vendor 目录，忽略无权限的目录
+            >>> nodes = list(client.files.walk(
+            ...     prune=lambda d: d.name == "vendor",
+            ...     on_error=lambda path, e: print("跳过", path, e),
+            ... ))
+        """
+        return walk_tree(
+            self.list, path, concurrency, max_depth, include, exclude, prune, skip_ignored, on_error
+        )
+
+    def read(
+        self, path: str, start_line: Optional[int] = None, end_line: Optional[int] = None
     ) -> FileContent:
         """
         读取文件内容。
-        
+
         Args:
             path: 文件路径
             start_line: 起始行号（可选）
             end_line: 结束行号（可选）
-            
+
         Returns:
             FileContent 对象
-            
+
         Raises:
             NotFoundError: 文件不存在
             BadRequestError: 文件无法读取
-            
+
         Example:
             >>> # 读取整个文件
             >>> content = client.files.read("README.md")
             >>> print(content.content)
-            
+
             >>> # 读取指定行
             >>> content = client.files.read("README.md", start_line=1, end_line=10)
         """
-        params: Dict[str, Any] = {'path': path}
+        cache = self.cache
+        if cache is not None:
+            content = cache.get_read(path, start_line, end_line)
+            if content is not None:
+                return content
+            generation = cache.generation
+
+        params: Dict[str, Any] = {"path": path}
         if start_line is not None:
-            params['startLine'] = start_line
+            params["startLine"] = start_line
         if end_line is not None:
-            params['endLine'] = end_line
-            
-        response = self._http_client.get('/file/read', params=params)
-        return FileContent(**response)
-    
+            params["endLine"] = end_line
+
+        response = self._http_client.get("/file/read", params=params)
+        content = FileContent(**response)
+        if cache is not None:
+            cache.put_read(path, start_line, end_line, content, generation)
+        return content
+
+    def iter_lines(
+        self,
+        path: str,
+        chunk_lines: int = 1000,
+        concurrency: int = 4,
+        start_line: int = 1,
+        end_line: Optional[int] = None,
+    ) -> Iterator[str]:
+        """
+        分块读取文件，逐行返回。
+
+        把文件切成每块 ``chunk_lines`` 行的区间，通过 :meth:`read` 的 ``start_line`` /
+        ``end_line`` 分块读取，同时保持 ``concurrency`` 个区间请求在途，按顺序返回各行。
+        某个区间返回的行数不足时视为文件结束。适合读取几百 MB 的日志文件，
+        不需要一次性的超大响应。分块读取不经过文件缓存。
+
+        Args:
+            path: 文件路径
+            chunk_lines: 每个区间的行数
+            concurrency: 同时在途的区间请求数
+            start_line: 起始行号（从 1 开始）
+            end_line: 结束行号（包含），None 表示读到文件末尾
+
+        Yields:
+            文件的每一行（不含换行符）
+
+        Raises:
+            NotFoundError: 文件不存在
+            OpencodeException: 文件是二进制文件
+
+        Example:
+            >>> for line in client.files.iter_lines("logs/server.log", chunk_lines=5000):
+            ...     if "ERROR" in line:
+            ...         print(line)
+        """
+        return iter_lines(
+            self.with_cache(None).read, path, chunk_lines, concurrency, start_line, end_line
+        )
+
+    def read_mapped(
+        self,
+        path: str,
+        chunk_lines: int = 1000,
+        concurrency: int = 4,
+        directory: Optional[str] = None,
+    ) -> MappedLines:
+        """
+        分块读取整个文件并写入内存映射的临时文件，返回可随机访问的行序列。
+
+        读取方式同 :meth:`iter_lines`。返回的 :class:`~opencode_sdk.line_reader.MappedLines`
+        支持 ``len()``、下标和切片，堆上只保存每行的偏移量；用完后调用 ``close()``
+        （或使用 with 语句）删除临时文件。
+
+        Args:
+            path: 文件路径
+            chunk_lines: 每个区间的行数
+            concurrency: 同时在途的区间请求数
+            directory: 临时文件所在目录，None 表示系统默认临时目录
+
+        Returns:
+            MappedLines 对象
+
+        Example:
+            >>> with client.files.read_mapped("logs/server.log") as lines:
+            ...     print(len(lines), lines[-10:])
+        """
+        return spill_lines(self.iter_lines(path, chunk_lines, concurrency), directory)
+
     def status(self) -> Dict[str, Any]:
         """
         获取文件状态。
-        
+
         返回文件系统的状态信息，如修改的文件、未跟踪的文件等。
-        
+
         Returns:
             文件状态字典
-            
+
         Example:
             >>> status = client.files.status()
             >>> print(f"修改的文件: {len(status.get('modified', []))}")
             >>> print(f"未跟踪的文件: {len(status.get('untracked', []))}")
         """
-        response = self._http_client.get('/file/status')
+        response = self._http_client.get("/file/status")
+        return response
+
+
+class AsyncFileResource(_FileCacheMixin, AsyncBaseResource):
+    """
+    异步 File 资源类。
+
+    提供与 :class:`FileResource` 相同的文件操作功能。
+    """
+
+    async def list(
+        self, path: str = ".", recursive: bool = False, max_depth: Optional[int] = None
+    ) -> List[FileNode]:
+        """异步列出文件和目录，参见 :meth:`FileResource.list`。"""
+        cache = self.cache
+        if cache is not None:
+            nodes = cache.get_list(path, recursive, max_depth)
+            if nodes is not None:
+                return nodes
+            generation = cache.generation
+
+        params: Dict[str, Any] = {"path": path}
+        if recursive:
+            params["recursive"] = True
+        if max_depth is not None:
+            params["maxDepth"] = max_depth
+
+        response = await self._http_client.get("/file", params=params)
+        nodes = [FileNode(**item) for item in response]
+        if cache is not None:
+            cache.put_list(path, recursive, max_depth, nodes, generation)
+        return nodes
+
+    def walk(
+        self,
+        path: str = ".",
+        concurrency: int = 8,
+        max_depth: Optional[int] = None,
+        include: Patterns = None,
+        exclude: Patterns = None,
+        prune: Optional[Callable[[FileNode], bool]] = None,
+        skip_ignored: bool = False,
+        on_error: Optional[Callable[[str, Exception], Any]] = None,
+    ) -> AsyncIterator[FileNode]:
+        """
+        并发遍历目录树，参见 :meth:`FileResource.walk`。
+
+        Example:
+            >>> async for node in client.files.walk(include="*.py", skip_ignored=True):
+            ...     print(node.path)
+        """
+        return awalk_tree(
+            self.list, path, concurrency, max_depth, include, exclude, prune, skip_ignored, on_error
+        )
+
+    async def read(
+        self, path: str, start_line: Optional[int] = None, end_line: Optional[int] = None
+    ) -> FileContent:
+        """异步读取文件内容，参见 :meth:`FileResource.read`。"""
+        cache = self.cache
+        if cache is not None:
+            content = cache.get_read(path, start_line, end_line)
+            if content is not None:
+                return content
+            generation = cache.generation
+
+        params: Dict[str, Any] = {"path": path}
+        if start_line is not None:
+            params["startLine"] = start_line
+        if end_line is not None:
+            params["endLine"] = end_line
+
+        response = await self._http_client.get("/file/read", params=params)
+        content = FileContent(**response)
+        if cache is not None:
+            cache.put_read(path, start_line, end_line, content, generation)
+        return content
+
+    def iter_lines(
+        self,
+        path: str,
+        chunk_lines: int = 1000,
+        concurrency: int = 4,
+        start_line: int = 1,
+        end_line: Optional[int] = None,
+    ) -> AsyncIterator[str]:
+        """
+        分块读取文件，逐行返回，参见 :meth:`FileResource.iter_lines`。
+
+        Example:
+            >>> async for line in client.files.iter_lines("logs/server.log"):
+            ...     print(line)
+        """
+        return aiter_lines(
+            self.with_cache(None).read, path, chunk_lines, concurrency, start_line, end_line
+        )
+
+    async def read_mapped(
+        self,
+        path: str,
+        chunk_lines: int = 1000,
+        concurrency: int = 4,
+        directory: Optional[str] = None,
+    ) -> MappedLines:
+        """分块读取整个文件并写入内存映射的临时文件，参见 :meth:`FileResource.read_mapped`。"""
+        return await aspill_lines(self.iter_lines(path, chunk_lines, concurrency), directory)
+
+    async def status(self) -> Dict[str, Any]:
+        """异步获取文件状态，参见 :meth:`FileResource.status`。"""
+        response = await self._http_client.get("/file/status")
         return response
@@ -4,20 +4,135 @@ Find 资源模块。
 提供搜索功能，包括文本搜索、文件搜索和符号搜索。
 """
 
-from typing import List, Optional, Dict, Any
-from .base import BaseResource
+import copy
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
+from ..exceptions import OpencodeException
+from ..json_stream import JSONArrayDecoder, NDJSONDecoder
+from .base import AsyncBaseResource, BaseResource
 
-class FindResource(BaseResource):
+if TYPE_CHECKING:
+    from ..find_index import FindIndex
+
+
+_FindResourceT = TypeVar("_FindResourceT", bound="_FindIndexMixin")
+
+# 流式搜索优先请求 NDJSON；服务器不支持时返回普通 JSON 数组，同样可以增量解码
+_STREAM_HEADERS = {"Accept": "application/x-ndjson, application/json;q=0.9"}
+
+
+def _text_params(
+    query: str,
+    path: Optional[str],
+    case_sensitive: bool,
+    whole_word: bool,
+    regex: bool,
+    max_results: Optional[int],
+) -> Dict[str, Any]:
+    params: Dict[str, Any] = {"query": query}
+    if path:
+        params["path"] = path
+    if case_sensitive:
+        params["caseSensitive"] = True
+    if whole_word:
+        params["wholeWord"] = True
+    if regex:
+        params["regex"] = True
+    if max_results is not None:
+        params["maxResults"] = max_results
+    return params
+
+
+def _decoder(content_type: str) -> Any:
+    if "ndjson" in content_type or "jsonl" in content_type:
+        return NDJSONDecoder()
+    return JSONArrayDecoder()
+
+
+def _feed(decoder: Any, chunk: Optional[bytes]) -> List[Any]:
+    """向解码器追加一块数据，chunk 为 None 表示响应结束；解析失败转换为 SDK 异常。"""
+    try:
+        return decoder.close() if chunk is None else decoder.feed(chunk)
+    except ValueError as e:
+        raise OpencodeException(f"搜索结果解析失败: {e}") from e
+
+
+def _match_path(match: Dict[str, Any]) -> str:
+    """
+    取出搜索结果的文件路径。
+
+    兼容 ``{"path": "a.py"}`` 和 ripgrep 风格的 ``{"path": {"text": "a.py"}}`` 两种格式。
+    """
+    path = match.get("path")
+    if isinstance(path, dict):
+        path = path.get("text")
+    return path or ""
+
+
+def _group_by_file(matches: Iterable[Dict[str, Any]]) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+    """把连续属于同一文件的结果合并为一组。"""
+    current: Optional[str] = None
+    group: List[Dict[str, Any]] = []
+    for match in matches:
+        path = _match_path(match)
+        if group and path != current:
+            yield current, group  # type: ignore[misc]
+            group = []
+        current = path
+        group.append(match)
+    if group:
+        yield current, group  # type: ignore[misc]
+
+
+class _FindIndexMixin:
+    """同步与异步 Find 资源共享的本地索引配置。"""
+
+    index: Optional["FindIndex"] = None
+
+    def with_index(self: _FindResourceT, index: Optional["FindIndex"]) -> _FindResourceT:
+        """
+        返回优先查询本地索引的资源副本。
+
+        索引加载后，``files()`` 和 ``symbols()`` 直接在本地回答，不再请求服务器；
+        索引尚未加载或查询为 glob 模式时仍请求服务器。``text()`` 不受影响。
+
+        Args:
+            index: 本地索引，None 表示不使用索引
+
+        Returns:
+            新的资源对象
+
+        Example:
+            >>> index = FindIndex()
+            >>> await index.load(client)
+            >>> client.find = client.find.with_index(index)
+        """
+        clone = copy.copy(self)
+        clone.index = index
+        return clone
+
+
+class FindResource(_FindIndexMixin, BaseResource):
     """
     Find 资源类。
-    
+
     提供搜索功能，包括：
     - 在文件中搜索文本
     - 搜索文件名
     - 搜索工作区符号
     """
-    
+
     def text(
         self,
         query: str,
@@ -25,11 +140,11 @@ class FindResource(BaseResource):
         case_sensitive: bool = False,
         whole_word: bool = False,
         regex: bool = False,
-        max_results: Optional[int] = None
+        max_results: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """
         在文件中搜索文本。
-        
+
         Args:
             query: 搜索查询字符串
             path: 可选的搜索路径（限制搜索范围）
@@ -37,95 +152,243 @@ class FindResource(BaseResource):
             whole_word: 是否匹配整个单词
             regex: 是否使用正则表达式
             max_results: 最大结果数量
-            
+
         Returns:
             搜索结果列表，每个结果包含文件路径、行号、匹配内容等
-            
+
         Example:
             >>> # 搜索文本
             >>> results = client.find.text("TODO")
             >>> for result in results:
             ...     print(f"{result['path']}:{result['line']}: {result['text']}")
-            
+
             >>> # 使用正则表达式搜索
             >>> results = client.find.text(r"function\s+\w+", regex=True)
         """
-        params: Dict[str, Any] = {'query': query}
-        if path:
-            params['path'] = path
-        if case_sensitive:
-            params['caseSensitive'] = True
-        if whole_word:
-            params['wholeWord'] = True
-        if regex:
-            params['regex'] = True
-        if max_results is not None:
-            params['maxResults'] = max_results
-            
-        response = self._http_client.get('/find/text', params=params)
+        params = _text_params(query, path, case_sensitive, whole_word, regex, max_results)
+        response = self._http_client.get("/find/text", params=params)
         return response
-    
-    def files(
+
+    def text_stream(
+        self,
+        query: str,
+        path: Optional[str] = None,
+        case_sensitive: bool = False,
+        whole_word: bool = False,
+        regex: bool = False,
+        max_results: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        在文件中搜索文本，边接收响应边逐个返回结果。
+
+        参数与 :meth:`text` 相同。响应体按块读取并增量解码，每个结果完整到达后立即返回，
+        不必等整个响应下载完毕，内存中也不保留完整的结果列表。服务器以 NDJSON
+        返回时按行解码，否则增量解析 JSON 数组。提前结束遍历会关闭连接。
+
+        Yields:
+            搜索结果字典，格式与 :meth:`text` 的元素相同
+
+        Raises:
+            OpencodeException: 响应不完整（连接提前断开）或不是 JSON 数组
+
+        Example:
+            >>> for match in client.find.text_stream("TODO"):
+            ...     print(match['path'], match['line'])
+        """
+        params = _text_params(query, path, case_sensitive, whole_word, regex, max_results)
+        with self._http_client.stream(
+            "GET", "/find/text", params=params, headers=_STREAM_HEADERS
+        ) as response:
+            decoder = _decoder(response.headers.get("content-type", ""))
+            for chunk in response.iter_bytes():
+                yield from _feed(decoder, chunk)
+            yield from _feed(decoder, None)
+
+    def text_by_file(
         self,
         query: str,
         path: Optional[str] = None,
-        max_results: Optional[int] = None
+        case_sensitive: bool = False,
+        whole_word: bool = False,
+        regex: bool = False,
+        max_results: Optional[int] = None,
+    ) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+        """
+        在文件中搜索文本，按文件分组逐组返回结果。
+
+        基于 :meth:`text_stream`，服务器连续返回的同一文件的结果合并为一组，
+        下一个文件的第一条结果到达时返回上一组。
+
+        Yields:
+            ``(文件路径, 该文件的搜索结果列表)``
+
+        Example:
+            >>> for file, matches in client.find.text_by_file("TODO"):
+            ...     print(f"{file}: {len(matches)} 处")
+        """
+        return _group_by_file(
+            self.text_stream(query, path, case_sensitive, whole_word, regex, max_results)
+        )
+
+    def files(
+        self, query: str, path: Optional[str] = None, max_results: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         搜索文件名。
-        
+
         Args:
             query: 文件名搜索查询（支持模糊匹配）
             path: 可选的搜索路径
             max_results: 最大结果数量
-            
+
         Returns:
             匹配的文件列表
-            
+
         Example:
             >>> # 搜索文件
             >>> files = client.find.files("*.py")
             >>> for file in files:
             ...     print(file['path'])
-            
+
             >>> # 模糊搜索
             >>> files = client.find.files("readme")
         """
-        params: Dict[str, Any] = {'query': query}
+        index = self.index
+        if index is not None and index.answers("files", query):
+            return index.search_files(query, max_results, path)
+
+        params: Dict[str, Any] = {"query": query}
         if path:
-            params['path'] = path
+            params["path"] = path
         if max_results is not None:
-            params['maxResults'] = max_results
-            
-        response = self._http_client.get('/find/files', params=params)
+            params["maxResults"] = max_results
+
+        response = self._http_client.get("/find/files", params=params)
         return response
-    
-    def symbols(
-        self,
-        query: str,
-        max_results: Optional[int] = None
-    ) -> List[Dict[str, Any]]:
+
+    def symbols(self, query: str, max_results: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         搜索工作区符号。
-        
+
         搜索代码中的符号（函数、类、变量等）。
-        
+
         Args:
             query: 符号名称搜索查询
             max_results: 最大结果数量
-            
+
         Returns:
             符号列表，每个符号包含名称、类型、位置等信息
-            
+
         Example:
             >>> # 搜索函数
             >>> symbols = client.find.symbols("main")
             >>> for symbol in symbols:
             ...     print(f"{symbol['name']} ({symbol['kind']}) in {symbol['path']}")
         """
-        params: Dict[str, Any] = {'query': query}
+        index = self.index
+        if index is not None and index.answers("symbols", query):
+            return index.search_symbols(query, max_results)
+
+        params: Dict[str, Any] = {"query": query}
         if max_results is not None:
-            params['maxResults'] = max_results
-            
-        response = self._http_client.get('/find/symbols', params=params)
+            params["maxResults"] = max_results
+
+        response = self._http_client.get("/find/symbols", params=params)
+        return response
+
+
+class AsyncFindResource(_FindIndexMixin, AsyncBaseResource):
+    """
+    异步 Find 资源类。
+
+    提供与 :class:`FindResource` 相同的搜索功能。
+    """
+
+    async def text(
+        self,
+        query: str,
+        path: Optional[str] = None,
+        case_sensitive: bool = False,
+        whole_word: bool = False,
+        regex: bool = False,
+        max_results: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """异步在文件中搜索文本，参见 :meth:`FindResource.text`。"""
+        params = _text_params(query, path, case_sensitive, whole_word, regex, max_results)
+        response = await self._http_client.get("/find/text", params=params)
+        return response
+
+    async def text_stream(
+        self,
+        query: str,
+        path: Optional[str] = None,
+        case_sensitive: bool = False,
+        whole_word: bool = False,
+        regex: bool = False,
+        max_results: Optional[int] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """异步搜索文本并逐个返回结果，参见 :meth:`FindResource.text_stream`。"""
+        params = _text_params(query, path, case_sensitive, whole_word, regex, max_results)
+        async with self._http_client.stream(
+            "GET", "/find/text", params=params, headers=_STREAM_HEADERS
+        ) as response:
+            decoder = _decoder(response.headers.get("content-type", ""))
+            async for chunk in response.aiter_bytes():
+                for match in _feed(decoder, chunk):
+                    yield match
+            for match in _feed(decoder, None):
+                yield match
+
+    async def text_by_file(
+        self,
+        query: str,
+        path: Optional[str] = None,
+        case_sensitive: bool = False,
+        whole_word: bool = False,
+        regex: bool = False,
+        max_results: Optional[int] = None,
+    ) -> AsyncIterator[Tuple[str, List[Dict[str, Any]]]]:
+        """异步搜索文本并按文件分组返回结果，参见 :meth:`FindResource.text_by_file`。"""
+        current: Optional[str] = None
+        group: List[Dict[str, Any]] = []
+        async for match in self.text_stream(
+            query, path, case_sensitive, whole_word, regex, max_results
+        ):
+            file = _match_path(match)
+            if group and file != current:
+                yield current, group  # type: ignore[misc]
+                group = []
+            current = file
+            group.append(match)
+        if group:
+            yield current, group  # type: ignore[misc]
+
+    async def files(
+        self, query: str, path: Optional[str] = None, max_results: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """异步搜索文件名，参见 :meth:`FindResource.files`。"""
+        index = self.index
+        if index is not None and index.answers("files", query):
+            return index.search_files(query, max_results, path)
+
+        params: Dict[str, Any] = {"query": query}
+        if path:
+            params["path"] = path
+        if max_results is not None:
+            params["maxResults"] = max_results
+
+        response = await self._http_client.get("/find/files", params=params)
+        return response
+
+    async def symbols(self, query: str, max_results: Optional[int] = None) -> List[Dict[str, Any]]:
+        """异步搜索工作区符号，参见 :meth:`FindResource.symbols`。"""
+        index = self.index
+        if index is not None and index.answers("symbols", query):
+            return index.search_symbols(query, max_results)
+
+        params: Dict[str, Any] = {"query": query}
+        if max_results is not None:
+            params["maxResults"] = max_results
+
+        response = await self._http_client.get("/find/symbols", params=params)
         return response
@@ -3,7 +3,7 @@
 from typing import Any, Dict, List
 
 from ..http_client import HttpClient
-from .base import BaseResource
+from .base import AsyncBaseResource, BaseResource
 
 
 class LspResource(BaseResource):
@@ -22,3 +22,11 @@ class LspResource(BaseResource):
             ...     print(f"{lsp['name']}: {lsp['status']}")
         """
         return self._http_client.get("/lsp")
+
+
+class AsyncLspResource(AsyncBaseResource):
+    """异步 LSP (Language Server Protocol) 服务器状态资源。"""
+
+    async def status(self) -> List[Dict[str, Any]]:
+        """异步获取所有 LSP 服务器的状态，参见 :meth:`LspResource.status`。"""
+        return await self._http_client.get("/lsp")
@@ -2,9 +2,9 @@
 
 from typing import Any, Dict, Optional, Union
 
-from ..http_client import HttpClient
+from ..http_client import AsyncHttpClient, HttpClient
 from ..models.config import McpLocalConfig, McpRemoteConfig
-from .base import BaseResource
+from .base import AsyncBaseResource, BaseResource
 
 
 class McpAuthResource(BaseResource):
@@ -47,10 +47,7 @@ class McpAuthResource(BaseResource):
         示例:
             >>> status = client.mcp.auth("github").callback("auth_code_123")
         """
-        return self._http_client.post(
-            f"/mcp/{self.name}/auth/callback",
-            json_data={"code": code}
-        )
+        return self._http_client.post(f"/mcp/{self.name}/auth/callback", json_data={"code": code})
 
     def authenticate(self) -> Dict[str, Any]:
         """
@@ -98,9 +95,7 @@ class McpResource(BaseResource):
         return self._http_client.get("/mcp")
 
     def add(
-        self,
-        name: str,
-        config: Union[McpLocalConfig, McpRemoteConfig, Dict[str, Any]]
+        self, name: str, config: Union[McpLocalConfig, McpRemoteConfig, Dict[str, Any]]
     ) -> Dict[str, Dict[str, Any]]:
         """
         动态添加新的 MCP 服务器。
@@ -120,7 +115,7 @@ class McpResource(BaseResource):
             ...     "env": {"API_KEY": "xxx"}
             ... }
             >>> status = client.mcp.add("my-server", config)
-            
+
             >>> # 添加远程 MCP 服务器
             >>> config = {
             ...     "url": "https://api.example.com/mcp",
@@ -131,11 +126,8 @@ class McpResource(BaseResource):
         # 如果是 Pydantic 模型，转换为字典
         if hasattr(config, "model_dump"):
             config = config.model_dump(exclude_none=True)
-        
-        return self._http_client.post(
-            "/mcp",
-            json_data={"name": name, "config": config}
-        )
+
+        return self._http_client.post("/mcp", json_data={"name": name, "config": config})
 
     def connect(self, name: str) -> bool:
         """
@@ -181,14 +173,76 @@ class McpResource(BaseResource):
             >>> # 开始 OAuth 认证
             >>> result = client.mcp.auth("github").start()
             >>> print(result["authorizationUrl"])
-            
+
             >>> # 完成 OAuth 认证
             >>> status = client.mcp.auth("github").callback("auth_code")
-            
+
             >>> # 一键认证（打开浏览器）
             >>> status = client.mcp.auth("github").authenticate()
-            
+
             >>> # 移除认证
             >>> result = client.mcp.auth("github").remove()
         """
         return McpAuthResource(self._http_client, name)
+
+
+class AsyncMcpAuthResource(AsyncBaseResource):
+    """异步 MCP OAuth 认证资源。"""
+
+    def __init__(self, http_client: AsyncHttpClient, name: str) -> None:
+        """
+        初始化异步 MCP OAuth 认证资源。
+
+        Args:
+            http_client: 异步 HTTP 客户端实例
+            name: MCP 服务器名称
+        """
+        super().__init__(http_client)
+        self.name = name
+
+    async def start(self) -> Dict[str, str]:
+        """异步开始 OAuth 认证流程，参见 :meth:`McpAuthResource.start`。"""
+        return await self._http_client.post(f"/mcp/{self.name}/auth")
+
+    async def callback(self, code: str) -> Dict[str, Any]:
+        """异步完成 OAuth 认证，参见 :meth:`McpAuthResource.callback`。"""
+        return await self._http_client.post(
+            f"/mcp/{self.name}/auth/callback", json_data={"code": code}
+        )
+
+    async def authenticate(self) -> Dict[str, Any]:
+        """异步启动 OAuth 流程并等待回调，参见 :meth:`McpAuthResource.authenticate`。"""
+        return await self._http_client.post(f"/mcp/{self.name}/auth/authenticate")
+
+    async def remove(self) -> Dict[str, bool]:
+        """异步移除 OAuth 凭证，参见 :meth:`McpAuthResource.remove`。"""
+        return await self._http_client.delete(f"/mcp/{self.name}/auth")
+
+
+class AsyncMcpResource(AsyncBaseResource):
+    """异步 MCP (Model Context Protocol) 服务器管理资源。"""
+
+    async def status(self) -> Dict[str, Dict[str, Any]]:
+        """异步获取所有 MCP 服务器的状态，参见 :meth:`McpResource.status`。"""
+        return await self._http_client.get("/mcp")
+
+    async def add(
+        self, name: str, config: Union[McpLocalConfig, McpRemoteConfig, Dict[str, Any]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """异步动态添加新的 MCP 服务器，参见 :meth:`McpResource.add`。"""
+        if hasattr(config, "model_dump"):
+            config = config.model_dump(exclude_none=True)
+
+        return await self._http_client.post("/mcp", json_data={"name": name, "config": config})
+
+    async def connect(self, name: str) -> bool:
+        """异步连接 MCP 服务器，参见 :meth:`McpResource.connect`。"""
+        return await self._http_client.post(f"/mcp/{name}/connect")
+
+    async def disconnect(self, name: str) -> bool:
+        """异步断开 MCP 服务器连接，参见 :meth:`McpResource.disconnect`。"""
+        return await self._http_client.post(f"/mcp/{name}/disconnect")
+
+    def auth(self, name: str) -> AsyncMcpAuthResource:
+        """获取异步 MCP OAuth 认证资源，参见 :meth:`McpResource.auth`。"""
+        return AsyncMcpAuthResource(self._http_client, name)
@@ -5,31 +5,32 @@ Project 资源模块。
 """
 
 from typing import List, Optional
-from .base import BaseResource
+
+from .base import AsyncBaseResource, BaseResource
 
 
 class ProjectResource(BaseResource):
     """
     Project 资源类。
-    
+
     提供项目管理功能，包括：
     - 列出所有项目
     - 获取当前项目信息
     - 更新项目属性
     """
-    
+
     def list(self, directory: Optional[str] = None) -> List[dict]:
         """
         列出所有项目。
-        
+
         返回已在 OpenCode 中打开的所有项目列表。
-        
+
         Args:
             directory: 可选的目录路径，用于过滤特定目录的项目
-            
+
         Returns:
             项目列表，每个项目是一个字典
-            
+
         Example:
             >>> projects = client.projects.list()
             >>> for project in projects:
@@ -37,26 +38,26 @@ class ProjectResource(BaseResource):
         """
         params = {}
         if directory:
-            params['directory'] = directory
-            
-        response = self._http_client.get('/project', params=params)
+            params["directory"] = directory
+
+        response = self._http_client.get("/project", params=params)
         return response
-    
+
     def current(self, directory: Optional[str] = None) -> dict:
         """
         获取当前项目信息。
-        
+
         返回当前正在使用的项目信息。
-        
+
         Args:
             directory: 可选的目录路径
-            
+
         Returns:
             当前项目信息字典
-            
+
         Raises:
             NotFoundError: 项目不存在
-            
+
         Example:
             >>> project = client.projects.current()
             >>> print(f"当前项目: {project['name']}")
@@ -64,43 +65,43 @@ class ProjectResource(BaseResource):
         """
         params = {}
         if directory:
-            params['directory'] = directory
-            
-        response = self._http_client.get('/project/current', params=params)
+            params["directory"] = directory
+
+        response = self._http_client.get("/project/current", params=params)
         return response
-    
+
     def update(
         self,
         project_id: str,
         name: Optional[str] = None,
         icon: Optional[str] = None,
-        color: Optional[str] = None
+        color: Optional[str] = None,
     ) -> dict:
         """
         更新项目属性。
-        
+
         更新项目的名称、图标或颜色等属性。
-        
+
         Args:
             project_id: 项目 ID
             name: 可选的新项目名称
             icon: 可选的新项目图标
             color: 可选的新项目颜色
-            
+
         Returns:
             更新后的项目信息字典
-            
+
         Raises:
             NotFoundError: 项目不存在
             BadRequestError: 参数无效
-            
+
         Example:
             >>> # 更新项目名称
             >>> project = client.projects.update(
             ...     project_id="proj_123",
             ...     name="新项目名称"
             ... )
-            
+
             >>> # 更新项目图标和颜色
             >>> project = client.projects.update(
             ...     project_id="proj_123",
@@ -110,14 +111,62 @@ class ProjectResource(BaseResource):
         """
         data = {}
         if name is not None:
-            data['name'] = name
+            data["name"] = name
+        if icon is not None:
+            data["icon"] = icon
+        if color is not None:
+            data["color"] = color
+
+        if not data:
+            raise ValueError("至少需要提供一个更新参数 (name, icon, color)")
+
+        response = self._http_client.patch(f"/project/{project_id}", json_data=data)
+        return response
+
+
+class AsyncProjectResource(AsyncBaseResource):
+    """
+    异步 Project 资源类。
+
+    提供与 :class:`ProjectResource` 相同的项目管理功能。
+    """
+
+    async def list(self, directory: Optional[str] = None) -> List[dict]:
+        """异步列出所有项目，参见 :meth:`ProjectResource.list`。"""
+        params = {}
+        if directory:
+            params["directory"] = directory
+
+        response = await self._http_client.get("/project", params=params)
+        return response
+
+    async def current(self, directory: Optional[str] = None) -> dict:
+        """异步获取当前项目信息，参见 :meth:`ProjectResource.current`。"""
+        params = {}
+        if directory:
+            params["directory"] = directory
+
+        response = await self._http_client.get("/project/current", params=params)
+        return response
+
+    async def update(
+        self,
+        project_id: str,
+        name: Optional[str] = None,
+        icon: Optional[str] = None,
+        color: Optional[str] = None,
+    ) -> dict:
+        """异步更新项目属性，参见 :meth:`ProjectResource.update`。"""
+        data = {}
+        if name is not None:
+            data["name"] = name
         if icon is not None:
-            data['icon'] = icon
+            data["icon"] = icon
         if color is not None:
-            data['color'] = color
-        
+            data["color"] = color
+
         if not data:
             raise ValueError("至少需要提供一个更新参数 (name, icon, color)")
-        
-        response = self._http_client.patch(f'/project/{project_id}', json_data=data)
+
+        response = await self._http_client.patch(f"/project/{project_id}", json_data=data)
         return response
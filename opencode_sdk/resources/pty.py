@@ -3,7 +3,7 @@
 from typing import Any, Dict, List, Optional
 
 from ..http_client import HttpClient
-from .base import BaseResource
+from .base import AsyncBaseResource, BaseResource
 
 
 class PtyResource(BaseResource):
@@ -29,7 +29,7 @@ class PtyResource(BaseResource):
         args: Optional[List[str]] = None,
         cwd: Optional[str] = None,
         title: Optional[str] = None,
-        env: Optional[Dict[str, str]] = None
+        env: Optional[Dict[str, str]] = None,
     ) -> Dict[str, Any]:
         """
         创建新的 PTY 会话。
@@ -47,7 +47,7 @@ class PtyResource(BaseResource):
         示例:
             >>> # 创建默认 shell 会话
             >>> pty = client.pty.create()
-            
+
             >>> # 创建自定义命令会话
             >>> pty = client.pty.create(
             ...     command="python",
@@ -88,10 +88,7 @@ class PtyResource(BaseResource):
         return self._http_client.get(f"/pty/{pty_id}")
 
     def update(
-        self,
-        pty_id: str,
-        title: Optional[str] = None,
-        size: Optional[Dict[str, int]] = None
+        self, pty_id: str, title: Optional[str] = None, size: Optional[Dict[str, int]] = None
     ) -> Dict[str, Any]:
         """
         更新 PTY 会话属性。
@@ -107,7 +104,7 @@ class PtyResource(BaseResource):
         示例:
             >>> # 更新标题
             >>> pty = client.pty.update("pty_123", title="新标题")
-            
+
             >>> # 更新终端大小
             >>> pty = client.pty.update(
             ...     "pty_123",
@@ -156,3 +153,58 @@ class PtyResource(BaseResource):
             ...     pass
         """
         return self._http_client.get(f"/pty/{pty_id}/connect")
+
+
+class AsyncPtyResource(AsyncBaseResource):
+    """异步 PTY (Pseudo-Terminal) 会话管理资源。"""
+
+    async def list(self) -> List[Dict[str, Any]]:
+        """异步列出所有活动的 PTY 会话，参见 :meth:`PtyResource.list`。"""
+        return await self._http_client.get("/pty")
+
+    async def create(
+        self,
+        command: Optional[str] = None,
+        args: Optional[List[str]] = None,
+        cwd: Optional[str] = None,
+        title: Optional[str] = None,
+        env: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """异步创建新的 PTY 会话，参见 :meth:`PtyResource.create`。"""
+        data = {}
+        if command is not None:
+            data["command"] = command
+        if args is not None:
+            data["args"] = args
+        if cwd is not None:
+            data["cwd"] = cwd
+        if title is not None:
+            data["title"] = title
+        if env is not None:
+            data["env"] = env
+
+        return await self._http_client.post("/pty", json_data=data if data else None)
+
+    async def get(self, pty_id: str) -> Dict[str, Any]:
+        """异步获取指定 PTY 会话的详细信息，参见 :meth:`PtyResource.get`。"""
+        return await self._http_client.get(f"/pty/{pty_id}")
+
+    async def update(
+        self, pty_id: str, title: Optional[str] = None, size: Optional[Dict[str, int]] = None
+    ) -> Dict[str, Any]:
+        """异步更新 PTY 会话属性，参见 :meth:`PtyResource.update`。"""
+        data = {}
+        if title is not None:
+            data["title"] = title
+        if size is not None:
+            data["size"] = size
+
+        return await self._http_client.put(f"/pty/{pty_id}", json_data=data)
+
+    async def remove(self, pty_id: str) -> bool:
+        """异步移除并终止 PTY 会话，参见 :meth:`PtyResource.remove`。"""
+        return await self._http_client.delete(f"/pty/{pty_id}")
+
+    async def connect(self, pty_id: str) -> bool:
+        """异步检查 PTY 会话是否可以连接，参见 :meth:`PtyResource.connect`。"""
+        return await self._http_client.get(f"/pty/{pty_id}/connect")
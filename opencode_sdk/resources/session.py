@@ -5,18 +5,27 @@ Session 资源模块。
 以及消息交互、命令执行、版本控制等功能。
 """
 
-from typing import List, Dict, Any, Optional, AsyncIterator
-from ..models.session import Session, SessionStatus, SessionSummary
-from ..models.message import Message, Part
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional
+
+from ..batch import PromptJob, PromptResult, arun_prompts, run_prompts
 from ..models.common import FileDiff, Todo
 from ..models.events import Event
-from .base import BaseResource
+from ..models.message import Message, Part, _message_dict, parse_message, parse_messages
+from ..models.session import SESSION_STATUS_MAP_ADAPTER, Session, SessionStatus, SessionSummary
+from .base import AsyncBaseResource, BaseResource
+
+
+def _build_sessions(items: List[Dict[str, Any]]) -> List[Session]:
+    """将会话字典列表转换为 Session 列表。"""
+    return [Session(**item) for item in items]
 
 
 class SessionResource(BaseResource):
     """
     Session 资源类。
-    
+
     提供会话管理的完整功能，包括：
     - 基础 CRUD 操作（创建、读取、更新、删除）
     - 消息交互（发送消息、获取消息列表）
@@ -25,19 +34,26 @@ class SessionResource(BaseResource):
     - 会话管理（分享、分叉、中止）
     - 状态查询（状态、差异、待办事项）
     """
-    
+
     # ==================== 基础 CRUD 操作 ====================
-    
-    def list(self, directory: Optional[str] = None) -> List[Session]:
+
+    def list(
+        self,
+        directory: Optional[str] = None,
+        raw: Optional[bool] = None,
+        lazy: Optional[bool] = None,
+    ) -> List[Session]:
         """
         列出所有会话。
-        
+
         Args:
             directory: 可选的目录路径，用于过滤特定目录的会话
-            
+            raw: 为 True 时返回原始 JSON，跳过模型校验
+            lazy: 为 True 时返回惰性视图，字段在首次访问时才校验
+
         Returns:
             会话列表
-            
+
         Example:
             >>> sessions = client.sessions.list()
             >>> for session in sessions:
@@ -45,42 +61,42 @@ class SessionResource(BaseResource):
         """
         params = {}
         if directory:
-            params['directory'] = directory
-            
-        response = self._http_client.get('/session', params=params)
-        return [Session(**item) for item in response]
-    
+            params["directory"] = directory
+
+        response = self._http_client.get("/session", params=params)
+        return self._convert(response, _build_sessions, Session, raw, lazy)
+
     def create(
         self,
         title: Optional[str] = None,
         directory: Optional[str] = None,
         parent_id: Optional[str] = None,
         permission: Optional[Dict[str, Any]] = None,
-        **kwargs
+        **kwargs: Any,
     ) -> Session:
         """
         创建新会话。
-        
+
         Args:
             title: 会话标题
             directory: 项目目录（作为查询参数，用于指定项目）
             parent_id: 父会话 ID（用于创建子会话）
             permission: 权限规则集
             **kwargs: 其他可选参数
-            
+
         Returns:
             创建的会话对象
-            
+
         Example:
             >>> # 创建普通会话
             >>> session = client.sessions.create(title="新会话")
-            
+
             >>> # 在指定目录创建会话（自动创建项目）
             >>> session = client.sessions.create(
             ...     title="新会话",
             ...     directory="/path/to/project"
             ... )
-            
+
             >>> # 创建子会话
             >>> child_session = client.sessions.create(
             ...     title="子会话",
@@ -90,71 +106,75 @@ class SessionResource(BaseResource):
         # 构建查询参数
         params = {}
         if directory:
-            params['directory'] = directory
-        
+            params["directory"] = directory
+
         # 构建请求体
-        data = {}
+        data: Dict[str, Any] = {}
         if title:
-            data['title'] = title
+            data["title"] = title
         if parent_id:
-            data['parentID'] = parent_id
+            data["parentID"] = parent_id
         if permission:
-            data['permission'] = permission
+            data["permission"] = permission
         data.update(kwargs)
-        
-        response = self._http_client.post('/session', params=params, json_data=data)
+
+        response = self._http_client.post("/session", params=params, json_data=data)
         return Session(**response)
-    
-    def get(self, session_id: str) -> Session:
+
+    def get(
+        self, session_id: str, raw: Optional[bool] = None, lazy: Optional[bool] = None
+    ) -> Session:
         """
         获取会话详情。
-        
+
         Args:
             session_id: 会话 ID
-            
+            raw: 为 True 时返回原始 JSON，跳过模型校验
+            lazy: 为 True 时返回惰性视图，字段在首次访问时才校验
+
         Returns:
             会话对象
-            
+
         Raises:
             NotFoundError: 会话不存在
-            
+
         Example:
             >>> session = client.sessions.get("session_123")
             >>> print(session.name)
         """
-        response = self._http_client.get(f'/session/{session_id}')
-        return Session(**response)
-    
+        response = self._http_client.get(f"/session/{session_id}")
+        return self._convert(response, Session.model_validate, Session, raw, lazy)
+
     def delete(self, session_id: str) -> None:
         """
         删除会话及其所有数据。
-        
+
         Args:
             session_id: 会话 ID
-            
+
         Raises:
             NotFoundError: 会话不存在
-            
+
         Example:
             >>> client.sessions.delete("session_123")
         """
-        self._http_client.delete(f'/session/{session_id}')
-    
-    def update(self, session_id: str, **kwargs) -> Session:
+        self._http_client.delete(f"/session/{session_id}")
+
+    def update(self, session_id: str, **kwargs: Any) -> Session:
         """
         更新会话属性。
-        
+
         Args:
             session_id: 会话 ID
             **kwargs: 要更新的属性（name, providerId, modelId 等）
-            
+
         Returns:
             更新后的会话对象
-            
+
         Raises:
             NotFoundError: 会话不存在
             BadRequestError: 参数无效
-            
+
         Example:
             >>> session = client.sessions.update(
             ...     "session_123",
@@ -162,137 +182,188 @@ class SessionResource(BaseResource):
             ...     modelId="claude-3-5-sonnet-20241022"
             ... )
         """
-        response = self._http_client.patch(f'/session/{session_id}', json_data=kwargs)
+        response = self._http_client.patch(f"/session/{session_id}", json_data=kwargs)
         return Session(**response)
-    
+
     # ==================== 状态和消息 ====================
-    
+
     def status(self, session_id: Optional[str] = None) -> Dict[str, SessionStatus]:
         """
         获取会话状态。
-        
+
         Args:
             session_id: 可选的会话 ID，如果不提供则返回所有会话的状态
-            
+
         Returns:
             会话状态字典，键为会话 ID，值为状态对象
-            
+
         Example:
             >>> # 获取所有会话状态
             >>> statuses = client.sessions.status()
-            >>> 
+            >>>
             >>> # 获取特定会话状态
             >>> status = client.sessions.status("session_123")
         """
         params = {}
         if session_id:
-            params['sessionId'] = session_id
-            
-        response = self._http_client.get('/session/status', params=params)
-        return {k: SessionStatus(**v) for k, v in response.items()}
-    
+            params["sessionId"] = session_id
+
+        response = self._http_client.get("/session/status", params=params)
+        return SESSION_STATUS_MAP_ADAPTER.validate_python(response)
+
     def messages(
         self,
         session_id: str,
         limit: Optional[int] = None,
-        offset: Optional[int] = None
+        offset: Optional[int] = None,
+        raw: Optional[bool] = None,
+        lazy: Optional[bool] = None,
     ) -> List[Message]:
         """
         获取会话的消息列表。
-        
+
         Args:
             session_id: 会话 ID
             limit: 限制返回的消息数量
             offset: 偏移量，用于分页
-            
+            raw: 为 True 时返回原始 JSON，跳过模型校验
+            lazy: 为 True 时返回惰性视图，字段在首次访问时才校验
+
         Returns:
             消息列表
-            
+
         Raises:
             NotFoundError: 会话不存在
-            
+
         Example:
             >>> messages = client.sessions.messages("session_123", limit=10)
             >>> for msg in messages:
             ...     print(f"{msg.role}: {msg.parts[0].text}")
+
+            >>> # 只读取少量字段时使用惰性视图，未访问的字段不做校验
+            >>> for msg in client.sessions.messages("session_123", lazy=True):
+            ...     print(msg.id, msg.time.created)
         """
         params = {}
         if limit is not None:
-            params['limit'] = limit
+            params["limit"] = limit
         if offset is not None:
-            params['offset'] = offset
-            
-        response = self._http_client.get(f'/session/{session_id}/message', params=params)
-        
-        from ..models.message import UserMessage, AssistantMessage
-        
-        messages = []
-        for item in response:
-            role = item.get('role')
-            if role == 'user':
-                messages.append(UserMessage(**item))
-            elif role == 'assistant':
-                messages.append(AssistantMessage(**item))
-            else:
-                messages.append(Message(**item))
-        return messages
-    
-    def message(self, session_id: str, message_id: str) -> Message:
+            params["offset"] = offset
+
+        response = self._http_client.get(f"/session/{session_id}/message", params=params)
+        return self._convert(response, parse_messages, Message, raw, lazy, _message_dict)
+
+    def message(
+        self,
+        session_id: str,
+        message_id: str,
+        raw: Optional[bool] = None,
+        lazy: Optional[bool] = None,
+    ) -> Message:
         """
         获取单条消息。
-        
+
         Args:
             session_id: 会话 ID
             message_id: 消息 ID
-            
+            raw: 为 True 时返回原始 JSON，跳过模型校验
+            lazy: 为 True 时返回惰性视图，字段在首次访问时才校验
+
         Returns:
             消息对象
-            
+
         Raises:
             NotFoundError: 会话或消息不存在
-            
+
         Example:
             >>> message = client.sessions.message("session_123", "msg_456")
             >>> print(message.parts[0].text)
         """
-        response = self._http_client.get(f'/session/{session_id}/message/{message_id}')
-        
-        from ..models.message import UserMessage, AssistantMessage
-        
-        role = response.get('role')
-        if role == 'user':
-            return UserMessage(**response)
-        elif role == 'assistant':
-            return AssistantMessage(**response)
-        else:
-            return Message(**response)
-    
-    # ==================== 交互操作 ====================
-    
-    def prompt(
+        response = self._http_client.get(f"/session/{session_id}/message/{message_id}")
+        return self._convert(response, parse_message, Message, raw, lazy, _message_dict)
+
+    def iter_messages(
         self,
         session_id: str,
-        parts: List[Dict[str, Any]],
-        **kwargs
-    ) -> Message:
+        page_size: int = 100,
+        offset: int = 0,
+        prefetch: bool = True,
+        raw: Optional[bool] = None,
+        lazy: Optional[bool] = None,
+    ) -> Iterator[Message]:
+        """
+        逐条遍历会话的全部消息，自动按 ``limit``/``offset`` 分页。
+
+        调用方处理当前页时，下一页已在后台线程中请求，内存占用只与页大小有关。
+        提前结束遍历（break 或关闭生成器）会丢弃尚未使用的预取结果。
+
+        Args:
+            session_id: 会话 ID
+            page_size: 每页消息数量
+            offset: 起始偏移量
+            prefetch: 是否在处理当前页时预取下一页
+            raw: 为 True 时返回原始 JSON，跳过模型校验
+            lazy: 为 True 时返回惰性视图，字段在首次访问时才校验
+
+        Yields:
+            消息对象
+
+        Raises:
+            NotFoundError: 会话不存在
+
+        Example:
+            >>> for msg in client.sessions.iter_messages("session_123", page_size=500):
+            ...     print(msg.id, msg.role)
+        """
+        if page_size <= 0:
+            raise ValueError("page_size 必须为正整数")
+
+        def fetch(start: int) -> List[Message]:
+            return self.messages(session_id, limit=page_size, offset=start, raw=raw, lazy=lazy)
+
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        pending: Optional[Future] = None
+        try:
+            page = fetch(offset)
+            while page:
+                offset += len(page)
+                last = len(page) < page_size
+                if executor is not None and not last:
+                    pending = executor.submit(fetch, offset)
+                yield from page
+                if last:
+                    return
+                if pending is not None:
+                    page, pending = pending.result(), None
+                else:
+                    page = fetch(offset)
+        finally:
+            if pending is not None:
+                pending.cancel()
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+    # ==================== 交互操作 ====================
+
+    def prompt(self, session_id: str, parts: List[Dict[str, Any]], **kwargs: Any) -> Message:
         """
         发送消息到会话（同步）。
-        
+
         此方法会等待 AI 完成响应后返回。
-        
+
         Args:
             session_id: 会话 ID
             parts: 消息部分列表，每个部分是一个字典
             **kwargs: 其他可选参数
-            
+
         Returns:
             AI 的响应消息
-            
+
         Raises:
             NotFoundError: 会话不存在
             BadRequestError: 参数无效
             MessageAbortedError: 消息被中止
-            
+
         Example:
             >>> response = client.sessions.prompt(
             ...     "session_123",
@@ -300,49 +371,32 @@ class SessionResource(BaseResource):
             ... )
             >>> print(response.parts[0].text)
         """
-        data = {'parts': parts}
+        data = {"parts": parts}
         data.update(kwargs)
-        
-        response = self._http_client.post(f'/session/{session_id}/message', json_data=data)
-        
-        if isinstance(response, dict) and 'info' in response and 'parts' in response:
-            message_data = {**response['info'], 'parts': response['parts']}
-        else:
-            message_data = response
-        
-        from ..models.message import UserMessage, AssistantMessage
-        
-        role = message_data.get('role')
-        if role == 'user':
-            return UserMessage(**message_data)
-        elif role == 'assistant':
-            return AssistantMessage(**message_data)
-        else:
-            return Message(**message_data)
-    
+
+        response = self._http_client.post(f"/session/{session_id}/message", json_data=data)
+        return parse_message(response)
+
     async def prompt_async(
-        self,
-        session_id: str,
-        parts: List[Dict[str, Any]],
-        **kwargs
+        self, session_id: str, parts: List[Dict[str, Any]], **kwargs: Any
     ) -> AsyncIterator[Event]:
         """
         发送消息到会话（异步流式）。
-        
+
         此方法立即返回，通过事件流接收 AI 的响应。
-        
+
         Args:
             session_id: 会话 ID
             parts: 消息部分列表
             **kwargs: 其他可选参数
-            
+
         Yields:
             事件对象，包含 AI 响应的各个部分
-            
+
         Raises:
             NotFoundError: 会话不存在
             BadRequestError: 参数无效
-            
+
         Example:
             >>> async for event in client.sessions.prompt_async(
             ...     "session_123",
@@ -353,36 +407,62 @@ class SessionResource(BaseResource):
         """
         # 使用 Event 资源的 subscribe_session 方法
         from .event import EventResource
+
         event_resource = EventResource(self._http_client)
-        
+
         async for event in event_resource.subscribe_session(
-            session_id=session_id,
-            parts=parts,
-            **kwargs
+            session_id=session_id, parts=parts, **kwargs
         ):
             yield event
-    
-    def command(
-        self,
-        session_id: str,
-        name: str,
-        args: Optional[Dict[str, Any]] = None
-    ) -> Message:
+
+    def prompt_many(
+        self, jobs: Iterable[PromptJob], concurrency: int = 8, timeout: Optional[float] = None
+    ) -> Iterator[PromptResult]:
+        """
+        以有限并发向多个会话发送消息，按完成顺序逐个返回结果。
+
+        每个任务在后台线程中调用 :meth:`prompt`。单个任务失败不会中断整批任务，
+        错误记录在结果的 ``error`` 中；超过 ``timeout`` 的任务会调用 :meth:`abort`
+        中止会话，并以 ``TimeoutError`` 结束。提前结束遍历（break 或关闭生成器）
+        会取消尚未开始的任务，并中止正在执行的会话。
+
+        ``concurrency`` 超过客户端的 ``max_connections`` 时，多出的请求会在连接池中排队。
+
+        Args:
+            jobs: 任务序列，每项为 ``(session_id, parts)`` 或 ``(session_id, parts, kwargs)``，
+                按需读取，可以是生成器
+            concurrency: 最大并发数
+            timeout: 单个任务的超时时间（秒），None 表示不限
+
+        Yields:
+            PromptResult 对象（``index`` 为任务在输入中的序号）
+
+        Example:
+            >>> jobs = [(sid, [{"type": "text", "text": "总结这个项目"}]) for sid in session_ids]
+            >>> for result in client.sessions.prompt_many(jobs, concurrency=16, timeout=300):
+            ...     if result.ok:
+            ...         print(result.session_id, result.message.id)
+            ...     else:
+            ...         print(result.session_id, "失败:", result.error)
+        """
+        return run_prompts(self.prompt, self.abort, jobs, concurrency, timeout)
+
+    def command(self, session_id: str, name: str, args: Optional[Dict[str, Any]] = None) -> Message:
         """
         执行命令。
-        
+
         Args:
             session_id: 会话 ID
             name: 命令名称
             args: 命令参数
-            
+
         Returns:
             命令执行结果消息
-            
+
         Raises:
             NotFoundError: 会话不存在
             BadRequestError: 命令无效
-            
+
         Example:
             >>> result = client.sessions.command(
             ...     "session_123",
@@ -390,37 +470,28 @@ class SessionResource(BaseResource):
             ...     args={"query": "TODO"}
             ... )
         """
-        data = {'name': name}
+        data: Dict[str, Any] = {"name": name}
         if args:
-            data['args'] = args
-            
-        response = self._http_client.post(f'/session/{session_id}/command', json_data=data)
-        
-        from ..models.message import UserMessage, AssistantMessage
-        
-        role = response.get('role')
-        if role == 'user':
-            return UserMessage(**response)
-        elif role == 'assistant':
-            return AssistantMessage(**response)
-        else:
-            return Message(**response)
-    
+            data["args"] = args
+
+        response = self._http_client.post(f"/session/{session_id}/command", json_data=data)
+        return parse_message(response)
+
     def shell(self, session_id: str, command: str) -> Message:
         """
         执行 Shell 命令。
-        
+
         Args:
             session_id: 会话 ID
             command: Shell 命令字符串
-            
+
         Returns:
             命令执行结果消息
-            
+
         Raises:
             NotFoundError: 会话不存在
             BadRequestError: 命令无效
-            
+
         Example:
             >>> result = client.sessions.shell(
             ...     "session_123",
@@ -428,259 +499,530 @@ class SessionResource(BaseResource):
             ... )
             >>> print(result.parts[0].text)
         """
-        data = {'command': command}
-        response = self._http_client.post(f'/session/{session_id}/shell', json_data=data)
-        
-        from ..models.message import UserMessage, AssistantMessage
-        
-        role = response.get('role')
-        if role == 'user':
-            return UserMessage(**response)
-        elif role == 'assistant':
-            return AssistantMessage(**response)
-        else:
-            return Message(**response)
-    
+        data = {"command": command}
+        response = self._http_client.post(f"/session/{session_id}/shell", json_data=data)
+        return parse_message(response)
+
     def abort(self, session_id: str) -> None:
         """
         中止会话。
-        
+
         停止当前正在执行的操作。
-        
+
         Args:
             session_id: 会话 ID
-            
+
         Raises:
             NotFoundError: 会话不存在
-            
+
         Example:
             >>> client.sessions.abort("session_123")
         """
-        self._http_client.post(f'/session/{session_id}/abort')
-    
+        self._http_client.post(f"/session/{session_id}/abort")
+
     # ==================== 分享和协作 ====================
-    
+
     def share(self, session_id: str) -> Session:
         """
         分享会话。
-        
+
         生成分享链接，允许其他人查看会话。
-        
+
         Args:
             session_id: 会话 ID
-            
+
         Returns:
             更新后的会话对象（包含分享信息）
-            
+
         Raises:
             NotFoundError: 会话不存在
-            
+
         Example:
             >>> session = client.sessions.share("session_123")
             >>> print(f"分享链接: {session.share_url}")
         """
-        response = self._http_client.post(f'/session/{session_id}/share')
+        response = self._http_client.post(f"/session/{session_id}/share")
         return Session(**response)
-    
+
     def unshare(self, session_id: str) -> Session:
         """
         取消分享会话。
-        
+
         Args:
             session_id: 会话 ID
-            
+
         Returns:
             更新后的会话对象
-            
+
         Raises:
             NotFoundError: 会话不存在
-            
+
         Example:
             >>> session = client.sessions.unshare("session_123")
         """
-        response = self._http_client.delete(f'/session/{session_id}/share')
+        response = self._http_client.delete(f"/session/{session_id}/share")
         return Session(**response)
-    
+
     # ==================== 差异和总结 ====================
-    
+
     def diff(self, session_id: str) -> List[FileDiff]:
         """
         获取会话的文件差异。
-        
+
         返回会话中所有文件的修改差异。
-        
+
         Args:
             session_id: 会话 ID
-            
+
         Returns:
             文件差异列表
-            
+
         Raises:
             NotFoundError: 会话不存在
-            
+
         Example:
             >>> diffs = client.sessions.diff("session_123")
             >>> for diff in diffs:
             ...     print(f"{diff.path}: +{diff.additions} -{diff.deletions}")
         """
-        response = self._http_client.get(f'/session/{session_id}/diff')
+        response = self._http_client.get(f"/session/{session_id}/diff")
         return [FileDiff(**item) for item in response]
-    
+
     def summarize(self, session_id: str) -> SessionSummary:
         """
         总结会话。
-        
+
         生成会话的摘要信息。
-        
+
         Args:
             session_id: 会话 ID
-            
+
         Returns:
             会话摘要对象
-            
+
         Raises:
             NotFoundError: 会话不存在
-            
+
         Example:
             >>> summary = client.sessions.summarize("session_123")
             >>> print(summary.summary)
         """
-        response = self._http_client.post(f'/session/{session_id}/summarize')
+        response = self._http_client.post(f"/session/{session_id}/summarize")
         return SessionSummary(**response)
-    
+
     # ==================== 版本控制 ====================
-    
+
     def revert(self, session_id: str, message_id: str) -> Session:
         """
         回退到指定消息。
-        
+
         将会话状态回退到指定消息之前的状态。
-        
+
         Args:
             session_id: 会话 ID
             message_id: 要回退到的消息 ID
-            
+
         Returns:
             更新后的会话对象
-            
+
         Raises:
             NotFoundError: 会话或消息不存在
-            
+
         Example:
             >>> session = client.sessions.revert("session_123", "msg_456")
         """
-        data = {'messageId': message_id}
-        response = self._http_client.post(f'/session/{session_id}/revert', json_data=data)
+        data = {"messageId": message_id}
+        response = self._http_client.post(f"/session/{session_id}/revert", json_data=data)
         return Session(**response)
-    
+
     def unrevert(self, session_id: str) -> Session:
         """
         恢复所有回退的消息。
-        
+
         取消之前的回退操作，恢复到最新状态。
-        
+
         Args:
             session_id: 会话 ID
-            
+
         Returns:
             更新后的会话对象
-            
+
         Raises:
             NotFoundError: 会话不存在
-            
+
         Example:
             >>> session = client.sessions.unrevert("session_123")
         """
-        response = self._http_client.post(f'/session/{session_id}/unrevert')
+        response = self._http_client.post(f"/session/{session_id}/unrevert")
         return Session(**response)
-    
+
     # ==================== 关系和层级 ====================
-    
-    def children(self, session_id: str) -> List[Session]:
+
+    def children(
+        self, session_id: str, raw: Optional[bool] = None, lazy: Optional[bool] = None
+    ) -> List[Session]:
         """
         获取子会话列表。
-        
+
         返回从当前会话分叉出的所有子会话。
-        
+
         Args:
             session_id: 会话 ID
-            
+            raw: 为 True 时返回原始 JSON，跳过模型校验
+            lazy: 为 True 时返回惰性视图，字段在首次访问时才校验
+
         Returns:
             子会话列表
-            
+
         Raises:
             NotFoundError: 会话不存在
-            
+
         Example:
             >>> children = client.sessions.children("session_123")
             >>> for child in children:
             ...     print(f"子会话: {child.name}")
         """
-        response = self._http_client.get(f'/session/{session_id}/children')
-        return [Session(**item) for item in response]
-    
+        response = self._http_client.get(f"/session/{session_id}/children")
+        return self._convert(response, _build_sessions, Session, raw, lazy)
+
     def todo(self, session_id: str) -> List[Todo]:
         """
         获取待办事项列表。
-        
+
         返回会话中标记的所有待办事项。
-        
+
         Args:
             session_id: 会话 ID
-            
+
         Returns:
             待办事项列表
-            
+
         Raises:
             NotFoundError: 会话不存在
-            
+
         Example:
             >>> todos = client.sessions.todo("session_123")
             >>> for todo in todos:
             ...     print(f"[ ] {todo.text}")
         """
-        response = self._http_client.get(f'/session/{session_id}/todo')
+        response = self._http_client.get(f"/session/{session_id}/todo")
         return [Todo(**item) for item in response]
-    
+
     def fork(self, session_id: str, message_id: str) -> Session:
         """
         在指定消息处分叉会话。
-        
+
         创建一个新会话，从指定消息开始。
-        
+
         Args:
             session_id: 原会话 ID
             message_id: 分叉点消息 ID
-            
+
         Returns:
             新创建的会话对象
-            
+
         Raises:
             NotFoundError: 会话或消息不存在
-            
+
         Example:
             >>> new_session = client.sessions.fork("session_123", "msg_456")
             >>> print(f"新会话 ID: {new_session.id}")
         """
-        data = {'messageId': message_id}
-        response = self._http_client.post(f'/session/{session_id}/fork', json_data=data)
+        data = {"messageId": message_id}
+        response = self._http_client.post(f"/session/{session_id}/fork", json_data=data)
         return Session(**response)
-    
+
     # ==================== 初始化 ====================
-    
+
     def init(self, session_id: str) -> None:
         """
         初始化会话。
-        
+
         分析应用并创建 AGENTS.md 文件。
-        
+
         Args:
             session_id: 会话 ID
-            
+
         Raises:
             NotFoundError: 会话不存在
-            
+
         Example:
             >>> client.sessions.init("session_123")
         """
-        self._http_client.post(f'/session/{session_id}/init')
+        self._http_client.post(f"/session/{session_id}/init")
+
+
+class AsyncSessionResource(AsyncBaseResource):
+    """
+    异步 Session 资源类。
+
+    与 :class:`SessionResource` 提供相同的方法，所有请求通过共享的
+    ``httpx.AsyncClient`` 连接池发送，适合在单个事件循环中驱动大量并发会话。
+    """
+
+    # ==================== 基础 CRUD 操作 ====================
+
+    async def list(
+        self,
+        directory: Optional[str] = None,
+        raw: Optional[bool] = None,
+        lazy: Optional[bool] = None,
+    ) -> List[Session]:
+        """异步列出所有会话，参见 :meth:`SessionResource.list`。"""
+        params = {}
+        if directory:
+            params["directory"] = directory
+
+        response = await self._http_client.get("/session", params=params)
+        return self._convert(response, _build_sessions, Session, raw, lazy)
+
+    async def create(
+        self,
+        title: Optional[str] = None,
+        directory: Optional[str] = None,
+        parent_id: Optional[str] = None,
+        permission: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Session:
+        """异步创建新会话，参见 :meth:`SessionResource.create`。"""
+        params = {}
+        if directory:
+            params["directory"] = directory
+
+        data: Dict[str, Any] = {}
+        if title:
+            data["title"] = title
+        if parent_id:
+            data["parentID"] = parent_id
+        if permission:
+            data["permission"] = permission
+        data.update(kwargs)
+
+        response = await self._http_client.post("/session", params=params, json_data=data)
+        return Session(**response)
+
+    async def get(
+        self, session_id: str, raw: Optional[bool] = None, lazy: Optional[bool] = None
+    ) -> Session:
+        """异步获取会话详情，参见 :meth:`SessionResource.get`。"""
+        response = await self._http_client.get(f"/session/{session_id}")
+        return self._convert(response, Session.model_validate, Session, raw, lazy)
+
+    async def delete(self, session_id: str) -> None:
+        """异步删除会话，参见 :meth:`SessionResource.delete`。"""
+        await self._http_client.delete(f"/session/{session_id}")
+
+    async def update(self, session_id: str, **kwargs: Any) -> Session:
+        """异步更新会话属性，参见 :meth:`SessionResource.update`。"""
+        response = await self._http_client.patch(f"/session/{session_id}", json_data=kwargs)
+        return Session(**response)
+
+    # ==================== 状态和消息 ====================
+
+    async def status(self, session_id: Optional[str] = None) -> Dict[str, SessionStatus]:
+        """异步获取会话状态，参见 :meth:`SessionResource.status`。"""
+        params = {}
+        if session_id:
+            params["sessionId"] = session_id
+
+        response = await self._http_client.get("/session/status", params=params)
+        return SESSION_STATUS_MAP_ADAPTER.validate_python(response)
+
+    async def messages(
+        self,
+        session_id: str,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        raw: Optional[bool] = None,
+        lazy: Optional[bool] = None,
+    ) -> List[Message]:
+        """异步获取会话的消息列表，参见 :meth:`SessionResource.messages`。"""
+        params = {}
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+
+        response = await self._http_client.get(f"/session/{session_id}/message", params=params)
+        return self._convert(response, parse_messages, Message, raw, lazy, _message_dict)
+
+    async def message(
+        self,
+        session_id: str,
+        message_id: str,
+        raw: Optional[bool] = None,
+        lazy: Optional[bool] = None,
+    ) -> Message:
+        """异步获取单条消息，参见 :meth:`SessionResource.message`。"""
+        response = await self._http_client.get(f"/session/{session_id}/message/{message_id}")
+        return self._convert(response, parse_message, Message, raw, lazy, _message_dict)
+
+    async def iter_messages(
+        self,
+        session_id: str,
+        page_size: int = 100,
+        offset: int = 0,
+        prefetch: bool = True,
+        raw: Optional[bool] = None,
+        lazy: Optional[bool] = None,
+    ) -> AsyncIterator[Message]:
+        """
+        异步逐条遍历会话的全部消息，参见 :meth:`SessionResource.iter_messages`。
+
+        下一页的请求作为后台任务与当前页的处理并发进行。
+        """
+        if page_size <= 0:
+            raise ValueError("page_size 必须为正整数")
+
+        pending: Optional["asyncio.Task[List[Message]]"] = None
+        try:
+            page = await self.messages(
+                session_id, limit=page_size, offset=offset, raw=raw, lazy=lazy
+            )
+            while page:
+                offset += len(page)
+                last = len(page) < page_size
+                if prefetch and not last:
+                    pending = asyncio.create_task(
+                        self.messages(
+                            session_id, limit=page_size, offset=offset, raw=raw, lazy=lazy
+                        )
+                    )
+                for message in page:
+                    yield message
+                if last:
+                    return
+                if pending is not None:
+                    page, pending = await pending, None
+                else:
+                    page = await self.messages(
+                        session_id, limit=page_size, offset=offset, raw=raw, lazy=lazy
+                    )
+        finally:
+            if pending is not None and not pending.done():
+                pending.cancel()
+
+    # ==================== 交互操作 ====================
+
+    async def prompt(self, session_id: str, parts: List[Dict[str, Any]], **kwargs: Any) -> Message:
+        """
+        异步发送消息到会话，并等待 AI 完成响应。
+
+        与 :meth:`SessionResource.prompt` 相同，但等待期间不会阻塞事件循环。
+        """
+        data = {"parts": parts}
+        data.update(kwargs)
+
+        response = await self._http_client.post(f"/session/{session_id}/message", json_data=data)
+        return parse_message(response)
+
+    async def prompt_async(
+        self, session_id: str, parts: List[Dict[str, Any]], **kwargs: Any
+    ) -> AsyncIterator[Event]:
+        """发送消息并通过事件流接收响应，参见 :meth:`SessionResource.prompt_async`。"""
+        from .event import AsyncEventResource
+
+        event_resource = AsyncEventResource(self._http_client)
+
+        async for event in event_resource.subscribe_session(
+            session_id=session_id, parts=parts, **kwargs
+        ):
+            yield event
+
+    def prompt_many(
+        self, jobs: Iterable[PromptJob], concurrency: int = 8, timeout: Optional[float] = None
+    ) -> AsyncIterator[PromptResult]:
+        """
+        以有限并发向多个会话发送消息，参见 :meth:`SessionResource.prompt_many`。
+
+        任务作为事件循环中的任务执行；提前结束遍历或外部取消时会中止正在执行的会话。
+
+        Example:
+            >>> async for result in client.sessions.prompt_many(jobs, concurrency=32):
+            ...     print(result.index, result.ok)
+        """
+        return arun_prompts(self.prompt, self.abort, jobs, concurrency, timeout)
+
+    async def command(
+        self, session_id: str, name: str, args: Optional[Dict[str, Any]] = None
+    ) -> Message:
+        """异步执行命令，参见 :meth:`SessionResource.command`。"""
+        data: Dict[str, Any] = {"name": name}
+        if args:
+            data["args"] = args
+
+        response = await self._http_client.post(f"/session/{session_id}/command", json_data=data)
+        return parse_message(response)
+
+    async def shell(self, session_id: str, command: str) -> Message:
+        """异步执行 Shell 命令，参见 :meth:`SessionResource.shell`。"""
+        data = {"command": command}
+        response = await self._http_client.post(f"/session/{session_id}/shell", json_data=data)
+        return parse_message(response)
+
+    async def abort(self, session_id: str) -> None:
+        """异步中止会话，参见 :meth:`SessionResource.abort`。"""
+        await self._http_client.post(f"/session/{session_id}/abort")
+
+    # ==================== 分享和协作 ====================
+
+    async def share(self, session_id: str) -> Session:
+        """异步分享会话，参见 :meth:`SessionResource.share`。"""
+        response = await self._http_client.post(f"/session/{session_id}/share")
+        return Session(**response)
+
+    async def unshare(self, session_id: str) -> Session:
+        """异步取消分享会话，参见 :meth:`SessionResource.unshare`。"""
+        response = await self._http_client.delete(f"/session/{session_id}/share")
+        return Session(**response)
+
+    # ==================== 差异和总结 ====================
+
+    async def diff(self, session_id: str) -> List[FileDiff]:
+        """异步获取会话的文件差异，参见 :meth:`SessionResource.diff`。"""
+        response = await self._http_client.get(f"/session/{session_id}/diff")
+        return [FileDiff(**item) for item in response]
+
+    async def summarize(self, session_id: str) -> SessionSummary:
+        """异步总结会话，参见 :meth:`SessionResource.summarize`。"""
+        response = await self._http_client.post(f"/session/{session_id}/summarize")
+        return SessionSummary(**response)
+
+    # ==================== 版本控制 ====================
+
+    async def revert(self, session_id: str, message_id: str) -> Session:
+        """异步回退到指定消息，参见 :meth:`SessionResource.revert`。"""
+        data = {"messageId": message_id}
+        response = await self._http_client.post(f"/session/{session_id}/revert", json_data=data)
+        return Session(**response)
+
+    async def unrevert(self, session_id: str) -> Session:
+        """异步恢复所有回退的消息，参见 :meth:`SessionResource.unrevert`。"""
+        response = await self._http_client.post(f"/session/{session_id}/unrevert")
+        return Session(**response)
+
+    # ==================== 关系和层级 ====================
+
+    async def children(
+        self, session_id: str, raw: Optional[bool] = None, lazy: Optional[bool] = None
+    ) -> List[Session]:
+        """异步获取子会话列表，参见 :meth:`SessionResource.children`。"""
+        response = await self._http_client.get(f"/session/{session_id}/children")
+        return self._convert(response, _build_sessions, Session, raw, lazy)
+
+    async def todo(self, session_id: str) -> List[Todo]:
+        """异步获取待办事项列表，参见 :meth:`SessionResource.todo`。"""
+        response = await self._http_client.get(f"/session/{session_id}/todo")
+        return [Todo(**item) for item in response]
+
+    async def fork(self, session_id: str, message_id: str) -> Session:
+        """异步在指定消息处分叉会话，参见 :meth:`SessionResource.fork`。"""
+        data = {"messageId": message_id}
+        response = await self._http_client.post(f"/session/{session_id}/fork", json_data=data)
+        return Session(**response)
+
+    # ==================== 初始化 ====================
+
+    async def init(self, session_id: str) -> None:
+        """异步初始化会话，参见 :meth:`SessionResource.init`。"""
+        await self._http_client.post(f"/session/{session_id}/init")
@@ -3,7 +3,7 @@
 from typing import Any, Dict, List
 
 from ..http_client import HttpClient
-from .base import BaseResource
+from .base import AsyncBaseResource, BaseResource
 
 
 class ToolResource(BaseResource):
@@ -46,6 +46,19 @@ class ToolResource(BaseResource):
             ...     print(f"参数: {tool['parameters']}")
         """
         return self._http_client.get(
-            "/experimental/tool",
-            params={"provider": provider_id, "model": model_id}
+            "/experimental/tool", params={"provider": provider_id, "model": model_id}
+        )
+
+
+class AsyncToolResource(AsyncBaseResource):
+    """异步工具管理资源。"""
+
+    async def ids(self) -> List[str]:
+        """异步获取所有可用的工具 ID 列表，参见 :meth:`ToolResource.ids`。"""
+        return await self._http_client.get("/experimental/tool/ids")
+
+    async def list(self, provider_id: str, model_id: str) -> List[Dict[str, Any]]:
+        """异步获取指定提供商和模型的可用工具列表，参见 :meth:`ToolResource.list`。"""
+        return await self._http_client.get(
+            "/experimental/tool", params={"provider": provider_id, "model": model_id}
         )
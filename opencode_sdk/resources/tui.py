@@ -3,7 +3,7 @@
 from typing import Any, Dict, Literal, Optional
 
 from ..http_client import HttpClient
-from .base import BaseResource
+from .base import AsyncBaseResource, BaseResource
 
 
 class TuiResource(BaseResource):
@@ -23,10 +23,7 @@ class TuiResource(BaseResource):
             >>> success = client.tui.append_prompt("你好，")
             >>> success = client.tui.append_prompt("世界！")
         """
-        return self._http_client.post(
-            "/tui/append-prompt",
-            json_data={"text": text}
-        )
+        return self._http_client.post("/tui/append-prompt", json_data={"text": text})
 
     def submit_prompt(self) -> bool:
         """
@@ -66,17 +63,14 @@ class TuiResource(BaseResource):
         示例:
             >>> success = client.tui.execute_command("agent_cycle")
         """
-        return self._http_client.post(
-            "/tui/execute-command",
-            json_data={"command": command}
-        )
+        return self._http_client.post("/tui/execute-command", json_data={"command": command})
 
     def show_toast(
         self,
         message: str,
         variant: Literal["info", "success", "warning", "error"],
         title: Optional[str] = None,
-        duration: int = 5000
+        duration: int = 5000,
     ) -> bool:
         """
         在 TUI 中显示提示消息。
@@ -93,7 +87,7 @@ class TuiResource(BaseResource):
         示例:
             >>> # 显示成功消息
             >>> client.tui.show_toast("操作成功", "success")
-            
+
             >>> # 显示错误消息
             >>> client.tui.show_toast(
             ...     "操作失败",
@@ -102,11 +96,7 @@ class TuiResource(BaseResource):
             ...     duration=10000
             ... )
         """
-        data = {
-            "message": message,
-            "variant": variant,
-            "duration": duration
-        }
+        data = {"message": message, "variant": variant, "duration": duration}
         if title is not None:
             data["title"] = title
 
@@ -173,10 +163,7 @@ class TuiResource(BaseResource):
         示例:
             >>> success = client.tui.select_session("ses_123")
         """
-        return self._http_client.post(
-            "/tui/select-session",
-            json_data={"sessionID": session_id}
-        )
+        return self._http_client.post("/tui/select-session", json_data={"sessionID": session_id})
 
     def publish(self, event: Dict[str, Any]) -> bool:
         """
@@ -196,3 +183,63 @@ class TuiResource(BaseResource):
             >>> success = client.tui.publish(event)
         """
         return self._http_client.post("/tui/publish", json_data=event)
+
+
+class AsyncTuiResource(AsyncBaseResource):
+    """异步 TUI (Terminal User Interface) 交互资源。"""
+
+    async def append_prompt(self, text: str) -> bool:
+        """异步追加文本到 TUI 提示框，参见 :meth:`TuiResource.append_prompt`。"""
+        return await self._http_client.post("/tui/append-prompt", json_data={"text": text})
+
+    async def submit_prompt(self) -> bool:
+        """异步提交 TUI 提示框中的内容，参见 :meth:`TuiResource.submit_prompt`。"""
+        return await self._http_client.post("/tui/submit-prompt")
+
+    async def clear_prompt(self) -> bool:
+        """异步清空 TUI 提示框，参见 :meth:`TuiResource.clear_prompt`。"""
+        return await self._http_client.post("/tui/clear-prompt")
+
+    async def execute_command(self, command: str) -> bool:
+        """异步执行 TUI 命令，参见 :meth:`TuiResource.execute_command`。"""
+        return await self._http_client.post("/tui/execute-command", json_data={"command": command})
+
+    async def show_toast(
+        self,
+        message: str,
+        variant: Literal["info", "success", "warning", "error"],
+        title: Optional[str] = None,
+        duration: int = 5000,
+    ) -> bool:
+        """异步在 TUI 中显示提示消息，参见 :meth:`TuiResource.show_toast`。"""
+        data = {"message": message, "variant": variant, "duration": duration}
+        if title is not None:
+            data["title"] = title
+
+        return await self._http_client.post("/tui/show-toast", json_data=data)
+
+    async def open_help(self) -> bool:
+        """异步打开 TUI 帮助对话框，参见 :meth:`TuiResource.open_help`。"""
+        return await self._http_client.post("/tui/open-help")
+
+    async def open_sessions(self) -> bool:
+        """异步打开 TUI 会话列表对话框，参见 :meth:`TuiResource.open_sessions`。"""
+        return await self._http_client.post("/tui/open-sessions")
+
+    async def open_themes(self) -> bool:
+        """异步打开 TUI 主题选择对话框，参见 :meth:`TuiResource.open_themes`。"""
+        return await self._http_client.post("/tui/open-themes")
+
+    async def open_models(self) -> bool:
+        """异步打开 TUI 模型选择对话框，参见 :meth:`TuiResource.open_models`。"""
+        return await self._http_client.post("/tui/open-models")
+
+    async def select_session(self, session_id: str) -> bool:
+        """异步选择指定的会话，参见 :meth:`TuiResource.select_session`。"""
+        return await self._http_client.post(
+            "/tui/select-session", json_data={"sessionID": session_id}
+        )
+
+    async def publish(self, event: Dict[str, Any]) -> bool:
+        """异步发布 TUI 事件，参见 :meth:`TuiResource.publish`。"""
+        return await self._http_client.post("/tui/publish", json_data=event)
@@ -0,0 +1,233 @@
+"""
+HTTP 请求重试策略。
+
+:class:`RetryPolicy` 描述哪些失败可以重试以及重试前等待多久；
+:class:`RetryStats` 记录重试次数等计数，供监控使用。
+"""
+
+import random
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, FrozenSet, Mapping, Optional
+
+from .exceptions import APIError, ConnectionError, TimeoutError
+
+# 按 HTTP 语义可安全重复执行的方法
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+@dataclass
+class RetryPolicy:
+    """
+    HTTP 请求重试策略。
+
+    第 n 次重试前等待 ``min(max_delay, initial_delay * multiplier ** (n - 1))`` 秒，
+    再乘以 ``[1 - jitter, 1 + jitter]`` 区间内的随机因子；响应带有 ``Retry-After``
+    时优先使用服务器给出的时间。
+
+    非幂等请求（如 ``POST /session/{id}/message``）只有在请求确定没有发出
+    （连接建立失败）时才会重试，避免同一条消息被服务器处理两次；
+    ``retry_non_idempotent=True`` 可以取消这一限制。
+
+    Example:
+        >>> client = OpencodeClient(retry=RetryPolicy(max_attempts=5))
+        >>> client.files = client.files.with_retry(RetryPolicy(max_attempts=2))
+    """
+
+    max_attempts: int = 3
+    """总尝试次数（包括第一次请求），1 表示不重试"""
+
+    initial_delay: float = 0.5
+    """首次重试前的基础等待时间（秒）"""
+
+    max_delay: float = 10.0
+    """单次等待时间上限（秒）"""
+
+    multiplier: float = 2.0
+    """指数退避倍数"""
+
+    jitter: float = 0.5
+    """随机抖动比例（0 表示不抖动）"""
+
+    retry_statuses: FrozenSet[int] = frozenset({408, 429, 500, 502, 503, 504})
+    """可重试的 HTTP 状态码"""
+
+    retry_on_timeout: bool = True
+    """是否重试超时的请求"""
+
+    retry_on_connection_error: bool = True
+    """是否重试连接错误"""
+
+    idempotent_methods: FrozenSet[str] = IDEMPOTENT_METHODS
+    """视为幂等、可以安全重试的 HTTP 方法"""
+
+    retry_non_idempotent: bool = False
+    """是否在请求可能已送达服务器时也重试非幂等请求"""
+
+    respect_retry_after: bool = True
+    """是否遵循响应中的 ``Retry-After`` 头"""
+
+    max_retry_after: float = 60.0
+    """``Retry-After`` 等待时间上限（秒）"""
+
+    def is_retryable(self, method: str, error: BaseException, sent: bool = True) -> bool:
+        """
+        判断一次失败是否可以重试（不考虑次数限制）。
+
+        Args:
+            method: HTTP 方法
+            error: 请求抛出的异常
+            sent: 请求是否可能已经送达服务器
+
+        Returns:
+            是否可以重试
+        """
+        if isinstance(error, APIError):
+            if error.status_code is None:
+                return False
+            if error.status_code not in self.retry_statuses and not error.is_retryable:
+                return False
+        elif isinstance(error, TimeoutError):
+            if not self.retry_on_timeout:
+                return False
+        elif isinstance(error, ConnectionError):
+            if not self.retry_on_connection_error:
+                return False
+        else:
+            return False
+
+        if not sent:
+            return True
+        return self.retry_non_idempotent or method.upper() in self.idempotent_methods
+
+    def backoff(self, attempt: int) -> float:
+        """
+        计算第 ``attempt`` 次重试前的退避时间。
+
+        Args:
+            attempt: 重试序号（从 1 开始）
+
+        Returns:
+            等待时间（秒）
+        """
+        delay = min(self.max_delay, self.initial_delay * self.multiplier ** (attempt - 1))
+        if self.jitter:
+            delay *= random.uniform(1 - self.jitter, 1 + self.jitter)
+        return max(0.0, delay)
+
+    def delay(self, attempt: int, error: Optional[BaseException] = None) -> float:
+        """
+        计算第 ``attempt`` 次重试前的等待时间，优先使用 ``Retry-After``。
+
+        Args:
+            attempt: 重试序号（从 1 开始）
+            error: 触发重试的异常
+
+        Returns:
+            等待时间（秒）
+        """
+        if self.respect_retry_after and isinstance(error, APIError):
+            retry_after = parse_retry_after(error.response_headers)
+            if retry_after is not None:
+                return min(retry_after, self.max_retry_after)
+        return self.backoff(attempt)
+
+
+def parse_retry_after(headers: Optional[Mapping[str, str]]) -> Optional[float]:
+    """
+    解析 ``Retry-After`` 响应头（秒数或 HTTP 日期）。
+
+    Args:
+        headers: 响应头
+
+    Returns:
+        等待时间（秒），没有或无法解析时返回 None
+    """
+    if not headers:
+        return None
+    value = next((v for k, v in headers.items() if k.lower() == "retry-after"), None)
+    if value is None:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+@dataclass
+class RetryStats:
+    """重试计数，可在多个线程中共享。"""
+
+    requests: int = 0
+    """发出的请求总数（含重试）"""
+
+    retries: int = 0
+    """重试次数"""
+
+    recovered: int = 0
+    """经过重试最终成功的调用数"""
+
+    exhausted: int = 0
+    """重试次数用尽后仍失败的调用数"""
+
+    backoff_seconds: float = 0.0
+    """累计退避等待时间（秒）"""
+
+    by_reason: Dict[str, int] = field(default_factory=dict)
+    """按原因（状态码、timeout、connection）统计的重试次数"""
+
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def _record_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def _record_retry(self, error: BaseException, delay: float) -> None:
+        if isinstance(error, APIError):
+            reason = str(error.status_code)
+        elif isinstance(error, TimeoutError):
+            reason = "timeout"
+        else:
+            reason = "connection"
+        with self._lock:
+            self.retries += 1
+            self.backoff_seconds += delay
+            self.by_reason[reason] = self.by_reason.get(reason, 0) + 1
+
+    def _record_result(self, attempts: int, success: bool) -> None:
+        if attempts <= 1:
+            return
+        with self._lock:
+            if success:
+                self.recovered += 1
+            else:
+                self.exhausted += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """返回当前计数的副本，便于导出到监控系统。"""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "retries": self.retries,
+                "recovered": self.recovered,
+                "exhausted": self.exhausted,
+                "backoff_seconds": self.backoff_seconds,
+                "by_reason": dict(self.by_reason),
+            }
+
+    def reset(self) -> None:
+        """清零所有计数。"""
+        with self._lock:
+            self.requests = self.retries = self.recovered = self.exhausted = 0
+            self.backoff_seconds = 0.0
+            self.by_reason.clear()
@@ -0,0 +1,233 @@
+"""
+事件驱动的本地会话状态缓存。
+
+:class:`SessionStore` 启动时通过 ``GET /session`` 和 ``GET /session/status``
+获取一次快照，之后订阅全局事件流，应用 ``session.created``、``session.updated``、
+``session.deleted``、``session.status`` 和 ``session.idle`` 事件保持同步。
+读取直接从内存返回，不访问服务器；事件流断线重连后自动重新获取快照，
+弥补断线期间丢失的事件。
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Union
+
+from .models.session import Session, SessionStatus
+from .sse_client import ReconnectPolicy
+from .utils import call_resource
+
+# 影响会话列表和状态的事件
+SESSION_EVENT_TYPES = frozenset(
+    {
+        "session.created",
+        "session.updated",
+        "session.deleted",
+        "session.status",
+        "session.idle",
+    }
+)
+
+
+def _session(info: Any) -> Session:
+    return info if isinstance(info, Session) else Session(**info)
+
+
+class SessionStore:
+    """
+    本地会话状态缓存。
+
+    同时适用于 :class:`~opencode_sdk.OpencodeClient` 和
+    :class:`~opencode_sdk.AsyncOpencodeClient`，事件流通过客户端共享的全局事件中心订阅，
+    不会额外建立连接。
+
+    读取方法返回的数据反映截至 :attr:`version` 的事件；:attr:`last_event_at` 和
+    :attr:`synced_at` 可用于判断数据新鲜度，:attr:`live` 为 False 时表示事件流已断开，
+    数据可能已过期。
+
+    Example:
+        >>> async with SessionStore(client) as store:
+        ...     while True:
+        ...         busy = [sid for sid, s in store.status().items() if s.type == "busy"]
+        ...         print(len(store.list()), "个会话，", len(busy), "个正在运行")
+        ...         await asyncio.sleep(1)
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        reconnect: Union[bool, ReconnectPolicy] = True,
+        connect_timeout: Optional[float] = 10.0,
+    ) -> None:
+        """
+        初始化会话缓存。
+
+        Args:
+            client: OpencodeClient 或 AsyncOpencodeClient
+            reconnect: 事件流断开时是否自动重连（可传入 ReconnectPolicy）；
+                不重连时事件流断开后缓存停止更新
+            connect_timeout: 获取快照前等待事件流建立的最长时间（秒）
+        """
+        self._client = client
+        self.reconnect = reconnect
+        self.connect_timeout = connect_timeout
+
+        self._sessions: Dict[str, Session] = {}
+        self._status: Dict[str, SessionStatus] = {}
+        self._subscription: Any = None
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._connects = 0
+
+        self.version = 0
+        """已应用的事件数与快照次数之和，每次状态变化后递增"""
+
+        self.synced_at: Optional[float] = None
+        """最近一次获取快照的时间（``time.time()``）"""
+
+        self.last_event_at: Optional[float] = None
+        """最近一次应用事件的时间（``time.time()``）"""
+
+        self.resyncs = 0
+        """因事件流重连而重新获取快照的次数"""
+
+        self.error: Optional[BaseException] = None
+        """事件流终止的原因"""
+
+    # ==================== 生命周期 ====================
+
+    async def start(self) -> "SessionStore":
+        """
+        订阅事件流并获取初始快照。
+
+        先订阅再获取快照：快照期间到达的事件暂存在订阅队列中，随后按顺序应用，
+        因此不会遗漏快照与订阅之间的变化。
+
+        Returns:
+            自身，便于链式调用
+        """
+        if self._task is not None:
+            return self
+        hub = self._client.events.hub("/global/event", reconnect=self.reconnect)
+        self._subscription = await hub.subscribe(
+            event_types=SESSION_EVENT_TYPES | {"server.connected"}
+        )
+        await hub.wait_connected(self.connect_timeout)
+        self._connects = hub.metrics.connects
+        try:
+            await self._sync()
+        except BaseException:
+            await self._subscription.aclose()
+            self._subscription = None
+            raise
+        self._task = asyncio.create_task(self._run(hub))
+        return self
+
+    async def close(self) -> None:
+        """停止更新并取消订阅。"""
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        if self._subscription is not None:
+            await self._subscription.aclose()
+            self._subscription = None
+
+    async def __aenter__(self) -> "SessionStore":
+        return await self.start()
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    @property
+    def live(self) -> bool:
+        """事件流是否仍在更新缓存。"""
+        return self._task is not None and not self._task.done()
+
+    # ==================== 读取 ====================
+
+    def list(self) -> List[Session]:
+        """返回全部会话，按最后更新时间倒序排列。"""
+        return sorted(self._sessions.values(), key=lambda s: s.time.updated, reverse=True)
+
+    def get(self, session_id: str) -> Optional[Session]:
+        """返回指定会话，不存在时返回 None。"""
+        return self._sessions.get(session_id)
+
+    def status(self, session_id: Optional[str] = None) -> Dict[str, SessionStatus]:
+        """
+        返回会话状态，格式与 ``sessions.status()`` 相同：空闲的会话不出现在结果中。
+
+        Args:
+            session_id: 只返回该会话的状态
+
+        Returns:
+            会话状态字典
+        """
+        if session_id is not None:
+            status = self._status.get(session_id)
+            return {session_id: status} if status is not None else {}
+        return dict(self._status)
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, session_id: object) -> bool:
+        return session_id in self._sessions
+
+    # ==================== 内部方法 ====================
+
+    async def _sync(self) -> None:
+        """获取快照，整体替换缓存内容。"""
+        sessions = self._client.sessions
+        items = await call_resource(sessions.list, raw=False, lazy=False)
+        statuses = await call_resource(sessions.status)
+        self._sessions = {session.id: session for session in items}
+        self._status = {sid: s for sid, s in statuses.items() if s.type != "idle"}
+        self.synced_at = time.time()
+        self.version += 1
+
+    async def _run(self, hub: Any) -> None:
+        """应用事件；发现事件流重连过后重新获取快照。"""
+        try:
+            async for event in self._subscription:
+                connects = hub.metrics.connects
+                if connects != self._connects:
+                    # 断线期间的事件已经丢失，以新快照为准，之后的事件继续按顺序应用
+                    self._connects = connects
+                    self.resyncs += 1
+                    await self._sync()
+                self._apply(event)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.error = e
+
+    def _apply(self, event: Any) -> None:
+        event_type = event.type
+        properties = event.properties
+        if event_type in ("session.created", "session.updated"):
+            session = _session(properties.info)
+            current = self._sessions.get(session.id)
+            # 快照之前暂存的旧事件不能覆盖快照中更新的数据
+            if current is not None and current.time.updated > session.time.updated:
+                return
+            self._sessions[session.id] = session
+        elif event_type == "session.deleted":
+            session_id = (
+                properties.info["id"] if isinstance(properties.info, dict) else properties.info.id
+            )
+            self._sessions.pop(session_id, None)
+            self._status.pop(session_id, None)
+        elif event_type == "session.status":
+            if properties.status.type == "idle":
+                self._status.pop(properties.session_id, None)
+            else:
+                self._status[properties.session_id] = properties.status
+        elif event_type == "session.idle":
+            self._status.pop(properties.session_id, None)
+        else:
+            return
+        self.version += 1
+        self.last_event_at = time.time()
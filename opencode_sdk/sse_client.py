@@ -4,284 +4,461 @@ SSE (Server-Sent Events) 客户端模块。
 提供异步事件流处理功能，用于接收服务器推送的实时事件。
 """
 
-import json
 import asyncio
-from typing import AsyncIterator, Optional, Dict, Any
+import random
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, Optional, Union, cast
+
 import httpx
-from .models.events import Event
-from .exceptions import ConnectionError, TimeoutError, APIError
+
+from . import codec, tracing
+from .event_filter import EventFilter
+from .exceptions import APIError, ConnectionError, TimeoutError
+from .models.events import EVENT_ADAPTER, EVENT_CLASS_MAP, GLOBAL_EVENT_ADAPTER, Event
+from .sse_parser import SSEParser
+from .utils import parse_transport
+
+if TYPE_CHECKING:
+    from .sse_replay import SSERecorder
+
+
+@dataclass
+class ReconnectPolicy:
+    """
+    SSE 断线重连策略。
+
+    第 n 次重连前等待 ``min(max_delay, base * multiplier ** (n - 1))`` 秒，
+    再乘以 ``[1 - jitter, 1 + jitter]`` 区间内的随机因子，避免大量客户端同时重连。
+    ``base`` 为服务器 ``retry:`` 字段给出的间隔（若有且 ``honor_retry`` 为真），
+    否则为 ``initial_delay``。
+    """
+
+    initial_delay: float = 1.0
+    """首次重连的基础等待时间（秒）"""
+
+    max_delay: float = 30.0
+    """单次等待时间上限（秒）"""
+
+    multiplier: float = 2.0
+    """指数退避倍数"""
+
+    jitter: float = 0.5
+    """随机抖动比例（0 表示不抖动）"""
+
+    max_attempts: Optional[int] = None
+    """连续重连失败的最大次数，None 表示无限重连"""
+
+    honor_retry: bool = True
+    """是否使用服务器 ``retry:`` 字段作为基础间隔"""
+
+    def delay(self, attempt: int, server_retry_ms: Optional[int] = None) -> float:
+        """
+        计算第 ``attempt`` 次重连前的等待时间。
+
+        Args:
+            attempt: 连续重连次数（从 1 开始）
+            server_retry_ms: 服务器建议的重连间隔（毫秒）
+
+        Returns:
+            等待时间（秒）
+        """
+        base = server_retry_ms / 1000.0 if server_retry_ms is not None else self.initial_delay
+        delay = min(self.max_delay, base * self.multiplier ** (attempt - 1))
+        if self.jitter:
+            delay *= random.uniform(1 - self.jitter, 1 + self.jitter)
+        return max(0.0, delay)
+
+
+@dataclass
+class SSEMetrics:
+    """SSE 连接统计信息。"""
+
+    connects: int = 0
+    """成功建立连接的次数"""
+
+    reconnects: int = 0
+    """重连尝试次数"""
+
+    events: int = 0
+    """已解析的事件数"""
+
+    filtered: int = 0
+    """被 :class:`~opencode_sdk.event_filter.EventFilter` 在解码前跳过的事件数"""
+
+    last_gap: float = 0.0
+    """最近一次断线到重新连上的时长（秒）"""
+
+    max_gap: float = 0.0
+    """最长的一次中断时长（秒）"""
+
+    total_gap: float = 0.0
+    """累计中断时长（秒）"""
+
+    last_error: Optional[str] = None
+    """最近一次断线的原因"""
+
+    _disconnected_at: Optional[float] = field(default=None, repr=False)
+
+    def _connected(self) -> None:
+        """记录一次连接成功，并结算中断时长。"""
+        self.connects += 1
+        if self._disconnected_at is not None:
+            gap = time.monotonic() - self._disconnected_at
+            self.last_gap = gap
+            self.max_gap = max(self.max_gap, gap)
+            self.total_gap += gap
+            self._disconnected_at = None
+
+    def _disconnected(self, error: BaseException) -> None:
+        """记录一次断线。"""
+        if self._disconnected_at is None:
+            self._disconnected_at = time.monotonic()
+        self.last_error = str(error)
 
 
 class SSEClient:
     """
     SSE (Server-Sent Events) 客户端。
-    
+
     用于处理服务器推送的事件流，支持异步迭代。
     """
-    
+
     def __init__(
         self,
         base_url: str,
         headers: Optional[Dict[str, str]] = None,
-        timeout: Optional[float] = None
+        timeout: Optional[float] = None,
+        client: Optional[httpx.AsyncClient] = None,
+        transport: Optional[str] = None,
+        recorder: Optional["SSERecorder"] = None,
+        prefilter: Optional[EventFilter] = None,
     ):
         """
         初始化 SSE 客户端。
-        
+
         Args:
             base_url: API 基础 URL
             headers: 请求头
             timeout: 超时时间（秒）
+            client: 可选的已有 httpx.AsyncClient，提供时复用其连接池且不会在退出时关闭
+            transport: None 或 "tcp" 表示通过 TCP 连接；"unix:///path.sock" 表示通过
+                Unix 域套接字连接（提供 ``client`` 时忽略）
+            recorder: 可选的 SSERecorder，把收到的原始字节写入录制文件
+            prefilter: 可选的 EventFilter，确定不匹配的事件在解码前跳过
         """
         self.base_url = base_url
         self.headers = headers or {}
         self.timeout = timeout
-        self._client: Optional[httpx.AsyncClient] = None
-    
-    async def __aenter__(self):
+        self._client: Optional[httpx.AsyncClient] = client
+        self._owns_client = client is None
+        self._uds = parse_transport(transport)
+        self._parser = SSEParser()
+        self.recorder = recorder
+
+        # 解码前按 type / sessionID 字节预过滤，可在接收过程中随时替换
+        self.prefilter = prefilter
+
+        # 最近一次收到的事件 ID 和服务器建议的重连间隔（毫秒）
+        self.last_event_id: Optional[str] = None
+        self.retry: Optional[int] = None
+
+        # 事件是否包装在 {"directory", "payload"} 中，None 表示尚未确定
+        self._envelope: Optional[bool] = None
+
+        # 连接和重连统计
+        self.metrics = SSEMetrics()
+
+    async def __aenter__(self) -> "SSEClient":
         """异步上下文管理器入口。"""
-        self._client = httpx.AsyncClient(
-            base_url=self.base_url,
-            headers=self.headers,
-            timeout=self.timeout
-        )
+        if self._owns_client:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self.headers,
+                timeout=self.timeout,
+                transport=httpx.AsyncHTTPTransport(uds=self._uds) if self._uds else None,
+            )
         return self
-    
-    async def __aexit__(self, *args):
+
+    async def __aexit__(self, *args: Any) -> None:
         """异步上下文管理器退出。"""
-        if self._client:
+        if self._client and self._owns_client:
             await self._client.aclose()
-    
+            self._client = None
+
     async def connect(
         self,
         url: str,
         params: Optional[Dict[str, Any]] = None,
         method: str = "GET",
-        json_data: Optional[Dict[str, Any]] = None
+        json_data: Optional[Dict[str, Any]] = None,
+        on_open: Optional[Callable[[], None]] = None,
+        reconnect: Union[bool, ReconnectPolicy] = False,
     ) -> AsyncIterator[Event]:
         """
         连接到 SSE 端点并接收事件流。
-        
+
+        启用 ``reconnect`` 后，连接异常断开（服务器重启、代理超时等导致的传输错误、
+        超时或 5xx）时会按指数退避加随机抖动自动重连，并通过 ``Last-Event-ID`` 请求头
+        从断点续传；服务器通过 ``retry:`` 字段建议的间隔会作为退避的基础间隔。
+        服务器以 204 响应或正常结束事件流表示订阅结束，不会重连。
+        重连次数和中断时长记录在 :attr:`metrics` 中。
+
+        重连会重新发送请求，因此只有 GET 订阅支持 ``reconnect``，
+        POST 请求（如发送 prompt 的流式接口）不会被重复提交。
+
         Args:
             url: SSE 端点 URL（相对路径）
             params: 查询参数（用于 GET 请求）
             method: HTTP 方法（GET 或 POST）
             json_data: JSON 数据（用于 POST 请求）
-            
+            on_open: 每次连接建立（收到 200 响应头）后调用的回调
+            reconnect: 是否自动重连（仅 GET）；可传入 ReconnectPolicy 自定义退避参数
+
         Yields:
             Event 对象
-            
+
         Raises:
-            ConnectionError: 连接失败
+            ValueError: 对非 GET 请求启用了 ``reconnect``
+            ConnectionError: 连接失败（未启用重连，或重连次数用尽）
             TimeoutError: 连接超时
-            APIError: API 错误
-            
+            APIError: API 错误（4xx 错误不会触发重连）
+
         Example:
             >>> async with SSEClient(base_url="http://localhost:8000") as client:
             ...     async for event in client.connect("/global/event"):
             ...         print(f"收到事件: {event.type}")
+
+            >>> # 长期订阅：断线自动重连
+            >>> async with SSEClient(base_url="http://localhost:8000") as client:
+            ...     async for event in client.connect("/global/event", reconnect=True):
+            ...         print(f"收到事件: {event.type}")
+            ...     print(client.metrics.reconnects)
         """
         if not self._client:
             raise RuntimeError("SSEClient 必须在 async with 语句中使用")
-        
+        if reconnect and method.upper() != "GET":
+            raise ValueError(f"只有 GET 订阅支持自动重连，{method} 请求重连会重复提交请求体")
+
+        # 启用 OpenTelemetry 追踪时，整个订阅（包括重连）对应一个 span
+        trace = tracing.start_sse_trace(url, method)
+        if trace is not None:
+            on_open = trace.wrap_on_open(on_open)
+
+        try:
+            if not reconnect:
+                async for event in self._connect_once(url, params, method, json_data, on_open):
+                    if trace is not None:
+                        trace.observe(event)
+                    yield event
+                return
+
+            policy = reconnect if isinstance(reconnect, ReconnectPolicy) else ReconnectPolicy()
+            metrics = self.metrics
+            attempt = 0
+
+            while True:
+                received = False
+                try:
+                    async for event in self._connect_once(url, params, method, json_data, on_open):
+                        received = True
+                        if trace is not None:
+                            trace.observe(event)
+                        yield event
+                    # 服务器以 204 响应或正常结束了事件流：订阅结束，不再重连
+                    return
+                except (ConnectionError, TimeoutError) as e:
+                    error: Exception = e
+                except APIError as e:
+                    if e.status_code is not None and not e.is_retryable:
+                        raise
+                    error = e
+
+                # 连接已断开：成功收到过事件则重置退避计数
+                metrics._disconnected(error)
+                if trace is not None:
+                    trace.disconnected(error)
+                if received:
+                    attempt = 0
+                attempt += 1
+                if policy.max_attempts is not None and attempt > policy.max_attempts:
+                    raise error
+
+                delay = policy.delay(attempt, self.retry if policy.honor_retry else None)
+                metrics.reconnects += 1
+                await asyncio.sleep(delay)
+        except Exception as e:
+            if trace is not None:
+                trace.fail(e)
+            raise
+        finally:
+            if trace is not None:
+                trace.end()
+
+    async def _connect_once(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        method: str,
+        json_data: Optional[Dict[str, Any]],
+        on_open: Optional[Callable[[], None]],
+    ) -> AsyncIterator[Event]:
+        """建立一次 SSE 连接并读取事件，直到连接结束。"""
+        client = self._client
+        if client is None:
+            raise RuntimeError("SSEClient 必须在 async with 语句中使用")
         try:
             # 根据方法类型构建请求
-            request_kwargs = {
-                "headers": {"Accept": "text/event-stream"},
-                "timeout": None  # SSE 连接不应该有超时
-            }
-            
+            headers = {"Accept": "text/event-stream"}
+            if self.last_event_id is not None:
+                headers["Last-Event-ID"] = self.last_event_id
+
+            content: Optional[bytes] = None
+            query: Optional[Dict[str, Any]] = None
             if method.upper() == "POST":
-                request_kwargs["json"] = json_data
+                if json_data is not None:
+                    content = codec.dumps(json_data)
+                    headers["Content-Type"] = "application/json"
             else:
-                request_kwargs["params"] = params
-            
-            
-            async with self._client.stream(
-                method,
-                url,
-                **request_kwargs
+                query = params
+
+            # SSE 连接不应该有超时
+            async with client.stream(
+                method, url, params=query, content=content, headers=headers, timeout=None
             ) as response:
                 # 检查响应状态
                 # 200: 正常响应
-                # 204: 无内容（请求成功但没有流式响应）
+                # 204: 无内容（服务器要求客户端停止订阅，不会重连）
                 if response.status_code == 204:
-                    # 204 表示请求成功但没有流式内容，直接返回
                     return
                 elif response.status_code != 200:
                     error_text = await response.aread()
                     raise APIError(
                         message=f"SSE 连接失败: {response.status_code}",
                         status_code=response.status_code,
-                        response_body=error_text.decode()
+                        is_retryable=response.status_code >= 500,
+                        response_body=error_text.decode(),
                     )
-                
+
+                self.metrics._connected()
+                if on_open is not None:
+                    on_open()
+
                 # 处理事件流
                 async for event in self._parse_stream(response):
                     yield event
-                    
+
         except httpx.TimeoutException as e:
             raise TimeoutError(f"SSE 连接超时: {str(e)}")
         except httpx.ConnectError as e:
             raise ConnectionError(f"SSE 连接失败: {str(e)}")
+        except httpx.TransportError as e:
+            # 读取过程中连接被断开（服务器重启、代理超时等）
+            raise ConnectionError(f"SSE 连接中断: {str(e)}")
         except Exception as e:
             if isinstance(e, (APIError, TimeoutError, ConnectionError)):
                 raise
             raise APIError(f"SSE 处理错误: {str(e)}")
-    
+
     async def _parse_stream(self, response: httpx.Response) -> AsyncIterator[Event]:
         """
         解析 SSE 事件流。
-        
+
+        直接读取响应字节块并交给增量解析器处理，``id:`` 和 ``retry:`` 字段
+        分别记录在 ``last_event_id`` 和 ``retry`` 属性中。设置了 ``recorder`` 时，
+        字节块在解析前原样写入录制文件；设置了 ``prefilter`` 时，确定不匹配的事件帧
+        不做解码。
+
         Args:
             response: HTTP 响应对象
-            
+
         Yields:
             Event 对象
         """
-        event_type: Optional[str] = None
-        event_data: str = ""
-        
-        async for line in response.aiter_lines():
-            line = line.strip()
-            
-            # 空行表示事件结束
-            if not line:
-                if event_data:
-                    # 解析并生成事件（event_type 可能为 None，从 data 中获取）
-                    event = self._parse_event(event_type, event_data)
-                    if event:
-                        yield event
-                    
-                    # 重置状态
-                    event_type = None
-                    event_data = ""
-                continue
-            
-            # 解析事件字段
-            if line.startswith("event:"):
-                event_type = line[6:].strip()
-            elif line.startswith("data:"):
-                data = line[5:].strip()
-                if event_data:
-                    event_data += "\n" + data
-                else:
-                    event_data = data
-            # 忽略其他字段（id, retry 等）
-    
-    def _parse_event(self, event_type: Optional[str], event_data: str) -> Optional[Event]:
+        parser = self._parser
+        # 上一次连接可能在事件中途被断开（TransportError 等），残留的半个事件
+        # 不能与新连接的数据拼接；last_event_id 和 retry 会保留
+        parser.reset()
+        recorder = self.recorder
+        if recorder is not None:
+            stream = recorder.opened(response.request.url.raw_path.decode("ascii"))
+        async for chunk in response.aiter_bytes():
+            if recorder is not None:
+                recorder.write(stream, chunk)
+            for frame in parser.feed(chunk):
+                self.last_event_id = parser.last_event_id
+                self.retry = parser.retry
+                prefilter = self.prefilter
+                if prefilter is not None and not prefilter.matches(frame.event, frame.data):
+                    self.metrics.filtered += 1
+                    continue
+                event = self._parse_event(frame.event, frame.data)
+                if event:
+                    self.metrics.events += 1
+                    yield event
+
+    def _parse_event(self, event_type: Optional[str], event_data: bytes) -> Optional[Event]:
         """
         解析单个事件。
-        
+
+        常见情况下直接对原始字节调用缓存的 ``TypeAdapter.validate_json``，
+        由 pydantic 按 ``type`` 字段一次完成 JSON 解析和模型构建。
+        服务器是否用 ``{"directory", "payload"}`` 包装事件在首次遇到时确定，
+        之后沿用；未知类型、类型由 ``event:`` 字段给出等情况走通用路径。
+
         Args:
             event_type: 事件类型（可能为 None，从 data 中获取）
-            event_data: 事件数据（JSON 字符串）
-            
+            event_data: 事件数据（JSON 字节串）
+
         Returns:
             Event 对象，如果解析失败则返回 None
         """
+        if event_type is None:
+            envelope = self._envelope
+            try:
+                if envelope:
+                    return GLOBAL_EVENT_ADAPTER.validate_json(event_data).payload
+                if envelope is not None:
+                    return EVENT_ADAPTER.validate_json(event_data)
+            except ValueError:
+                pass
+        return self._parse_event_fallback(event_type, event_data)
+
+    def _parse_event_fallback(
+        self, event_type: Optional[str], event_data: bytes
+    ) -> Optional[Event]:
+        """通用解析路径：先解析 JSON，再按事件类型查表构建模型。"""
         try:
             # 解析 JSON 数据
-            data = json.loads(event_data)
-            
+            data = codec.loads(event_data)
+
             # 如果 data 不是字典，返回 None
             if not isinstance(data, dict):
                 return None
-            
+
             # 检查是否有 payload 字段（服务器可能将事件包装在 payload 中）
             if "payload" in data and isinstance(data["payload"], dict):
                 data = data["payload"]
-            
+                self._envelope = True
+            elif "type" in data:
+                self._envelope = False
+
             # 获取事件类型
             if event_type is None:
                 event_type = data.get("type")
-            
+
             if not event_type:
                 return None
-            
-            # 根据事件类型导入对应的类
-            from .models.events import (
-                EventServerConnected,
-                EventServerInstanceDisposed,
-                EventSessionStatus,
-                EventSessionIdle,
-                EventSessionCreated,
-                EventSessionUpdated,
-                EventSessionDeleted,
-                EventSessionDiff,
-                EventSessionError,
-                EventSessionCompacted,
-                EventMessageUpdated,
-                EventMessageRemoved,
-                EventMessagePartUpdated,
-                EventMessagePartRemoved,
-                EventMessagePartDelta,
-                EventPermissionUpdated,
-                EventPermissionReplied,
-                EventFileEdited,
-                EventFileWatcherUpdated,
-                EventVcsBranchUpdated,
-                EventTodoUpdated,
-                EventCommandExecuted,
-                EventTuiPromptAppend,
-                EventTuiCommandExecute,
-                EventTuiToastShow,
-                EventPtyCreated,
-                EventPtyUpdated,
-                EventPtyExited,
-                EventPtyDeleted,
-                EventInstallationUpdated,
-                EventInstallationUpdateAvailable,
-                EventLspClientDiagnostics,
-                EventLspUpdated,
-            )
-            
-            # 事件类型映射
-            event_class_map = {
-                "server.connected": EventServerConnected,
-                "server.instance.disposed": EventServerInstanceDisposed,
-                "session.status": EventSessionStatus,
-                "session.idle": EventSessionIdle,
-                "session.created": EventSessionCreated,
-                "session.updated": EventSessionUpdated,
-                "session.deleted": EventSessionDeleted,
-                "session.diff": EventSessionDiff,
-                "session.error": EventSessionError,
-                "session.compacted": EventSessionCompacted,
-                "message.updated": EventMessageUpdated,
-                "message.removed": EventMessageRemoved,
-                "message.part.updated": EventMessagePartUpdated,
-                "message.part.removed": EventMessagePartRemoved,
-                "message.part.delta": EventMessagePartDelta,
-                "permission.updated": EventPermissionUpdated,
-                "permission.replied": EventPermissionReplied,
-                "file.edited": EventFileEdited,
-                "file.watcher.updated": EventFileWatcherUpdated,
-                "vcs.branch.updated": EventVcsBranchUpdated,
-                "todo.updated": EventTodoUpdated,
-                "command.executed": EventCommandExecuted,
-                "tui.prompt.append": EventTuiPromptAppend,
-                "tui.command.execute": EventTuiCommandExecute,
-                "tui.toast.show": EventTuiToastShow,
-                "pty.created": EventPtyCreated,
-                "pty.updated": EventPtyUpdated,
-                "pty.exited": EventPtyExited,
-                "pty.deleted": EventPtyDeleted,
-                "installation.updated": EventInstallationUpdated,
-                "installation.update-available": EventInstallationUpdateAvailable,
-                "lsp.client.diagnostics": EventLspClientDiagnostics,
-                "lsp.updated": EventLspUpdated,
-            }
-            
+
             # 获取对应的事件类
-            event_class = event_class_map.get(event_type)
+            event_class = EVENT_CLASS_MAP.get(event_type)
             if event_class:
-                return event_class(**data)
+                return cast(Event, event_class.model_validate(data))
             else:
                 # 未知事件类型，静默忽略
                 return None
-            
-        except json.JSONDecodeError:
+
+        except ValueError:
             # JSON 解析失败，静默忽略
             return None
         except Exception:
@@ -294,21 +471,21 @@ async def subscribe_events(
     url: str,
     headers: Optional[Dict[str, str]] = None,
     params: Optional[Dict[str, Any]] = None,
-    timeout: Optional[float] = None
+    timeout: Optional[float] = None,
 ) -> AsyncIterator[Event]:
     """
     订阅事件流的便捷函数。
-    
+
     Args:
         base_url: API 基础 URL
         url: SSE 端点 URL
         headers: 请求头
         params: 查询参数
         timeout: 超时时间
-        
+
     Yields:
         Event 对象
-        
+
     Example:
         >>> async for event in subscribe_events(
         ...     base_url="http://localhost:8000",
@@ -0,0 +1,163 @@
+"""
+SSE (Server-Sent Events) 增量解析器。
+
+直接处理字节块，按 WHATWG 规范解析 ``event``、``data``、``id``、``retry``
+字段，支持 LF、CRLF 和单独 CR 三种换行符。多行 ``data`` 先收集到列表中，
+在事件结束时一次性拼接，避免字符串重复拼接带来的二次方开销。
+"""
+
+from typing import List, NamedTuple, Optional
+
+
+class SSEFrame(NamedTuple):
+    """一个完整的 SSE 事件帧。"""
+
+    event: Optional[str]
+    """事件类型（``event:`` 字段），未指定时为 None"""
+
+    data: bytes
+    """事件数据，多行 ``data:`` 以 ``\\n`` 连接"""
+
+    id: Optional[str]
+    """事件分发时的最后事件 ID（``id:`` 字段）"""
+
+
+# 绕过 NamedTuple 生成的 __new__，在热路径上直接构造 SSEFrame
+_new_frame = tuple.__new__
+
+
+class SSEParser:
+    """
+    增量 SSE 解析器。
+
+    CR / CRLF 换行先统一规范化为 LF，然后按空行（``\\n\\n``）把缓冲区切分为
+    完整的事件块；只含单行 ``data:`` 的事件块（最常见的情况）无需逐行处理。
+    尚未结束的事件块以字节块列表暂存，出现事件边界时才一次性拼接，
+    因此即使一个事件被拆分成很多块，总开销也与输入大小成线性关系。
+
+    Example:
+        >>> parser = SSEParser()
+        >>> parser.feed(b'id: 1\\ndata: {"type": "session.idle"}\\n\\n')
+        [SSEFrame(event=None, data=b'{"type": "session.idle"}', id='1')]
+    """
+
+    def __init__(self) -> None:
+        """初始化解析器。"""
+        # 尚未遇到事件边界的字节块
+        self._pending: List[bytes] = []
+        # 流中出现过 CR 后才需要规范化换行符
+        self._seen_cr = False
+        # 上一块以 CR 结尾时，下一块开头的 LF 属于同一个 CRLF
+        self._skip_lf = False
+
+        self.last_event_id: Optional[str] = None
+        """最近一次 ``id:`` 字段的值，用于断线重连时的 Last-Event-ID"""
+
+        self.retry: Optional[int] = None
+        """服务器通过 ``retry:`` 字段建议的重连间隔（毫秒）"""
+
+    def feed(self, chunk: bytes) -> List[SSEFrame]:
+        """
+        输入一块字节数据。
+
+        Args:
+            chunk: 从网络读取的原始字节
+
+        Returns:
+            本次输入后完成的事件帧列表（可能为空）
+        """
+        if self._skip_lf:
+            self._skip_lf = False
+            if chunk[:1] == b"\n":
+                chunk = chunk[1:]
+        if self._seen_cr or b"\r" in chunk:
+            self._seen_cr = True
+            if chunk[-1:] == b"\r":
+                self._skip_lf = True
+            chunk = chunk.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+        if not chunk:
+            return []
+
+        pending = self._pending
+        if b"\n\n" not in chunk and not (chunk[0] == 0x0A and pending and pending[-1][-1] == 0x0A):
+            pending.append(chunk)
+            return []
+
+        if pending:
+            pending.append(chunk)
+            data = b"".join(pending)
+            pending.clear()
+        else:
+            data = chunk
+
+        blocks = data.split(b"\n\n")
+        rest = blocks.pop()
+        if rest:
+            pending.append(rest)
+
+        frames: List[SSEFrame] = []
+        append = frames.append
+        for block in blocks:
+            if block[:6] == b"data: " and b"\n" not in block:
+                # 快速路径：单行 data 事件
+                append(_new_frame(SSEFrame, (None, block[6:], self.last_event_id)))
+            elif block:
+                frame = self._parse_block(block)
+                if frame is not None:
+                    append(frame)
+        return frames
+
+    def reset(self) -> None:
+        """
+        清空缓冲区和未完成的事件（例如连接断开后）。
+
+        按规范，流结束时未以空行终止的事件会被丢弃；``last_event_id`` 和
+        ``retry`` 会保留，以便重连时使用。
+        """
+        self._pending.clear()
+        self._skip_lf = False
+
+    def _parse_block(self, block: bytes) -> Optional[SSEFrame]:
+        """解析一个完整的事件块（多行，不含结尾空行）。"""
+        event: Optional[str] = None
+        data: List[bytes] = []
+
+        for line in block.split(b"\n"):
+            if not line:
+                # 事件块开头多余的空行
+                continue
+            if line[:5] == b"data:":
+                data.append(line[6:] if line[5:6] == b" " else line[5:])
+                continue
+            if line[:4] == b"id: ":
+                if b"\x00" not in line:
+                    self.last_event_id = line[4:].decode("utf-8", "replace")
+                continue
+            if line[0] == 0x3A:
+                # 以冒号开头的是注释（常用作心跳）
+                continue
+
+            colon = line.find(b":")
+            if colon == -1:
+                field, value = line, b""
+            else:
+                field = line[:colon]
+                value = (
+                    line[colon + 2 :] if line[colon + 1 : colon + 2] == b" " else line[colon + 1 :]
+                )
+
+            if field == b"data":
+                data.append(value)
+            elif field == b"event":
+                event = value.decode("utf-8", "replace")
+            elif field == b"id":
+                if b"\x00" not in value:
+                    self.last_event_id = value.decode("utf-8", "replace")
+            elif field == b"retry":
+                if value.isdigit():
+                    self.retry = int(value)
+            # 其他字段按规范忽略
+
+        if not data:
+            return None
+        return SSEFrame(event, data[0] if len(data) == 1 else b"\n".join(data), self.last_event_id)
@@ -0,0 +1,405 @@
+"""
+SSE 事件流录制与回放。
+
+:class:`SSERecorder` 把 :class:`~opencode_sdk.sse_client.SSEClient` 收到的原始字节块
+连同接收时间原样写入紧凑的日志文件；:class:`SSEReplayer` 读取日志，按原速、N 倍速或
+不限速把字节块重新送入真实的 :class:`~opencode_sdk.sse_parser.SSEParser` 和事件解码，
+不需要模型和 OpenCode 服务器即可复现事件消费端的性能问题、对 ``subscribe_session``
+的消费者做压力测试，或离线测量解析吞吐量。
+
+日志格式（小端）::
+
+    文件头   b"OCSSE1\\n" + float64 录制开始的 Unix 时间
+    记录     uint8 类型 + uint32 连接编号 + uint64 相对录制开始的微秒数 + uint32 长度 + 负载
+
+记录类型为 ``OPEN``（建立一次 SSE 连接，负载为请求路径和查询参数）和 ``DATA``
+（该连接收到的一个字节块）。每次连接（包括重连）使用新的连接编号，回放时各自使用独立的
+解析器，与 ``SSEClient`` 断线后重置解析器的行为一致。启用压缩时整个文件是一个 zstd 流
+（需要安装 ``zstandard``：``pip install opencode-sdk[zstd]``），读取时自动识别。
+"""
+
+import asyncio
+import io
+import struct
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    BinaryIO,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+)
+
+import httpx
+
+from .models.events import Event
+from .sse_client import SSEClient
+from .sse_parser import SSEFrame, SSEParser
+
+if TYPE_CHECKING:
+    from .client import AsyncOpencodeClient
+
+_MAGIC = b"OCSSE1\n"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_FILE_HEADER = struct.Struct("<d")
+_RECORD = struct.Struct("<BIQI")
+
+OPEN = 0
+"""记录类型：建立 SSE 连接"""
+
+DATA = 1
+"""记录类型：收到的字节块"""
+
+
+def _require_zstd() -> Any:
+    """zstd 压缩依赖 zstandard 包，缺失时给出明确的安装提示。"""
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(
+            "压缩录制文件需要安装 zstandard: pip install opencode-sdk[zstd]"
+        ) from None
+    return zstandard
+
+
+class SSERecord(NamedTuple):
+    """录制文件中的一条记录。"""
+
+    kind: int
+    """记录类型（``OPEN`` 或 ``DATA``）"""
+
+    stream: int
+    """连接编号"""
+
+    offset: int
+    """相对录制开始的时间（微秒）"""
+
+    payload: bytes
+    """``OPEN`` 为请求路径，``DATA`` 为原始字节块"""
+
+
+class SSERecorder:
+    """
+    把 SSE 原始字节块写入录制文件。
+
+    通过 ``SSEClient(recorder=...)`` 或客户端的 ``sse_recorder`` 属性挂接，之后建立的
+    事件流连接都会写入同一个文件。写入在事件循环中同步进行，每个字节块只多一次
+    ``struct.pack`` 和两次缓冲写。
+
+    Args:
+        path: 录制文件路径
+        compress: 是否使用 zstd 压缩
+        level: zstd 压缩级别
+
+    Example:
+        >>> with SSERecorder("prompt.sselog", compress=True) as recorder:
+        ...     client.sse_recorder = recorder
+        ...     async for event in client.sessions.prompt_async("ses_abc", parts=parts):
+        ...         ...
+    """
+
+    def __init__(self, path: str, compress: bool = False, level: int = 3) -> None:
+        self.path = path
+        self.compress = compress
+        file: BinaryIO = open(path, "wb")
+        if compress:
+            zstandard = _require_zstd()
+            file = zstandard.ZstdCompressor(level=level).stream_writer(file, closefd=True)
+        self._file: Optional[BinaryIO] = file
+        self._started = time.perf_counter_ns()
+        self._streams = 0
+        file.write(_MAGIC + _FILE_HEADER.pack(time.time()))
+
+        self.bytes_recorded = 0
+        """已录制的原始字节数（不含记录头）"""
+
+    def _offset(self) -> int:
+        return (time.perf_counter_ns() - self._started) // 1000
+
+    def opened(self, url: str) -> int:
+        """
+        记录一次新建立的 SSE 连接。
+
+        Args:
+            url: 请求路径（含查询参数）
+
+        Returns:
+            之后写入字节块时使用的连接编号
+        """
+        stream = self._streams
+        self._streams += 1
+        self._write(OPEN, stream, url.encode("utf-8"))
+        return stream
+
+    def write(self, stream: int, chunk: bytes) -> None:
+        """记录连接 ``stream`` 收到的一个字节块。"""
+        self.bytes_recorded += len(chunk)
+        self._write(DATA, stream, chunk)
+
+    def _write(self, kind: int, stream: int, payload: bytes) -> None:
+        file = self._file
+        if file is None:
+            # 录制已结束，之后收到的数据直接丢弃
+            return
+        file.write(_RECORD.pack(kind, stream, self._offset(), len(payload)))
+        file.write(payload)
+
+    def flush(self) -> None:
+        """把缓冲的数据写入磁盘（压缩时结束当前压缩块）。"""
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self) -> None:
+        """结束录制并关闭文件。"""
+        if self._file is not None:
+            file, self._file = self._file, None
+            file.close()
+
+    def __enter__(self) -> "SSERecorder":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+def read_recording(path: str) -> List[SSERecord]:
+    """
+    读取录制文件中的全部记录。
+
+    Args:
+        path: 录制文件路径（压缩与否自动识别）
+
+    Returns:
+        按录制顺序排列的记录列表
+
+    Raises:
+        ValueError: 文件不是 SSE 录制文件
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if data[:4] == _ZSTD_MAGIC:
+        zstandard = _require_zstd()
+        reader = zstandard.ZstdDecompressor().stream_reader(
+            io.BytesIO(data), read_across_frames=True
+        )
+        data = reader.read()
+    if not data.startswith(_MAGIC):
+        raise ValueError(f"不是 SSE 录制文件: {path}")
+
+    records: List[SSERecord] = []
+    append = records.append
+    unpack = _RECORD.unpack_from
+    header_size = _RECORD.size
+    view = memoryview(data)
+    pos = len(_MAGIC) + _FILE_HEADER.size
+    end = len(data)
+    while pos + header_size <= end:
+        kind, stream, offset, length = unpack(data, pos)
+        pos += header_size
+        if pos + length > end:
+            # 录制时进程被中断，最后一条记录不完整
+            break
+        append(SSERecord(kind, stream, offset, bytes(view[pos : pos + length])))
+        pos += length
+    return records
+
+
+class _Pacer:
+    """按录制时间安排回放节奏：``speed`` 为倍速，None 表示不等待。"""
+
+    __slots__ = ("_speed", "_origin")
+
+    def __init__(self, speed: Optional[float]) -> None:
+        self._speed = speed
+        self._origin: Optional[float] = None
+
+    def delay(self, offset: int) -> float:
+        """距离 ``offset``（微秒）对应的回放时刻还需等待的秒数。"""
+        if self._speed is None:
+            return 0.0
+        now = time.perf_counter()
+        if self._origin is None:
+            self._origin = now - offset / 1e6 / self._speed
+            return 0.0
+        return self._origin + offset / 1e6 / self._speed - now
+
+
+class _ReplayStream(httpx.AsyncByteStream):
+    """按录制节奏输出一次连接的字节块。"""
+
+    def __init__(self, records: List[SSERecord], speed: Optional[float]) -> None:
+        self._records = records
+        self._speed = speed
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        pacer = _Pacer(self._speed)
+        for record in self._records:
+            delay = pacer.delay(record.offset)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            yield record.payload
+
+
+class _ReplayTransport(httpx.AsyncBaseTransport):
+    """
+    回放录制连接的 httpx 传输层。
+
+    对同一路径的第 n 个事件流请求回放录制中该路径的第 n 次连接，录制的连接用完后返回 204；
+    其他请求（如 ``prompt_async``）一律返回 204。
+    """
+
+    def __init__(self, replayer: "SSEReplayer") -> None:
+        self._replayer = replayer
+        self._served: Dict[str, int] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if "text/event-stream" not in request.headers.get("accept", ""):
+            return httpx.Response(204)
+        url = request.url.raw_path.decode("ascii")
+        candidates = self._replayer._connections(url)
+        served = self._served.get(url, 0)
+        if served >= len(candidates):
+            return httpx.Response(204)
+        self._served[url] = served + 1
+        return httpx.Response(
+            200,
+            headers={"content-type": "text/event-stream"},
+            stream=_ReplayStream(candidates[served], self._replayer.speed),
+        )
+
+
+class SSEReplayer:
+    """
+    回放 :class:`SSERecorder` 录制的事件流。
+
+    录制文件在构造时整体读入内存，回放过程不涉及磁盘读取；每次回放都按相同的字节块边界
+    输入解析器，结果是确定的。
+
+    Args:
+        path: 录制文件路径
+        speed: 回放倍速，1.0 为原速，None 表示不等待、尽快回放
+
+    Example:
+        >>> replayer = SSEReplayer("prompt.sselog", speed=None)
+        >>> async for event in replayer.events():
+        ...     consumer.handle(event)
+
+        >>> # 让 subscribe_session / prompt_async 的消费者直接消费录制的事件流
+        >>> async with AsyncOpencodeClient() as client:
+        ...     SSEReplayer("prompt.sselog", speed=10.0).attach(client)
+        ...     async for event in client.sessions.prompt_async("ses_abc", parts=parts):
+        ...         ...
+    """
+
+    def __init__(self, path: str, speed: Optional[float] = 1.0) -> None:
+        if speed is not None and speed <= 0:
+            raise ValueError("speed 必须大于 0")
+        self.path = path
+        self.speed = speed
+        self.records = read_recording(path)
+        self.streams: Dict[int, str] = {
+            record.stream: record.payload.decode("utf-8")
+            for record in self.records
+            if record.kind == OPEN
+        }
+        """连接编号 -> 请求路径"""
+
+    @property
+    def duration(self) -> float:
+        """录制时长（秒）。"""
+        return self.records[-1].offset / 1e6 if self.records else 0.0
+
+    @property
+    def size(self) -> int:
+        """录制的原始字节数。"""
+        return sum(len(record.payload) for record in self.records if record.kind == DATA)
+
+    def chunks(self) -> Iterator[SSERecord]:
+        """按录制节奏逐个产出 ``DATA`` 记录（同步等待）。"""
+        pacer = _Pacer(self.speed)
+        for record in self.records:
+            if record.kind != DATA:
+                continue
+            delay = pacer.delay(record.offset)
+            if delay > 0:
+                time.sleep(delay)
+            yield record
+
+    def frames(self) -> Iterator[SSEFrame]:
+        """按录制节奏把字节块送入 :class:`SSEParser`，产出解析出的事件帧。"""
+        parsers: Dict[int, SSEParser] = {}
+        for record in self.chunks():
+            parser = parsers.get(record.stream)
+            if parser is None:
+                parser = parsers[record.stream] = SSEParser()
+            yield from parser.feed(record.payload)
+
+    async def events(self) -> AsyncIterator[Event]:
+        """
+        按录制节奏解析并解码事件。
+
+        每个连接使用独立的 :class:`SSEClient` 解码路径（包括 ``{"directory", "payload"}``
+        包装的识别），与实时订阅得到的 Event 对象相同。
+        """
+        pacer = _Pacer(self.speed)
+        decoders: Dict[int, SSEClient] = {}
+        for record in self.records:
+            if record.kind == OPEN:
+                decoders[record.stream] = SSEClient("")
+                continue
+            delay = pacer.delay(record.offset)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            decoder = decoders.get(record.stream)
+            if decoder is None:
+                decoder = decoders[record.stream] = SSEClient("")
+            for frame in decoder._parser.feed(record.payload):
+                event = decoder._parse_event(frame.event, frame.data)
+                if event is not None:
+                    yield event
+
+    def _connections(self, url: str) -> List[List[SSERecord]]:
+        """请求 ``url`` 对应的各次录制连接的 ``DATA`` 记录（时间相对连接建立时刻）。"""
+        path = url.partition("?")[0]
+        streams = [stream for stream, recorded in self.streams.items() if recorded == url]
+        if not streams:
+            streams = [
+                stream
+                for stream, recorded in self.streams.items()
+                if recorded.partition("?")[0] == path
+            ]
+        opened = {record.stream: record.offset for record in self.records if record.kind == OPEN}
+        connections: Dict[int, List[SSERecord]] = {stream: [] for stream in streams}
+        for record in self.records:
+            if record.kind == DATA and record.stream in connections:
+                connections[record.stream].append(
+                    record._replace(offset=record.offset - opened[record.stream])
+                )
+        return [connections[stream] for stream in streams]
+
+    def transport(self) -> httpx.AsyncBaseTransport:
+        """
+        创建回放录制连接的 httpx 异步传输层。
+
+        事件流请求按路径（含查询参数，没有完全匹配时只比较路径）回放录制的连接，
+        每个请求回放下一次连接；其他请求返回 204。
+        """
+        return _ReplayTransport(self)
+
+    def attach(self, client: "AsyncOpencodeClient") -> None:
+        """
+        让异步客户端的请求改由回放传输层处理。
+
+        ``client.events`` 的订阅和 ``sessions.prompt_async`` 会收到录制的事件流，
+        ``prompt_async`` 发出的请求直接返回 204。应在客户端发出任何请求之前调用。
+        """
+        http_client = client._http_client
+        http_client.client = httpx.AsyncClient(
+            base_url=http_client.base_url,
+            headers=http_client.default_headers,
+            transport=self.transport(),
+        )
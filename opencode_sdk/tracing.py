@@ -0,0 +1,264 @@
+"""
+OpenTelemetry 追踪（可选）。
+
+调用 :func:`enable_tracing` 后，SDK 会创建以下 span，一条 trace 即可看出一次 prompt 的时间
+花在了哪里：
+
+- 每个 HTTP 请求（每次重试单独计）一个 ``CLIENT`` span，名称如 ``POST /session/{id}/message``
+- 每个 SSE 订阅（``SSEClient.connect``）一个长期存在的 span，连接建立、断开和重连记为 span 事件
+- SSE 订阅 span 之下，根据 ``message.part.updated`` 事件派生的子 span：
+
+  - ``step``：从 ``StepStartPart`` 到 ``StepFinishPart``，记录 token 用量、成本和完成原因
+  - ``execute_tool {tool}``：``ToolPart`` 从 pending（排队）到 running（执行）再到
+    completed / error；进入 running 时记一个 span 事件。订阅开始时工具已在运行或已结束的，
+    使用服务器给出的开始 / 结束时间
+
+需要安装 ``opentelemetry-api``（``pip install opencode-sdk[otel]``）并由应用配置
+TracerProvider。未调用 :func:`enable_tracing` 时 SDK 不会导入 OpenTelemetry，
+请求和事件处理路径上只多一次 None 判断。
+
+Example:
+    >>> from opentelemetry import trace
+    >>> from opencode_sdk.tracing import enable_tracing
+    >>> enable_tracing()
+    >>> with trace.get_tracer(__name__).start_as_current_span("fix-bug"):
+    ...     client.sessions.prompt("ses_abc", parts=[{"type": "text", "text": "修复测试"}])
+"""
+
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+
+from .version import __version__
+
+if TYPE_CHECKING:
+    from .instrumentation import RequestRecord
+
+# 启用追踪后为 opentelemetry.trace 模块和 Tracer，否则为 None
+_trace: Any = None
+_tracer: Any = None
+
+
+def enable_tracing(tracer_provider: Optional[Any] = None) -> None:
+    """
+    启用 OpenTelemetry 追踪。
+
+    Args:
+        tracer_provider: 使用的 TracerProvider，None 表示全局 TracerProvider
+
+    Raises:
+        ImportError: 未安装 opentelemetry-api
+    """
+    global _trace, _tracer
+    try:
+        from opentelemetry import trace
+    except ImportError:
+        raise ImportError(
+            "启用追踪需要安装 OpenTelemetry: pip install opencode-sdk[otel]"
+        ) from None
+    _tracer = trace.get_tracer("opencode_sdk", __version__, tracer_provider=tracer_provider)
+    _trace = trace
+
+
+def disable_tracing() -> None:
+    """停用追踪，已经开始的 span 仍会正常结束。"""
+    global _tracer
+    _tracer = None
+
+
+def tracing_enabled() -> bool:
+    """是否已启用追踪。"""
+    return _tracer is not None
+
+
+def _ms_to_ns(value: Optional[int]) -> Optional[int]:
+    return value * 1_000_000 if value is not None else None
+
+
+def _error_status(span: Any, description: str) -> None:
+    span.set_status(_trace.Status(_trace.StatusCode.ERROR, description))
+
+
+# ============================================================================
+# HTTP 请求
+# ============================================================================
+
+
+def start_request_span(record: "RequestRecord") -> Optional[Any]:
+    """为一次 HTTP 请求开始 span（未启用追踪时返回 None）。"""
+    tracer = _tracer
+    if tracer is None:
+        return None
+    attributes: Dict[str, Any] = {
+        "http.request.method": record.method,
+        "http.route": record.route,
+        "url.path": record.path,
+    }
+    if record.attempt > 1:
+        attributes["http.request.resend_count"] = record.attempt - 1
+    return tracer.start_span(
+        f"{record.method} {record.route}", kind=_trace.SpanKind.CLIENT, attributes=attributes
+    )
+
+
+def end_request_span(record: "RequestRecord") -> None:
+    """记录响应信息并结束请求的 span。"""
+    span = record.span
+    if record.status is not None:
+        span.set_attribute("http.response.status_code", record.status)
+    span.set_attribute("http.request.body.size", record.bytes_sent)
+    span.set_attribute("http.response.body.size", record.bytes_received)
+    if record.error is not None:
+        if record.outcome == "cancelled":
+            error_type = "cancelled"
+        elif record.status is not None:
+            error_type = str(record.status)
+        else:
+            error_type = type(record.error).__name__
+        span.set_attribute("error.type", error_type)
+        span.record_exception(record.error)
+        _error_status(span, str(record.error))
+    span.end()
+
+
+# ============================================================================
+# SSE 订阅和派生的 step / tool span
+# ============================================================================
+
+
+class SSETrace:
+    """一次 SSE 订阅的 span，以及从事件派生的 step 和工具调用 span。"""
+
+    def __init__(self, tracer: Any, url: str, method: str) -> None:
+        self._tracer = tracer
+        self.span = tracer.start_span(
+            f"SSE {url}",
+            kind=_trace.SpanKind.CLIENT,
+            attributes={"http.request.method": method, "url.path": url},
+        )
+        self.events = 0
+        # messageID -> 进行中的 step span
+        self._steps: Dict[str, Any] = {}
+        # 工具 part ID -> [span, 最近一次看到的状态, 是否使用服务器时间]
+        self._tools: Dict[str, Any] = {}
+
+    def wrap_on_open(self, on_open: Optional[Callable[[], None]]) -> Callable[[], None]:
+        """包装 on_open 回调，在每次连接建立时记录 span 事件。"""
+
+        def opened() -> None:
+            self.span.add_event("connected")
+            if on_open is not None:
+                on_open()
+
+        return opened
+
+    def disconnected(self, error: BaseException) -> None:
+        self.span.add_event("disconnected", {"error": str(error)})
+
+    def observe(self, event: Any) -> None:
+        """处理一个事件，维护 step 和工具调用的子 span。"""
+        self.events += 1
+        if event.type != "message.part.updated":
+            return
+        part = event.properties.part
+        if part.type == "tool":
+            self._tool(part)
+        elif part.type == "step-start":
+            self._step_start(part)
+        elif part.type == "step-finish":
+            self._step_finish(part)
+
+    def _child(
+        self, name: str, parent: Any, start_time: Optional[int], attributes: Dict[str, Any]
+    ) -> Any:
+        return self._tracer.start_span(
+            name,
+            context=_trace.set_span_in_context(parent),
+            start_time=start_time,
+            attributes=attributes,
+        )
+
+    def _step_start(self, part: Any) -> None:
+        if part.message_id in self._steps:
+            return
+        self._steps[part.message_id] = self._child(
+            "step",
+            self.span,
+            None,
+            {"opencode.session.id": part.session_id, "opencode.message.id": part.message_id},
+        )
+
+    def _step_finish(self, part: Any) -> None:
+        span = self._steps.pop(part.message_id, None)
+        if span is None:
+            return
+        tokens = part.tokens
+        span.set_attributes(
+            {
+                "opencode.step.reason": part.reason,
+                "opencode.step.cost": part.cost,
+                "gen_ai.usage.input_tokens": tokens.input,
+                "gen_ai.usage.output_tokens": tokens.output,
+            }
+        )
+        span.end()
+
+    def _tool(self, part: Any) -> None:
+        state = part.state
+        status = state.status
+        entry = self._tools.get(part.id)
+        if entry is None:
+            if status == "pending":
+                start_time = None
+            else:
+                start_time = _ms_to_ns(state.time.get("start"))
+            parent = self._steps.get(part.message_id, self.span)
+            span = self._child(
+                f"execute_tool {part.tool}",
+                parent,
+                start_time,
+                {
+                    "gen_ai.tool.name": part.tool,
+                    "gen_ai.tool.call.id": part.call_id,
+                    "opencode.session.id": part.session_id,
+                    "opencode.message.id": part.message_id,
+                },
+            )
+            # 没有看到 pending 状态时 span 从服务器给出的开始时间算起，结束时间同样用服务器时间，
+            # 避免混用两边的时钟
+            entry = self._tools[part.id] = [span, None, start_time is not None]
+        span, previous, server_clock = entry
+        if status == previous:
+            return
+        entry[1] = status
+        if status == "running":
+            span.add_event("running")
+        elif status in ("completed", "error"):
+            del self._tools[part.id]
+            end_time = _ms_to_ns(state.time.get("end")) if server_clock else None
+            if status == "error":
+                span.set_attribute("error.type", "tool_error")
+                _error_status(span, state.error)
+            elif state.title:
+                span.set_attribute("opencode.tool.title", state.title)
+            span.end(end_time=end_time)
+
+    def fail(self, error: BaseException) -> None:
+        self.span.record_exception(error)
+        _error_status(self.span, str(error))
+
+    def end(self) -> None:
+        """结束订阅 span；未结束的 step 和工具调用 span 标记为未完成后一并结束。"""
+        for span in [*(entry[0] for entry in self._tools.values()), *self._steps.values()]:
+            span.set_attribute("opencode.incomplete", True)
+            span.end()
+        self._tools.clear()
+        self._steps.clear()
+        self.span.set_attribute("opencode.sse.events", self.events)
+        self.span.end()
+
+
+def start_sse_trace(url: str, method: str) -> Optional[SSETrace]:
+    """为一次 SSE 订阅开始追踪（未启用追踪时返回 None）。"""
+    tracer = _tracer
+    if tracer is None:
+        return None
+    return SSETrace(tracer, url, method)
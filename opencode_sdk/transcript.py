@@ -0,0 +1,247 @@
+"""
+流式消息组装模块。
+
+:class:`TranscriptAssembler` 把 ``message.updated``、``message.part.updated``
+和 ``message.part.delta`` 事件增量合并为完整的消息。增量文本按
+``(sessionID, messageID, partID, field)`` 存放在分块列表中，避免对长文本反复
+``str +=``；收到 ``session.idle`` 时产出该会话已完成的 :class:`AssistantMessage`，
+无需再调用 ``sessions.message()`` 获取最终结果。
+"""
+
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
+
+from .models.message import AssistantMessage, Part, TextPart
+
+# (sessionID, messageID, partID)
+PartKey = Tuple[str, str, str]
+
+
+class _TextBuffer:
+    """增量文本缓冲：追加只记录分块，读取时拼接一次并缓存结果。"""
+
+    __slots__ = ("_chunks", "_text")
+
+    def __init__(self, text: str = "") -> None:
+        self._chunks: List[str] = [text] if text else []
+        self._text: Optional[str] = text
+
+    def append(self, delta: str) -> None:
+        self._chunks.append(delta)
+        self._text = None
+
+    def reset(self, text: str) -> None:
+        self._chunks = [text] if text else []
+        self._text = text
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = "".join(self._chunks)
+            # 拼接后合并为单个分块，下次追加后只需再拼接新增部分
+            self._chunks = [self._text]
+        return self._text
+
+
+class TranscriptAssembler:
+    """
+    把流式事件组装为完整的助手消息。
+
+    依次把事件传给 :meth:`feed`；收到 ``session.idle`` 时返回该会话中已完成的
+    助手消息（按首次出现的顺序），其 ``parts`` 中的文本已合并了全部增量，
+    随后丢弃该会话的状态。流式输出期间可以随时通过 :meth:`text` 读取某个部分的当前文本。
+
+    Example:
+        >>> assembler = TranscriptAssembler()
+        >>> async for event in client.sessions.prompt_async(session_id, parts):
+        ...     for message in assembler.feed(event):
+        ...         print(message.id, message.parts[0].text)
+    """
+
+    def __init__(self) -> None:
+        # 消息 ID -> 最新的消息信息（来自 message.updated）
+        self._messages: Dict[str, Any] = {}
+        # 会话 ID -> 按出现顺序排列的消息 ID
+        self._sessions: Dict[str, Dict[str, None]] = {}
+        # 消息 ID -> {部分 ID: 最新的部分快照}，保持部分出现的顺序
+        self._parts: Dict[str, Dict[str, Optional[Part]]] = {}
+        # (会话, 消息, 部分) -> {字段: 增量缓冲}
+        self._buffers: Dict[PartKey, Dict[str, _TextBuffer]] = {}
+
+    def feed(self, event: Any) -> List[AssistantMessage]:
+        """
+        处理一个事件。
+
+        Args:
+            event: SSE 事件对象
+
+        Returns:
+            事件为 ``session.idle`` 时返回该会话已完成的助手消息，否则返回空列表
+        """
+        event_type = getattr(event, "type", None)
+        properties = getattr(event, "properties", None)
+        if properties is None:
+            return []
+        if event_type == "message.part.delta":
+            self._on_delta(
+                properties.session_id,
+                properties.message_id,
+                properties.part_id,
+                properties.field,
+                properties.delta,
+            )
+        elif event_type == "message.part.updated":
+            self._on_part(properties.part)
+        elif event_type == "message.updated":
+            info = properties.info
+            self._messages[info.id] = info
+            self._track(info.session_id, info.id)
+        elif event_type == "message.part.removed":
+            self._drop_part(properties.session_id, properties.message_id, properties.part_id)
+        elif event_type == "message.removed":
+            self._drop_message(properties.session_id, properties.message_id)
+        elif event_type == "session.idle":
+            return self.finish(properties.session_id)
+        return []
+
+    def feed_all(self, events: Iterable[Any]) -> List[AssistantMessage]:
+        """依次处理多个事件，返回期间完成的全部助手消息。"""
+        finished: List[AssistantMessage] = []
+        for event in events:
+            finished.extend(self.feed(event))
+        return finished
+
+    async def assemble(self, events: AsyncIterator[Any]) -> AsyncIterator[AssistantMessage]:
+        """
+        处理异步事件流，逐个产出完成的助手消息。
+
+        Example:
+            >>> async for message in TranscriptAssembler().assemble(client.events.subscribe()):
+            ...     print(message.session_id, message.parts[-1])
+        """
+        async for event in events:
+            for message in self.feed(event):
+                yield message
+
+    def text(self, session_id: str, message_id: str, part_id: str, field: str = "text") -> str:
+        """
+        读取某个部分字段的当前文本。
+
+        没有新增量时直接返回缓存的字符串；有新增量时只拼接一次。
+
+        Args:
+            session_id: 会话 ID
+            message_id: 消息 ID
+            part_id: 部分 ID
+            field: 字段名称
+
+        Returns:
+            当前文本，尚未收到任何内容时返回空字符串
+        """
+        buffer = self._buffers.get((session_id, message_id, part_id), {}).get(field)
+        if buffer is not None:
+            return buffer.text
+        part = self._parts.get(message_id, {}).get(part_id)
+        value = getattr(part, field, None)
+        return value if isinstance(value, str) else ""
+
+    def parts(self, message_id: str) -> List[Part]:
+        """返回消息当前的部分列表（已合并增量），按出现顺序排列。"""
+        message = self._messages.get(message_id)
+        session_id = getattr(message, "session_id", None)
+        result: List[Part] = []
+        for part_id, part in self._parts.get(message_id, {}).items():
+            if session_id is None and part is not None:
+                session_id = part.session_id
+            merged = self._merge(session_id, message_id, part_id, part)
+            if merged is not None:
+                result.append(merged)
+        return result
+
+    def message(self, message_id: str) -> Optional[Any]:
+        """返回消息的当前快照（已合并增量），尚未收到 ``message.updated`` 时返回 None。"""
+        info = self._messages.get(message_id)
+        if info is None:
+            return None
+        return info.model_copy(update={"parts": self.parts(message_id)})
+
+    def finish(self, session_id: str) -> List[AssistantMessage]:
+        """
+        完成会话：返回其中的助手消息并丢弃该会话的全部状态。
+
+        通常由 ``session.idle`` 事件触发，也可以在流意外结束时手动调用。
+        """
+        finished: List[AssistantMessage] = []
+        for message_id in self._sessions.pop(session_id, {}):
+            message = self.message(message_id)
+            if isinstance(message, AssistantMessage):
+                finished.append(message)
+            self._forget(session_id, message_id)
+        return finished
+
+    # ==================== 内部方法 ====================
+
+    def _track(self, session_id: str, message_id: str) -> None:
+        self._sessions.setdefault(session_id, {})[message_id] = None
+
+    def _on_delta(
+        self, session_id: str, message_id: str, part_id: str, field: str, delta: str
+    ) -> None:
+        self._track(session_id, message_id)
+        self._parts.setdefault(message_id, {}).setdefault(part_id, None)
+        fields = self._buffers.setdefault((session_id, message_id, part_id), {})
+        buffer = fields.get(field)
+        if buffer is None:
+            # 先收到部分快照再收到增量时，以快照中的文本为起点
+            part = self._parts[message_id][part_id]
+            value = getattr(part, field, None)
+            buffer = fields[field] = _TextBuffer(value if isinstance(value, str) else "")
+        buffer.append(delta)
+
+    def _on_part(self, part: Part) -> None:
+        session_id, message_id, part_id = part.session_id, part.message_id, part.id
+        self._track(session_id, message_id)
+        self._parts.setdefault(message_id, {})[part_id] = part
+        # 部分快照中的文本是服务器端的完整内容，以它为准重置已有的缓冲
+        for field, buffer in self._buffers.get((session_id, message_id, part_id), {}).items():
+            value = getattr(part, field, None)
+            if isinstance(value, str):
+                buffer.reset(value)
+
+    def _merge(
+        self,
+        session_id: Optional[str],
+        message_id: str,
+        part_id: str,
+        part: Optional[Part],
+    ) -> Optional[Part]:
+        """把增量缓冲中的文本写回部分快照。"""
+        fields = self._buffers.get((session_id, message_id, part_id)) if session_id else None
+        if not fields:
+            return part
+        update = {field: buffer.text for field, buffer in fields.items()}
+        if part is None:
+            # 只收到增量、没有收到部分快照：文本增量还原为 TextPart，其他字段无法还原
+            if "text" not in update:
+                return None
+            return TextPart.model_validate(
+                {
+                    "id": part_id,
+                    "sessionID": session_id,
+                    "messageID": message_id,
+                    "text": update["text"],
+                }
+            )
+        return part.model_copy(update=update)
+
+    def _drop_part(self, session_id: str, message_id: str, part_id: str) -> None:
+        self._parts.get(message_id, {}).pop(part_id, None)
+        self._buffers.pop((session_id, message_id, part_id), None)
+
+    def _drop_message(self, session_id: str, message_id: str) -> None:
+        self._sessions.get(session_id, {}).pop(message_id, None)
+        self._forget(session_id, message_id)
+
+    def _forget(self, session_id: str, message_id: str) -> None:
+        self._messages.pop(message_id, None)
+        for part_id in self._parts.pop(message_id, {}):
+            self._buffers.pop((session_id, message_id, part_id), None)
@@ -1,6 +1,10 @@
 """OpenCode SDK 的工具函数。"""
 
-from typing import Any, Dict, Optional
+import asyncio
+import inspect
+import posixpath
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import unquote
 
 
 def remove_none_values(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -31,3 +35,66 @@ def merge_dicts(*dicts: Dict[str, Any]) -> Dict[str, Any]:
         if d:
             result.update(d)
     return result
+
+
+def parse_transport(transport: Optional[str]) -> Optional[str]:
+    """
+    解析 transport 参数。
+
+    Args:
+        transport: None 或 "tcp" 表示通过 TCP 连接 base_url；
+            "unix:///path/to/opencode.sock" 表示通过 Unix 域套接字连接
+
+    Returns:
+        Unix 域套接字路径，使用 TCP 时返回 None
+
+    Raises:
+        ValueError: 不支持的 transport
+    """
+    if transport is None or transport == "tcp":
+        return None
+    if transport.startswith("unix://") and len(transport) > len("unix://"):
+        return transport[len("unix://") :]
+    raise ValueError(f"不支持的 transport: {transport!r}，应为 'tcp' 或 'unix:///path.sock'")
+
+
+def relative_path(path: str, root: Optional[str]) -> str:
+    """
+    把事件或 LSP 结果中的路径统一为相对于项目根目录的 POSIX 路径。
+
+    Args:
+        path: 相对路径、绝对路径或 ``file://`` URI
+        root: 项目根目录，None 时只做规范化
+
+    Returns:
+        相对路径，根目录本身为 "."；不在根目录下的绝对路径原样返回
+    """
+    if path.startswith("file://"):
+        path = unquote(path[len("file://") :])
+    path = posixpath.normpath(path.replace("\\", "/"))
+    if root and posixpath.isabs(path):
+        if path == root:
+            return "."
+        if path.startswith(root + "/"):
+            return path[len(root) + 1 :]
+    return path
+
+
+async def call_resource(method: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    调用同步或异步资源方法。
+
+    同步方法在线程中执行，避免阻塞事件循环，使同一段异步代码同时适用于
+    OpencodeClient 和 AsyncOpencodeClient。
+
+    Args:
+        method: 资源方法
+        *args: 位置参数
+        **kwargs: 关键字参数
+
+    Returns:
+        方法的返回值
+    """
+    if inspect.iscoroutinefunction(method):
+        return await method(*args, **kwargs)
+    return await asyncio.to_thread(method, *args, **kwargs)
@@ -0,0 +1,198 @@
+"""
+并发目录遍历。
+
+:func:`walk_tree` 和 :func:`awalk_tree` 按广度优先逐层调用非递归的 ``files.list()``，
+同时进行的请求不超过 ``concurrency`` 个，每个目录的列表返回后立即产出其中的
+:class:`~opencode_sdk.models.file.FileNode`。相比 ``list(recursive=True)`` 一次返回整棵树，
+单个请求很小，不会因为目录树过大而超时，也不必等整棵树遍历完才拿到第一批结果。
+
+一般通过 ``client.files.walk()`` 使用。
+"""
+
+import asyncio
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from fnmatch import fnmatchcase
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .models.file import FileNode
+
+Patterns = Union[str, Iterable[str], None]
+"""glob 模式：单个字符串或字符串序列"""
+
+
+def _patterns(value: Patterns) -> Tuple[str, ...]:
+    if value is None:
+        return ()
+    if isinstance(value, str):
+        return (value,)
+    return tuple(value)
+
+
+def _matches(node: FileNode, patterns: Tuple[str, ...]) -> bool:
+    """模式与相对路径或名称匹配即视为命中（``node_modules`` 与 ``src/**/*.py`` 都可用）。"""
+    return any(fnmatchcase(node.path, p) or fnmatchcase(node.name, p) for p in patterns)
+
+
+class _Filter:
+    """遍历条件：决定节点是否产出、目录是否继续展开。"""
+
+    __slots__ = ("include", "exclude", "prune", "skip_ignored", "max_depth")
+
+    def __init__(
+        self,
+        include: Patterns,
+        exclude: Patterns,
+        prune: Optional[Callable[[FileNode], bool]],
+        skip_ignored: bool,
+        max_depth: Optional[int],
+    ) -> None:
+        if max_depth is not None and max_depth <= 0:
+            raise ValueError("max_depth 必须为正整数")
+        self.include = _patterns(include)
+        self.exclude = _patterns(exclude)
+        self.prune = prune
+        self.skip_ignored = skip_ignored
+        self.max_depth = max_depth
+
+    def visit(self, nodes: List[FileNode], depth: int) -> Tuple[List[FileNode], List[str]]:
+        """
+        处理一个目录的列表。
+
+        Returns:
+            (需要产出的节点, 需要继续展开的子目录)
+        """
+        found: List[FileNode] = []
+        subdirs: List[str] = []
+        descend = self.max_depth is None or depth < self.max_depth
+        for node in nodes:
+            if self.skip_ignored and node.ignored:
+                continue
+            if self.exclude and _matches(node, self.exclude):
+                continue
+            if not self.include or _matches(node, self.include):
+                found.append(node)
+            if descend and node.type == "directory" and not (self.prune and self.prune(node)):
+                subdirs.append(node.path)
+        return found, subdirs
+
+
+def _check_concurrency(concurrency: int) -> None:
+    if concurrency <= 0:
+        raise ValueError("concurrency 必须为正整数")
+
+
+def walk_tree(
+    list_dir: Callable[[str], List[FileNode]],
+    path: str = ".",
+    concurrency: int = 8,
+    max_depth: Optional[int] = None,
+    include: Patterns = None,
+    exclude: Patterns = None,
+    prune: Optional[Callable[[FileNode], bool]] = None,
+    skip_ignored: bool = False,
+    on_error: Optional[Callable[[str, Exception], Any]] = None,
+) -> Iterator[FileNode]:
+    """
+    在线程池中并发遍历目录树，按目录完成的顺序产出节点。
+
+    参数含义参见 :meth:`FileResource.walk`。
+
+    Args:
+        list_dir: 列出单个目录的函数，签名同 ``FileResource.list(path)``
+
+    Yields:
+        FileNode 对象
+    """
+    _check_concurrency(concurrency)
+    rules = _Filter(include, exclude, prune, skip_ignored, max_depth)
+    queue: Deque[Tuple[str, int]] = deque([(path, 1)])
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="opencode-walk")
+    running: Dict[Future, Tuple[str, int]] = {}
+    try:
+        while True:
+            while queue and len(running) < concurrency:
+                directory, depth = queue.popleft()
+                running[executor.submit(list_dir, directory)] = (directory, depth)
+            if not running:
+                return
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                directory, depth = running.pop(future)
+                error = future.exception()
+                if error is not None:
+                    if on_error is None or not isinstance(error, Exception):
+                        raise error
+                    on_error(directory, error)
+                    continue
+                found, subdirs = rules.visit(future.result(), depth)
+                queue.extend((subdir, depth + 1) for subdir in subdirs)
+                yield from found
+    finally:
+        # 提前结束遍历：丢弃排队中的请求，不等待正在进行的请求
+        for future in running:
+            future.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def awalk_tree(
+    list_dir: Callable[[str], Awaitable[List[FileNode]]],
+    path: str = ".",
+    concurrency: int = 8,
+    max_depth: Optional[int] = None,
+    include: Patterns = None,
+    exclude: Patterns = None,
+    prune: Optional[Callable[[FileNode], bool]] = None,
+    skip_ignored: bool = False,
+    on_error: Optional[Callable[[str, Exception], Any]] = None,
+) -> AsyncIterator[FileNode]:
+    """
+    在事件循环中并发遍历目录树，参见 :func:`walk_tree`。
+
+    提前结束遍历（break 或 ``aclose()``）时会取消尚未完成的请求。
+    """
+    _check_concurrency(concurrency)
+    rules = _Filter(include, exclude, prune, skip_ignored, max_depth)
+    queue: Deque[Tuple[str, int]] = deque([(path, 1)])
+    running: Dict["asyncio.Task[List[FileNode]]", Tuple[str, int]] = {}
+    try:
+        while True:
+            while queue and len(running) < concurrency:
+                directory, depth = queue.popleft()
+                running[asyncio.ensure_future(list_dir(directory))] = (directory, depth)
+            if not running:
+                return
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                directory, depth = running.pop(task)
+                try:
+                    nodes = task.result()
+                except Exception as e:
+                    if on_error is None:
+                        raise
+                    on_error(directory, e)
+                    continue
+                found, subdirs = rules.visit(nodes, depth)
+                queue.extend((subdir, depth + 1) for subdir in subdirs)
+                for node in found:
+                    yield node
+    finally:
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
@@ -35,6 +35,18 @@ setup(
         "typing-extensions>=4.0.0",
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.9.0",
+        ],
+        "http2": [
+            "httpx[http2]>=0.27.0",
+        ],
+        "otel": [
+            "opentelemetry-api>=1.20.0",
+        ],
+        "zstd": [
+            "zstandard>=0.21.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-asyncio>=0.21.0",
@@ -0,0 +1,157 @@
+"""批量 prompt 执行测试。"""
+
+import asyncio
+import threading
+import time
+from typing import Any, Dict, Iterator, List
+
+import pytest
+
+from opencode_sdk.batch import PromptJob, arun_prompts, run_prompts
+from opencode_sdk.exceptions import APIError, TimeoutError
+
+
+class _Server:
+    """记录并发数的假 prompt / abort 实现；``sleep`` 按会话指定耗时。"""
+
+    def __init__(self, sleep: Dict[str, float]) -> None:
+        self.sleep = sleep
+        self.active = 0
+        self.peak = 0
+        self.aborted: List[str] = []
+        self._lock = threading.Lock()
+
+    def _enter(self) -> None:
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+
+    def _exit(self) -> None:
+        with self._lock:
+            self.active -= 1
+
+    def prompt(self, session_id: str, parts: List[Dict[str, Any]], **kwargs: Any) -> Any:
+        self._enter()
+        try:
+            time.sleep(self.sleep.get(session_id, 0.01))
+            if session_id == "ses_fail":
+                raise APIError("boom", status_code=500)
+            return {"session": session_id, **kwargs}
+        finally:
+            self._exit()
+
+    def abort(self, session_id: str) -> None:
+        self.aborted.append(session_id)
+
+    async def aprompt(self, session_id: str, parts: List[Dict[str, Any]], **kwargs: Any) -> Any:
+        self._enter()
+        try:
+            await asyncio.sleep(self.sleep.get(session_id, 0.01))
+            if session_id == "ses_fail":
+                raise APIError("boom", status_code=500)
+            return {"session": session_id, **kwargs}
+        finally:
+            self._exit()
+
+    async def aabort(self, session_id: str) -> None:
+        self.aborted.append(session_id)
+
+
+def _jobs(n: int) -> List[PromptJob]:
+    return [(f"ses_{i}", [{"type": "text", "text": str(i)}]) for i in range(n)]
+
+
+def test_all_jobs_complete_within_concurrency() -> None:
+    server = _Server({})
+    results = list(run_prompts(server.prompt, server.abort, _jobs(10), concurrency=3))
+    assert sorted(r.index for r in results) == list(range(10))
+    assert all(r.ok and r.message["session"] == r.session_id for r in results)
+    assert server.peak <= 3
+
+
+def test_failure_is_isolated_and_kwargs_are_passed() -> None:
+    server = _Server({})
+    jobs: List[PromptJob] = [("ses_fail", []), ("ses_ok", [], {"agent": "build"})]
+    results = {r.session_id: r for r in run_prompts(server.prompt, server.abort, jobs)}
+    assert isinstance(results["ses_fail"].error, APIError)
+    assert results["ses_ok"].message == {"session": "ses_ok", "agent": "build"}
+
+
+def test_jobs_are_read_lazily() -> None:
+    server = _Server({})
+    taken: List[int] = []
+
+    def jobs() -> Iterator[PromptJob]:
+        for i in range(100):
+            taken.append(i)
+            yield (f"ses_{i}", [])
+
+    results = run_prompts(server.prompt, server.abort, jobs(), concurrency=2)
+    next(results)
+    results.close()
+    assert len(taken) <= 4
+
+
+def test_timeout_aborts_the_session() -> None:
+    server = _Server({"ses_slow": 0.5})
+    jobs: List[PromptJob] = [("ses_slow", []), ("ses_fast", [])]
+    results = {r.session_id: r for r in run_prompts(server.prompt, server.abort, jobs, timeout=0.1)}
+    assert isinstance(results["ses_slow"].error, TimeoutError)
+    assert results["ses_fast"].ok
+    assert server.aborted == ["ses_slow"]
+
+
+def test_early_exit_aborts_running_sessions() -> None:
+    server = _Server({"ses_0": 0.01, "ses_1": 0.5})
+    results = run_prompts(server.prompt, server.abort, _jobs(2), concurrency=2)
+    assert next(results).session_id == "ses_0"
+    results.close()
+    assert server.aborted == ["ses_1"]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"concurrency": 0}, {"timeout": 0}],
+)
+def test_invalid_arguments(kwargs: Dict[str, Any]) -> None:
+    server = _Server({})
+    with pytest.raises(ValueError):
+        next(run_prompts(server.prompt, server.abort, _jobs(1), **kwargs))
+
+
+def test_invalid_job_shape() -> None:
+    server = _Server({})
+    with pytest.raises(ValueError):
+        next(run_prompts(server.prompt, server.abort, [("ses_a",)]))  # type: ignore[list-item]
+
+
+@pytest.mark.asyncio
+async def test_async_jobs_complete_within_concurrency() -> None:
+    server = _Server({})
+    results = [r async for r in arun_prompts(server.aprompt, server.aabort, _jobs(10), 3)]
+    assert sorted(r.index for r in results) == list(range(10))
+    assert server.peak <= 3
+
+
+@pytest.mark.asyncio
+async def test_async_timeout_and_failure() -> None:
+    server = _Server({"ses_slow": 1.0})
+    jobs: List[PromptJob] = [("ses_slow", []), ("ses_fail", []), ("ses_ok", [])]
+    results = {
+        r.session_id: r
+        async for r in arun_prompts(server.aprompt, server.aabort, jobs, timeout=0.1)
+    }
+    assert isinstance(results["ses_slow"].error, TimeoutError)
+    assert isinstance(results["ses_fail"].error, APIError)
+    assert results["ses_ok"].ok
+    assert server.aborted == ["ses_slow"]
+
+
+@pytest.mark.asyncio
+async def test_async_early_exit_cancels_and_aborts() -> None:
+    server = _Server({"ses_0": 0.01, "ses_1": 1.0})
+    results = arun_prompts(server.aprompt, server.aabort, _jobs(2), concurrency=2)
+    assert (await results.__anext__()).session_id == "ses_0"
+    await results.aclose()
+    assert server.aborted == ["ses_1"]
+    assert server.active == 0
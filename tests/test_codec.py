@@ -0,0 +1,57 @@
+"""JSON 编解码器测试。"""
+
+import json
+from typing import Iterator
+
+import pytest
+
+from opencode_sdk import codec
+
+PAYLOAD = {"type": "message.part.delta", "delta": '你好 "world"\n', "n": [1, 2.5, None, True]}
+
+
+@pytest.fixture(autouse=True)
+def _restore_codec() -> Iterator[None]:
+    previous = codec.get_codec()
+    yield
+    codec.set_codec(previous)
+
+
+@pytest.mark.parametrize("name", codec.available_codecs())
+def test_round_trip(name: str) -> None:
+    active = codec.set_codec(name)
+    assert active.name == name
+    encoded = codec.dumps(PAYLOAD)
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == PAYLOAD
+    assert codec.loads(encoded) == PAYLOAD
+    assert codec.loads(encoded.decode()) == PAYLOAD
+
+
+@pytest.mark.parametrize("name", codec.available_codecs())
+def test_invalid_json_raises_value_error(name: str) -> None:
+    codec.set_codec(name)
+    with pytest.raises(ValueError):
+        codec.loads(b'{"type": ')
+
+
+def test_stdlib_output_is_compact_utf8() -> None:
+    codec.set_codec("json")
+    assert codec.dumps({"a": "é", "b": [1, 2]}) == '{"a":"é","b":[1,2]}'.encode()
+
+
+def test_stdlib_is_always_available_and_last() -> None:
+    assert codec.available_codecs()[-1] == "json"
+
+
+def test_custom_codec_and_auto_selection() -> None:
+    custom = codec.JSONCodec("custom", lambda data: "decoded", lambda obj: b"encoded")
+    assert codec.set_codec(custom) is custom
+    assert codec.loads(b"{}") == "decoded"
+    assert codec.dumps({}) == b"encoded"
+    assert codec.set_codec(None).name == codec.available_codecs()[0]
+
+
+def test_unknown_codec_name() -> None:
+    with pytest.raises(ValueError):
+        codec.set_codec("simdjson")
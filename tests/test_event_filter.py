@@ -0,0 +1,94 @@
+"""EventFilter 事件预过滤测试。"""
+
+from typing import Optional
+
+import httpx
+import pytest
+
+from opencode_sdk import EventFilter
+from opencode_sdk.sse_client import SSEClient
+
+BASE_URL = "http://opencode.test"
+
+
+def _data(event_type: str, session_id: Optional[str] = None) -> bytes:
+    properties = f'{{"sessionID": "{session_id}"}}' if session_id else '{"info":{"id":"ses_x"}}'
+    return f'{{"type": "{event_type}", "properties": {properties}}}'.encode()
+
+
+def test_no_conditions_keeps_everything() -> None:
+    assert EventFilter().matches(None, b"not even json")
+    assert EventFilter().params() == {}
+
+
+@pytest.mark.parametrize(
+    "event_type, data, expected",
+    [
+        (None, _data("session.idle", "ses_a"), True),
+        (None, _data("message.part.delta", "ses_a"), False),
+        # 字段顺序和空白不影响判断
+        (None, b'{"properties":{},"type":"session.idle"}', True),
+        # event: 字段优先于 data 中的 type
+        ("session.idle", _data("message.part.delta"), True),
+        ("message.part.delta", _data("session.idle"), False),
+    ],
+)
+def test_matches_event_type(event_type: Optional[str], data: bytes, expected: bool) -> None:
+    event_filter = EventFilter(event_types=["session.idle", "session.updated"])
+    assert event_filter.matches(event_type, data) is expected
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        (_data("message.part.delta", "ses_a"), True),
+        (_data("message.part.delta", "ses_b"), False),
+        # 不带 sessionID 的事件无法在字节层面判断，保留给事件中心
+        (_data("session.updated"), True),
+        # 嵌套多处 sessionID 时任意一处匹配即保留
+        (b'{"properties":{"sessionID":"ses_b","part":{"sessionID":"ses_a"}}}', True),
+    ],
+)
+def test_matches_session(data: bytes, expected: bool) -> None:
+    assert EventFilter(session_ids=["ses_a"]).matches(None, data) is expected
+
+
+def test_type_and_session_must_both_match() -> None:
+    event_filter = EventFilter(session_ids=["ses_a"], event_types=["session.idle"])
+    assert event_filter.matches(None, _data("session.idle", "ses_a"))
+    assert not event_filter.matches(None, _data("session.idle", "ses_b"))
+    assert not event_filter.matches(None, _data("session.error", "ses_a"))
+
+
+def test_params_and_repr() -> None:
+    event_filter = EventFilter(session_ids=["ses_b", "ses_a"], event_types=["session.idle"])
+    assert event_filter.params() == {"sessionID": "ses_a,ses_b", "type": "session.idle"}
+    assert EventFilter(event_types=[]).params() == {}
+    assert repr(EventFilter(event_types=["session.idle"])) == (
+        "EventFilter(session_ids=None, event_types=frozenset({'session.idle'}))"
+    )
+
+
+@pytest.mark.asyncio
+async def test_sse_client_skips_filtered_frames_before_decoding() -> None:
+    body = b"".join(
+        b"data: " + data + b"\n\n"
+        for data in [
+            _data("message.part.delta", "ses_b"),
+            _data("session.idle", "ses_a"),
+            b'{"type":"session.idle","properties":{"sessionID":"ses_b"},"broken":',
+        ]
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"content-type": "text/event-stream"}, content=body)
+
+    prefilter = EventFilter(session_ids=["ses_a"])
+    async with httpx.AsyncClient(base_url=BASE_URL, transport=httpx.MockTransport(handler)) as http:
+        async with SSEClient(BASE_URL, client=http, prefilter=prefilter) as sse:
+            received = [event async for event in sse.connect("/event")]
+
+    assert [event.type for event in received] == ["session.idle"]
+    # 被跳过的帧（包括无法解析的）不会解码
+    assert sse.metrics.filtered == 2
+    assert sse.metrics.events == 1
@@ -0,0 +1,58 @@
+"""EventHub 连接生命周期测试。"""
+
+import asyncio
+from typing import AsyncIterator
+
+import httpx
+import pytest
+
+from opencode_sdk.event_hub import EventHub
+from opencode_sdk.sse_client import SSEClient
+
+BASE_URL = "http://opencode.test"
+
+
+class _EndlessStream(httpx.AsyncByteStream):
+    """持续推送 session.idle 事件的响应流。"""
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        while True:
+            yield b'data: {"type":"session.idle","properties":{"sessionID":"ses_a"}}\n\n'
+            await asyncio.sleep(0.005)
+
+
+def _hub() -> EventHub:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, headers={"content-type": "text/event-stream"}, stream=_EndlessStream()
+        )
+
+    http = httpx.AsyncClient(base_url=BASE_URL, transport=httpx.MockTransport(handler))
+    return EventHub(lambda: SSEClient(BASE_URL, client=http), "/event")
+
+
+@pytest.mark.asyncio
+async def test_subscribe_while_closing_gets_live_connection() -> None:
+    hub = _hub()
+    closed = []
+    hub._on_close = closed.append
+
+    first = await hub.subscribe(session_id="ses_a")
+    assert await hub.wait_connected(timeout=1)
+
+    # 最后一个订阅者离开触发 close()，在等待旧连接退出期间有新的订阅者到来
+    closing = asyncio.create_task(first.aclose())
+    await asyncio.sleep(0)
+    second = await hub.subscribe(session_id="ses_a")
+    await closing
+
+    assert closed == [hub]
+    assert hub.subscriber_count == 1
+    for _ in range(3):
+        event = await asyncio.wait_for(second.__anext__(), timeout=1)
+        assert event.type == "session.idle"
+
+    task = hub._task
+    assert task is not None and not task.done()
+    await second.aclose()
+    assert task.done()
@@ -0,0 +1,37 @@
+"""Event 资源订阅测试。"""
+
+import httpx
+import pytest
+
+from opencode_sdk import AsyncOpencodeClient
+from opencode_sdk.resources.event import _EventMixin
+
+BASE_URL = "http://opencode.test"
+_GLOBAL_EVENTS = (
+    b'data: {"directory":"/work","payload":'
+    b'{"type":"session.created","properties":{"info":{"id":"ses_a"}}}}\n\n'
+)
+
+
+def test_event_mixin_is_abstract() -> None:
+    with pytest.raises(TypeError):
+        _EventMixin()  # type: ignore[abstract]
+
+
+@pytest.mark.asyncio
+async def test_subscribe_global_yields_unwrapped_events() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/global/event"
+        return httpx.Response(
+            200, headers={"content-type": "text/event-stream"}, content=_GLOBAL_EVENTS
+        )
+
+    client = AsyncOpencodeClient(base_url=BASE_URL)
+    client._http_client.client = httpx.AsyncClient(
+        base_url=BASE_URL, transport=httpx.MockTransport(handler)
+    )
+
+    events = [event async for event in client.events.subscribe_global()]
+
+    assert [event.type for event in events] == ["session.created"]
+    assert events[0].properties.info["id"] == "ses_a"
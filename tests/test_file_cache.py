@@ -0,0 +1,191 @@
+"""FileCache 文件缓存测试。"""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any, List, Optional
+
+import httpx
+import pytest
+
+from opencode_sdk import FileCache, OpencodeClient
+from opencode_sdk.models.events import EVENT_ADAPTER, Event
+from opencode_sdk.models.file import FileContent, FileNode
+
+BASE_URL = "http://opencode.test"
+ROOT = "/w"
+
+
+def _content(text: str) -> FileContent:
+    return FileContent(content=text)
+
+
+def _node(path: str, kind: str = "file") -> FileNode:
+    return FileNode(
+        name=path.rsplit("/", 1)[-1],
+        path=path,
+        absolute=f"{ROOT}/{path}",
+        type=kind,
+        ignored=False,
+    )
+
+
+def _event(event_type: str, **properties: Any) -> Event:
+    return EVENT_ADAPTER.validate_python({"type": event_type, "properties": properties})
+
+
+def test_hit_miss_and_stats() -> None:
+    cache = FileCache()
+    assert cache.get_read("a.py") is None
+    cache.put_read("a.py", None, None, _content("x"))
+    assert cache.get_read("./a.py") is not None
+    # 行范围是键的一部分
+    assert cache.get_read("a.py", 1, 2) is None
+    assert cache.stats.snapshot()["hits"] == 1
+    assert cache.stats.misses == 2
+
+
+def test_lru_eviction_by_bytes() -> None:
+    cache = FileCache(max_bytes=10)
+    cache.put_read("a", None, None, _content("aaaa"))
+    cache.put_read("b", None, None, _content("bbbb"))
+    cache.get_read("a")
+    cache.put_read("c", None, None, _content("cccc"))
+    assert cache.get_read("b") is None
+    assert cache.get_read("a") is not None and cache.get_read("c") is not None
+    assert cache.bytes == 8 and cache.stats.evictions == 1
+    # 超过上限的单个条目不缓存
+    cache.put_read("big", None, None, _content("x" * 11))
+    assert cache.get_read("big") is None
+
+
+def test_stale_generation_is_not_stored() -> None:
+    cache = FileCache()
+    generation = cache.generation
+    cache.invalidate("a.py")
+    cache.put_read("a.py", None, None, _content("old"), generation)
+    assert cache.get_read("a.py") is None
+
+
+def test_invalidation_scope() -> None:
+    cache = FileCache(root=ROOT)
+    cache.put_read("src/a.py", None, None, _content("a"))
+    cache.put_list("src", False, None, [_node("src/a.py")])
+    cache.put_list(".", True, None, [_node("src", "directory"), _node("src/a.py")])
+    cache.put_list(".", False, None, [_node("src", "directory")])
+
+    # 内容变化只失效文件本身
+    cache.apply(_event("file.watcher.updated", file=f"{ROOT}/src/a.py", event="change"))
+    assert cache.get_read("src/a.py") is None
+    assert cache.get_list("src") is not None
+
+    # 新增文件失效直接上级目录和覆盖它的递归列表，不影响上上级的非递归列表
+    cache.apply(_event("file.watcher.updated", file=f"{ROOT}/src/b.py", event="add"))
+    assert cache.get_list("src") is None
+    assert cache.get_list(".", recursive=True) is None
+    assert cache.get_list(".") is not None
+
+
+def test_file_edited_keeps_listing_of_existing_file() -> None:
+    cache = FileCache(root=ROOT)
+    cache.put_list("src", False, None, [_node("src/a.py")])
+    cache.apply(_event("file.edited", file=f"{ROOT}/src/a.py"))
+    assert cache.get_list("src") is not None
+    # 编辑工具新建的文件不在列表中，目录列表失效
+    cache.apply(_event("file.edited", file=f"{ROOT}/src/new.py"))
+    assert cache.get_list("src") is None
+
+
+def test_root_is_learned_from_listing() -> None:
+    cache = FileCache()
+    cache.put_list(".", False, None, [_node("src", "directory")])
+    assert cache.root == ROOT
+
+
+def test_invalid_max_bytes() -> None:
+    with pytest.raises(ValueError):
+        FileCache(max_bytes=0)
+
+
+def test_with_cache_serves_repeated_reads() -> None:
+    requests: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        if request.url.path == "/file":
+            return httpx.Response(200, json=[_node("a.py").model_dump()])
+        return httpx.Response(200, json={"type": "text", "content": "x"})
+
+    client = OpencodeClient(base_url=BASE_URL)
+    client._http_client.client = httpx.Client(
+        base_url=BASE_URL, transport=httpx.MockTransport(handler)
+    )
+    cache = FileCache()
+    files = client.files.with_cache(cache)
+    assert files.read("a.py") is files.read("a.py")
+    assert files.list() is files.list()
+    assert requests == ["/file/read", "/file"]
+    # 原资源不受影响
+    client.files.read("a.py")
+    assert len(requests) == 3
+
+
+class _Hub:
+    def __init__(self) -> None:
+        self.queue: "asyncio.Queue[Event]" = asyncio.Queue()
+        self.metrics = SimpleNamespace(connects=1)
+        self.timeout: Optional[float] = -1.0
+
+    async def subscribe(self, event_types: Any = None) -> "_Hub":
+        return self
+
+    async def wait_connected(self, timeout: Optional[float] = None) -> bool:
+        self.timeout = timeout
+        return True
+
+    async def __aenter__(self) -> "_Hub":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        pass
+
+    def __aiter__(self) -> "_Hub":
+        return self
+
+    async def __anext__(self) -> Event:
+        return await self.queue.get()
+
+
+@pytest.mark.asyncio
+async def test_watch_applies_events_and_clears_on_reconnect() -> None:
+    hub = _Hub()
+
+    async def path() -> Any:
+        return {"directory": ROOT + "/"}
+
+    client = SimpleNamespace(
+        path=SimpleNamespace(get=path),
+        events=SimpleNamespace(hub=lambda path, reconnect: hub),
+    )
+    cache = FileCache()
+    watcher = asyncio.create_task(cache.watch(client, connect_timeout=2.5))
+    await asyncio.sleep(0.01)
+    assert cache.root == ROOT
+    assert hub.timeout == 2.5
+
+    cache.put_read("a.py", None, None, _content("a"))
+    cache.put_read("b.py", None, None, _content("b"))
+    hub.queue.put_nowait(_event("file.edited", file=f"{ROOT}/a.py"))
+    await asyncio.sleep(0.01)
+    assert cache.get_read("a.py") is None and cache.get_read("b.py") is not None
+
+    # 重连后断线期间的事件已丢失，整体清空
+    hub.metrics.connects = 2
+    hub.queue.put_nowait(_event("server.connected"))
+    await asyncio.sleep(0.01)
+    assert cache.get_read("b.py") is None
+
+    cache.put_read("c.py", None, None, _content("c"))
+    watcher.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await watcher
+    assert cache.bytes == 0
@@ -0,0 +1,126 @@
+"""请求埋点测试：提前放弃的请求和指标导出器。"""
+
+import asyncio
+from typing import Any, Dict, List, Tuple
+
+import httpx
+import pytest
+
+from opencode_sdk import AsyncOpencodeClient, MetricsExporter, OpencodeClient, RequestRecord
+
+BASE_URL = "http://opencode.test"
+_MATCHES = b'[{"path":"a.py"},{"path":"b.py"},{"path":"c.py"}]'
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, headers={"content-type": "application/json"}, content=_MATCHES)
+
+
+def _hooks(client: Any) -> List[Tuple[str, str]]:
+    calls: List[Tuple[str, str]] = []
+    client.instrumentation.add_hook(
+        after=lambda r: calls.append(("after", r.outcome)),
+        error=lambda r: calls.append(("error", r.outcome)),
+    )
+    return calls
+
+
+def _series(client: Any) -> Dict[str, Any]:
+    (series,) = client.instrumentation.metrics.series()
+    return {
+        "route": series.route,
+        "status": series.status,
+        "count": series.count,
+        "errors": series.errors,
+    }
+
+
+def test_stream_closed_early_is_recorded_as_cancelled() -> None:
+    client = OpencodeClient(base_url=BASE_URL)
+    client._http_client.client = httpx.Client(
+        base_url=BASE_URL, transport=httpx.MockTransport(_handler)
+    )
+    calls = _hooks(client)
+
+    for _ in client.find.text_stream("x"):
+        break
+
+    assert calls == [("error", "cancelled")]
+    assert _series(client) == {
+        "route": "/find/text",
+        "status": "cancelled",
+        "count": 1,
+        "errors": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_async_stream_closed_early_is_recorded_as_cancelled() -> None:
+    client = AsyncOpencodeClient(base_url=BASE_URL)
+    client._http_client.client = httpx.AsyncClient(
+        base_url=BASE_URL, transport=httpx.MockTransport(_handler)
+    )
+    calls = _hooks(client)
+
+    matches = client.find.text_stream("x")
+    async for _ in matches:
+        break
+    await matches.aclose()
+
+    assert calls == [("error", "cancelled")]
+    assert _series(client)["status"] == "cancelled"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_request_is_recorded() -> None:
+    started = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        started.set()
+        await asyncio.sleep(10)
+        return httpx.Response(200, json=[])
+
+    client = AsyncOpencodeClient(base_url=BASE_URL)
+    client._http_client.client = httpx.AsyncClient(
+        base_url=BASE_URL, transport=httpx.MockTransport(handler)
+    )
+    calls = _hooks(client)
+
+    task = asyncio.create_task(client._http_client.get("/session"))
+    await started.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert calls == [("error", "cancelled")]
+    assert _series(client)["count"] == 1
+
+
+def test_exporter_must_implement_export() -> None:
+    class Incomplete(MetricsExporter):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()  # type: ignore[abstract]
+
+
+def test_exporter_receives_every_finished_request() -> None:
+    class Recorder(MetricsExporter):
+        def __init__(self) -> None:
+            self.records: List[RequestRecord] = []
+
+        def export(self, record: RequestRecord) -> None:
+            self.records.append(record)
+
+    client = OpencodeClient(base_url=BASE_URL)
+    client._http_client.client = httpx.Client(
+        base_url=BASE_URL, transport=httpx.MockTransport(_handler)
+    )
+    exporter = Recorder()
+    client.instrumentation.add_exporter(exporter)
+    list(client.find.text_stream("x"))
+    assert [(r.route, r.outcome) for r in exporter.records] == [("/find/text", "200")]
+
+    client.instrumentation.remove_exporter(exporter)
+    list(client.find.text_stream("x"))
+    assert len(exporter.records) == 1
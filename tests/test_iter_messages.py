@@ -0,0 +1,77 @@
+"""iter_messages 分页遍历测试。"""
+
+from typing import List
+
+import httpx
+import pytest
+
+from opencode_sdk import AsyncOpencodeClient, OpencodeClient
+
+BASE_URL = "http://opencode.test"
+
+
+def _transport(total: int, offsets: List[int]) -> httpx.MockTransport:
+    """按 limit / offset 返回 total 条消息的服务器，记录请求的偏移量。"""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        limit = int(request.url.params["limit"])
+        offset = int(request.url.params["offset"])
+        offsets.append(offset)
+        end = min(total, offset + limit)
+        return httpx.Response(200, json=[{"id": f"msg_{i}"} for i in range(offset, end)])
+
+    return httpx.MockTransport(handler)
+
+
+def _sync(total: int, offsets: List[int]) -> OpencodeClient:
+    client = OpencodeClient(base_url=BASE_URL, response_mode="raw")
+    client._http_client.client = httpx.Client(
+        base_url=BASE_URL, transport=_transport(total, offsets)
+    )
+    return client
+
+
+@pytest.mark.parametrize(
+    "total, expected_offsets",
+    [(7, [0, 3, 6]), (6, [0, 3, 6]), (0, [0])],
+)
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_all_pages_in_order(total: int, expected_offsets: List[int], prefetch: bool) -> None:
+    offsets: List[int] = []
+    client = _sync(total, offsets)
+    ids = [m["id"] for m in client.sessions.iter_messages("ses_a", page_size=3, prefetch=prefetch)]
+    assert ids == [f"msg_{i}" for i in range(total)]
+    assert sorted(offsets) == expected_offsets
+
+
+def test_start_offset() -> None:
+    offsets: List[int] = []
+    client = _sync(5, offsets)
+    ids = [m["id"] for m in client.sessions.iter_messages("ses_a", page_size=2, offset=3)]
+    assert ids == ["msg_3", "msg_4"]
+
+
+def test_early_break_fetches_at_most_one_page_ahead() -> None:
+    offsets: List[int] = []
+    client = _sync(100, offsets)
+    for _ in client.sessions.iter_messages("ses_a", page_size=10):
+        break
+    assert set(offsets) <= {0, 10}
+
+
+def test_page_size_must_be_positive() -> None:
+    with pytest.raises(ValueError):
+        next(_sync(1, []).sessions.iter_messages("ses_a", page_size=0))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("prefetch", [True, False])
+async def test_async_all_pages_in_order(prefetch: bool) -> None:
+    offsets: List[int] = []
+    client = AsyncOpencodeClient(base_url=BASE_URL, response_mode="raw")
+    client._http_client.client = httpx.AsyncClient(
+        base_url=BASE_URL, transport=_transport(7, offsets)
+    )
+    ids = [m["id"] async for m in client.sessions.iter_messages("ses_a", 3, prefetch=prefetch)]
+    assert ids == [f"msg_{i}" for i in range(7)]
+    assert offsets == [0, 3, 6]
@@ -0,0 +1,57 @@
+"""JSONArrayDecoder 分块边界测试。"""
+
+import json
+
+import pytest
+
+from opencode_sdk.json_stream import JSONArrayDecoder
+
+PAYLOADS = [
+    b"[1.5]",
+    b"[1.5e2]",
+    b"[12, -0.25, 3E+4, 1.5e-2]",
+    b'[true, false, null, "text", 7]',
+    b'[{"path": {"text": "a.py"}, "line_number": 12.5}, [1, 2.0e1], -3]',
+    b"[ 100 ,\n 2 ]",
+]
+
+
+def _decode(chunks):
+    decoder = JSONArrayDecoder()
+    items = []
+    for chunk in chunks:
+        items.extend(decoder.feed(chunk))
+    items.extend(decoder.close())
+    return items
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_every_split_point(payload: bytes) -> None:
+    expected = json.loads(payload)
+    for i in range(len(payload) + 1):
+        assert _decode([payload[:i], payload[i:]]) == expected, payload[:i]
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_byte_by_byte(payload: bytes) -> None:
+    assert _decode([payload[i : i + 1] for i in range(len(payload))]) == json.loads(payload)
+
+
+def test_number_split_at_fraction_and_exponent() -> None:
+    decoder = JSONArrayDecoder()
+    assert decoder.feed(b"[1.") == []
+    assert decoder.feed(b"5, 1.5e") == [1.5]
+    assert decoder.feed(b"2]") == [150.0]
+    assert decoder.close() == []
+
+
+def test_complete_object_is_returned_without_waiting() -> None:
+    decoder = JSONArrayDecoder()
+    assert decoder.feed(b'[{"a": 1}') == [{"a": 1}]
+
+
+def test_truncated_array() -> None:
+    decoder = JSONArrayDecoder()
+    decoder.feed(b"[1, 2")
+    with pytest.raises(ValueError):
+        decoder.close()
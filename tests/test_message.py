@@ -0,0 +1,68 @@
+"""消息和部分模型的解析测试。"""
+
+from typing import Any, Dict
+
+import pytest
+from pydantic import ValidationError
+
+from opencode_sdk.models.message import (
+    AssistantMessage,
+    TextPart,
+    UserMessage,
+    parse_message,
+    parse_messages,
+)
+
+
+def _user() -> Dict[str, Any]:
+    return {
+        "id": "msg_1",
+        "sessionID": "ses_a",
+        "role": "user",
+        "time": {"created": 1},
+        "agent": "build",
+        "model": {"providerID": "anthropic", "modelID": "claude-sonnet"},
+    }
+
+
+def _assistant() -> Dict[str, Any]:
+    return {
+        "id": "msg_2",
+        "sessionID": "ses_a",
+        "role": "assistant",
+        "time": {"created": 2},
+        "parentID": "msg_1",
+        "modelID": "claude-sonnet",
+        "providerID": "anthropic",
+        "mode": "build",
+        "path": {"cwd": "/w", "root": "/w"},
+        "cost": 0.0,
+        "tokens": {"input": 1, "output": 1, "reasoning": 0, "cache": {"read": 0, "write": 0}},
+    }
+
+
+def test_dispatches_on_role() -> None:
+    user, assistant = parse_messages([_user(), _assistant()])
+    assert isinstance(user, UserMessage)
+    assert isinstance(assistant, AssistantMessage)
+
+
+def test_info_and_parts_envelope_is_unwrapped() -> None:
+    text = {"id": "prt_1", "sessionID": "ses_a", "messageID": "msg_2", "type": "text", "text": "hi"}
+    message = parse_message({"info": _assistant(), "parts": [text]})
+    assert isinstance(message, AssistantMessage)
+    assert isinstance(message.parts[0], TextPart)
+    assert message.parts[0].text == "hi"
+
+
+@pytest.mark.parametrize("role", [None, "system"])
+def test_missing_or_unknown_role_is_rejected(role: Any) -> None:
+    data = _assistant()
+    if role is None:
+        del data["role"]
+    else:
+        data["role"] = role
+    with pytest.raises(ValidationError):
+        parse_message(data)
+    with pytest.raises(ValidationError):
+        parse_messages([_user(), data])
@@ -0,0 +1,90 @@
+"""原始（raw）与惰性（lazy）响应模式测试。"""
+
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+
+from opencode_sdk import OpencodeClient
+from opencode_sdk.lazy import LazyModel, resolve_response_mode
+from opencode_sdk.models.message import AssistantMessage, UserMessage
+from opencode_sdk.models.session import Session
+
+BASE_URL = "http://opencode.test"
+
+SESSION = {
+    "id": "ses_a",
+    "projectID": "prj_1",
+    "directory": "/w",
+    "title": "t",
+    "version": "1",
+    "time": {"created": 1, "updated": 2},
+}
+MESSAGES: List[Dict[str, Any]] = [
+    {
+        "info": {
+            "id": "msg_1",
+            "sessionID": "ses_a",
+            "role": "user",
+            "time": {"created": 1},
+            "agent": "build",
+            "model": {"providerID": "anthropic", "modelID": "claude-sonnet"},
+        },
+        "parts": [],
+    },
+    {
+        "info": {"id": "msg_2", "sessionID": "ses_a", "role": "assistant", "time": {"created": 2}},
+        "parts": [],
+    },
+]
+
+
+def _client(response_mode: str = "model") -> OpencodeClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/session":
+            return httpx.Response(200, json=[SESSION])
+        return httpx.Response(200, json=MESSAGES)
+
+    client = OpencodeClient(base_url=BASE_URL, response_mode=response_mode)
+    client._http_client.client = httpx.Client(
+        base_url=BASE_URL, transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+@pytest.mark.parametrize(
+    "default, raw, lazy, expected",
+    [
+        ("model", None, None, "model"),
+        ("model", True, None, "raw"),
+        ("model", None, True, "lazy"),
+        ("raw", False, None, "model"),
+        ("lazy", None, False, "model"),
+        ("lazy", True, None, "raw"),
+    ],
+)
+def test_resolve_response_mode(default: str, raw: Any, lazy: Any, expected: str) -> None:
+    assert resolve_response_mode(default, raw, lazy) == expected
+
+
+def test_model_mode_validates() -> None:
+    (session,) = _client().sessions.list()
+    assert isinstance(session, Session)
+
+
+def test_raw_mode_returns_json_and_can_be_overridden() -> None:
+    client = _client("raw")
+    assert client.sessions.list() == [SESSION]
+    assert isinstance(client.sessions.list(raw=False)[0], Session)
+
+
+def test_lazy_view_dispatches_on_role_and_validates_on_access() -> None:
+    user, assistant = _client().sessions.messages("ses_a", lazy=True)
+    assert isinstance(user, LazyModel) and user.model_class is UserMessage
+    assert assistant.model_class is AssistantMessage
+    assert user.time.created == 1
+    # 只访问存在的字段时不会因为其他必填字段缺失而失败
+    assert assistant.id == "msg_2"
+    with pytest.raises(AttributeError):
+        assistant.cost
+    assert isinstance(user.to_model(), UserMessage)
@@ -0,0 +1,138 @@
+"""重试策略测试。"""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from typing import Callable, List
+
+import httpx
+import pytest
+
+from opencode_sdk import OpencodeClient, RetryPolicy
+from opencode_sdk.exceptions import APIError, ConnectionError, NotFoundError, TimeoutError
+from opencode_sdk.retry import parse_retry_after
+
+BASE_URL = "http://opencode.test"
+NO_WAIT = RetryPolicy(max_attempts=3, initial_delay=0, jitter=0)
+
+
+def _client(
+    handler: Callable[[httpx.Request], httpx.Response], retry: RetryPolicy = NO_WAIT
+) -> OpencodeClient:
+    client = OpencodeClient(base_url=BASE_URL, retry=retry)
+    client._http_client.client = httpx.Client(
+        base_url=BASE_URL, transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+def _flaky(statuses: List[int]) -> Callable[[httpx.Request], httpx.Response]:
+    """依次返回给定状态码，用完后返回 200。"""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if statuses:
+            return httpx.Response(statuses.pop(0), text="busy")
+        return httpx.Response(200, json={"ok": True})
+
+    return handler
+
+
+def test_backoff_is_exponential_and_capped() -> None:
+    policy = RetryPolicy(initial_delay=0.5, multiplier=2, max_delay=3, jitter=0)
+    assert [policy.backoff(n) for n in range(1, 5)] == [0.5, 1.0, 2.0, 3.0]
+
+
+def test_backoff_jitter_stays_in_range() -> None:
+    policy = RetryPolicy(initial_delay=1, jitter=0.5)
+    assert all(0.5 <= policy.backoff(1) <= 1.5 for _ in range(100))
+
+
+def test_parse_retry_after() -> None:
+    assert parse_retry_after({"Retry-After": "3"}) == 3.0
+    assert parse_retry_after({"retry-after": " 1.5 "}) == 1.5
+    assert parse_retry_after({"Retry-After": "-1"}) == 0.0
+    assert parse_retry_after({"Retry-After": "soon"}) is None
+    assert parse_retry_after({}) is None
+    assert parse_retry_after(None) is None
+    later = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+    delay = parse_retry_after({"Retry-After": later})
+    assert delay is not None and 25 < delay <= 30
+
+
+def test_retry_after_is_capped() -> None:
+    policy = RetryPolicy(max_retry_after=5)
+    error = APIError("busy", status_code=429, response_headers={"Retry-After": "120"})
+    assert policy.delay(1, error) == 5
+
+
+@pytest.mark.parametrize(
+    "method, error, sent, expected",
+    [
+        ("GET", APIError("x", status_code=503), True, True),
+        ("GET", APIError("x", status_code=429), True, True),
+        ("GET", APIError("x", status_code=422), True, False),
+        ("GET", APIError("x"), True, False),
+        ("POST", APIError("x", status_code=503), True, False),
+        ("POST", ConnectionError("x"), False, True),
+        ("POST", TimeoutError("x"), True, False),
+        ("DELETE", TimeoutError("x"), True, True),
+        ("GET", NotFoundError(), True, False),
+    ],
+)
+def test_is_retryable(method: str, error: Exception, sent: bool, expected: bool) -> None:
+    assert RetryPolicy().is_retryable(method, error, sent) is expected
+
+
+def test_retry_non_idempotent_opt_in() -> None:
+    policy = RetryPolicy(retry_non_idempotent=True)
+    assert policy.is_retryable("POST", APIError("x", status_code=503))
+
+
+def test_get_recovers_after_retries() -> None:
+    client = _client(_flaky([503, 502]))
+    assert client._http_client.get("/session") == {"ok": True}
+    stats = client.retry_stats.snapshot()
+    assert stats["requests"] == 3
+    assert stats["retries"] == 2
+    assert stats["recovered"] == 1
+    assert stats["by_reason"] == {"503": 1, "502": 1}
+
+
+def test_exhausted_retries_raise_last_error() -> None:
+    client = _client(_flaky([503, 503, 503, 503]))
+    with pytest.raises(APIError) as info:
+        client._http_client.get("/session")
+    assert info.value.status_code == 503
+    assert client.retry_stats.requests == 3
+    assert client.retry_stats.exhausted == 1
+
+
+def test_post_that_reached_the_server_is_not_retried() -> None:
+    client = _client(_flaky([503]))
+    with pytest.raises(APIError):
+        client._http_client.post("/session/ses_a/message", json_data={"parts": []})
+    assert client.retry_stats.requests == 1
+
+
+def test_post_that_never_connected_is_retried() -> None:
+    attempts = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise httpx.ConnectError("refused")
+        return httpx.Response(200, json={"ok": True})
+
+    client = _client(handler)
+    assert client._http_client.post("/session/ses_a/message", json_data={}) == {"ok": True}
+    assert client.retry_stats.by_reason == {"connection": 1}
+
+
+def test_no_policy_means_no_retry() -> None:
+    client = OpencodeClient(base_url=BASE_URL)
+    client._http_client.client = httpx.Client(
+        base_url=BASE_URL, transport=httpx.MockTransport(_flaky([503]))
+    )
+    with pytest.raises(APIError):
+        client._http_client.get("/session")
+    assert client.retry_stats.retries == 0
@@ -0,0 +1,181 @@
+"""SessionStore 本地会话缓存测试。"""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from opencode_sdk.models.events import EVENT_ADAPTER, Event
+from opencode_sdk.models.session import SESSION_STATUS_MAP_ADAPTER, Session
+from opencode_sdk.session_store import SessionStore
+
+
+def _info(session_id: str, updated: int, title: str = "t") -> Dict[str, Any]:
+    return {
+        "id": session_id,
+        "projectID": "prj",
+        "directory": "/w",
+        "title": title,
+        "version": "1",
+        "time": {"created": 1, "updated": updated},
+    }
+
+
+def _event(event_type: str, **properties: Any) -> Event:
+    return EVENT_ADAPTER.validate_python({"type": event_type, "properties": properties})
+
+
+class _Subscription:
+    def __init__(self) -> None:
+        self.queue: "asyncio.Queue[Optional[Event]]" = asyncio.Queue()
+        self.closed = False
+
+    def __aiter__(self) -> "_Subscription":
+        return self
+
+    async def __anext__(self) -> Event:
+        event = await self.queue.get()
+        if event is None:
+            raise StopAsyncIteration
+        return event
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+class _Hub:
+    """假事件中心：测试通过 ``send`` 推送事件，``connects`` 模拟重连次数。"""
+
+    def __init__(self) -> None:
+        self.subscription = _Subscription()
+        self.metrics = SimpleNamespace(connects=1)
+        self.event_types: Any = None
+
+    async def subscribe(self, event_types: Any = None) -> _Subscription:
+        self.event_types = event_types
+        return self.subscription
+
+    async def wait_connected(self, timeout: Optional[float] = None) -> bool:
+        return True
+
+    async def send(self, *events: Optional[Event]) -> None:
+        for event in events:
+            self.subscription.queue.put_nowait(event)
+        # 让后台任务处理完已推送的事件
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+
+class _Sessions:
+    def __init__(self, sessions: List[Dict[str, Any]], status: Dict[str, Any]) -> None:
+        self.sessions = sessions
+        self.status_data = status
+        self.list_calls = 0
+
+    async def list(self, raw: bool = False, lazy: bool = False) -> List[Session]:
+        self.list_calls += 1
+        return [Session(**info) for info in self.sessions]
+
+    async def status(self) -> Dict[str, Any]:
+        return SESSION_STATUS_MAP_ADAPTER.validate_python(self.status_data)
+
+
+def _client(sessions: List[Dict[str, Any]], status: Dict[str, Any]) -> Any:
+    hub = _Hub()
+    return SimpleNamespace(
+        hub=hub,
+        sessions=_Sessions(sessions, status),
+        events=SimpleNamespace(hub=lambda path, reconnect: hub),
+    )
+
+
+@pytest.mark.asyncio
+async def test_snapshot_is_loaded_on_start() -> None:
+    client = _client(
+        [_info("ses_a", 1), _info("ses_b", 2)],
+        {"ses_a": {"type": "busy"}, "ses_b": {"type": "idle"}},
+    )
+    async with SessionStore(client) as store:
+        assert store.live
+        assert [s.id for s in store.list()] == ["ses_b", "ses_a"]
+        assert len(store) == 2 and "ses_a" in store
+        # 空闲会话不出现在状态中，与 sessions.status() 一致
+        assert list(store.status()) == ["ses_a"]
+        assert store.status("ses_b") == {}
+        assert store.version == 1 and store.synced_at is not None
+        assert "session.created" in client.hub.event_types
+    assert not store.live
+    assert client.hub.subscription.closed
+
+
+@pytest.mark.asyncio
+async def test_events_update_sessions_and_status() -> None:
+    client = _client([_info("ses_a", 1)], {})
+    async with SessionStore(client) as store:
+        await client.hub.send(
+            _event("session.created", info=_info("ses_b", 5)),
+            _event("session.updated", info=_info("ses_a", 6, title="renamed")),
+            _event("session.status", sessionID="ses_b", status={"type": "busy"}),
+        )
+        assert [s.id for s in store.list()] == ["ses_a", "ses_b"]
+        session = store.get("ses_a")
+        assert session is not None and session.title == "renamed"
+        assert store.status("ses_b")["ses_b"].type == "busy"
+        assert store.version == 4 and store.last_event_at is not None
+
+        await client.hub.send(_event("session.idle", sessionID="ses_b"))
+        assert store.status() == {}
+
+        await client.hub.send(
+            _event("session.status", sessionID="ses_a", status={"type": "busy"}),
+            _event("session.deleted", info=_info("ses_a", 7)),
+        )
+        assert store.get("ses_a") is None and store.status() == {}
+
+
+@pytest.mark.asyncio
+async def test_stale_event_does_not_overwrite_newer_snapshot() -> None:
+    client = _client([_info("ses_a", 10, title="new")], {})
+    async with SessionStore(client) as store:
+        await client.hub.send(_event("session.updated", info=_info("ses_a", 5, title="old")))
+        session = store.get("ses_a")
+        assert session is not None and session.title == "new"
+        assert store.version == 1
+
+
+@pytest.mark.asyncio
+async def test_reconnect_triggers_resync() -> None:
+    client = _client([_info("ses_a", 1)], {})
+    async with SessionStore(client) as store:
+        # 断线期间 ses_a 被删除、ses_b 被创建，事件全部丢失
+        client.sessions.sessions = [_info("ses_b", 2)]
+        client.hub.metrics.connects = 2
+        await client.hub.send(_event("server.connected"))
+        assert store.resyncs == 1
+        assert client.sessions.list_calls == 2
+        assert [s.id for s in store.list()] == ["ses_b"]
+
+
+@pytest.mark.asyncio
+async def test_stream_end_stops_updates() -> None:
+    client = _client([], {})
+    async with SessionStore(client) as store:
+        await client.hub.send(None)
+        assert not store.live
+        assert store.error is None
+
+
+@pytest.mark.asyncio
+async def test_failed_snapshot_closes_subscription() -> None:
+    client = _client([], {})
+
+    async def broken(**kwargs: Any) -> List[Session]:
+        raise RuntimeError("down")
+
+    client.sessions.list = broken
+    store = SessionStore(client)
+    with pytest.raises(RuntimeError):
+        await store.start()
+    assert client.hub.subscription.closed
+    assert not store.live
@@ -0,0 +1,94 @@
+"""SSEClient 断线重连测试。"""
+
+from typing import AsyncIterator, List
+
+import httpx
+import pytest
+
+from opencode_sdk.sse_client import ReconnectPolicy, SSEClient
+
+BASE_URL = "http://opencode.test"
+
+
+def _idle(session_id: str) -> bytes:
+    return (
+        b'data: {"type":"session.idle","properties":{"sessionID":"'
+        + session_id.encode()
+        + b'"}}\n\n'
+    )
+
+
+class _BrokenStream(httpx.AsyncByteStream):
+    """输出若干字节块后以 ReadError 断开。"""
+
+    def __init__(self, chunks: List[bytes]) -> None:
+        self._chunks = chunks
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for chunk in self._chunks:
+            yield chunk
+        raise httpx.ReadError("connection reset")
+
+
+@pytest.mark.asyncio
+async def test_frame_split_by_disconnect_is_resent_after_reconnect() -> None:
+    last_event_ids = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        last_event_ids.append(request.headers.get("last-event-id"))
+        headers = {"content-type": "text/event-stream"}
+        if len(last_event_ids) == 1:
+            # 事件 2 只收到一半连接就断开
+            chunks = [b"id: 1\n" + _idle("ses_1"), b'id: 2\ndata: {"type":"sess']
+            return httpx.Response(200, headers=headers, stream=_BrokenStream(chunks))
+        return httpx.Response(200, headers=headers, content=b"id: 2\n" + _idle("ses_2"))
+
+    policy = ReconnectPolicy(initial_delay=0, jitter=0)
+    received = []
+    async with httpx.AsyncClient(base_url=BASE_URL, transport=httpx.MockTransport(handler)) as http:
+        async with SSEClient(BASE_URL, client=http) as sse:
+            async for event in sse.connect("/event", reconnect=policy):
+                received.append(event.properties.session_id)
+                if len(received) == 2:
+                    break
+
+    assert received == ["ses_1", "ses_2"]
+    assert last_event_ids == [None, "1"]
+    assert sse.last_event_id == "2"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status", [200, 204])
+async def test_clean_end_of_stream_does_not_reconnect(status: int) -> None:
+    requests = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal requests
+        requests += 1
+        content = _idle("ses_1") if status == 200 else b""
+        return httpx.Response(
+            status, headers={"content-type": "text/event-stream"}, content=content
+        )
+
+    policy = ReconnectPolicy(initial_delay=0, jitter=0)
+    async with httpx.AsyncClient(base_url=BASE_URL, transport=httpx.MockTransport(handler)) as http:
+        async with SSEClient(BASE_URL, client=http) as sse:
+            received = [event async for event in sse.connect("/event", reconnect=policy)]
+
+    assert len(received) == (1 if status == 200 else 0)
+    assert requests == 1
+    assert sse.metrics.reconnects == 0
+
+
+@pytest.mark.asyncio
+async def test_reconnect_is_rejected_for_post() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise AssertionError("不应发出请求")
+
+    async with httpx.AsyncClient(base_url=BASE_URL, transport=httpx.MockTransport(handler)) as http:
+        async with SSEClient(BASE_URL, client=http) as sse:
+            stream = sse.connect(
+                "/session/ses_1/prompt", method="POST", json_data={}, reconnect=True
+            )
+            with pytest.raises(ValueError):
+                await stream.__anext__()
@@ -0,0 +1,91 @@
+"""SSEParser 增量解析测试。"""
+
+from typing import List
+
+import pytest
+
+from opencode_sdk.sse_parser import SSEFrame, SSEParser
+
+STREAM = (
+    b": keep-alive\n\n"
+    b'id: 1\ndata: {"type":"session.idle"}\n\n'
+    b"event: message.part.delta\ndata: line one\ndata: line two\n\n"
+    b"retry: 2500\n\n"
+    b"id:2\ndata:no-space\n\n"
+    b"data\n\n"
+    b"id: 3\n\n"
+    b"data: after-id\n\n"
+)
+
+EXPECTED = [
+    SSEFrame(None, b'{"type":"session.idle"}', "1"),
+    SSEFrame("message.part.delta", b"line one\nline two", "1"),
+    SSEFrame(None, b"no-space", "2"),
+    SSEFrame(None, b"", "2"),
+    SSEFrame(None, b"after-id", "3"),
+]
+
+
+def _feed_all(chunks: List[bytes]) -> List[SSEFrame]:
+    parser = SSEParser()
+    frames: List[SSEFrame] = []
+    for chunk in chunks:
+        frames.extend(parser.feed(chunk))
+    return frames
+
+
+@pytest.mark.parametrize("newline", [b"\n", b"\r\n", b"\r"], ids=["LF", "CRLF", "CR"])
+def test_line_endings(newline: bytes) -> None:
+    parser = SSEParser()
+    assert parser.feed(STREAM.replace(b"\n", newline)) == EXPECTED
+    assert parser.last_event_id == "3"
+    assert parser.retry == 2500
+
+
+@pytest.mark.parametrize("newline", [b"\n", b"\r\n", b"\r"], ids=["LF", "CRLF", "CR"])
+def test_every_split_point(newline: bytes) -> None:
+    payload = STREAM.replace(b"\n", newline)
+    for i in range(len(payload) + 1):
+        assert _feed_all([payload[:i], payload[i:]]) == EXPECTED, i
+
+
+def test_byte_by_byte_crlf() -> None:
+    payload = STREAM.replace(b"\n", b"\r\n")
+    assert _feed_all([payload[i : i + 1] for i in range(len(payload))]) == EXPECTED
+
+
+def test_crlf_split_between_chunks_is_one_line_break() -> None:
+    parser = SSEParser()
+    assert parser.feed(b"data: a\r") == []
+    # 块尾的 CR 已经结束了一行，下一块开头的 LF 不能再算作一个空行
+    assert parser.feed(b"\n\r") == [SSEFrame(None, b"a", None)]
+    assert parser.feed(b"\ndata: b\r") == []
+    assert parser.feed(b"\n\r\n") == [SSEFrame(None, b"b", None)]
+
+
+def test_partial_tail_waits_for_blank_line() -> None:
+    parser = SSEParser()
+    assert parser.feed(b'data: {"type":"sess') == []
+    assert parser.feed(b'ion.idle"}\n') == []
+    assert parser.feed(b"\n") == [SSEFrame(None, b'{"type":"session.idle"}', None)]
+
+
+def test_reset_drops_partial_event_but_keeps_id_and_retry() -> None:
+    parser = SSEParser()
+    parser.feed(b"id: 7\nretry: 100\ndata: done\n\ndata: half")
+    parser.reset()
+    assert parser.last_event_id == "7"
+    assert parser.retry == 100
+    assert parser.feed(b"data: next\n\n") == [SSEFrame(None, b"next", "7")]
+
+
+def test_invalid_id_and_retry_are_ignored() -> None:
+    parser = SSEParser()
+    frames = parser.feed(b"id: 1\n\nid: a\x00b\nretry: soon\ndata: x\n\n")
+    assert frames == [SSEFrame(None, b"x", "1")]
+    assert parser.retry is None
+
+
+def test_unknown_fields_and_comments_are_ignored() -> None:
+    parser = SSEParser()
+    assert parser.feed(b": ping\nfoo: bar\ndata: x\n: trailing\n\n") == [SSEFrame(None, b"x", None)]
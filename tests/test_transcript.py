@@ -0,0 +1,151 @@
+"""TranscriptAssembler 组装流式消息测试。"""
+
+from typing import Any, Dict, List
+
+import pytest
+
+from opencode_sdk.models.events import EVENT_ADAPTER, Event
+from opencode_sdk.models.message import AssistantMessage, TextPart, ToolPart
+from opencode_sdk.transcript import TranscriptAssembler
+
+SESSION = "ses_a"
+
+
+def _event(event_type: str, **properties: Any) -> Event:
+    return EVENT_ADAPTER.validate_python({"type": event_type, "properties": properties})
+
+
+def _assistant(message_id: str = "msg_1", session_id: str = SESSION) -> Dict[str, Any]:
+    return {
+        "id": message_id,
+        "sessionID": session_id,
+        "role": "assistant",
+        "time": {"created": 1},
+        "parentID": "msg_0",
+        "modelID": "claude-sonnet",
+        "providerID": "anthropic",
+        "mode": "build",
+        "path": {"cwd": "/w", "root": "/w"},
+        "cost": 0.0,
+        "tokens": {"input": 1, "output": 1, "reasoning": 0, "cache": {"read": 0, "write": 0}},
+    }
+
+
+def _text(part_id: str, text: str, message_id: str = "msg_1") -> Dict[str, Any]:
+    return {
+        "id": part_id,
+        "sessionID": SESSION,
+        "messageID": message_id,
+        "type": "text",
+        "text": text,
+    }
+
+
+def _delta(part_id: str, delta: str, message_id: str = "msg_1", field: str = "text") -> Event:
+    return _event(
+        "message.part.delta",
+        sessionID=SESSION,
+        messageID=message_id,
+        partID=part_id,
+        field=field,
+        delta=delta,
+    )
+
+
+def _idle(session_id: str = SESSION) -> Event:
+    return _event("session.idle", sessionID=session_id)
+
+
+def test_deltas_are_merged_into_the_final_message() -> None:
+    assembler = TranscriptAssembler()
+    events: List[Event] = [
+        _event("message.updated", info=_assistant()),
+        _event("message.part.updated", part=_text("prt_1", "")),
+        *(_delta("prt_1", chunk) for chunk in ["Hel", "lo, ", "world"]),
+    ]
+    assert assembler.feed_all(events) == []
+    assert assembler.text(SESSION, "msg_1", "prt_1") == "Hello, world"
+
+    (message,) = assembler.feed(_idle())
+    assert isinstance(message, AssistantMessage)
+    assert [part.text for part in message.parts] == ["Hello, world"]
+    # 会话完成后状态被丢弃
+    assert assembler.message("msg_1") is None
+
+
+def test_part_snapshot_resets_buffered_text() -> None:
+    assembler = TranscriptAssembler()
+    assembler.feed(_event("message.updated", info=_assistant()))
+    assembler.feed(_delta("prt_1", "draft"))
+    assembler.feed(_event("message.part.updated", part=_text("prt_1", "final")))
+    assert assembler.text(SESSION, "msg_1", "prt_1") == "final"
+    assembler.feed(_delta("prt_1", "!"))
+    assert assembler.text(SESSION, "msg_1", "prt_1") == "final!"
+
+
+def test_delta_without_snapshot_becomes_text_part() -> None:
+    assembler = TranscriptAssembler()
+    assembler.feed(_event("message.updated", info=_assistant()))
+    assembler.feed(_delta("prt_1", "only deltas"))
+    (part,) = assembler.parts("msg_1")
+    assert isinstance(part, TextPart)
+    assert (part.id, part.session_id, part.message_id) == ("prt_1", SESSION, "msg_1")
+    assert part.text == "only deltas"
+
+
+def test_non_text_parts_keep_order_and_removed_parts_are_dropped() -> None:
+    assembler = TranscriptAssembler()
+    tool = {
+        "id": "prt_2",
+        "sessionID": SESSION,
+        "messageID": "msg_1",
+        "type": "tool",
+        "callID": "call_1",
+        "tool": "read",
+        "state": {"status": "pending", "input": {}, "raw": ""},
+    }
+    assembler.feed_all(
+        [
+            _event("message.updated", info=_assistant()),
+            _event("message.part.updated", part=_text("prt_1", "a")),
+            _event("message.part.updated", part=tool),
+            _event("message.part.updated", part=_text("prt_3", "b")),
+            _event("message.part.removed", sessionID=SESSION, messageID="msg_1", partID="prt_3"),
+        ]
+    )
+    parts = assembler.parts("msg_1")
+    assert [part.id for part in parts] == ["prt_1", "prt_2"]
+    assert isinstance(parts[1], ToolPart)
+
+
+def test_idle_only_finishes_its_own_session() -> None:
+    assembler = TranscriptAssembler()
+    assembler.feed(_event("message.updated", info=_assistant("msg_1", SESSION)))
+    assembler.feed(_event("message.updated", info=_assistant("msg_2", "ses_b")))
+    assert [m.id for m in assembler.feed(_idle("ses_b"))] == ["msg_2"]
+    assert assembler.message("msg_1") is not None
+
+
+def test_removed_message_is_not_returned() -> None:
+    assembler = TranscriptAssembler()
+    assembler.feed(_event("message.updated", info=_assistant()))
+    assembler.feed(_event("message.removed", sessionID=SESSION, messageID="msg_1"))
+    assert assembler.feed(_idle()) == []
+
+
+def test_events_without_properties_are_ignored() -> None:
+    class Bare:
+        type = "server.connected"
+
+    assert TranscriptAssembler().feed(Bare()) == []
+
+
+@pytest.mark.asyncio
+async def test_assemble_async_stream() -> None:
+    async def stream() -> Any:
+        yield _event("message.updated", info=_assistant())
+        yield _delta("prt_1", "hi")
+        yield _idle()
+
+    messages = [m async for m in TranscriptAssembler().assemble(stream())]
+    assert [m.parts[0].text for m in messages] == ["hi"]